@@ -1,8 +1,17 @@
 import os
+import tempfile
 from dotenv import load_dotenv
 
 load_dotenv()
 
+# Стенд 'fake' — in-memory фейк API (core/fake_api.py), поднимается conftest'ом в процессе прогона.
+# Учётки и id сидовых сущностей фейка подставляются, если не заданы в окружении
+if os.getenv('TEST_STAND_NAME') == 'fake':
+    from tests.core.fake_api import FAKE_ENV
+
+    for _name, _value in FAKE_ENV.items():
+        os.environ.setdefault(_name, _value)
+
 URL = os.getenv('URL')
 print('Loaded URL:', URL)
 
@@ -38,13 +47,63 @@ USERS = {
 
 TEST_STAND_NAME = os.getenv('TEST_STAND_NAME', 'kuber_dev')
 
+# Порт фейка; xdist-воркеры поднимают свои экземпляры на соседних портах
+FAKE_API_PORT = int(os.getenv('FAKE_API_PORT', 18765)) + int(os.getenv('PYTEST_XDIST_WORKER', 'gw0')[2:] or 0)
+
 API_URL = {
     'dev': 'https://api.vaiz.dev/v4',
     'local': 'https://api.vaiz.local:10000/v4',
     'kuber_dev': 'https://vaiz-api-ms.vaiz.dev/v4',
     'kuber_uat': 'https://vaiz-api-uat.vaiz.dev/v4',
+    'fake': f'http://127.0.0.1:{FAKE_API_PORT}',
 }[TEST_STAND_NAME]
 
+# MongoDB стенда: проверки сохранённого состояния (фикстура persisted) читают базу напрямую; без MONGO_URI — через API
+MONGO_URI = os.getenv('MONGO_URI')
+MONGO_DB_NAME = os.getenv('MONGO_DB_NAME')
+# Сколько драйвер ищет доступный сервер, прежде чем ответить ошибкой (мс); по умолчанию pymongo — 30 с
+MONGO_TIMEOUT_MS = int(os.getenv('MONGO_TIMEOUT_MS', '5000'))
+
+# Запись/воспроизведение HTTP-кассеты APIClient: 'record', 'replay' или пусто (обычный прогон против стенда)
+CASSETTE_MODE = os.getenv('CASSETTE_MODE', '')
+CASSETTE_PATH = os.getenv(
+    'CASSETTE_PATH',
+    os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'cassettes', f'{TEST_STAND_NAME}.jsonl'),
+)
+
+# Сколько спейсов держать готовыми в фоне для фикстур space_id_*/project_id_*/board_id_module; 0 — без пула.
+# С кассетой пул по умолчанию выключен: фоновое создание делает порядок запросов недетерминированным
+RESOURCE_POOL_SIZE = int(os.getenv('RESOURCE_POOL_SIZE', 0 if CASSETTE_MODE else {
+    'dev': 2,
+    'local': 2,
+    'kuber_dev': 3,
+    'kuber_uat': 2,
+    'fake': 0,
+}.get(TEST_STAND_NAME, 0)))
+
+# Бенчмарки (--benchmark): baseline хранится в репозитории по стендам, свежие результаты пишутся в BENCHMARK_RESULTS_DIR
+BENCHMARK_BASELINE_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'benchmarks',
+                                      TEST_STAND_NAME)
+BENCHMARK_RESULTS_DIR = os.getenv('BENCHMARK_RESULTS_DIR', 'benchmark-results')
+# Профиль фикстур (--profile-fixtures) в формате folded stacks; xdist-воркеры пишут каждый в свой файл
+_XDIST_WORKER = os.getenv('PYTEST_XDIST_WORKER')
+FIXTURE_PROFILE_PATH = os.getenv('FIXTURE_PROFILE_PATH', os.path.join(
+    BENCHMARK_RESULTS_DIR, f'fixtures.{_XDIST_WORKER}.folded' if _XDIST_WORKER else 'fixtures.folded'))
+
+# Потолок воркеров для pytest -n auto (число подбирается по задержке API, см. tests/core/scheduling.py)
+XDIST_MAX_WORKERS = int(os.getenv('XDIST_MAX_WORKERS', 8))
+
+# История длительностей тестов для шардирования (--num-shards) и --slowest-first; в CI кэшируется между прогонами
+DURATIONS_STORE_PATH = os.getenv('DURATIONS_STORE_PATH', os.path.join(
+    os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))), '.test-durations.json'))
+
+# Кэш случаев фаззинга санитайзера комментариев, уже совпавших с эталонной моделью (по стендам)
+SANITIZER_FUZZ_CACHE_PATH = os.getenv('SANITIZER_FUZZ_CACHE_PATH', os.path.join(
+    os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))), '.sanitizer-fuzz-cache.json'))
+
+# Дисковый кэш токенов, общий для процессов (в т.ч. xdist-воркеров) и прогонов
+TOKEN_CACHE_PATH = os.getenv('TOKEN_CACHE_PATH', os.path.join(tempfile.gettempdir(), 'vaiz_autotests_tokens.json'))
+
 if os.getenv('GITHUB_ENV'):
     with open(os.getenv('GITHUB_ENV'), 'a') as f:
         f.write(f'API_URL={API_URL}\n')
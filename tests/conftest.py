@@ -1,8 +1,10 @@
 import datetime
 import os
 import uuid
+from functools import partial
 
 from pymongo import MongoClient
+from pymongo.errors import PyMongoError
 
 import pytest
 import requests
@@ -21,13 +23,25 @@ from test_backend.data.endpoints.User.register_endpoint import register_endpoint
 from test_backend.data.endpoints.access_group.aaccess_group_endpoints import create_access_group_endpoint
 from test_backend.data.endpoints.invite.invite_endpoint import invite_to_space_endpoint, confirm_space_invite_endpoint
 from test_backend.data.endpoints.milestone.milestones_endpoints import create_milestone_endpoint
+from test_backend.task_service.utils import board_metadata_cache, invalidate_board_metadata
 from tests.config import settings
 from tests.config.generators import generate_space_name, generate_project_name, generate_slug, generate_board_name
 from tests.test_backend.data.endpoints.Board.board_endpoints import get_board_endpoint
 from tests.test_backend.data.endpoints.Document.document_endpoints import create_document_endpoint, archive_document_endpoint
 from tests.test_backend.data.endpoints.member.member_endpoints import get_space_members_endpoint
-from tests.core.client import APIClient
-from tests.core.auth import get_token
+from tests.core.async_client import PooledAPIClient, run_concurrently
+from tests.core.client import APIClient, add_middleware, remove_middleware
+from tests.core.auth import get_token, prewarm_tokens, role_for_token
+from tests.core.cassette import Cassette
+from tests.core.fake_api import FakeVaizAPI
+from tests.core.fake_stand import fake_unsupported_reason
+from tests.core.resource_pool import ResourcePool, SpaceBundle, count_pool_demand
+from tests.core.durations import DurationsPlugin
+from tests.core.persisted import PersistedState
+from tests.core.change_stream import ChangeStreamWaiter, set_change_waiter
+from tests.core.profiler import FixtureProfiler
+from tests.core.scheduling import SchedulingPlugin, WorkerCountPlugin
+from core.waiters import WAIT_STATS, deadline_budget, wait_stats_report
 from tests.config.settings import API_URL, MAIN_SPACE_ID, MAIN_PROJECT_ID, MAIN_BOARD_ID
 from tests.test_backend.data.endpoints.Board.constants import DEFAULT_BOARD_GROUPS
 from tests.test_backend.data.endpoints.Project.project_endpoints import (
@@ -42,12 +56,132 @@ from tests.test_backend.data.endpoints.Space.space_endpoints import (
 )
 
 
+def pytest_addoption(parser):
+    """
+    Регистрирует флаг --benchmark: бенчмарки (маркер benchmark) запускаются только с ним.
+    --update-benchmark-baseline: бенчмарки сохраняют результаты как новый baseline.
+    --shard-id/--num-shards: запустить одну из частей прогона, сбалансированных по истории длительностей;
+    --slowest-first: самые долгие тесты (по истории) идут первыми.
+    --profile-fixtures: профиль времени, запросов и трафика фикстур (flame graph + таблица в конце прогона).
+    """
+    parser.addoption(
+        "--benchmark",
+        action="store_true",
+        default=False,
+        help="Запустить бенчмарки (тесты с маркером benchmark)",
+    )
+    parser.addoption(
+        "--update-benchmark-baseline",
+        action="store_true",
+        default=False,
+        help="Перезаписать baseline бенчмарков текущими результатами вместо сравнения с ним",
+    )
+    parser.addoption(
+        "--shard-id",
+        type=int,
+        default=int(os.getenv("SHARD_ID", 0)),
+        help="Номер шарда (с 0), который нужно запустить",
+    )
+    parser.addoption(
+        "--num-shards",
+        type=int,
+        default=int(os.getenv("NUM_SHARDS", 1)),
+        help="На сколько шардов делить тесты (по истории длительностей, см. tests/core/durations.py)",
+    )
+    parser.addoption(
+        "--slowest-first",
+        action="store_true",
+        default=False,
+        help="Запускать самые долгие по истории тесты первыми",
+    )
+    parser.addoption(
+        "--profile-fixtures",
+        action="store_true",
+        default=False,
+        help="Профилировать фикстуры: время setup/teardown, запросы APIClient и байты (см. tests/core/profiler.py)",
+    )
+
+
+def pytest_configure(config):
+    """
+    Планировщик для pytest-xdist: тесты, меняющие общие ресурсы (маркер mutates, фикстуры из MUTATING_FIXTURES),
+    получают xdist_group и с --dist loadgroup идут одним воркером; -n auto подбирает число воркеров по задержке API.
+    История длительностей пишется в settings.DURATIONS_STORE_PATH и используется для шардов и --slowest-first.
+    """
+    shard_id, num_shards = config.getoption('--shard-id'), config.getoption('--num-shards')
+    if num_shards < 1 or not 0 <= shard_id < num_shards:
+        raise pytest.UsageError(f'--shard-id должен быть от 0 до {num_shards - 1}, получено {shard_id}')
+    config.pluginmanager.register(SchedulingPlugin(), 'scheduling')
+    config.pluginmanager.register(DurationsPlugin(settings.DURATIONS_STORE_PATH, shard_id, num_shards,
+                                                  config.getoption('--slowest-first')), 'durations')
+    if config.getoption('--profile-fixtures'):
+        config.pluginmanager.register(FixtureProfiler(settings.FIXTURE_PROFILE_PATH), 'fixture_profiler')
+    if config.pluginmanager.hasplugin('xdist'):
+        config.pluginmanager.register(WorkerCountPlugin(settings.API_URL, settings.XDIST_MAX_WORKERS), 'xdist_workers')
+        if getattr(config.option, 'numprocesses', None) and config.getoption('dist') != 'loadgroup':
+            print('\n⚠️  xdist без --dist loadgroup: группы тестов, меняющих общие ресурсы, не учитываются')
+
+
+def pytest_collection_modifyitems(config, items):
+    if settings.TEST_STAND_NAME == 'fake':
+        # Сценарии, которые фейк не поддерживает, пропускаются с причиной из tests/core/fake_stand.py
+        for item in items:
+            reason = fake_unsupported_reason(item.nodeid)
+            if reason:
+                item.add_marker(pytest.mark.skip(reason=f'Фейковый стенд: {reason}'))
+    if config.getoption("--benchmark"):
+        return
+    skip_benchmark = pytest.mark.skip(reason="Бенчмарк: запускается только с флагом --benchmark")
+    for item in items:
+        if item.get_closest_marker("benchmark"):
+            item.add_marker(skip_benchmark)
+
+
 def pytest_collection_finish(session):
     has_backend = any(item.get_closest_marker('backend') for item in session.items)
     if has_backend:
         print(f'\n🧪 Running on stand: {settings.TEST_STAND_NAME}')
         print(f'🔗 API URL: {settings.API_URL}\n')
 
+def pytest_terminal_summary(terminalreporter):
+    """Печатает места вызова wait_until с наибольшим суммарным временем ожидания и статистику кэша метаданных."""
+    if WAIT_STATS:
+        terminalreporter.write_sep('-', 'wait_until: время ожидания по местам вызова')
+        terminalreporter.write_line(wait_stats_report())
+    scheduling = terminalreporter.config.pluginmanager.get_plugin('scheduling')
+    if scheduling is not None and scheduling.groups:
+        terminalreporter.write_line(f'Группы xdist (общие ресурсы): {scheduling.report()}')
+    durations = terminalreporter.config.pluginmanager.get_plugin('durations')
+    for line in durations.report() if durations is not None else ():
+        terminalreporter.write_line(line)
+    profiler = terminalreporter.config.pluginmanager.get_plugin('fixture_profiler')
+    if profiler is not None and profiler.stats:
+        terminalreporter.write_sep('-', f'Профиль фикстур (flame graph: {profiler.path})')
+        terminalreporter.write_line(profiler.table())
+    if board_metadata_cache.misses:
+        terminalreporter.write_line(f'Кэш метаданных борд: {board_metadata_cache.stats()}')
+    if _cassette_stats:
+        terminalreporter.write_line(f'Кассета {settings.CASSETTE_PATH}: {_cassette_stats}')
+    for name, pool in _resource_pools.items():
+        terminalreporter.write_line(f'Пул {name}: {pool.stats()}')
+        for error in pool.errors:
+            terminalreporter.write_line(error)
+
+
+@pytest.fixture(autouse=True)
+def wait_budget(request):
+    """
+    Общий бюджет времени на все ожидания теста: @pytest.mark.wait_budget(seconds).
+    Вложенные wait_until берут время из этого бюджета. Без маркера бюджет не ограничен.
+    """
+    marker = request.node.get_closest_marker('wait_budget')
+    if marker is None:
+        yield None
+        return
+    with deadline_budget(marker.args[0]) as budget:
+        yield budget
+
+
 @pytest.fixture(scope="session")
 def mongo_client():
     """Создает подключение к MongoDB на время всего прогона тестов."""
@@ -55,7 +189,7 @@ def mongo_client():
     mongo_uri = os.getenv("MONGO_URI")
 
     # Подключаемся
-    client = MongoClient(mongo_uri)
+    client = MongoClient(mongo_uri, serverSelectionTimeoutMS=settings.MONGO_TIMEOUT_MS)
 
     yield client
 
@@ -70,6 +204,46 @@ def db(mongo_client):
     return mongo_client[db_name]
 
 
+@pytest.fixture(scope="session")
+def state_db(request, fake_api):
+    """
+    База для проверок и ожиданий без API: MongoDB при MONGO_URI, на стенде fake — хранилище фейка, иначе None.
+    MongoClient подключается лениво, поэтому база проверяется ping'ом: если он не прошёл за MONGO_TIMEOUT_MS
+    (нет DNS/сети до кластера, нет доступа), тоже None — проверки и ожидания идут через API.
+    """
+    if fake_api is not None:
+        return fake_api.mongo()
+    if settings.MONGO_URI:
+        try:
+            db = request.getfixturevalue("db")
+            db.command("ping")
+            return db
+        except PyMongoError as error:
+            print(f"\n[state_db] MongoDB недоступна ({error.__class__.__name__}), проверки и ожидания — через API")
+    return None
+
+
+@pytest.fixture(scope="session")
+def persisted(state_db):
+    """
+    Проверка сохранённого состояния после записи (PersistedState): проекции и батчи $in из MongoDB,
+    если задан MONGO_URI (на стенде fake — из хранилища фейка), иначе Get* через API.
+    """
+    return PersistedState(state_db)
+
+
+@pytest.fixture(scope="session", autouse=True)
+def change_waiter(state_db):
+    """
+    Ожидание побочных эффектов по change stream MongoDB (assert_history_event_exists, wait_group_empty);
+    без базы хелперы опрашивают API, как раньше.
+    """
+    waiter = ChangeStreamWaiter(state_db)
+    set_change_waiter(waiter)
+    yield waiter
+    set_change_waiter(ChangeStreamWaiter())
+
+
 @pytest.fixture(scope="session", autouse=True)
 def global_ssl_settings():
     """
@@ -97,40 +271,171 @@ def global_ssl_settings():
         requests.Session.request = patched_request
 
 
+@pytest.fixture(scope='session', autouse=True)
+def fake_api(global_ssl_settings):
+    """
+    TEST_STAND_NAME=fake — поднимает in-memory фейк API с сидовыми данными на settings.API_URL.
+    Логин и регистрация идут к нему по HTTP, запросы APIClient обслуживаются в процессе, без сети.
+    """
+    if settings.TEST_STAND_NAME != 'fake':
+        yield None
+        return
+    fake = FakeVaizAPI().seed(dict(os.environ))
+    fake.serve(port=settings.FAKE_API_PORT)
+    add_middleware(fake)
+    yield fake
+    remove_middleware(fake)
+    fake.stop()
+
+
+@pytest.fixture(scope='session', autouse=True)
+def http_cassette(global_ssl_settings, fake_api):
+    """
+    CASSETTE_MODE=record — все запросы APIClient пишутся в кассету settings.CASSETTE_PATH,
+    CASSETTE_MODE=replay — ответы отдаются из кассеты без сети. Без CASSETTE_MODE ничего не делает.
+    """
+    if not settings.CASSETTE_MODE:
+        yield None
+        return
+    cassette = Cassette(settings.CASSETTE_PATH, settings.CASSETTE_MODE, identify=role_for_token)
+    add_middleware(cassette)
+    yield cassette
+    remove_middleware(cassette)
+    cassette.close()
+    _cassette_stats.update(cassette.stats())
+
+
+@pytest.fixture(autouse=True)
+def cassette_scope(request, http_cassette):
+    """Запросы теста сопоставляются в первую очередь с записями этого же теста."""
+    if http_cassette is not None:
+        http_cassette.scope = request.node.nodeid
+    yield
+
+
+@pytest.fixture(scope='session', autouse=True)
+def prewarmed_tokens(request, http_cassette):
+    """
+    Для backend-прогона логинится всеми ролями параллельно один раз за сессию.
+    Дальше клиентские фикстуры берут токены из кэша (в памяти и на диске).
+    """
+    if any(item.get_closest_marker('backend') for item in request.session.items):
+        prewarm_tokens()
+
+
+# Пулы заранее созданных спейсов: имя пула -> (клиентская фикстура, создавать ли борду)
+RESOURCE_POOLS = {
+    'main_spaces': ('main_client', True),
+    'owner_spaces': ('owner_client', False),
+}
+# Фикстуры, берущие спейс из пула: имя фикстуры -> (имя пула, scope)
+POOLED_FIXTURES = {
+    'temp_space': ('main_spaces', 'session'),
+    'space_id_module': ('main_spaces', 'module'),
+    'project_id_module': ('main_spaces', 'module'),
+    'board_id_module': ('main_spaces', 'module'),
+    'space_id_function': ('owner_spaces', 'function'),
+    'project_id_function': ('owner_spaces', 'function'),
+}
+_resource_pools = {}
+_cassette_stats = {}
+
+
+def _provision_space(client, with_board: bool) -> SpaceBundle:
+    response = client.post(**create_space_endpoint(name=generate_space_name()))
+    assert response.status_code == 200, f'Ошибка создания спейса: {response.text}'
+    space_id = response.json()['payload']['space']['_id']
+
+    common_kwargs = {'color': 'blue', 'icon': 'Dot', 'description': 'temporary project', 'space_id': space_id}
+    response = client.post(**create_project_endpoint(name=generate_project_name(), slug=generate_slug(), **common_kwargs))
+    assert response.status_code == 200, f'Ошибка создания проекта: {response.text}'
+    project_id = response.json()['payload']['project']['_id']
+
+    board_id = None
+    if with_board:
+        response = client.post(**create_board_endpoint(
+            name=generate_board_name(),
+            temp_project=project_id,
+            space_id=space_id,
+            groups=DEFAULT_BOARD_GROUPS,
+            typesList=[],
+            customFields=[],
+        ))
+        assert response.status_code == 200, f'Ошибка создания борды: {response.text}'
+        board_id = response.json()['payload']['board']['_id']
+
+    return SpaceBundle(space_id=space_id, project_id=project_id, board_id=board_id)
+
+
+def _remove_space(client, bundle: SpaceBundle):
+    client.post(**remove_space_endpoint(space_id=bundle.space_id))
+
+
+def _get_pool(request, name: str, demand: int = 0) -> ResourcePool:
+    """Пул по имени; если прогон его не предсказал (фикстура взята динамически), создаётся без предзаполнения."""
+    if name not in _resource_pools:
+        client_fixture, with_board = RESOURCE_POOLS[name]
+        client = request.getfixturevalue(client_fixture)
+        _resource_pools[name] = ResourcePool(
+            name,
+            provision=partial(_provision_space, client, with_board),
+            destroy=partial(_remove_space, client),
+            size=settings.RESOURCE_POOL_SIZE,
+            demand=demand,
+        ).start()
+    return _resource_pools[name]
+
+
+@pytest.fixture(scope='session', autouse=True)
+def resource_pools(request, prewarmed_tokens):
+    """
+    Заранее создаёт в фоне спейсы (с проектом и бордой) для фикстур из POOLED_FIXTURES.
+    Объём считается по собранным тестам, размер пула — settings.RESOURCE_POOL_SIZE.
+    В конце сессии дожидается фоновых удалений и удаляет невыданные спейсы.
+    """
+    for name, demand in count_pool_demand(request.session.items, POOLED_FIXTURES).items():
+        _get_pool(request, name, demand)
+
+    yield _resource_pools
+
+    for pool in _resource_pools.values():
+        pool.close()
+
+
 @pytest.fixture(scope='session')
 def main_client():
-    return APIClient(base_url=API_URL, token=get_token('main'))
+    return PooledAPIClient(base_url=API_URL, token=get_token('main'))
 
 @pytest.fixture(scope='session')
 def second_main_client():
-    return APIClient(base_url=API_URL, token=get_token('second_main'))
+    return PooledAPIClient(base_url=API_URL, token=get_token('second_main'))
 
 
 # Фикстура: возвращает авторизованного API клиента с токеном владельца
 @pytest.fixture(scope='session')
 def owner_client():
-    return APIClient(base_url=API_URL, token=get_token('owner'))
+    return PooledAPIClient(base_url=API_URL, token=get_token('owner'))
 
 
 @pytest.fixture(scope='session')
 def manager_client():
-    return APIClient(base_url=API_URL, token=get_token('manager'))
+    return PooledAPIClient(base_url=API_URL, token=get_token('manager'))
 
 
 @pytest.fixture(scope='session')
 def member_client():
-    return APIClient(base_url=API_URL, token=get_token('member'))
+    return PooledAPIClient(base_url=API_URL, token=get_token('member'))
 
 
 @pytest.fixture(scope='session')
 def guest_client():
-    return APIClient(base_url=API_URL, token=get_token('guest'))
+    return PooledAPIClient(base_url=API_URL, token=get_token('guest'))
 
 
 # Пользователь не имеет доступ к spаce
 @pytest.fixture(scope='session')
 def foreign_client():
-    return APIClient(base_url=API_URL, token=get_token('foreign_client'))
+    return PooledAPIClient(base_url=API_URL, token=get_token('foreign_client'))
 
 @pytest.fixture(scope="session")
 def temp_client():
@@ -169,13 +474,13 @@ def temp_client():
 # Пользователь имеет доступ к spаce в роли member(и не имеет доступ к проекту и борде)
 @pytest.fixture(scope='session')
 def client_with_access_only_in_space():
-    return APIClient(base_url=API_URL, token=get_token('space_client'))
+    return PooledAPIClient(base_url=API_URL, token=get_token('space_client'))
 
 
 # Пользователь имеет доступ к spаce и к проекту (и не имеет доступ к борде)
 @pytest.fixture(scope='session')
 def client_with_access_only_in_project():
-    return APIClient(base_url=API_URL, token=get_token('project_client'))
+    return PooledAPIClient(base_url=API_URL, token=get_token('project_client'))
 
 
 @pytest.fixture(scope='session')
@@ -310,15 +615,13 @@ def temp_member_profile(main_client, temp_space):
 
 # Фикстура: создает временный спейс и после прохождения тестов удаляет этот временный спейс
 @pytest.fixture(scope='session')
-def temp_space(main_client):
-    name = generate_space_name()
-    response = main_client.post(**create_space_endpoint(name=name))
-    assert response.status_code == 200
-    space_id = response.json()['payload']['space']['_id']
+def temp_space(request):
+    pool = _get_pool(request, 'main_spaces')
+    bundle = pool.acquire()
 
-    yield space_id
+    yield bundle.space_id
 
-    main_client.post(**remove_space_endpoint(space_id=space_id))
+    pool.release(bundle)
 
 
 @pytest.fixture(scope='session')
@@ -455,6 +758,7 @@ def temp_milestone_on_board_with_tasks(owner_client, main_space, board_with_task
         )
         assert create_resp.status_code == 200, f"Ошибка создания майлстоуна в фикстуре: {create_resp.text}"
         milestone_id = create_resp.json()['payload']['milestone']['_id']
+        invalidate_board_metadata(space_id=main_space, board_id=board_with_tasks)
 
     # Передаем ID майлстоуна в тест
     yield milestone_id
@@ -469,6 +773,7 @@ def temp_milestone_on_board_with_tasks(owner_client, main_space, board_with_task
             )
         )
         assert archive_resp.status_code == 200, f"Ошибка при архивации майлстоуна в фикстуре: {archive_resp.text}"
+        invalidate_board_metadata(space_id=main_space, board_id=board_with_tasks)
 
 
 @pytest.fixture(scope="session")
@@ -534,39 +839,42 @@ def space_with_members(
         assert create_resp.status_code == 200, f"Ошибка при создании пространства: {create_resp.text}"
         space_id = create_resp.json()['payload']['space']['_id']
 
-    # 2. main_client приглашает всех пользователей и они подтверждают инвайт
+    # 2. main_client приглашает всех пользователей и они подтверждают инвайт.
+    # Цепочки invite -> GetSpaces -> confirm для разных ролей независимы, поэтому идут конкурентно.
+    async def _invite_and_confirm(role, client):
+        client_email = settings.USERS[role.lower()]['email']
+        client_password = settings.USERS[role.lower()]['password']
+
+        # Отправка инвайта
+        invite_resp = await main_client.aio.post(**invite_to_space_endpoint(
+            space_id=space_id,
+            email=client_email,
+            space_access=role
+        ))
+        assert invite_resp.status_code == 200, f"Не удалось пригласить {role}: {invite_resp.text}"
+
+        # Получение списка спейсов клиента для поиска inviteCode
+        spaces_resp = await client.aio.post(**get_spaces_endpoint())
+        assert spaces_resp.status_code == 200, f"Не удалось получить список спейсов для {role}: {spaces_resp.text}"
+
+        spaces = spaces_resp.json().get('payload', {}).get('spaces', [])
+        target_space = next((s for s in spaces if s.get('_id') == space_id), None)
+
+        assert target_space, f"Пространство {space_id} не найдено у {role}"
+        invite_code = target_space.get('inviteCode')
+        assert invite_code, f"У пространства {space_id} нет inviteCode для пользователя {role}"
+
+        # Подтверждение инвайта
+        confirm_resp = await client.aio.post(**confirm_space_invite_endpoint(
+            code=invite_code,
+            full_name=f"Test {role}",
+            password=client_password,
+            termsAccepted=True
+        ))
+        assert confirm_resp.status_code == 200, f"Ошибка подтверждения инвайта для {role}: {confirm_resp.text}"
+
     with allure.step("Приглашение пользователей и подтверждение инвайтов"):
-        for role, client in clients_to_invite.items():
-            client_email = settings.USERS[role.lower()]['email']
-            client_password = settings.USERS[role.lower()]['password']
-
-            # Отправка инвайта
-            invite_resp = main_client.post(**invite_to_space_endpoint(
-                space_id=space_id,
-                email=client_email,
-                space_access=role
-            ))
-            assert invite_resp.status_code == 200, f"Не удалось пригласить {role}: {invite_resp.text}"
-
-            # Получение списка спейсов клиента для поиска inviteCode
-            spaces_resp = client.post(**get_spaces_endpoint())
-            assert spaces_resp.status_code == 200, f"Не удалось получить список спейсов для {role}: {spaces_resp.text}"
-
-            spaces = spaces_resp.json().get('payload', {}).get('spaces', [])
-            target_space = next((s for s in spaces if s.get('_id') == space_id), None)
-
-            assert target_space, f"Пространство {space_id} не найдено у {role}"
-            invite_code = target_space.get('inviteCode')
-            assert invite_code, f"У пространства {space_id} нет inviteCode для пользователя {role}"
-
-            # Подтверждение инвайта
-            confirm_resp = client.post(**confirm_space_invite_endpoint(
-                code=invite_code,
-                full_name=f"Test {role}",
-                password=client_password,
-                termsAccepted=True
-            ))
-            assert confirm_resp.status_code == 200, f"Ошибка подтверждения инвайта для {role}: {confirm_resp.text}"
+        run_concurrently(*(_invite_and_confirm(role, client) for role, client in clients_to_invite.items()))
 
     # Передаем управление тестам
     yield space_id
@@ -579,8 +887,10 @@ def space_with_members(
     # 4. Проверяем, что спейс пропал у всех приглашенных клиентов и у создателя
     all_clients = [main_client] + list(clients_to_invite.values())
     with allure.step("Проверка, что удаленное пространство недоступно у всех клиентов"):
-        for client in all_clients:
-            check_resp = client.post(**get_space_endpoint(space_id=space_id))
+        check_resps = run_concurrently(
+            *(client.aio.post(**get_space_endpoint(space_id=space_id)) for client in all_clients)
+        )
+        for check_resp in check_resps:
             # Ожидаем, что пространство не будет найдено (статус код не 200, статус код == 400)
             assert check_resp.status_code != 200, (
                 f"Уязвимость! Пространство {space_id} всё ещё доступно для одного из клиентов "
@@ -603,16 +913,19 @@ def foreign_space(guest_client):
 
 
 @pytest.fixture(scope='module')
-def space_id_module(main_client):
-    client = main_client
-    name = generate_space_name()
-    response = client.post(**create_space_endpoint(name=name))
-    assert response.status_code == 200
-    space_id = response.json()['payload']['space']['_id']
+def space_bundle_module(request):
+    """Спейс из пула main_spaces (с проектом и бордой) на модуль: основа space_id/project_id/board_id_module."""
+    pool = _get_pool(request, 'main_spaces')
+    bundle = pool.acquire()
 
-    yield space_id
+    yield bundle
 
-    client.post(**remove_space_endpoint(space_id=space_id))
+    pool.release(bundle)
+
+
+@pytest.fixture(scope='module')
+def space_id_module(space_bundle_module):
+    yield space_bundle_module.space_id
 
 
 @pytest.fixture(scope='module')
@@ -633,31 +946,12 @@ def space_id_(second_main_client):
     client.post(**remove_space_endpoint(space_id=space_id))
 
 @pytest.fixture(scope='module')
-def project_id_module(main_client, space_id_module):
-    name = generate_project_name()
-    slug = generate_slug()
-    common_kwargs = {'color': 'blue', 'icon': 'Dot', 'description': 'temporary project', 'space_id': space_id_module}
-    response = main_client.post(**create_project_endpoint(name=name, slug=slug, **common_kwargs))
-    assert response.status_code == 200
-    project_id = response.json()['payload']['project']['_id']
-
-    yield project_id
+def project_id_module(space_bundle_module):
+    yield space_bundle_module.project_id
 
 @pytest.fixture(scope='module')
-def board_id_module(main_client, project_id_module, space_id_module):
-    board_name = generate_board_name()
-    payload = create_board_endpoint(
-        name=board_name,
-        temp_project=project_id_module,
-        space_id=space_id_module,
-        groups=DEFAULT_BOARD_GROUPS,
-        typesList=[],
-        customFields=[],
-    )
-    response = main_client.post(**payload)
-    assert response.status_code == 200
-
-    yield response.json()['payload']['board']['_id']
+def board_id_module(space_bundle_module):
+    yield space_bundle_module.board_id
 
 
 @pytest.fixture(scope='module')
@@ -692,28 +986,24 @@ def member_id_module(main_client, space_id_module):
 
 
 @pytest.fixture(scope='function')
-def space_id_function(owner_client):
-    client = owner_client
-    name = generate_space_name()
-    response = client.post(**create_space_endpoint(name=name))
-    assert response.status_code == 200
-    space_id = response.json()['payload']['space']['_id']
+def space_bundle_function(request):
+    """Спейс из пула owner_spaces (с проектом) на тест; удаляется в фоне после теста."""
+    pool = _get_pool(request, 'owner_spaces')
+    bundle = pool.acquire()
 
-    yield space_id
+    yield bundle
 
-    client.post(**remove_space_endpoint(space_id=space_id))
+    pool.release(bundle)
 
 
 @pytest.fixture(scope='function')
-def project_id_function(owner_client, space_id_function):
-    name = generate_project_name()
-    slug = generate_slug()
-    common_kwargs = {'color': 'blue', 'icon': 'Dot', 'description': 'temporary project', 'space_id': space_id_function}
-    response = owner_client.post(**create_project_endpoint(name=name, slug=slug, **common_kwargs))
-    assert response.status_code == 200
-    project_id = response.json()['payload']['project']['_id']
+def space_id_function(space_bundle_function):
+    yield space_bundle_function.space_id
+
 
-    yield project_id
+@pytest.fixture(scope='function')
+def project_id_function(space_bundle_function):
+    yield space_bundle_function.project_id
 
 
 @pytest.fixture(scope='function')
@@ -0,0 +1,126 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from tests.core.client import APIClient, PostCall, send
+
+# Сколько запросов одновременно держим "в полёте" на один клиент (и сколько keep-alive соединений в пуле)
+DEFAULT_MAX_CONNECTIONS = 8
+
+
+def make_pooled_session(max_connections: int = DEFAULT_MAX_CONNECTIONS) -> requests.Session:
+    """
+    Создаёт requests.Session с ограниченным пулом keep-alive соединений.
+    pool_block=True: при исчерпании пула запрос ждёт свободное соединение, а не открывает лишнее.
+    """
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=1, pool_maxsize=max_connections, pool_block=True)
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    return session
+
+
+class AsyncAPIClient:
+    """
+    asyncio-вариант APIClient с тем же контрактом post(path, json, headers).
+
+    Запросы выполняются в пуле потоков поверх общей requests.Session,
+    поэтому возвращается обычный requests.Response, а число одновременных запросов
+    ограничено max_connections (семафор + размер пула соединений).
+    """
+
+    def __init__(self, base_url: str, token: str = None, max_connections: int = DEFAULT_MAX_CONNECTIONS,
+                 session: requests.Session = None):
+        self.base_url = base_url.rstrip('/')
+        self.max_connections = max_connections
+        self.session = session or make_pooled_session(max_connections)
+        self.token = token
+        self._executor = ThreadPoolExecutor(max_workers=max_connections, thread_name_prefix='async-api')
+        self._semaphores = {}
+        if token:
+            self.set_auth_header(token)
+
+    def set_auth_header(self, token: str):
+        self.token = token
+        self.session.headers.update({'Authorization': f'Bearer {token}', 'Cookie': f'_t={token}'})
+
+    def _semaphore(self) -> asyncio.Semaphore:
+        # Семафор привязан к event loop: для нового loop (каждый asyncio.run) создаём новый, старый отбрасываем
+        loop = asyncio.get_running_loop()
+        if loop not in self._semaphores:
+            self._semaphores = {loop: asyncio.Semaphore(self.max_connections)}
+        return self._semaphores[loop]
+
+    async def post(self, path: str, json: dict = None, headers: dict = None, **kwargs) -> requests.Response:
+        url = f'{self.base_url}{path}'
+        final_headers = self.session.headers.copy()
+        if headers:
+            final_headers.update(headers)
+        call = partial(send, PostCall(self.session, path, url, json, final_headers, kwargs))
+        async with self._semaphore():
+            return await asyncio.get_running_loop().run_in_executor(self._executor, call)
+
+    async def post_many(self, calls: list) -> list:
+        """
+        Отправляет пачку запросов конкурентно.
+        :param calls: список словарей endpoint'ов ({'path', 'json', 'headers'}), как их возвращают *_endpoint().
+        :return: список requests.Response в том же порядке, что и calls.
+        """
+        return list(await asyncio.gather(*(self.post(**call) for call in calls)))
+
+    def close(self):
+        self._executor.shutdown(wait=False)
+        self.session.close()
+
+
+def run_concurrently(*coros) -> list:
+    """
+    Синхронно выполняет корутины конкурентно (для фикстур и хелперов, которые сами не асинхронные).
+    Из работающего event loop вызывать нельзя — синхронное ожидание заблокировало бы сам loop:
+    там нужно await asyncio.gather(...) или await client.aio.post_many(...).
+    :return: список результатов в порядке переданных корутин.
+    """
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        pass
+    else:
+        for coro in coros:
+            coro.close()
+        raise RuntimeError("run_concurrently вызван из работающего event loop: используйте "
+                           "await asyncio.gather(...) или await client.aio.post_many(...)")
+
+    async def _gather():
+        return list(await asyncio.gather(*coros))
+
+    return asyncio.run(_gather())
+
+
+class PooledAPIClient(APIClient):
+    """
+    Синхронный фасад над AsyncAPIClient.
+
+    Полностью совместим с APIClient (post() работает как раньше), но использует ограниченный пул
+    соединений и умеет отправлять пачку запросов конкурентно через post_many().
+    Асинхронный клиент на той же сессии доступен как .aio.
+    """
+
+    def __init__(self, base_url: str, token: str = None, max_connections: int = DEFAULT_MAX_CONNECTIONS):
+        super().__init__(base_url=base_url)
+        self.session = make_pooled_session(max_connections)
+        self.aio = AsyncAPIClient(base_url=base_url, max_connections=max_connections, session=self.session)
+        if token:
+            self.set_auth_header(token)
+
+    def set_auth_header(self, token: str):
+        super().set_auth_header(token)
+        self.aio.token = token
+
+    def post_many(self, calls: list) -> list:
+        """Конкурентно отправляет список endpoint'ов и возвращает ответы в исходном порядке."""
+        if not calls:
+            return []
+        return run_concurrently(*(self.aio.post(**call) for call in calls))
@@ -1,31 +1,148 @@
+import base64
+import fcntl
+import json
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+
 import requests
-from tests.config.settings import USERS, API_URL
+from tests.config.settings import USERS, API_URL, TEST_STAND_NAME, TOKEN_CACHE_PATH, CASSETTE_MODE
+
+# Токен обновляется заранее, если до истечения осталось меньше REFRESH_MARGIN секунд
+REFRESH_MARGIN = 5 * 60
+# Срок жизни токена, если из него не удалось достать exp (токен не JWT)
+DEFAULT_TOKEN_TTL = 60 * 60
 
 _token_cache = {}
 
 
-def get_token(role: str = 'guest') -> str:
-    if role in _token_cache:
-        return _token_cache[role]
+def _token_expiry(token: str) -> float:
+    """Возвращает момент истечения токена (unix time) из JWT-claim `exp` или now + DEFAULT_TOKEN_TTL."""
+    try:
+        payload = token.split('.')[1]
+        claims = json.loads(base64.urlsafe_b64decode(payload + '=' * (-len(payload) % 4)))
+        return float(claims['exp'])
+    except (IndexError, KeyError, TypeError, ValueError):
+        return time.time() + DEFAULT_TOKEN_TTL
+
+
+def _is_fresh(entry: dict, email: str) -> bool:
+    return bool(entry) and entry.get('email') == email and entry.get('expires_at', 0) - time.time() > REFRESH_MARGIN
 
-    credentials = USERS.get(role)
-    if not credentials:
-        raise ValueError(f'Unknown role: {role}')
 
+@contextmanager
+def _file_lock(path: str):
+    """Эксклюзивная межпроцессная блокировка (flock) на файле path."""
+    with open(path, 'a') as lock_file:
+        fcntl.flock(lock_file, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+
+def _read_disk_cache() -> dict:
+    try:
+        with open(TOKEN_CACHE_PATH) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def _update_disk_cache(key: str, entry: dict = None):
+    """Записывает (или удаляет при entry=None) одну запись дискового кэша под общей блокировкой."""
+    with _file_lock(f'{TOKEN_CACHE_PATH}.lock'):
+        cache = _read_disk_cache()
+        if entry is None:
+            cache.pop(key, None)
+        else:
+            cache[key] = entry
+        tmp_path = f'{TOKEN_CACHE_PATH}.{os.getpid()}.tmp'
+        with open(os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600), 'w') as f:
+            json.dump(cache, f)
+        os.replace(tmp_path, TOKEN_CACHE_PATH)
+
+
+def _login(credentials: dict) -> str:
     login_url = f"{API_URL.rstrip('/')}/Login"
     headers = {'Content-Type': 'application/json'}
     response = requests.post(login_url, headers=headers, json=credentials)
 
     assert response.status_code == 202, f'Login failed ({response.status_code}): {response.text}'
 
-    token = response.json()['payload']['token']
-    _token_cache[role] = token
-    return token
+    return response.json()['payload']['token']
+
+
+def get_token(role: str = 'guest') -> str:
+    """
+    Возвращает токен роли. Порядок поиска: кэш процесса -> дисковый кэш (общий для процессов,
+    xdist-воркеров и прогонов, ключ stand:role) -> /Login.
+    Токен, который истекает в ближайшие REFRESH_MARGIN секунд, перевыпускается.
+    """
+    credentials = USERS.get(role)
+    if not credentials:
+        raise ValueError(f'Unknown role: {role}')
+
+    email = credentials.get('email')
+    if CASSETTE_MODE == 'replay':
+        # Ответы берутся из кассеты, логин не нужен: токен лишь указывает роль для сопоставления запросов
+        _token_cache.setdefault(role, {'token': f'replay-{role}', 'email': email, 'expires_at': float('inf')})
+    if _is_fresh(_token_cache.get(role), email):
+        return _token_cache[role]['token']
+
+    if TEST_STAND_NAME == 'fake':
+        # Фейк живёт в процессе прогона: его токены нельзя переиспользовать между процессами и прогонами
+        token = _login(credentials)
+        _token_cache[role] = {'token': token, 'email': email, 'expires_at': _token_expiry(token)}
+        return token
+
+    key = f'{TEST_STAND_NAME}:{role}'
+    # Блокировка на роль: параллельные процессы не логинятся одной ролью дважды, а разные роли не ждут друг друга
+    with _file_lock(f'{TOKEN_CACHE_PATH}.{key.replace(":", "_")}.lock'):
+        entry = _read_disk_cache().get(key)
+        if not _is_fresh(entry, email):
+            token = _login(credentials)
+            entry = {'token': token, 'email': email, 'expires_at': _token_expiry(token)}
+            _update_disk_cache(key, entry)
+
+    _token_cache[role] = entry
+    return entry['token']
+
+
+def role_for_token(token: str):
+    """Роль, которой выдан токен (по кэшу процесса), или None для чужого/невалидного токена."""
+    for role, entry in list(_token_cache.items()):
+        if entry.get('token') == token:
+            return role
+    return None
+
+
+def _try_get_token(role: str):
+    try:
+        return get_token(role)
+    except (AssertionError, requests.RequestException):
+        # Ошибку логина покажет фикстура, которой эта роль действительно понадобится
+        return None
+
+
+def prewarm_tokens(roles: list = None, max_workers: int = None) -> dict:
+    """
+    Параллельно получает токены для ролей (по умолчанию — для всех из settings.USERS).
+    max_workers=None — по потоку на роль. Возвращает {role: token} для ролей, под которыми удалось залогиниться.
+    """
+    roles = list(roles or USERS)
+    if not roles:
+        return {}
+    max_workers = max_workers or len(roles)
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        tokens = dict(zip(roles, executor.map(_try_get_token, roles)))
+    return {role: token for role, token in tokens.items() if token}
 
 
 def reset_token_cache(role: str = None):
-    """Очистка кэша токенов — для одной роли или всех."""
-    if role:
-        _token_cache.pop(role, None)
-    else:
-        _token_cache.clear()
+    """Очистка кэша токенов — для одной роли или всех (в памяти и на диске)."""
+    roles = [role] if role else list(USERS)
+    for r in roles:
+        _token_cache.pop(r, None)
+        _update_disk_cache(f'{TEST_STAND_NAME}:{r}')
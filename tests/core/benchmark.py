@@ -0,0 +1,200 @@
+import json
+import math
+import os
+import resource
+import sys
+import time
+from dataclasses import dataclass, field
+
+import allure
+
+# Регрессия — если метрика выросла больше чем в (1 + REGRESSION_TOLERANCE) раз и больше абсолютного запаса:
+# REGRESSION_SLACK_MS, но не больше REGRESSION_SLACK_RATIO от baseline (иначе на фейке с долями миллисекунд
+# запас в 20 мс перекрывает любой рост)
+REGRESSION_TOLERANCE = 0.25
+REGRESSION_SLACK_MS = 20.0
+REGRESSION_SLACK_RATIO = 0.5
+# Допуск по стендам baseline. Время фейка зависит от машины и её загрузки (между прогонами — до x2),
+# поэтому на нём гейт ловит только многократный (алгоритмический) рост
+STAND_TOLERANCE = {'fake': 2.0}
+# Метрики, которые сравниваются с baseline
+GATED_METRICS = ('p50_ms', 'p95_ms')
+
+
+def percentile(samples: list, p: float) -> float:
+    """Перцентиль p (0..100) с линейной интерполяцией между соседними значениями."""
+    if not samples:
+        return math.nan
+    ordered = sorted(samples)
+    rank = (len(ordered) - 1) * p / 100
+    low, high = math.floor(rank), math.ceil(rank)
+    return ordered[low] + (ordered[high] - ordered[low]) * (rank - low)
+
+
+@dataclass
+class LatencyStats:
+    """Замер одного сценария: задержки (мс), размер ответа (байт) и число элементов в ответе."""
+
+    name: str
+    params: dict
+    samples_ms: list = field(default_factory=list)
+    payload_bytes: int = 0
+    items: int = 0
+    errors: int = 0
+
+    def summary(self) -> dict:
+        return {
+            'name': self.name,
+            'params': self.params,
+            'runs': len(self.samples_ms),
+            'errors': self.errors,
+            'p50_ms': round(percentile(self.samples_ms, 50), 2),
+            'p95_ms': round(percentile(self.samples_ms, 95), 2),
+            'p99_ms': round(percentile(self.samples_ms, 99), 2),
+            'max_ms': round(max(self.samples_ms, default=math.nan), 2),
+            'payload_bytes': self.payload_bytes,
+            'items': self.items,
+        }
+
+
+def measure(client, endpoint: dict, name: str, params: dict = None, runs: int = 20, warmup: int = 2,
+            items_key: str = None) -> LatencyStats:
+    """
+    Выполняет запрос endpoint (словарь *_endpoint()) warmup + runs раз подряд и собирает задержки.
+    Ответы не-200 считаются ошибками и в перцентили не попадают.
+    """
+    stats = LatencyStats(name=name, params=params or {})
+    for attempt in range(warmup + runs):
+        start = time.perf_counter()
+        response = client.post(**endpoint)
+        elapsed_ms = (time.perf_counter() - start) * 1000
+        if attempt < warmup:
+            continue
+        if response.status_code != 200:
+            stats.errors += 1
+            continue
+        stats.samples_ms.append(elapsed_ms)
+        stats.payload_bytes = len(response.content)
+        if items_key:
+            stats.items = len(response.json()['payload'][items_key])
+    return stats
+
+
+@dataclass
+class Regression:
+    name: str
+    metric: str
+    baseline: float
+    actual: float
+
+    def __str__(self):
+        return f'{self.name}: {self.metric} {self.baseline:.1f} -> {self.actual:.1f} мс (x{self.actual / max(self.baseline, 0.01):.2f})'
+
+
+class BenchmarkReport:
+    """
+    Результаты набора сценариев: JSON для машинной обработки, текстовая таблица для консоли и Allure,
+    сравнение с сохранённым baseline (файл того же формата).
+    """
+
+    def __init__(self, suite: str, stand: str = None):
+        self.suite = suite
+        self.stand = stand
+        self.results = []
+
+    def add(self, stats: LatencyStats):
+        self.results.append(stats.summary())
+        return self
+
+    def to_dict(self) -> dict:
+        return {'suite': self.suite, 'stand': self.stand, 'created_at': time.strftime('%Y-%m-%dT%H:%M:%SZ', time.gmtime()),
+                'results': self.results}
+
+    def write(self, path: str):
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        tmp_path = f'{path}.tmp'
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(self.to_dict(), f, ensure_ascii=False, indent=2)
+        os.replace(tmp_path, path)
+
+    def table(self) -> str:
+        width = max((len(r['name']) for r in self.results), default=4)
+        lines = [f"{'case':<{width}}  {'p50':>8}  {'p95':>8}  {'p99':>8}  {'bytes':>9}  {'items':>5}  err"]
+        for r in self.results:
+            lines.append(
+                f"{r['name']:<{width}}  {r['p50_ms']:>8.1f}  {r['p95_ms']:>8.1f}  {r['p99_ms']:>8.1f}  "
+                f"{r['payload_bytes']:>9}  {r['items']:>5}  {r['errors']}"
+            )
+        return '\n'.join(lines)
+
+    def attach(self):
+        allure.attach(self.table(), name=f'{self.suite}: latency (ms)', attachment_type=allure.attachment_type.TEXT)
+        allure.attach(json.dumps(self.to_dict(), ensure_ascii=False, indent=2), name=f'{self.suite}.json',
+                      attachment_type=allure.attachment_type.JSON)
+
+    def compare(self, baseline: dict, tolerance: float = None, slack_ms: float = REGRESSION_SLACK_MS,
+                slack_ratio: float = REGRESSION_SLACK_RATIO) -> list:
+        """
+        Регрессии относительно baseline (сценарии, которых нет в baseline, не сравниваются).
+        tolerance по умолчанию — STAND_TOLERANCE стенда baseline или REGRESSION_TOLERANCE.
+        """
+        if tolerance is None:
+            tolerance = STAND_TOLERANCE.get(baseline.get('stand'), REGRESSION_TOLERANCE)
+        previous = {r['name']: r for r in baseline.get('results', [])}
+        regressions = []
+        for result in self.results:
+            base = previous.get(result['name'])
+            if base is None:
+                continue
+            for metric in GATED_METRICS:
+                slack = min(slack_ms, base[metric] * slack_ratio)
+                limit = max(base[metric] * (1 + tolerance), base[metric] + slack)
+                if result[metric] > limit:
+                    regressions.append(Regression(result['name'], metric, base[metric], result[metric]))
+        return regressions
+
+
+def _proc_status_kb(key: str):
+    try:
+        with open('/proc/self/status', encoding='ascii') as f:
+            for line in f:
+                if line.startswith(f'{key}:'):
+                    return int(line.split()[1])
+    except OSError:
+        pass
+    return None
+
+
+def rss_kb() -> int:
+    """Текущий RSS процесса (КБ); без /proc — пик за всё время жизни процесса."""
+    return _proc_status_kb('VmRSS') or peak_rss_kb()
+
+
+def peak_rss_kb() -> int:
+    """Пиковый RSS процесса (КБ) с последнего reset_peak_rss()."""
+    peak = _proc_status_kb('VmHWM')
+    if peak is not None:
+        return peak
+    maxrss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return maxrss // 1024 if sys.platform == 'darwin' else maxrss
+
+
+def reset_peak_rss() -> bool:
+    """
+    Сбрасывает пик RSS до текущего значения (Linux, /proc/self/clear_refs), чтобы мерить пик отдельной операции.
+    False — сброс недоступен, и peak_rss_kb() отдаёт пик за всё время жизни процесса.
+    """
+    try:
+        with open('/proc/self/clear_refs', 'w', encoding='ascii') as f:
+            f.write('5')
+        return True
+    except OSError:
+        return False
+
+
+def load_baseline(path: str):
+    try:
+        with open(path, encoding='utf-8') as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return None
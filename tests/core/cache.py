@@ -0,0 +1,43 @@
+import threading
+import time
+
+
+class TTLCache:
+    """
+    Потокобезопасный кэш с временем жизни записей и счётчиками попаданий/промахов.
+
+    Значение загружается через loader() при первом обращении к ключу и живёт ttl секунд.
+    Записи можно явно сбросить через invalidate() — например, после изменения структуры борды.
+    """
+
+    def __init__(self, ttl: float = 60):
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self._entries = {}
+        self._lock = threading.Lock()
+
+    def get_or_load(self, key, loader):
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry and entry[0] > now:
+                self.hits += 1
+                return entry[1]
+            self.misses += 1
+
+        value = loader()
+        with self._lock:
+            self._entries[key] = (now + self.ttl, value)
+        return value
+
+    def invalidate(self, predicate=None) -> int:
+        """Удаляет записи, ключи которых удовлетворяют predicate (по умолчанию — все). Возвращает число удалённых."""
+        with self._lock:
+            keys = [key for key in self._entries if predicate is None or predicate(key)]
+            for key in keys:
+                del self._entries[key]
+        return len(keys)
+
+    def stats(self) -> dict:
+        return {'hits': self.hits, 'misses': self.misses, 'size': len(self._entries)}
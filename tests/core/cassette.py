@@ -0,0 +1,177 @@
+import hashlib
+import json
+import os
+import re
+import threading
+from datetime import timedelta
+from typing import Optional
+
+import requests
+from requests.structures import CaseInsensitiveDict
+
+RECORD = 'record'
+REPLAY = 'replay'
+
+# Поля, значения которых меняются от прогона к прогону: при сопоставлении запросов они маскируются.
+# Запросы, ставшие одинаковыми после маскирования, воспроизводятся в порядке записи.
+VOLATILE_FIELDS = frozenset({
+    '_id', 'createdAt', 'updatedAt', 'archivedAt', 'completedAt', 'deletedAt', 'dueStart', 'dueEnd',
+    'name', 'title', 'slug', 'description', 'email', 'lastLoadedDate', 'dateRangeStart', 'dateRangeEnd',
+})
+# Заголовки, участвующие в сопоставлении (токен учитывается отдельно — через роль, а не значение)
+MATCH_HEADERS = ('Content-Type', 'Current-Space-Id')
+MASK = '<masked>'
+ISO_DATETIME = re.compile(r'^\d{4}-\d{2}-\d{2}T\d{2}:\d{2}')
+# Из заголовков ответа сохраняем только нужные для разбора тела
+KEPT_RESPONSE_HEADERS = ('Content-Type',)
+
+
+class CassetteMiss(LookupError):
+    """В режиме воспроизведения для запроса нет записи."""
+
+
+def normalize_body(body, volatile=VOLATILE_FIELDS):
+    """Тело запроса для сопоставления: значения volatile-полей и дат заменены на MASK."""
+    if isinstance(body, dict):
+        return {key: MASK if key in volatile else normalize_body(value, volatile) for key, value in body.items()}
+    if isinstance(body, list):
+        return [normalize_body(value, volatile) for value in body]
+    if isinstance(body, str) and ISO_DATETIME.match(body):
+        return MASK
+    return body
+
+
+def _token_from(call) -> Optional[str]:
+    auth = call.headers.get('Authorization', '')
+    if auth.startswith('Bearer '):
+        return auth[len('Bearer '):]
+    return None
+
+
+def _cookie_token(call) -> Optional[str]:
+    cookie = call.headers.get('Cookie', '')
+    match = re.search(r'(?:^|;\s*)_t=([^;]*)', cookie)
+    return match.group(1) if match else None
+
+
+class Cassette:
+    """
+    Запись/воспроизведение HTTP-взаимодействий APIClient (обработчик для client.add_middleware).
+
+    Формат на диске — два файла:
+      <path>          — по одной записи на строку (компактный JSON): ключ, scope, path, статус, заголовки, тело ответа;
+      <path>.idx.json — индекс {ключ: [смещения строк]}, отдельно для ключей со scope (id теста) и без.
+    При воспроизведении в память загружается только индекс; запись читается по смещению (seek),
+    поэтому поиск не зависит от размера кассеты. Ключ — хэш path, роли (по токену), MATCH_HEADERS
+    и нормализованного тела. Сначала ищется запись того же теста, затем — любая с тем же ключом.
+    """
+
+    def __init__(self, path: str, mode: str, identify=None, volatile=VOLATILE_FIELDS):
+        if mode not in (RECORD, REPLAY):
+            raise ValueError(f'Неизвестный режим кассеты: {mode}')
+        self.path = path
+        self.mode = mode
+        self.identify = identify or (lambda token: None)
+        self.volatile = volatile
+        self.scope = ''
+        self.hits = 0
+        self.recorded = 0
+        self._lock = threading.Lock()
+        self._cursors = {}
+
+        if mode == RECORD:
+            os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+            self._file = open(path, 'wb')
+            self._index = {'scoped': {}, 'any': {}}
+        else:
+            with open(f'{path}.idx.json', encoding='utf-8') as f:
+                self._index = json.load(f)
+            self._file = open(path, 'rb')
+
+    def _identity(self, call) -> list:
+        identities = []
+        for token in (_token_from(call), _cookie_token(call)):
+            if token is None:
+                identities.append(None)
+            else:
+                identities.append(self.identify(token) or 'unknown')
+        return identities
+
+    def key(self, call) -> str:
+        material = [
+            call.path,
+            self._identity(call),
+            [call.headers.get(name) for name in MATCH_HEADERS],
+            normalize_body(call.json, self.volatile),
+        ]
+        raw = json.dumps(material, sort_keys=True, ensure_ascii=False, separators=(',', ':'))
+        return hashlib.sha1(raw.encode('utf-8')).hexdigest()[:20]
+
+    def __call__(self, call, send):
+        if self.mode == RECORD:
+            response = send(call)
+            self._record(call, response)
+            return response
+        return self._replay(call)
+
+    def _record(self, call, response):
+        entry = {
+            'k': self.key(call),
+            's': self.scope,
+            'p': call.path,
+            'st': response.status_code,
+            'h': {name: response.headers[name] for name in KEPT_RESPONSE_HEADERS if name in response.headers},
+            'b': response.text,
+        }
+        line = json.dumps(entry, ensure_ascii=False, separators=(',', ':')).encode('utf-8') + b'\n'
+        with self._lock:
+            offset = self._file.tell()
+            self._file.write(line)
+            self._index['scoped'].setdefault(f"{self.scope}|{entry['k']}", []).append(offset)
+            self._index['any'].setdefault(entry['k'], []).append(offset)
+            self.recorded += 1
+
+    def _next_offset(self, index_key: str, offsets: list) -> int:
+        # Одинаковые запросы отдаются в порядке записи; после последней записи повторяется последняя
+        position = self._cursors.get(index_key, 0)
+        self._cursors[index_key] = position + 1
+        return offsets[min(position, len(offsets) - 1)]
+
+    def _replay(self, call) -> requests.Response:
+        key = self.key(call)
+        scoped_key = f'{self.scope}|{key}'
+        with self._lock:
+            if scoped_key in self._index['scoped']:
+                offset = self._next_offset(scoped_key, self._index['scoped'][scoped_key])
+            elif key in self._index['any']:
+                offset = self._next_offset(key, self._index['any'][key])
+            else:
+                raise CassetteMiss(f'Нет записи для {call.path} (ключ {key}, тест {self.scope or "-"}) в {self.path}')
+            self._file.seek(offset)
+            entry = json.loads(self._file.readline())
+            self.hits += 1
+        return self._build_response(call, entry)
+
+    @staticmethod
+    def _build_response(call, entry) -> requests.Response:
+        response = requests.Response()
+        response.status_code = entry['st']
+        response.headers = CaseInsensitiveDict(entry['h'])
+        response._content = entry['b'].encode('utf-8')
+        response.encoding = 'utf-8'
+        response.url = call.url
+        response.elapsed = timedelta(0)
+        return response
+
+    def close(self):
+        """Закрывает файл; в режиме записи сохраняет индекс (атомарно, через временный файл)."""
+        with self._lock:
+            self._file.close()
+            if self.mode == RECORD:
+                tmp_path = f'{self.path}.idx.json.tmp'
+                with open(tmp_path, 'w', encoding='utf-8') as f:
+                    json.dump(self._index, f, separators=(',', ':'))
+                os.replace(tmp_path, f'{self.path}.idx.json')
+
+    def stats(self) -> dict:
+        return {'mode': self.mode, 'recorded': self.recorded, 'replayed': self.hits}
@@ -0,0 +1,131 @@
+import time
+from typing import Callable, Optional
+
+from pymongo.errors import ConnectionFailure, PyMongoError
+
+from tests.core.persisted import object_id, plain
+from core.waiters import WAIT_STATS, budgeted, caller_site, wait_until
+
+# Сколько change stream ждёт следующее изменение на сервере за один try_next() (мс)
+STREAM_AWAIT_MS = 200
+# Операции, после которых документ может начать подходить под условие
+WATCHED_OPERATIONS = ('insert', 'update', 'replace')
+# Какую долю таймаута хелперы отдают ожиданию по change stream: остаток остаётся на проверку через API,
+# даже если база так и не дала сигнал (другое имя поля, другая форма документа)
+STREAM_TIMEOUT_SHARE = 0.5
+
+
+def _mongo_query(query: dict) -> dict:
+    """Строковые id в запросе -> ObjectId (в том числе внутри $in)."""
+    converted = {}
+    for field, condition in query.items():
+        if isinstance(condition, dict) and '$in' in condition:
+            condition = {**condition, '$in': [object_id(value) for value in condition['$in']]}
+        converted[field] = object_id(condition)
+    return converted
+
+
+class ChangeStreamWaiter:
+    """
+    Ожидание побочных эффектов (история, каскадное удаление, конвертация) по change stream MongoDB.
+
+    wait_for подписывается на изменения коллекции и только потом проверяет текущее состояние, поэтому
+    документ, появившийся между проверкой и подпиской, не теряется; дальше ожидание завершается на первом
+    подходящем изменении, без интервала поллинга. Если change stream недоступен (одиночный mongod без
+    replica set), база опрашивается через wait_until; без базы (db=None или база недоступна) — опрашивается API
+    функцией fallback.
+    Время ожидания попадает в WAIT_STATS по месту вызова, как у wait_until.
+    """
+
+    def __init__(self, db=None, await_ms: int = STREAM_AWAIT_MS):
+        self.db = db
+        self.await_ms = await_ms
+        self.streams = 0
+        self.fallbacks = 0
+
+    @property
+    def available(self) -> bool:
+        return self.db is not None
+
+    def wait_for(self, collection: str, query: dict, predicate: Callable[[dict], bool] = None, timeout: float = 20,
+                 fallback: Callable = None, poll_interval: float = None, call_site: str = None):
+        """
+        Ждёт документ collection, подходящий под query (равенство полей и $in) и predicate(документ).
+        Возвращает документ в виде ответа API (см. persisted.plain), без базы — результат fallback();
+        по таймауту — TimeoutError. Если база перестала отвечать (при подписке, в find или посреди change stream),
+        ожидание продолжается через fallback, а без него — сразу TimeoutError: вызывающий, как после таймаута,
+        проверяет состояние через API сам (так делают assert_history_event_exists и wait_group_empty).
+        poll_interval — интервал для поллинга (None — backoff wait_until).
+        """
+        site = call_site or caller_site()
+        if self.db is not None:
+            start = time.monotonic()
+            try:
+                return self._wait_db(collection, _mongo_query(query), predicate, timeout, poll_interval, site)
+            except ConnectionFailure as error:
+                # База перестала отвечать (при подписке или посреди ожидания): до конца сессии ждём через API;
+                # без fallback API опрашивает вызывающий
+                self.db = None
+                if fallback is None:
+                    raise TimeoutError(f"{collection}: MongoDB недоступна ({error.__class__.__name__})") from error
+                timeout = max(0.0, timeout - (time.monotonic() - start))
+        assert fallback is not None, f"{collection}: MongoDB не настроена, для ожидания через API нужен fallback"
+        return wait_until(fallback, timeout=timeout, poll_interval=poll_interval, call_site=site)
+
+    def _wait_db(self, collection: str, query: dict, predicate, timeout: float, poll_interval: float, site: str):
+        pipeline = [{'$match': {'operationType': {'$in': list(WATCHED_OPERATIONS)},
+                                **{f'fullDocument.{field}': value for field, value in query.items()}}}]
+        try:
+            stream = self.db[collection].watch(pipeline, full_document='updateLookup', max_await_time_ms=self.await_ms)
+        except ConnectionFailure:
+            raise
+        except PyMongoError:
+            self.fallbacks += 1
+            return wait_until(lambda: self._find(collection, query, predicate), timeout=timeout,
+                              poll_interval=poll_interval, call_site=site)
+        self.streams += 1
+        with stream:
+            return self._wait_stream(stream, collection, query, predicate, timeout, site)
+
+    def _find(self, collection: str, query: dict, predicate) -> Optional[dict]:
+        for document in self.db[collection].find(query):
+            document = plain(document)
+            if predicate is None or predicate(document):
+                return document
+        return None
+
+    def _wait_stream(self, stream, collection: str, query: dict, predicate, timeout: float, site: str) -> dict:
+        timeout = budgeted(timeout)
+        stats = WAIT_STATS[site]
+        stats['calls'] += 1
+        start = time.monotonic()
+        try:
+            stats['attempts'] += 1
+            found = self._find(collection, query, predicate)
+            while found is None and time.monotonic() - start < timeout:
+                change = stream.try_next()
+                if change is None or change.get('fullDocument') is None:
+                    continue
+                stats['attempts'] += 1
+                document = plain(change['fullDocument'])
+                if predicate is None or predicate(document):
+                    found = document
+        finally:
+            stats['waited'] += time.monotonic() - start
+        if found is None:
+            stats['timeouts'] += 1
+            raise TimeoutError(f"{collection}: за {timeout} секунд не появился документ {plain(query)}")
+        return found
+
+
+_waiter = ChangeStreamWaiter()
+
+
+def set_change_waiter(waiter: ChangeStreamWaiter):
+    """Ожидатель для хелперов (history_utils, task_service.utils); ставится фикстурой conftest на сессию."""
+    global _waiter
+    _waiter = waiter
+
+
+def get_change_waiter() -> ChangeStreamWaiter:
+    return _waiter
@@ -1,5 +1,47 @@
+from dataclasses import dataclass, field
+from typing import Any
+
 import requests
 
+# Обработчики запросов APIClient (запись/воспроизведение, профилирование): handler(call, send) -> Response,
+# где send(call) передаёт запрос следующему обработчику, а последний — в сеть
+_middlewares = []
+
+
+@dataclass
+class PostCall:
+    """Запрос APIClient.post в том виде, в каком он уходит в requests.Session.post."""
+
+    session: requests.Session
+    path: str
+    url: str
+    json: Any = None
+    headers: dict = field(default_factory=dict)
+    kwargs: dict = field(default_factory=dict)
+
+
+def add_middleware(handler):
+    _middlewares.append(handler)
+
+
+def remove_middleware(handler):
+    if handler in _middlewares:
+        _middlewares.remove(handler)
+
+
+def send(call: PostCall) -> requests.Response:
+    """Проводит запрос через зарегистрированные обработчики и отправляет его."""
+    handlers = list(_middlewares)
+
+    def _next(index):
+        def _send(c):
+            if index < len(handlers):
+                return handlers[index](c, _next(index + 1))
+            return c.session.post(c.url, json=c.json, headers=c.headers, **c.kwargs)
+        return _send
+
+    return _next(0)(call)
+
 
 class APIClient:
     def __init__(self, base_url: str, token: str = None):
@@ -18,4 +60,4 @@ class APIClient:
         final_headers = self.session.headers.copy()
         if headers:
             final_headers.update(headers)
-        return self.session.post(url, json=json, headers=final_headers, **kwargs)
+        return send(PostCall(self.session, path, url, json, final_headers, kwargs))
@@ -0,0 +1,227 @@
+import heapq
+import json
+import os
+import statistics
+import time
+import uuid
+
+import pytest
+
+from tests.core.auth import _file_lock
+from tests.core.scheduling import GROUP_PREFIX
+
+STORE_VERSION = 1
+# Вес последнего прогона в скользящем среднем: старые замеры затухают, разовый выброс не перекраивает шарды
+EWMA_ALPHA = 0.3
+# Записи тестов и фикстур, которых не было столько прогонов подряд (удалены, переименованы), выбрасываются
+STALE_RUNS = 100
+# Ожидаемая длительность теста без истории, если истории нет совсем (с)
+DEFAULT_DURATION = 1.0
+PHASES = ('setup', 'call', 'teardown')
+
+
+def strip_group(nodeid: str) -> str:
+    """nodeid без суффикса @<xdist_group>, который xdist дописывает на воркерах с --dist loadgroup."""
+    base, sep, group = nodeid.rpartition('@')
+    return base if sep and group.startswith(f'{GROUP_PREFIX}:') else nodeid
+
+
+def _ewma(previous, value: float) -> float:
+    if previous is None:
+        return round(value, 4)
+    return round(previous + EWMA_ALPHA * (value - previous), 4)
+
+
+class DurationStore:
+    """
+    История длительностей тестов и фикстур: одна запись на тест, а не на прогон, поэтому размер не растёт
+    с числом прогонов (тысячи тестов — сотни килобайт JSON, загрузка — миллисекунды).
+
+    Формат файла:
+        {"version": 1, "runs": 137, "run_uid": "...",
+         "tests": {"<файл>": {"<имя теста>": [прогонов, последний прогон, setup, call, teardown]}},
+         "fixtures": {"<фикстура>": [прогонов, последний прогон, setup, teardown]}}
+    Длительности — скользящее среднее (EWMA_ALPHA) в секундах; nodeid разбит на файл и имя, чтобы путь
+    к файлу не повторялся в каждой записи.
+    """
+
+    def __init__(self, data: dict = None):
+        data = data if data and data.get('version') == STORE_VERSION else {}
+        self.runs = data.get('runs', 0)
+        self.run_uid = data.get('run_uid')
+        self.tests = data.get('tests', {})
+        self.fixtures = data.get('fixtures', {})
+
+    @classmethod
+    def load(cls, path: str) -> 'DurationStore':
+        try:
+            with open(path, encoding='utf-8') as f:
+                return cls(json.load(f))
+        except (FileNotFoundError, json.JSONDecodeError):
+            return cls()
+
+    def to_dict(self) -> dict:
+        return {'version': STORE_VERSION, 'runs': self.runs, 'run_uid': self.run_uid,
+                'tests': self.tests, 'fixtures': self.fixtures}
+
+    def write(self, path: str):
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        tmp_path = f'{path}.tmp'
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(self.to_dict(), f, ensure_ascii=False, separators=(',', ':'))
+        os.replace(tmp_path, path)
+
+    def expected(self, nodeid: str):
+        """Ожидаемая длительность теста (setup + call + teardown) или None, если истории нет."""
+        path, _, name = nodeid.partition('::')
+        entry = self.tests.get(path, {}).get(name)
+        return None if entry is None else sum(entry[2:])
+
+    def merge(self, tests: dict, fixtures: dict, run_uid: str):
+        """
+        Добавляет замеры прогона: tests — {nodeid: {фаза: секунды}}, fixtures — {фикстура: [setup, teardown]}.
+        Процессы одного прогона (xdist-воркеры) передают общий run_uid — прогон считается один раз.
+        """
+        if run_uid != self.run_uid:
+            self.runs += 1
+            self.run_uid = run_uid
+        for nodeid, phases in tests.items():
+            path, _, name = nodeid.partition('::')
+            entry = self.tests.setdefault(path, {}).get(name) or [0, 0, None, None, None]
+            self.tests[path][name] = [entry[0] + 1, self.runs] + [
+                _ewma(entry[2 + i], phases.get(phase, 0.0)) for i, phase in enumerate(PHASES)
+            ]
+        for name, (setup, teardown) in fixtures.items():
+            entry = self.fixtures.get(name) or [0, 0, None, None]
+            self.fixtures[name] = [entry[0] + 1, self.runs, _ewma(entry[2], setup),
+                                   _ewma(entry[3], teardown) if teardown is not None else entry[3]]
+        self._prune()
+
+    def _prune(self):
+        oldest = self.runs - STALE_RUNS
+        for path in list(self.tests):
+            names = self.tests[path]
+            for name in [name for name, entry in names.items() if entry[1] <= oldest]:
+                del names[name]
+            if not names:
+                del self.tests[path]
+        for name in [name for name, entry in self.fixtures.items() if entry[1] <= oldest]:
+            del self.fixtures[name]
+
+    def slowest_fixtures(self, top: int = 10) -> list:
+        """[(фикстура, setup, teardown)] по убыванию setup + teardown."""
+        rows = [(name, entry[2], entry[3] or 0.0) for name, entry in self.fixtures.items()]
+        return sorted(rows, key=lambda row: row[1] + row[2], reverse=True)[:top]
+
+
+def balance_shards(units: dict, num_shards: int) -> list:
+    """
+    Раскладывает единицы {ключ: длительность} по num_shards шардам с минимальным самым долгим шардом
+    (жадно, от самых долгих: каждая единица — в наименее загруженный шард). Результат детерминирован,
+    поэтому каждый CI-раннер независимо получает то же разбиение. Возвращает [(сумма, [ключи])] по шардам.
+    """
+    shards = [(0.0, index, []) for index in range(num_shards)]
+    for key, duration in sorted(units.items(), key=lambda unit: (-unit[1], unit[0])):
+        total, index, keys = heapq.heappop(shards)
+        keys.append(key)
+        heapq.heappush(shards, (total + duration, index, keys))
+    return [(total, keys) for total, _, keys in sorted(shards, key=lambda shard: shard[1])]
+
+
+class DurationsPlugin:
+    """
+    Пишет длительности фаз тестов и setup/teardown фикстур в DurationStore, делит тесты на шарды по истории
+    (--shard-id/--num-shards) и с --slowest-first запускает самые долгие тесты шарда первыми.
+
+    Тесты одной xdist_group (общий изменяемый ресурс, см. scheduling.py) попадают в один шард целиком.
+    Тестам без истории приписывается медиана известных. Под xdist замеры пишет каждый воркер
+    (под межпроцессной блокировкой), контроллер тесты не выполняет и ничего не пишет.
+    """
+
+    def __init__(self, path: str, shard_id: int = None, num_shards: int = None, slowest_first: bool = False):
+        self.path = path
+        self.shard_id = shard_id
+        self.num_shards = num_shards
+        self.slowest_first = slowest_first
+        self.store = DurationStore.load(path)
+        self.tests = {}
+        self.fixtures = {}
+        self.shard_summary = None
+        self._teardown_started = {}
+
+    @pytest.hookimpl(trylast=True)
+    def pytest_collection_modifyitems(self, config, items):
+        expected = {item: self.store.expected(strip_group(item.nodeid)) for item in items}
+        known = [duration for duration in expected.values() if duration is not None]
+        fallback = statistics.median(known) if known else DEFAULT_DURATION
+        expected = {item: fallback if duration is None else duration for item, duration in expected.items()}
+
+        if self.num_shards and self.num_shards > 1:
+            units = {}
+            for item in items:
+                marker = item.get_closest_marker('xdist_group')
+                units.setdefault(f'group:{marker.args[0]}' if marker else strip_group(item.nodeid), []).append(item)
+            shards = balance_shards({key: sum(expected[i] for i in unit) for key, unit in units.items()},
+                                    self.num_shards)
+            total, keys = shards[self.shard_id]
+            selected = {item for key in keys for item in units[key]}
+            config.hook.pytest_deselected(items=[item for item in items if item not in selected])
+            items[:] = [item for item in items if item in selected]
+            self.shard_summary = (f'шард {self.shard_id + 1}/{self.num_shards}: {len(items)} тестов, '
+                                  f'ожидается {total:.0f} с (шарды: {", ".join(f"{t:.0f}" for t, _ in shards)} с; '
+                                  f'без истории: {len(expected) - len(known)})')
+
+        if self.slowest_first:
+            items.sort(key=lambda item: -expected[item])
+
+    @pytest.hookimpl(hookwrapper=True)
+    def pytest_fixture_setup(self, fixturedef, request):
+        start = time.perf_counter()
+        outcome = yield
+        if outcome.excinfo is None:
+            self._add_fixture(fixturedef.argname, 0, time.perf_counter() - start)
+            # Финализаторы выполняются в обратном порядке: этот сработает перед teardown самой фикстуры
+            key = id(fixturedef)
+            fixturedef.addfinalizer(lambda: self._teardown_started.__setitem__(key, time.perf_counter()))
+
+    def pytest_fixture_post_finalizer(self, fixturedef, request):
+        start = self._teardown_started.pop(id(fixturedef), None)
+        if start is not None:
+            self._add_fixture(fixturedef.argname, 1, time.perf_counter() - start)
+
+    def _add_fixture(self, name: str, phase: int, seconds: float):
+        # Фикстура за прогон может подниматься много раз (function scope) — копится среднее за прогон
+        totals = self.fixtures.setdefault(name, [0.0, 0.0, 0, 0])
+        totals[phase] += seconds
+        totals[2 + phase] += 1
+
+    def pytest_runtest_logreport(self, report):
+        self.tests.setdefault(strip_group(report.nodeid), {})[report.when] = report.duration
+
+    def pytest_sessionfinish(self, session):
+        config = session.config
+        if config.pluginmanager.hasplugin('dsession'):
+            return
+        # Тесты, пропущенные на setup, не дают представления о длительности
+        tests = {nodeid: phases for nodeid, phases in self.tests.items() if 'call' in phases}
+        if not tests and not self.fixtures:
+            return
+        fixtures = {
+            name: (setup / setups, teardown / teardowns if teardowns else None)
+            for name, (setup, teardown, setups, teardowns) in self.fixtures.items() if setups
+        }
+        workerinput = getattr(config, 'workerinput', None)
+        run_uid = workerinput['testrunuid'] if workerinput else uuid.uuid4().hex
+        with _file_lock(f'{self.path}.lock'):
+            store = DurationStore.load(self.path)
+            store.merge(tests, fixtures, run_uid)
+            store.write(self.path)
+        self.store = store
+
+    def report(self) -> list:
+        lines = [self.shard_summary] if self.shard_summary else []
+        slowest = self.store.slowest_fixtures(top=5)
+        if slowest:
+            lines.append('Самые долгие фикстуры (setup/teardown, с): ' +
+                         ', '.join(f'{name} {setup:.2f}/{teardown:.2f}' for name, setup, teardown in slowest))
+        return lines
@@ -0,0 +1,1655 @@
+import copy
+import itertools
+import json
+import re
+import threading
+import uuid
+from collections import defaultdict, deque
+from datetime import datetime, timedelta, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from tests.core.html_sanitizer import sanitize
+from tests.core.multipart import MultipartStream, UploadedFile, parse_multipart
+from tests.core.persisted import get_path, plain, project
+
+# Фиксированные id и учётки стенда 'fake': подставляются в окружение до чтения settings (см. config/settings.py)
+FAKE_PASSWORD = 'fake-password'
+FAKE_ENV = {
+    'URL': 'http://127.0.0.1/',
+    'PASSWORD': FAKE_PASSWORD,
+    'MAIN_SPACE_ID': '5a0000000000000000000001',
+    'SECOND_SPACE_ID': '5a0000000000000000000002',
+    'MAIN_PROJECT_ID': '5b0000000000000000000001',
+    'MAIN_2_PROJECT_ID': '5b0000000000000000000002',
+    'SECOND_PROJECT_ID': '5b0000000000000000000003',
+    'MAIN_BOARD_ID': '5c0000000000000000000001',
+    'BOARD_FOR_TEST': '5c0000000000000000000002',
+    'BOARD_WITH_TASKS': '5c0000000000000000000003',
+    'SECOND_BOARD_ID': '5c0000000000000000000004',
+    'MILESTONE_1_ID': '5d0000000000000000000001',
+    'MILESTONE_2_ID': '5d0000000000000000000002',
+    'MAIN_SPACE_DOC_ID': '5e0000000000000000000001',
+    'MAIN_PROJECT_DOC_ID': '5e0000000000000000000002',
+    'MAIN_PERSONAL_DOC_ID': '5e0000000000000000000003',
+    'MAIN_CLIENT': 'main@fake.vaiz',
+    'SECOND_MAIN_CLIENT': 'second_main@fake.vaiz',
+    'OWNER_EMAIL': 'owner@fake.vaiz',
+    'MANAGER_EMAIL': 'manager@fake.vaiz',
+    'MEMBER_EMAIL': 'member@fake.vaiz',
+    'GUEST_EMAIL': 'guest@fake.vaiz',
+    'SPACE_CLIENT': 'space_client@fake.vaiz',
+    'PROJECT_CLIENT': 'project_client@fake.vaiz',
+    'FOREIGN_CLIENT': 'foreign_client@fake.vaiz',
+}
+# Сколько задач создаётся на борде BOARD_WITH_TASKS (на стенде — 10.000)
+SEED_BOARD_TASKS = 10_000
+
+# Типы задач сидовых борд: тесты смены типа выбирают тип, отличный от текущего
+SEED_BOARD_TYPES = ({'label': 'Bug', 'icon': 'Bug', 'color': 'red'},
+                    {'label': 'Feature', 'icon': 'Star', 'color': 'blue'},
+                    {'label': 'Task', 'icon': 'Task', 'color': 'gray'})
+
+# Кастомные поля BOARD_FOR_TEST и задачи с id стенда: тесты edit_task_custom_field ссылаются на них напрямую
+SEED_CUSTOM_FIELDS_TASK_ID = '696a1a04c7fd1dbba471efc2'
+SEED_RELATED_TASK_IDS = ('6971d6992452157dfd8076d4',)
+SEED_OTHER_PROJECT_TASK_IDS = ('690af8691a593d8d7c4a8688', '690af86b1a593d8d7c4a86e9', '690af86d1a593d8d7c4a8740')
+SEED_BOARD_CUSTOM_FIELDS = (
+    {'_id': '696a1a0ac7fd1dbba471f014', 'name': 'Text', 'type': 'Text', 'value': 'Initial text'},
+    {'_id': '696a1a10c7fd1dbba471f031', 'name': 'Number', 'type': 'Number', 'value': '1'},
+    {'_id': '696a1a13c7fd1dbba471f050', 'name': 'Date', 'type': 'Date', 'value': [None, None]},
+    {'_id': '696e02dd2452157dfd7e2552', 'name': 'Boolean', 'type': 'Boolean', 'value': False},
+    {'_id': '696e02e02452157dfd7e2577', 'name': 'Member', 'type': 'Member', 'value': []},
+    {'_id': '696e02e42452157dfd7e25cd', 'name': 'Linked Tasks', 'type': 'TaskRelations', 'value': []},
+    {'_id': '696e02e62452157dfd7e2608', 'name': 'Select', 'type': 'Select', 'value': [],
+     'options': [{'_id': '764f797a466d5f6942715343', 'title': 'Option 1', 'color': 'red'},
+                 {'_id': '6d7142524f49337a78456775', 'title': 'Option 2', 'color': 'blue'}]},
+    {'_id': '696e02e92452157dfd7e2631', 'name': 'Url', 'type': 'Url', 'value': ''},
+    {'_id': '696e02ec2452157dfd7e2681', 'name': 'Estimation', 'type': 'Estimation', 'value': ''},
+)
+
+# Майлстоуны MAIN_BOARD_ID, которые тесты ищут по имени
+SEED_MAIN_BOARD_MILESTONES = ('parent_ms_1', 'parent_ms_2', 'subtask_ms_1', 'subtask_ms_2', 'Milestone total task count')
+
+OWNER, MANAGER, MEMBER, GUEST = 'Owner', 'Manager', 'Member', 'Guest'
+# Роли, которым доступны все проекты и борды спейса
+FULL_ACCESS = (OWNER, MANAGER)
+DEFAULT_GROUPS = ('Backlog', 'Todo', 'In Progress', 'Done')
+DEFAULT_PROJECT_COLOR = 'blue'
+DEFAULT_SPACE_COLOR = {'color': 'blue', 'isDark': False}
+# Тариф нового спейса: лимиты, которые Register отдаёт в space.plan
+FREE_PLAN_LIMITS = {'storage': {'available': 1_000_000_000, 'used': 0}, 'seats': {'available': 10, 'used': 1},
+                    'automation': {'available': 100, 'used': 0, 'resetInterval': 'Month'},
+                    'documentHistory': {'available': 7}}
+# Ограничения форм спейсов, проектов, борд, групп и кастомных полей (как в валидации API)
+PROJECT_SLUG = re.compile(r'^[A-Za-z]{1,8}$')
+MAX_SPACE_NAME_LENGTH = 30
+MAX_PROJECT_NAME_LENGTH = 25
+MAX_BOARD_NAME_LENGTH = 50
+MAX_DESCRIPTION_LENGTH = 1024
+# Валидация формы /register
+EMAIL = re.compile(r'^[^@\s]+@[^@\s]+\.[^@\s]+$')
+MAX_FULL_NAME_LENGTH = 30
+PASSWORD_LENGTH = (6, 64)
+NUMERIC_STRING = re.compile(r'^-?\d+(\.\d+)?$')
+ISO_DURATION = re.compile(r'^P(?!$)(\d+W)?(\d+D)?(T(?=\d)(\d+H)?(\d+M)?(\d+S)?)?$')
+ESTIMATION_FORMAT = ('Expected ISO 8601 Duration format. Examples: "PT5H" (5 hours), "P3D" (3 days), "P2W" (2 weeks), '
+                     '"P2DT3H" (2 days 3 hours)')
+CUSTOM_FIELD_TYPES = ('Text', 'Number', 'Boolean', 'Date', 'Member', 'TaskRelations', 'Select', 'Url', 'Estimation')
+DEFAULT_TASKS_LIMIT = 50
+OBJECT_ID = re.compile(r'^[0-9a-f]{24}$')
+TASK_FIELDS_BY_EDIT = ('name', 'completed', 'priority', 'types', 'assignees', 'dueStart', 'dueEnd', 'coverImage')
+# Сколько задач MultipleEditTasks принимает за один запрос
+MULTIPLE_EDIT_TASKS_LIMIT = 20
+# UploadAvatar: владельцы аватара, лимит размера файла (как на бэкенде, 100 * 1000 * 1000) и форматы по сигнатуре
+AVATAR_KINDS = ('User', 'Space')
+AVATAR_MAX_BYTES = 100 * 1000 * 1000
+IMAGE_SIGNATURES = ((b'\x89PNG\r\n\x1a\n', 'png'), (b'\xff\xd8\xff', 'jpg'), (b'GIF87a', 'gif'), (b'GIF89a', 'gif'))
+
+
+def _iso(moment: datetime) -> str:
+    return moment.astimezone(timezone.utc).isoformat(timespec='milliseconds').replace('+00:00', 'Z')
+
+
+class ApiError(Exception):
+    def __init__(self, status: int, code: str, message: str = '', meta: dict = None, fields: list = None):
+        super().__init__(message or code)
+        self.status = status
+        self.code = code
+        self.meta = meta
+        self.fields = fields
+
+
+def _object_id(value) -> str:
+    """id из тела запроса; не-ObjectId отклоняется валидацией формы, как в API."""
+    if not isinstance(value, str) or not OBJECT_ID.match(value):
+        raise ApiError(400, 'InvalidForm')
+    return value
+
+
+def _invalid_field(name: str, message: str, received, code: str = 'IllegalField', **meta):
+    """Ошибка валидации формы с описанием поля, как у API: error.fields[{name, codes, meta}]."""
+    return ApiError(400, 'InvalidForm', fields=[{'name': name, 'codes': [code],
+                                                  'meta': {'message': message, 'received': received, **meta}}])
+
+
+def _not_found(entity: str):
+    return ApiError(400, f'{entity}NotFound')
+
+
+def _denied(kind: str = None):
+    """403 AccessDenied; kind — сущность, к которой нет доступа (error.meta.kind), если API её сообщает."""
+    return ApiError(403, 'AccessDenied', meta={'kind': kind} if kind else None)
+
+
+class FakeCollection:
+    """
+    Коллекция-заглушка поверх словаря фейка: find/find_one с равенством полей, $in и inclusion-проекцией,
+    watch() — change stream (FakeChangeStream).
+    """
+
+    def __init__(self, db: 'FakeMongo', documents: dict):
+        self.db = db
+        self.documents = documents
+
+    @staticmethod
+    def _matches(document: dict, query: dict) -> bool:
+        for path, condition in plain(query).items():
+            value = get_path(document, path)
+            if isinstance(condition, dict) and '$in' in condition:
+                if value not in condition['$in']:
+                    return False
+            elif value != condition:
+                return False
+        return True
+
+    def find(self, query: dict = None, projection: dict = None) -> list:
+        query = query or {}
+        with self.db.api._lock:
+            self.db.queries += 1
+            ids = query.get('_id', {}).get('$in') if isinstance(query.get('_id'), dict) else [query.get('_id')]
+            candidates = ([self.documents.get(str(i)) for i in ids] if '_id' in query
+                          else list(self.documents.values()))
+            found = [document for document in candidates if document is not None and self._matches(document, query)]
+            fields = [field for field, include in (projection or {}).items() if include]
+            return [copy.deepcopy(project(document, fields) if fields else document) for document in found]
+
+    def find_one(self, query: dict = None, projection: dict = None):
+        return next(iter(self.find(query, projection)), None)
+
+    def watch(self, pipeline: list = None, full_document: str = None, max_await_time_ms: int = 1000):
+        return FakeChangeStream(self, pipeline or [], max_await_time_ms / 1000)
+
+
+class FakeChangeStream:
+    """
+    Change stream заглушки: после каждого запроса к фейку отдаёт документы, подходящие под fullDocument-условия
+    $match, как события update с полным документом (updateLookup). Запросы к фейку — единственный источник записей.
+    """
+
+    def __init__(self, collection: FakeCollection, pipeline: list, timeout: float):
+        match = pipeline[0].get('$match', {}) if pipeline else {}
+        prefix = 'fullDocument.'
+        self.query = {field[len(prefix):]: value for field, value in match.items() if field.startswith(prefix)}
+        self.collection = collection
+        self.timeout = timeout
+        self.version = collection.db.api.requests
+        self._pending = deque()
+
+    def try_next(self):
+        if not self._pending:
+            api = self.collection.db.api
+            with api._changed:
+                if not api._changed.wait_for(lambda: api.requests != self.version, timeout=self.timeout):
+                    return None
+                self.version = api.requests
+                for document in self.collection.find(self.query):
+                    self._pending.append({'operationType': 'update', 'documentKey': {'_id': document['_id']},
+                                          'fullDocument': document})
+        return self._pending.popleft() if self._pending else None
+
+    def close(self):
+        self._pending.clear()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+class FakeMongo:
+    """База-заглушка: коллекции MongoDB по именам поверх хранилища FakeVaizAPI, счётчик запросов."""
+
+    COLLECTIONS = {
+        'users': 'users', 'spaces': 'spaces', 'members': 'members', 'projects': 'projects', 'boards': 'boards',
+        'tasks': 'tasks', 'milestones': 'milestones', 'documents': 'documents', 'comments': 'comments',
+        'histories': 'history_events',
+    }
+
+    def __init__(self, api: 'FakeVaizAPI'):
+        self.api = api
+        self.queries = 0
+
+    def __getitem__(self, name: str) -> FakeCollection:
+        return FakeCollection(self, getattr(self.api, self.COLLECTIONS[name]))
+
+
+class FakeVaizAPI:
+    """
+    In-process фейк Vaiz API с состоянием: спейсы, участники и инвайты, проекты, борды, задачи,
+    майлстоуны, документы, комментарии (с эталонным санитайзером, см. html_sanitizer.py), аватары и история.
+
+    Данные лежат в словарях по _id плюс индексы (задачи борды, документы контейнера, история сущности),
+    поэтому обработка запроса не сканирует всё хранилище. Multipart-тела (UploadAvatar) читаются кусками,
+    от файлов остаются только размер, хэш и сигнатура. Ответы — в формате API:
+    {'payload': ..., 'type': <имя метода>}, ошибки — {'payload': None, 'error': {'code', 'originalType'}, 'type'}.
+    Подключение: как обработчик APIClient (client.add_middleware) — без сети, или как HTTP-сервер (serve()) —
+    для кода, который ходит через requests напрямую (логин, регистрация).
+    Покрыта основная модель с ролевыми проверками и валидацией форм проектов, борд, групп и кастомных полей;
+    неизвестные пути отвечают 404 NotImplemented, а неподдержанные тесты перечислены в fake_stand.py.
+    """
+
+    routes = {}
+
+    def __init__(self, base_url: str = None):
+        self.base_url = base_url
+        self._lock = threading.RLock()
+        # Ожидающие change stream (FakeChangeStream) просыпаются на каждом запросе
+        self._changed = threading.Condition(self._lock)
+        self._ids = itertools.count(1)
+        self._clock = datetime(2025, 1, 1, tzinfo=timezone.utc)
+        self.users = {}
+        self.users_by_email = {}
+        self.tokens = {}
+        self.spaces = {}
+        self.plans = {}
+        self.members = {}
+        self.members_by_space = defaultdict(dict)
+        self.invites = {}
+        self.projects = {}
+        self.projects_by_space = defaultdict(list)
+        self.boards = {}
+        self.boards_by_project = defaultdict(list)
+        self.tasks = {}
+        self.tasks_by_board = defaultdict(list)
+        self.task_counters = defaultdict(int)
+        self.milestones = {}
+        self.milestones_by_board = defaultdict(list)
+        self.documents = {}
+        self.documents_by_container = defaultdict(list)
+        self.documents_by_parent = defaultdict(list)
+        self.history = defaultdict(list)
+        self.history_events = {}
+        # Комментарии: к документу задачи (task['document']) или к документу спейса/проекта
+        self.task_documents = {}
+        self.comments = {}
+        self.comments_by_document = defaultdict(list)
+        self.requests = 0
+        self._server = None
+
+    # --- инфраструктура --------------------------------------------------------------------------
+
+    def new_id(self) -> str:
+        return f'{next(self._ids):024x}'
+
+    def now(self) -> str:
+        # Монотонные метки времени (шаг 1 мс): сортировки и dateRange детерминированы
+        self._clock += timedelta(milliseconds=1)
+        return _iso(self._clock)
+
+    @classmethod
+    def route(cls, path: str):
+        def decorator(handler):
+            cls.routes[path] = handler
+            return handler
+        return decorator
+
+    def handle(self, path: str, body: dict, headers: dict) -> tuple:
+        """Обрабатывает запрос; возвращает (status_code, json_body)."""
+        name = path.rsplit('/', 1)[-1]
+        handler = self.routes.get(f'/{name}')
+        # Тип ответа — имя операции: /register и /login отвечают типами Register и Login
+        method = name[:1].upper() + name[1:]
+        with self._lock:
+            self.requests += 1
+            self._changed.notify_all()
+            if handler is None:
+                return 404, self._error(method, 'NotImplemented')
+            headers = {key.lower(): value for key, value in (headers or {}).items()}
+            try:
+                status, payload = handler(self, _Context(self, headers), body or {})
+            except ApiError as e:
+                return e.status, self._error(method, e.code, e.meta, e.fields)
+        return status, {'payload': payload, 'type': method}
+
+    @staticmethod
+    def _error(method: str, code: str, meta: dict = None, fields: list = None) -> dict:
+        error = {'code': code, 'originalType': method}
+        if meta is not None:
+            error['meta'] = meta
+        if fields is not None:
+            error['fields'] = fields
+        return {'payload': None, 'error': error, 'type': method}
+
+    def __call__(self, call, send):
+        """Обработчик для client.add_middleware: запросы на base_url обслуживаются без сети."""
+        if self.base_url is None or not call.url.startswith(self.base_url):
+            return send(call)
+        import requests
+        from requests.structures import CaseInsensitiveDict
+
+        status, payload = self.handle(call.path, self._body(call), call.headers)
+        response = requests.Response()
+        response.status_code = status
+        response._content = json.dumps(payload).encode('utf-8')
+        response.headers = CaseInsensitiveDict({'Content-Type': 'application/json'})
+        response.encoding = 'utf-8'
+        response.url = call.url
+        response.elapsed = timedelta(0)
+        return response
+
+    @staticmethod
+    def _body(call) -> dict:
+        """
+        Тело запроса: JSON или multipart/form-data. Multipart (data=MultipartStream или поток кусков
+        с заголовком Content-Type, либо data=/files= как у requests) читается кусками, как сервер читает сокет.
+        """
+        data, files = call.kwargs.get('data'), call.kwargs.get('files')
+        if call.json is not None or (data is None and files is None):
+            return call.json
+        if files is not None or isinstance(data, dict):
+            data = MultipartStream(data, files)
+        content_type = data.content_type if isinstance(data, MultipartStream) else call.headers.get('Content-Type')
+        try:
+            return parse_multipart(data, content_type)
+        except ValueError:
+            return {}
+
+    def serve(self, host: str = '127.0.0.1', port: int = 0) -> str:
+        """Запускает HTTP-сервер в фоновом потоке; возвращает его URL (он же base_url, если тот не задан)."""
+        fake = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = 'HTTP/1.1'
+            disable_nagle_algorithm = True
+
+            def do_POST(self):
+                length = int(self.headers.get('Content-Length') or 0)
+                raw = self.rfile.read(length) if length else b''
+                try:
+                    body = json.loads(raw) if raw else {}
+                except ValueError:
+                    body = {}
+                status, payload = fake.handle(self.path, body, dict(self.headers))
+                data = json.dumps(payload).encode()
+                self.send_response(status)
+                self.send_header('Content-Type', 'application/json')
+                self.send_header('Content-Length', str(len(data)))
+                self.end_headers()
+                self.wfile.write(data)
+
+            def log_message(self, *args):
+                pass
+
+        self._server = ThreadingHTTPServer((host, port), Handler)
+        self._server.daemon_threads = True
+        threading.Thread(target=self._server.serve_forever, daemon=True).start()
+        bound_host, bound_port = self._server.server_address
+        url = f'http://{bound_host}:{bound_port}'
+        self.base_url = self.base_url or url
+        return url
+
+    def stop(self):
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+
+    def mongo(self) -> 'FakeMongo':
+        """Хранилище фейка в виде базы MongoDB (для PersistedState и проверок без API)."""
+        return FakeMongo(self)
+
+    # --- модель ----------------------------------------------------------------------------------
+
+    def add_user(self, email: str, password: str, full_name: str = None) -> dict:
+        user = {'_id': self.new_id(), 'email': email, 'password': password, 'fullName': full_name or email}
+        self.users[user['_id']] = user
+        # email на стенде регистронезависим
+        self.users_by_email[email.lower()] = user
+        return user
+
+    def issue_token(self, user: dict) -> str:
+        token = f'fake.{uuid.uuid4().hex}'
+        self.tokens[token] = user['_id']
+        return token
+
+    def add_space(self, creator: dict, name: str, space_id: str = None) -> dict:
+        now = self.now()
+        space = {'_id': space_id or self.new_id(), 'name': name, 'creator': creator['_id'], 'avatar': '',
+                 'avatarMode': 0, 'color': dict(DEFAULT_SPACE_COLOR), 'isForeign': False, 'plan': self.new_id(),
+                 'createdAt': now, 'updatedAt': now}
+        limits = copy.deepcopy(FREE_PLAN_LIMITS)
+        limits['automation']['resetDate'] = now
+        self.plans[space['plan']] = {'_id': space['plan'], 'space': space['_id'], 'predefinedPlan': 'Free',
+                                     'limits': limits, 'features': [], 'isEarlyBird': False,
+                                     'earlyBirdExpiresAt': None, 'planChangedAt': now, 'createdAt': now,
+                                     'updatedAt': now}
+        self.spaces[space['_id']] = space
+        self.add_member(space, creator, OWNER)
+        return space
+
+    def add_member(self, space: dict, user: dict, access: str, status: str = 'Active', full_name: str = None) -> dict:
+        now = self.now()
+        member = {'_id': self.new_id(), 'space': space['_id'], 'user': user['_id'], 'email': user['email'],
+                  'fullName': full_name or user['fullName'], 'spaceAccess': access, 'status': status,
+                  'avatar': None, 'createdAt': now, 'updatedAt': now}
+        self.members[member['_id']] = member
+        self.members_by_space[space['_id']][user['_id']] = member['_id']
+        return member
+
+    def add_project(self, space_id: str, creator: dict, name: str, slug: str, project_id: str = None,
+                    member_ids=None, **fields) -> dict:
+        now = self.now()
+        # slug хранится в верхнем регистре, цвет по умолчанию — как у проекта, созданного без цвета
+        project = {'_id': project_id or self.new_id(), 'space': space_id, 'name': name, 'slug': slug.upper(),
+                   'color': fields.get('color') or DEFAULT_PROJECT_COLOR, 'icon': fields.get('icon'),
+                   'description': fields.get('description'),
+                   'creator': creator['_id'], 'archiver': None, 'archivedAt': None, 'createdAt': now, 'updatedAt': now,
+                   'members': list(member_ids) if member_ids is not None else None}
+        self.projects[project['_id']] = project
+        self.projects_by_space[space_id].append(project['_id'])
+        return project
+
+    def add_board(self, project: dict, creator: dict, name: str, groups=None, types=None, custom_fields=None,
+                  board_id: str = None, member_ids=None) -> dict:
+        now = self.now()
+        groups = [{'_id': self.new_id(), **group} for group in (groups or [{'name': g} for g in DEFAULT_GROUPS])]
+        board = {'_id': board_id or self.new_id(), 'name': name, 'project': project['_id'], 'space': project['space'],
+                 'groups': groups, 'typesList': [{'_id': self.new_id(), **t} for t in (types or [])],
+                 'customFields': [{'_id': self.new_id(), **f} for f in (custom_fields or [])],
+                 'taskOrderByGroups': {group['_id']: [] for group in groups}, 'creator': creator['_id'],
+                 'createdAt': now, 'updatedAt': now,
+                 'members': list(member_ids) if member_ids is not None else None}
+        self.boards[board['_id']] = board
+        self.boards_by_project[project['_id']].append(board['_id'])
+        return board
+
+    def add_task(self, board: dict, member: dict, name: str = 'Untitled task', group: str = None,
+                 index: int = None, **fields) -> dict:
+        project = self.projects[board['project']]
+        self.task_counters[project['_id']] += 1
+        now = self.now()
+        group = group or board['groups'][0]['_id']
+        task = {
+            '_id': self.new_id(), 'name': name, 'group': group, 'board': board['_id'], 'project': project['_id'],
+            'parentTask': None, 'priority': 1, 'completed': False, 'types': [], 'assignees': [], 'milestones': [],
+            'subtasks': [], 'dueStart': None, 'dueEnd': None, 'createdAt': now, 'updatedAt': now,
+            'document': self.new_id(), 'followers': {member['_id']: 'creator'},
+            'hrid': f"{project['slug']}-{self.task_counters[project['_id']]}", 'rightConnectors': [],
+            'leftConnectors': [], 'archiver': None, 'archivedAt': None, 'completedAt': None, 'deleter': None,
+            'deletedAt': None, 'customFields': [], 'creator': member['_id'],
+        }
+        task.update(fields)
+        if task['completed'] and not task['completedAt']:
+            task['completedAt'] = now
+        self.tasks[task['_id']] = task
+        self.tasks_by_board[board['_id']].append(task['_id'])
+        self.task_documents[task['document']] = task['_id']
+        order = board['taskOrderByGroups'].setdefault(group, [])
+        order.insert(len(order) if index is None else index, task['_id'])
+        self.add_history('Task', task['_id'], member, 'TASK_CREATED', {'_id': task['_id'], 'name': name})
+        return task
+
+    def add_document(self, space_id: str, kind: str, kind_id: str, member: dict, title: str = 'Untitled',
+                     parent_id: str = None, index: int = None, document_id: str = None) -> dict:
+        now = self.now()
+        document = {'_id': document_id or self.new_id(), 'title': title, 'icon': None, 'kind': kind,
+                    'kindId': kind_id, 'space': space_id, 'parentDocument': parent_id, 'creator': member['_id'],
+                    'archiver': None, 'archivedAt': None, 'createdAt': now, 'updatedAt': now}
+        self.documents[document['_id']] = document
+        self.documents_by_container[(kind, kind_id)].append(document['_id'])
+        siblings = self.documents_by_parent[(kind, kind_id, parent_id)]
+        siblings.insert(len(siblings) if index is None else index, document['_id'])
+        return document
+
+    def add_milestone(self, board: dict, member: dict, name: str, milestone_id: str = None, **fields) -> dict:
+        now = self.now()
+        milestone = {'_id': milestone_id or self.new_id(), 'name': name, 'board': board['_id'],
+                     'project': board['project'], 'space': board['space'], 'dueStart': fields.get('dueStart'),
+                     'dueEnd': fields.get('dueEnd'), 'description': fields.get('description'), 'tasks': [],
+                     'creator': member['_id'], 'archiver': None, 'archivedAt': None, 'createdAt': now, 'updatedAt': now}
+        self.milestones[milestone['_id']] = milestone
+        self.milestones_by_board[board['_id']].append(milestone['_id'])
+        return milestone
+
+    def add_history(self, kind: str, kind_id: str, member: dict, key: str, data: dict):
+        event = {'_id': self.new_id(), 'creatorId': member['_id'], 'createdAt': self.now(), 'key': key, 'type': 0,
+                 'data': data, f'{kind[0].lower()}{kind[1:]}Id': kind_id}
+        self.history[(kind, kind_id)].append(event)
+        self.history_events[event['_id']] = event
+        return event
+
+    # --- доступ ----------------------------------------------------------------------------------
+
+    def can_see_project(self, member: dict, project: dict) -> bool:
+        return member['spaceAccess'] in FULL_ACCESS or project['members'] is None or member['_id'] in project['members']
+
+    def can_see_board(self, member: dict, board: dict) -> bool:
+        project = self.projects[board['project']]
+        return self.can_see_project(member, project) and (
+            member['spaceAccess'] in FULL_ACCESS or board['members'] is None or member['_id'] in board['members']
+        )
+
+    def can_see_document(self, member: dict, document: dict) -> bool:
+        if document['kind'] == 'Member':
+            return document['kindId'] == member['_id']
+        if document['kind'] == 'Project':
+            return self.can_see_project(member, self.projects[document['kindId']])
+        return True
+
+    # --- сиды ------------------------------------------------------------------------------------
+
+    def seed(self, env: dict = None, board_tasks: int = SEED_BOARD_TASKS):
+        """
+        Создаёт данные, на которые рассчитаны session-фикстуры conftest: пользователей всех ролей,
+        MAIN/SECOND спейсы с участниками (fullName = имя роли), проекты, борды, майлстоуны и документы с id из env.
+        """
+        env = {**FAKE_ENV, **{key: value for key, value in (env or {}).items() if value}}
+        password = env['PASSWORD']
+        emails = {
+            'main': env['MAIN_CLIENT'], 'second_main': env['SECOND_MAIN_CLIENT'], 'owner': env['OWNER_EMAIL'],
+            'manager': env['MANAGER_EMAIL'], 'member': env['MEMBER_EMAIL'], 'guest': env['GUEST_EMAIL'],
+            'space_client': env['SPACE_CLIENT'], 'project_client': env['PROJECT_CLIENT'],
+            'foreign_client': env['FOREIGN_CLIENT'],
+        }
+        users = {role: self.add_user(email, password, role) for role, email in emails.items()}
+        access = {'owner': OWNER, 'manager': MANAGER, 'member': MEMBER, 'guest': GUEST,
+                  'space_client': MEMBER, 'project_client': MEMBER}
+
+        for space_id, project_id, board_ids in (
+            (env['MAIN_SPACE_ID'], env['MAIN_PROJECT_ID'], (env['MAIN_BOARD_ID'], env['BOARD_FOR_TEST'],
+                                                            env['BOARD_WITH_TASKS'])),
+            (env['SECOND_SPACE_ID'], env['SECOND_PROJECT_ID'], (env['SECOND_BOARD_ID'],)),
+        ):
+            space = self.add_space(users['main'], 'Main space', space_id=space_id)
+            members = {'main': self.members[self.members_by_space[space_id][users['main']['_id']]]}
+            for role, level in access.items():
+                members[role] = self.add_member(space, users[role], level)
+            project_members = [m['_id'] for role, m in members.items() if role != 'space_client']
+            board_members = [m['_id'] for role, m in members.items() if role not in ('space_client', 'project_client')]
+            project = self.add_project(space_id, users['main'], 'Main project', 'MAIN', project_id=project_id,
+                                       member_ids=project_members)
+            for board_id in board_ids:
+                self.add_board(project, users['main'], 'Board', board_id=board_id, types=SEED_BOARD_TYPES,
+                               member_ids=board_members)
+            if space_id == env['MAIN_SPACE_ID']:
+                # slug второго проекта — как на стенде (его проверяет test_edit_project_slug_access_by_roles)
+                project_2 = self.add_project(space_id, users['main'], 'Main project 2', 'PNTY',
+                                             project_id=env['MAIN_2_PROJECT_ID'], member_ids=project_members)
+                main_members = members
+
+        board_for_test = self.boards[env['BOARD_FOR_TEST']]
+        self.add_milestone(board_for_test, main_members['main'], 'Milestone 1', milestone_id=env['MILESTONE_1_ID'])
+        self.add_milestone(board_for_test, main_members['main'], 'Milestone 2', milestone_id=env['MILESTONE_2_ID'])
+        for name in SEED_MAIN_BOARD_MILESTONES:
+            self.add_milestone(self.boards[env['MAIN_BOARD_ID']], main_members['main'], name)
+        self._seed_custom_fields(board_for_test, project_2, main_members['main'])
+
+        board = self.boards[env['BOARD_WITH_TASKS']]
+        creators = [main_members[role] for role in ('owner', 'manager', 'member')]
+        for i in range(board_tasks):
+            completed = i % 3 == 0
+            archived_at = self.now() if i % 7 == 0 else None
+            self.add_task(board, creators[i % 3], name=f'Seed task {i}', group=board['groups'][i % 4]['_id'],
+                          priority=i % 4, completed=completed, archivedAt=archived_at,
+                          archiver=creators[0]['_id'] if archived_at else None,
+                          dueStart=self.now() if i % 2 else None)
+
+        main = env['MAIN_SPACE_ID']
+        self.add_document(main, 'Space', main, main_members['main'], 'Main space doc',
+                          document_id=env['MAIN_SPACE_DOC_ID'])
+        self.add_document(main, 'Project', env['MAIN_PROJECT_ID'], main_members['main'], 'Main project doc',
+                          document_id=env['MAIN_PROJECT_DOC_ID'])
+        self.add_document(main, 'Member', main_members['main']['_id'], main_members['main'], 'Main personal doc',
+                          document_id=env['MAIN_PERSONAL_DOC_ID'])
+        return self
+
+    def _seed_custom_fields(self, board: dict, other_project: dict, member: dict):
+        """Кастомные поля борды и задачи с id стенда: целевая задача, связанные задачи и задачи другого проекта."""
+        for field in SEED_BOARD_CUSTOM_FIELDS:
+            board['customFields'].append(copy.deepcopy({key: value for key, value in field.items() if key != 'value'}))
+        values = [{'id': field['_id'], 'value': copy.deepcopy(field['value'])} for field in SEED_BOARD_CUSTOM_FIELDS]
+        self.add_task(board, member, name='Custom fields task', _id=SEED_CUSTOM_FIELDS_TASK_ID, customFields=values)
+        for task_id in SEED_RELATED_TASK_IDS:
+            self.add_task(board, member, name='Related task', _id=task_id)
+        other_board = self.add_board(other_project, self.users[member['user']], 'Board', types=SEED_BOARD_TYPES,
+                                     member_ids=other_project['members'])
+        for task_id in SEED_OTHER_PROJECT_TASK_IDS:
+            self.add_task(other_board, member, name='Other project task', _id=task_id)
+
+
+class _Context:
+    """Контекст запроса: пользователь по токену и его участник в спейсе из Current-Space-Id."""
+
+    def __init__(self, api: FakeVaizAPI, headers: dict):
+        self.api = api
+        self.headers = headers
+        token = None
+        auth = headers.get('authorization', '')
+        if auth.startswith('Bearer '):
+            token = auth[len('Bearer '):].strip()
+        if not token:
+            match = re.search(r'(?:^|;\s*)_t=([^;]*)', headers.get('cookie', ''))
+            token = match.group(1).strip() if match else None
+        self.token = token
+        self.user = api.users.get(api.tokens.get(token)) if token else None
+        self.space_id = headers.get('current-space-id')
+
+    def require_user(self) -> dict:
+        if self.user is None and self.token:
+            # Токен передан, но не выдан фейком: на стенде это ошибка проверки подписи JWT
+            raise ApiError(400, 'InvalidToken', meta={'token': self.token, 'description': 'invalid signature'})
+        if self.user is None:
+            raise ApiError(401, 'Unauthorized')
+        return self.user
+
+    def require_member(self, space_id: str = None) -> dict:
+        user = self.require_user()
+        space_id = _object_id(space_id or self.space_id)
+        if space_id not in self.api.spaces:
+            raise _not_found('Space')
+        member_id = self.api.members_by_space[space_id].get(user['_id'])
+        member = self.api.members.get(member_id)
+        if member is None or member['status'] != 'Active':
+            raise _denied()
+        return member
+
+    def require_space_member(self, space_id: str = None) -> dict:
+        """Для операций над самим спейсом: не-участник получает 400 MemberDidNotFound, а не 403."""
+        space_id = _object_id(space_id or self.space_id)
+        if self.require_user()['_id'] not in self.api.members_by_space.get(space_id, {}):
+            raise ApiError(400, 'MemberDidNotFound')
+        return self.require_member(space_id)
+
+    def require_writer(self) -> dict:
+        member = self.require_member()
+        if member['spaceAccess'] == GUEST:
+            raise _denied()
+        return member
+
+    def require_manager(self) -> dict:
+        """Участник с правом менять структуру спейса: проекты, борды, группы и кастомные поля."""
+        member = self.require_member()
+        if member['spaceAccess'] not in FULL_ACCESS:
+            raise _denied()
+        return member
+
+    def project(self, project_id: str, member: dict) -> dict:
+        project = self.api.projects.get(_object_id(project_id))
+        if project is None or project['space'] != self.space_id:
+            raise _not_found('Project')
+        if not self.api.can_see_project(member, project):
+            raise _denied()
+        return project
+
+    def board(self, board_id: str, member: dict) -> dict:
+        board = self.api.boards.get(_object_id(board_id))
+        if board is None or board['space'] != self.space_id:
+            raise _not_found('Board')
+        if not self.api.can_see_board(member, board):
+            raise _denied()
+        return board
+
+    def task(self, task_id: str, member: dict) -> dict:
+        task = self.api.tasks.get(_object_id(task_id))
+        if task is None or task['deletedAt'] or self.api.boards[task['board']]['space'] != self.space_id:
+            raise _not_found('Task')
+        self.board(task['board'], member)
+        return task
+
+    def document(self, document_id: str, member: dict) -> dict:
+        document = self.api.documents.get(_object_id(document_id))
+        if document is None or document['space'] != self.space_id or document['archivedAt']:
+            raise _not_found('Document')
+        if not self.api.can_see_document(member, document):
+            raise _denied()
+        return document
+
+
+def _public(entity: dict) -> dict:
+    """Копия сущности без служебных полей фейка (списки доступа)."""
+    return {key: value for key, value in entity.items() if key != 'members'}
+
+
+route = FakeVaizAPI.route
+
+
+# --- авторизация и профиль -----------------------------------------------------------------------
+
+@route('/Login')
+@route('/login')
+def _login(api, ctx, body):
+    email = body.get('email')
+    user = api.users_by_email.get(email.lower()) if isinstance(email, str) else None
+    if user is None or user['password'] != body.get('password'):
+        raise ApiError(400, 'InvalidCredentials')
+    return 202, {'token': api.issue_token(user)}
+
+
+def _registration_form(api, body) -> tuple:
+    """Поля /register после валидации: (email, password, fullName); ошибка — InvalidForm с полем, как у API."""
+    email, password, full_name = body.get('email'), body.get('password'), body.get('fullName')
+    if not isinstance(email, str) or not EMAIL.match(email.strip()):
+        raise _invalid_field('email', 'Invalid email', email, code='InvalidEmail')
+    if email.strip().lower() in api.users_by_email:
+        raise _invalid_field('email', 'Email already exists', email, code='EmailAlreadyExists')
+    if not isinstance(password, str) or not PASSWORD_LENGTH[0] <= len(password) <= PASSWORD_LENGTH[1]:
+        raise _invalid_field('password', f'Password length must be between {PASSWORD_LENGTH[0]} and '
+                                         f'{PASSWORD_LENGTH[1]}', None)
+    if not isinstance(full_name, str) or not 0 < len(full_name.strip()) <= MAX_FULL_NAME_LENGTH:
+        raise _invalid_field('fullName', f'Full name length must be between 1 and {MAX_FULL_NAME_LENGTH}', full_name)
+    if body.get('termsAccepted') is not True:
+        raise _invalid_field('termsAccepted', 'Terms must be accepted', body.get('termsAccepted'),
+                             code='TermsNotAccepted')
+    return email.strip(), password, full_name.strip()
+
+
+@route('/register')
+def _register(api, ctx, body):
+    email, password, full_name = _registration_form(api, body)
+    user = api.add_user(email, password, full_name)
+    space = api.add_space(user, f"{full_name}'s Space")
+    # Register, в отличие от GetSpace, разворачивает тариф спейса
+    return 200, {'token': api.issue_token(user), 'space': {**_public(space), 'plan': api.plans[space['plan']]}}
+
+
+@route('/getProfile')
+def _get_profile(api, ctx, body):
+    member = ctx.require_member()
+    user = ctx.user
+    return 200, {'profile': {'_id': user['_id'], 'memberId': member['_id'], 'email': user['email'],
+                             'fullName': member['fullName']}}
+
+
+# --- спейсы и участники --------------------------------------------------------------------------
+
+@route('/CreateSpace')
+def _create_space(api, ctx, body):
+    space = api.add_space(ctx.require_user(), _text(body, 'name', MAX_SPACE_NAME_LENGTH))
+    return 200, {'space': _public(space)}
+
+
+@route('/GetSpace')
+def _get_space(api, ctx, body):
+    ctx.require_space_member(body.get('spaceId'))
+    return 200, {'space': _public(api.spaces[body.get('spaceId') or ctx.space_id])}
+
+
+@route('/GetSpaces')
+def _get_spaces(api, ctx, body):
+    user = ctx.require_user()
+    spaces = []
+    for space_id, space in api.spaces.items():
+        member = api.members.get(api.members_by_space[space_id].get(user['_id']))
+        if member is None:
+            continue
+        entry = _public(space)
+        if member['status'] == 'Invited':
+            entry['inviteCode'] = next(code for code, m in api.invites.items() if m == member['_id'])
+        spaces.append(entry)
+    return 200, {'spaces': spaces}
+
+
+@route('/EditSpace')
+def _edit_space(api, ctx, body):
+    member = ctx.require_space_member()
+    if member['spaceAccess'] not in FULL_ACCESS:
+        raise _denied()
+    space = api.spaces[ctx.space_id]
+    name = _text(body, 'name', MAX_SPACE_NAME_LENGTH, required=False)
+    space.update(name=name or space['name'], updatedAt=api.now())
+    api.add_history('Space', space['_id'], member, 'SPACE_RENAMED', {'name': space['name']})
+    return 200, {'space': _public(space)}
+
+
+@route('/RemoveSpace')
+def _remove_space(api, ctx, body):
+    space_id = body.get('spaceId') or ctx.space_id
+    member = ctx.require_member(space_id)
+    if member['spaceAccess'] != OWNER:
+        raise _denied()
+    del api.spaces[space_id]
+    for member_id in api.members_by_space.pop(space_id, {}).values():
+        api.members.pop(member_id, None)
+    return 200, {'success': True}
+
+
+@route('/GetSpaceMembers')
+def _get_space_members(api, ctx, body):
+    ctx.require_member()
+    members = [api.members[member_id] for member_id in api.members_by_space[ctx.space_id].values()]
+    return 200, {'members': members}
+
+
+@route('/InviteToSpace')
+def _invite_to_space(api, ctx, body):
+    inviter = ctx.require_member()
+    if inviter['spaceAccess'] not in FULL_ACCESS:
+        raise _denied()
+    email = body.get('email')
+    if not isinstance(email, str) or not EMAIL.match(email):
+        raise _invalid_field('email', 'Invalid email', email, code='InvalidEmail')
+    for key in ('projectAccesses', 'boardAccesses'):
+        for access in body.get(key) or []:
+            if not OBJECT_ID.match(str(access.get('id'))) or access.get('access') not in (MANAGER, MEMBER, GUEST):
+                raise _invalid_field(key, 'Expected {id: ObjectId, access: Manager | Member | Guest}', access)
+    user = api.users_by_email.get(email.lower()) or api.add_user(email, None, body.get('fullName'))
+    existing = api.members.get(api.members_by_space[ctx.space_id].get(user['_id']))
+    if existing is not None:
+        raise ApiError(400, 'UserAlreadySpaceMember' if existing['status'] == 'Active' else 'UserAlreadyInvited')
+    member = api.add_member(api.spaces[ctx.space_id], user, body.get('spaceAccess', MEMBER), status='Invited',
+                            full_name=body.get('fullName'))
+    api.invites[uuid.uuid4().hex] = member['_id']
+    return 200, {'member': member}
+
+
+@route('/ConfirmSpaceInvite')
+def _confirm_space_invite(api, ctx, body):
+    member_id = api.invites.pop(body.get('code'), None)
+    member = api.members.get(member_id)
+    if member is None:
+        raise ApiError(400, 'InviteNotFound')
+    profile = body.get('profileFields') or {}
+    member.update(status='Active', fullName=profile.get('fullName') or member['fullName'], updatedAt=api.now())
+    user = api.users[member['user']]
+    if user['password'] is None:
+        user['password'] = profile.get('password')
+    return 200, {'token': api.issue_token(user), 'member': member}
+
+
+# --- проекты и борды -----------------------------------------------------------------------------
+
+def _text(body: dict, key: str, max_length: int, required: bool = True):
+    """Строковое поле формы: обязательное — непустое не из одних пробелов; длиннее max_length — InvalidForm."""
+    value = body.get(key)
+    if value is None and not required:
+        return None
+    if not isinstance(value, str) or len(value) > max_length or required and not value.strip():
+        raise ApiError(400, 'InvalidForm')
+    return value
+
+
+def _project_slug_taken(api, space_id: str, slug: str) -> bool:
+    return any(api.projects[p]['slug'] == slug.upper() for p in api.projects_by_space[space_id])
+
+
+@route('/CreateProject')
+def _create_project(api, ctx, body):
+    member = ctx.require_manager()
+    name = _text(body, 'name', MAX_PROJECT_NAME_LENGTH)
+    description = _text(body, 'description', MAX_DESCRIPTION_LENGTH, required=False)
+    slug = body.get('slug')
+    if not isinstance(slug, str) or not PROJECT_SLUG.match(slug) or _project_slug_taken(api, ctx.space_id, slug):
+        raise ApiError(400, 'InvalidForm')
+    project = api.add_project(ctx.space_id, ctx.user, name, slug, color=body.get('color'), icon=body.get('icon'),
+                              description=description)
+    api.add_history('Project', project['_id'], member, 'PROJECT_CREATED', {'_id': project['_id']})
+    return 200, {'project': _public(project)}
+
+
+@route('/GetProject')
+def _get_project(api, ctx, body):
+    member = ctx.require_member()
+    project = ctx.project(body.get('projectId'), member)
+    if project['archivedAt']:
+        raise ApiError(400, 'ItemInArchive')
+    return 200, {'project': _public(project)}
+
+
+@route('/GetProjects')
+def _get_projects(api, ctx, body):
+    member = ctx.require_member()
+    projects = [api.projects[p] for p in api.projects_by_space[ctx.space_id]]
+    return 200, {'projects': [_public(p) for p in projects if api.can_see_project(member, p)]}
+
+
+@route('/EditProject')
+def _edit_project(api, ctx, body):
+    member = ctx.require_manager()
+    project = ctx.project(body.get('projectId'), member)
+    # slug после создания не меняется (APP-4608): поле принимается и игнорируется
+    changes = {key: body[key] for key in ('name', 'color', 'description', 'icon') if key in body}
+    if 'name' in changes:
+        _text(changes, 'name', MAX_PROJECT_NAME_LENGTH)
+    project.update(changes, updatedAt=api.now())
+    return 200, {'project': _public(project)}
+
+
+@route('/IsProjectSlugUnique')
+def _is_project_slug_unique(api, ctx, body):
+    ctx.require_member()
+    return 200, {'isUnique': not _project_slug_taken(api, ctx.space_id, body.get('slug') or '')}
+
+
+@route('/ArchiveProject')
+def _archive_project(api, ctx, body):
+    member = ctx.require_manager()
+    project = ctx.project(body.get('projectId'), member)
+    project.update(archiver=member['_id'], archivedAt=api.now())
+    return 200, {'project': _public(project)}
+
+
+@route('/UnarchiveProject')
+def _unarchive_project(api, ctx, body):
+    member = ctx.require_manager()
+    project = ctx.project(body.get('projectId'), member)
+    project.update(archiver=None, archivedAt=None)
+    return 200, {'project': _public(project)}
+
+
+@route('/CreateBoard')
+def _create_board(api, ctx, body):
+    member = ctx.require_manager()
+    project = ctx.project(body.get('project'), member)
+    name = _text(body, 'name', MAX_BOARD_NAME_LENGTH)
+    # Списочные поля можно опустить, но явный null — ошибка типа
+    if any(key in body and not isinstance(body[key], list) for key in ('groups', 'typesList', 'customFields')):
+        raise ApiError(400, 'InvalidForm')
+    board = api.add_board(project, ctx.user, name, groups=body.get('groups'), types=body.get('typesList'),
+                          custom_fields=body.get('customFields'))
+    board['description'] = body.get('description')
+    return 200, {'board': _public(board)}
+
+
+@route('/GetBoard')
+def _get_board(api, ctx, body):
+    member = ctx.require_member()
+    return 200, {'board': _public(ctx.board(body.get('boardId'), member))}
+
+
+@route('/GetBoards')
+def _get_boards(api, ctx, body):
+    member = ctx.require_member()
+    boards = [api.boards[b] for p in api.projects_by_space[ctx.space_id] for b in api.boards_by_project[p]]
+    return 200, {'boards': [_public(b) for b in boards if api.can_see_board(member, b)]}
+
+
+@route('/EditBoard')
+def _edit_board(api, ctx, body):
+    member = ctx.require_writer()
+    board = ctx.board(body.get('boardId'), member)
+    board.update(name=body.get('name', board['name']), updatedAt=api.now())
+    return 200, {'board': _public(board)}
+
+
+@route('/DeleteBoard')
+def _delete_board(api, ctx, body):
+    member = ctx.require_writer()
+    board = ctx.board(body.get('boardId'), member)
+    del api.boards[board['_id']]
+    api.boards_by_project[board['project']].remove(board['_id'])
+    return 200, {'success': True}
+
+
+def _board_group_changes(body: dict, create: bool) -> dict:
+    """Поля группы борды из формы; limit API не валидирует (см. board_validation_test)."""
+    changes = {key: body[key] for key in ('name', 'description', 'limit', 'hidden') if key in body}
+    if create or 'name' in changes:
+        _text(body, 'name', MAX_BOARD_NAME_LENGTH)
+    _text(body, 'description', MAX_DESCRIPTION_LENGTH, required=False)
+    return changes
+
+
+@route('/CreateBoardGroup')
+def _create_board_group(api, ctx, body):
+    member = ctx.require_manager()
+    board = ctx.board(body.get('boardId'), member)
+    group = {'_id': api.new_id(), 'description': None, 'limit': None, 'hidden': False,
+             **_board_group_changes(body, create=True)}
+    board['groups'].append(group)
+    board['taskOrderByGroups'][group['_id']] = []
+    board['updatedAt'] = api.now()
+    return 200, {'boardGroups': board['groups']}
+
+
+@route('/EditBoardGroup')
+def _edit_board_group(api, ctx, body):
+    member = ctx.require_manager()
+    board = ctx.board(body.get('boardId'), member)
+    group = next((g for g in board['groups'] if g['_id'] == body.get('boardGroupId')), None)
+    if group is None:
+        raise _not_found('BoardGroup')
+    group.update(_board_group_changes(body, create=False))
+    board['updatedAt'] = api.now()
+    return 200, {'boardGroups': board['groups']}
+
+
+def _board_custom_field(board: dict, field_id) -> dict:
+    field = next((f for f in board['customFields'] if f['_id'] == field_id), None)
+    if field is None:
+        raise _not_found('CustomField')
+    return field
+
+
+@route('/CreateBoardCustomField')
+def _create_board_custom_field(api, ctx, body):
+    member = ctx.require_manager()
+    board = ctx.board(body.get('boardId'), member)
+    if body.get('type') not in CUSTOM_FIELD_TYPES or not isinstance(body.get('name'), str):
+        raise ApiError(400, 'InvalidForm')
+    field = {'_id': api.new_id(), 'name': body['name'], 'type': body['type'], 'hidden': bool(body.get('hidden')),
+             'description': _text(body, 'description', MAX_DESCRIPTION_LENGTH, required=False),
+             'options': list(body.get('options') or [])}
+    board['customFields'].append(field)
+    board['updatedAt'] = api.now()
+    return 200, {'customField': field}
+
+
+@route('/EditBoardCustomField')
+def _edit_board_custom_field(api, ctx, body):
+    member = ctx.require_manager()
+    board = ctx.board(body.get('boardId'), member)
+    field = _board_custom_field(board, body.get('fieldId'))
+    _text(body, 'description', MAX_DESCRIPTION_LENGTH, required=False)
+    field.update({key: body[key] for key in ('name', 'description', 'hidden', 'options') if key in body})
+    board['updatedAt'] = api.now()
+    return 200, {'customField': field}
+
+
+# --- задачи --------------------------------------------------------------------------------------
+
+def _edit_task(api, member, task: dict, changes: dict):
+    """Применяет изменения к задаче и пишет события истории, как это делает API."""
+    events = []
+    if 'name' in changes and changes['name'] != task['name']:
+        events.append(('TASK_RENAMED', {'name': changes['name']}))
+    if 'completed' in changes and changes['completed'] != task['completed']:
+        events.append(('TASK_COMPLETED' if changes['completed'] else 'TASK_UNCOMPLETED', {'_id': task['_id']}))
+        task['completedAt'] = api.now() if changes['completed'] else None
+    if 'priority' in changes and changes['priority'] != task['priority']:
+        events.append(('TASK_PRIORITY_CHANGED', {'taskPriority': changes['priority']}))
+    if 'assignees' in changes:
+        added = [m for m in changes['assignees'] if m not in task['assignees']]
+        removed = [m for m in task['assignees'] if m not in changes['assignees']]
+        if added:
+            events.append(('TASK_ASSIGNED', {'members': added}))
+        if removed:
+            events.append(('TASK_UNASSIGNED', {'members': removed}))
+    if 'types' in changes:
+        for type_id in set(changes['types']) - set(task['types']):
+            events.append(('TASK_TYPE_ADDED', {'_id': type_id}))
+        for type_id in set(task['types']) - set(changes['types']):
+            events.append(('TASK_TYPE_REMOVED', {'_id': type_id}))
+    if 'archivedAt' in changes:
+        task['archiver'] = member['_id'] if changes['archivedAt'] else None
+    if 'milestones' in changes:
+        for milestone_id in changes['milestones']:
+            if milestone_id not in api.milestones:
+                raise _not_found('Milestone')
+        for milestone_id in set(task['milestones']) - set(changes['milestones']):
+            api.milestones[milestone_id]['tasks'].remove(task['_id'])
+            events.append(('TASK_DETACHED_TO_MILESTONE', {'_id': milestone_id}))
+        for milestone_id in set(changes['milestones']) - set(task['milestones']):
+            api.milestones[milestone_id]['tasks'].append(task['_id'])
+            events.append(('TASK_ATTACHED_TO_MILESTONE', {'_id': milestone_id}))
+        task['milestones'] = list(changes['milestones'])
+
+    task.update({key: changes[key] for key in (*TASK_FIELDS_BY_EDIT, 'archivedAt') if key in changes})
+    task['updatedAt'] = api.now()
+    for key, data in events:
+        api.add_history('Task', task['_id'], member, key, data)
+    return task
+
+
+@route('/CreateTask')
+def _create_task(api, ctx, body):
+    member = ctx.require_writer()
+    board = ctx.board(body.get('board'), member)
+    fields = {key: body[key] for key in ('types', 'assignees', 'dueStart', 'dueEnd', 'priority', 'completed',
+                                         'milestones') if key in body}
+    task = api.add_task(board, member, name=body.get('name') or 'Untitled task', group=body.get('group'),
+                        index=body.get('index'), **fields)
+    if body.get('parentTask'):
+        _toggle_subtask(api, ctx, {'taskId': task['_id'], 'parentTaskId': body['parentTask']})
+    for milestone_id in task['milestones']:
+        if milestone_id in api.milestones:
+            api.milestones[milestone_id]['tasks'].append(task['_id'])
+    return 200, {'task': task}
+
+
+@route('/GetTask')
+def _get_task(api, ctx, body):
+    member = ctx.require_member()
+    slug = body.get('slug')
+    task = api.tasks.get(slug) or next((t for t in api.tasks.values() if t['hrid'] == slug), None)
+    if task is None:
+        raise _not_found('Task')
+    return 200, {'task': ctx.task(task['_id'], member)}
+
+
+@route('/GetTasks')
+def _get_tasks(api, ctx, body):
+    member = ctx.require_member()
+    if body.get('board'):
+        task_ids = api.tasks_by_board[ctx.board(body['board'], member)['_id']]
+    elif body.get('ids'):
+        task_ids = body['ids']
+    else:
+        boards = [b for p in api.projects_by_space[ctx.space_id] for b in api.boards_by_project[p]]
+        task_ids = [t for b in boards if api.can_see_board(member, api.boards[b]) for t in api.tasks_by_board[b]]
+
+    ids_filter = set(body['ids']) if body.get('ids') else None
+    filters = {key: body[key] for key in ('project', 'completed', 'creator', 'parentTask', 'archiver') if key in body}
+
+    def matches(task):
+        if task is None or task['deletedAt']:
+            return False
+        if ids_filter is not None and task['_id'] not in ids_filter:
+            return False
+        if body.get('archived'):
+            if not task['archivedAt']:
+                return False
+        elif task['archivedAt'] and not body.get('withArchived'):
+            return False
+        if any(task.get(key) != value for key, value in filters.items()):
+            return False
+        if body.get('milestones') and not set(body['milestones']) & set(task['milestones']):
+            return False
+        if body.get('assignees') and not set(body['assignees']) & set(task['assignees']):
+            return False
+        return True
+
+    tasks = (task for task in (api.tasks.get(t) for t in task_ids) if matches(task))
+    criteria = body.get('sortCriteria')
+    if criteria:
+        # null меньше любого значения, как в MongoDB: в начале при ASC, в конце при DESC
+        tasks = list(tasks)
+        descending = body.get('sortDirection', 1) == -1
+        present = sorted((t for t in tasks if t.get(criteria) is not None), key=lambda t: t[criteria],
+                         reverse=descending)
+        nulls = [t for t in tasks if t.get(criteria) is None]
+        tasks = iter(present + nulls if descending else nulls + present)
+    skip = body.get('skip') or 0
+    limit = body.get('limit') or DEFAULT_TASKS_LIMIT
+    # Без сортировки фильтр проходит только до конца запрошенной страницы
+    return 200, {'tasks': list(itertools.islice(tasks, skip, skip + limit))}
+
+
+@route('/EditTask')
+def _edit_task_route(api, ctx, body):
+    member = ctx.require_writer()
+    task = ctx.task(body.get('taskId'), member)
+    return 200, {'task': _edit_task(api, member, task, body)}
+
+
+@route('/MultipleEditTasks')
+def _multiple_edit_tasks(api, ctx, body):
+    member = ctx.require_writer()
+    if len(body.get('tasks') or []) > MULTIPLE_EDIT_TASKS_LIMIT:
+        raise ApiError(400, 'TooManyTasksSelected')
+    # Ошибка по отдельной задаче не роняет запрос: её id попадает в failed
+    success, failed = [], []
+    for change in body.get('tasks') or []:
+        try:
+            _edit_task(api, member, ctx.task(change.get('taskId'), member), change)
+        except ApiError:
+            failed.append(change.get('taskId'))
+        else:
+            success.append(change['taskId'])
+    return 200, {'success': success, 'failed': failed}
+
+
+@route('/DeleteTask')
+def _delete_task(api, ctx, body):
+    member = ctx.require_writer()
+    task = ctx.task(body.get('taskId'), member)
+    task.update(deleter=member['_id'], deletedAt=api.now())
+    board = api.boards[task['board']]
+    order = board['taskOrderByGroups'].get(task['group'], [])
+    if task['_id'] in order:
+        order.remove(task['_id'])
+    for milestone_id in task['milestones']:
+        milestone = api.milestones.get(milestone_id)
+        if milestone is not None and task['_id'] in milestone['tasks']:
+            milestone['tasks'].remove(task['_id'])
+    api.add_history('Task', task['_id'], member, 'TASK_DELETED', {'_id': task['_id']})
+    return 200, {'task': task}
+
+
+@route('/ArchiveTask')
+def _archive_task(api, ctx, body):
+    member = ctx.require_writer()
+    task = ctx.task(body.get('taskId'), member)
+    return 200, {'task': _edit_task(api, member, task, {'archivedAt': api.now()})}
+
+
+@route('/ToggleSubtask')
+def _toggle_subtask(api, ctx, body):
+    member = ctx.require_writer()
+    task = ctx.task(body.get('taskId'), member)
+    if task['parentTask']:
+        parent = api.tasks[task['parentTask']]
+        parent['subtasks'].remove(task['_id'])
+        api.add_history('Task', task['_id'], member, 'TASK_DETACHED_TO_PARENT', {'_id': parent['_id']})
+        api.add_history('Task', parent['_id'], member, 'TASK_DETACHED_AS_SUBTASK', {'_id': task['_id']})
+        task['parentTask'] = None
+    if body.get('parentTaskId'):
+        parent = ctx.task(body['parentTaskId'], member)
+        parent['subtasks'].append(task['_id'])
+        task['parentTask'] = parent['_id']
+        api.add_history('Task', task['_id'], member, 'TASK_ATTACHED_TO_PARENT', {'_id': parent['_id']})
+        api.add_history('Task', parent['_id'], member, 'TASK_ATTACHED_AS_SUBTASK', {'_id': task['_id']})
+    return 200, {'task': task}
+
+
+@route('/ToggleMilestone')
+def _toggle_milestone(api, ctx, body):
+    member = ctx.require_writer()
+    task = ctx.task(body.get('taskId'), member)
+    wanted = body.get('milestoneIds') or []
+    for milestone_id in set(task['milestones']) - set(wanted):
+        api.milestones[milestone_id]['tasks'].remove(task['_id'])
+        api.add_history('Task', task['_id'], member, 'TASK_DETACHED_TO_MILESTONE', {'_id': milestone_id})
+    for milestone_id in set(wanted) - set(task['milestones']):
+        if milestone_id not in api.milestones:
+            raise _not_found('Milestone')
+        api.milestones[milestone_id]['tasks'].append(task['_id'])
+        api.add_history('Task', task['_id'], member, 'TASK_ATTACHED_TO_MILESTONE', {'_id': milestone_id})
+    task.update(milestones=list(wanted), updatedAt=api.now())
+    return 200, {'task': task}
+
+
+def _task_custom_field_value(api, ctx, member, field: dict, value):
+    """Проверяет значение кастомного поля задачи по типу поля; ошибки — InvalidForm с error.fields, как у API."""
+    kind, name = field['type'], field['name']
+    if kind in ('Text', 'Url'):
+        if not isinstance(value, str):
+            raise _invalid_field(name, 'Expected string value', value)
+    elif kind == 'Number':
+        if not isinstance(value, str) or value and not NUMERIC_STRING.match(value):
+            raise _invalid_field(name, 'Expected numeric string (e.g., "123", "45.67")', value, code='InvalidNumber')
+    elif kind == 'Boolean':
+        if not isinstance(value, bool):
+            raise _invalid_field(name, 'Expected boolean value (true or false)', value)
+    elif kind == 'Estimation':
+        if not isinstance(value, str) or value and not ISO_DURATION.match(value):
+            raise _invalid_field(name, ESTIMATION_FORMAT, value)
+    elif kind == 'Date':
+        dates = value if isinstance(value, list) and len(value) == 2 else None
+        try:
+            parsed = [None if d is None else datetime.fromisoformat(d.replace('Z', '+00:00')) for d in dates]
+        except (TypeError, AttributeError, ValueError):
+            raise _invalid_field(name, 'Expected [start, end] ISO 8601 dates', value) from None
+        if None not in parsed and parsed[0] > parsed[1]:
+            raise _invalid_field(name, 'Start date cannot be after end date', value)
+    elif kind in ('Member', 'TaskRelations', 'Select'):
+        if not isinstance(value, list):
+            raise _invalid_field(name, 'Expected array value', value)
+        invalid = [v for v in value if not isinstance(v, str) or not OBJECT_ID.match(v)]
+        entity = {'Member': 'member', 'TaskRelations': 'task', 'Select': 'option'}[kind]
+        if invalid:
+            raise _invalid_field(name, f'All {entity} IDs must be valid 24-character hex strings', value,
+                                 invalidIds=invalid)
+        if len(set(value)) != len(value):
+            raise _invalid_field(name, f'Duplicate {entity} IDs are not allowed', value)
+        if kind == 'Member':
+            known = set(api.members_by_space[ctx.space_id].values())
+            message = 'One or more members do not exist in this workspace or are not accessible'
+        elif kind == 'TaskRelations':
+            known = {t for t in value if t in api.tasks and not api.tasks[t]['deletedAt']
+                     and api.boards[api.tasks[t]['board']]['space'] == ctx.space_id}
+            message = 'One or more tasks do not exist or are not accessible'
+        else:
+            known = {option['_id'] for option in field.get('options') or []}
+            message = 'One or more options do not exist'
+        if not set(value) <= known:
+            raise _invalid_field(name, message, value)
+    return value
+
+
+@route('/EditTaskCustomField')
+def _edit_task_custom_field(api, ctx, body):
+    member = ctx.require_member()
+    if member['spaceAccess'] == GUEST:
+        raise _denied('Board')
+    task = ctx.task(body.get('taskId'), member)
+    field = _board_custom_field(api.boards[task['board']], body.get('customFieldId'))
+    value = _task_custom_field_value(api, ctx, member, field, body.get('value'))
+    entry = next((cf for cf in task['customFields'] if cf['id'] == field['_id']), None)
+    if entry is None:
+        task['customFields'].append({'id': field['_id'], 'value': value})
+    else:
+        entry['value'] = value
+    task['updatedAt'] = api.now()
+    return 200, {'task': task}
+
+
+def _detach_subtasks(api, member, task: dict):
+    """Отвязывает подзадачи от задачи, которая уходит с борды (перенос, конвертация)."""
+    for subtask_id in task['subtasks']:
+        api.tasks[subtask_id]['parentTask'] = None
+        api.add_history('Task', subtask_id, member, 'TASK_DETACHED_TO_PARENT', {'_id': task['_id']})
+        api.add_history('Task', task['_id'], member, 'TASK_DETACHED_AS_SUBTASK', {'_id': subtask_id})
+    subtasks, task['subtasks'] = task['subtasks'], []
+    return subtasks
+
+
+def _remove_from_board(api, task: dict):
+    order = api.boards[task['board']]['taskOrderByGroups'].get(task['group'], [])
+    if task['_id'] in order:
+        order.remove(task['_id'])
+    api.tasks_by_board[task['board']].remove(task['_id'])
+
+
+@route('/MoveTaskToBoard')
+def _move_task_to_board(api, ctx, body):
+    member = ctx.require_writer()
+    task = ctx.task(body.get('taskId'), member)
+    board = ctx.board(body.get('toBoardId'), member)
+    if body.get('toGroupId') not in board['taskOrderByGroups']:
+        raise _not_found('BoardGroup')
+    _detach_subtasks(api, member, task)
+    if task['parentTask']:
+        _toggle_subtask(api, ctx, {'taskId': task['_id']})
+    from_board = task['board']
+    _remove_from_board(api, task)
+    # Типы и кастомные поля принадлежат борде и при переносе сбрасываются
+    task.update(board=board['_id'], project=board['project'], group=body['toGroupId'], types=[], customFields=[],
+                updatedAt=api.now())
+    api.tasks_by_board[board['_id']].append(task['_id'])
+    board['taskOrderByGroups'][task['group']].insert(0, task['_id'])
+    api.add_history('Task', task['_id'], member, 'TASK_MOVED_TO_BOARD',
+                    {'fromBoardId': from_board, 'toBoardId': board['_id']})
+    return 200, {'task': task}
+
+
+@route('/ConvertTaskToMilestone')
+def _convert_task_to_milestone(api, ctx, body):
+    member = ctx.require_writer()
+    task = ctx.task(body.get('taskId'), member)
+    board = api.boards[task['board']]
+    milestone = api.add_milestone(board, member, task['name'], dueStart=task['dueStart'], dueEnd=task['dueEnd'])
+    api.add_history('Milestone', milestone['_id'], member, 'MILESTONE_CREATED_FROM_TASK', {'_id': task['_id']})
+    # Подзадачи теряют родителя и становятся задачами нового майлстоуна
+    for subtask_id in task['subtasks']:
+        api.add_history('Task', subtask_id, member, 'PARENT_TASK_CONVERTED_TO_MILESTONE', {'_id': task['_id']})
+    for subtask_id in _detach_subtasks(api, member, task):
+        subtask = api.tasks[subtask_id]
+        subtask['milestones'].append(milestone['_id'])
+        milestone['tasks'].append(subtask_id)
+        api.add_history('Task', subtask_id, member, 'TASK_ATTACHED_TO_MILESTONE', {'_id': milestone['_id']})
+        api.add_history('Milestone', milestone['_id'], member, 'TASK_ATTACHED_INTO_MILESTONE', {'_id': subtask_id})
+    if task['parentTask']:
+        _toggle_subtask(api, ctx, {'taskId': task['_id']})
+    _delete_task(api, ctx, {'taskId': task['_id']})
+    return 200, {'milestone': _milestone_view(api, milestone)}
+
+
+# --- майлстоуны ----------------------------------------------------------------------------------
+
+def _milestone_view(api, milestone: dict) -> dict:
+    """Майлстоун со счётчиками total/completed, которые API считает по задачам."""
+    tasks = [api.tasks[t] for t in milestone['tasks']]
+    return {**milestone, 'total': len(tasks), 'completed': sum(1 for t in tasks if t['completed'])}
+
+
+@route('/CreateMilestone')
+def _create_milestone(api, ctx, body):
+    member = ctx.require_writer()
+    board = ctx.board(body.get('board'), member)
+    milestone = api.add_milestone(board, member, body.get('name'), dueStart=body.get('dueStart'),
+                                  dueEnd=body.get('dueEnd'), description=body.get('description'))
+    return 200, {'milestone': _milestone_view(api, milestone)}
+
+
+@route('/GetMilestone')
+def _get_milestone(api, ctx, body):
+    member = ctx.require_member()
+    milestone = api.milestones.get(body.get('_id'))
+    if milestone is None or milestone['space'] != ctx.space_id:
+        raise _not_found('Milestone')
+    ctx.board(milestone['board'], member)
+    return 200, {'milestone': _milestone_view(api, milestone)}
+
+
+@route('/GetMilestones')
+def _get_milestones(api, ctx, body):
+    member = ctx.require_member()
+    if body.get('boardId'):
+        milestone_ids = api.milestones_by_board[ctx.board(body['boardId'], member)['_id']]
+    else:
+        milestone_ids = [m for m, milestone in api.milestones.items() if milestone['space'] == ctx.space_id]
+    milestones = [api.milestones[m] for m in milestone_ids]
+    milestones = [m for m in milestones if body.get('withArchived') or not m['archivedAt']]
+    if body.get('projectId'):
+        milestones = [m for m in milestones if m['project'] == body['projectId']]
+    skip = body.get('skip') or 0
+    limit = body.get('limit') or len(milestones)
+    return 200, {'milestones': [_milestone_view(api, m) for m in milestones[skip:skip + limit]]}
+
+
+@route('/ArchiveMilestone')
+def _archive_milestone(api, ctx, body):
+    member = ctx.require_writer()
+    milestone = api.milestones.get(body.get('milestoneId'))
+    if milestone is None or milestone['space'] != ctx.space_id:
+        raise _not_found('Milestone')
+    milestone.update(archiver=member['_id'], archivedAt=api.now())
+    return 200, {'milestone': _milestone_view(api, milestone)}
+
+
+# --- документы -----------------------------------------------------------------------------------
+
+def _document_container_allowed(api, ctx, member, kind: str, kind_id: str):
+    if kind == 'Space':
+        if kind_id != ctx.space_id:
+            raise _not_found('Space')
+    elif kind == 'Project':
+        ctx.project(kind_id, member)
+    elif kind == 'Member':
+        if kind_id != member['_id']:
+            raise _denied()
+    else:
+        raise ApiError(400, 'ValidationError')
+
+
+def _tree(api, document: dict, counter=None) -> dict:
+    """Поддерево документа; lft/rgt — номера nested set в порядке обхода."""
+    counter = counter or itertools.count(1)
+    lft = next(counter)
+    children = [api.documents[c] for c in api.documents_by_parent[(document['kind'], document['kindId'], document['_id'])]]
+    nodes = [_tree(api, child, counter) for child in children if not child['archivedAt']]
+    return {'id': document['_id'], 'lft': lft, 'rgt': next(counter), 'document': document, 'children': nodes}
+
+
+@route('/CreateDocument')
+def _create_document(api, ctx, body):
+    kind, kind_id = body.get('kind'), body.get('kindId')
+    # Личные документы может создавать любой участник, в т.ч. гость
+    member = ctx.require_member() if kind == 'Member' else ctx.require_writer()
+    _document_container_allowed(api, ctx, member, kind, kind_id)
+    parent_id = body.get('parentDocumentId')
+    if parent_id is not None:
+        parent = ctx.document(parent_id, member)
+        if (parent['kind'], parent['kindId']) != (kind, kind_id):
+            raise ApiError(400, 'ValidationError')
+    document = api.add_document(ctx.space_id, kind, kind_id, member, body.get('title') or 'Untitled',
+                                parent_id=parent_id, index=body.get('index'))
+    return 200, {'document': document}
+
+
+@route('/GetDocument')
+def _get_document(api, ctx, body):
+    member = ctx.require_member()
+    return 200, {'document': ctx.document(body.get('documentId'), member)}
+
+
+@route('/GetDocuments')
+def _get_documents(api, ctx, body):
+    member = ctx.require_member()
+    kind, kind_id = body.get('kind'), body.get('kindId')
+    _document_container_allowed(api, ctx, member, kind, kind_id)
+    documents = [api.documents[d] for d in api.documents_by_container[(kind, kind_id)]]
+    return 200, {'documents': [d for d in documents if not d['archivedAt']]}
+
+
+@route('/GetDocumentSiblings')
+def _get_document_siblings(api, ctx, body):
+    member = ctx.require_member()
+    document = ctx.document(body.get('documentId'), member)
+    siblings = [d for d in api.documents_by_parent[(document['kind'], document['kindId'], document['parentDocument'])]
+                if not api.documents[d]['archivedAt']]
+    position = siblings.index(document['_id'])
+    parents = []
+    parent_id = document['parentDocument']
+    while parent_id is not None:
+        parents.insert(0, api.documents[parent_id])
+        parent_id = api.documents[parent_id]['parentDocument']
+
+    payload = {'parents': parents, 'tree': [_tree(api, document)]}
+    if position > 0:
+        payload['prevSibling'] = api.documents[siblings[position - 1]]
+    if position < len(siblings) - 1:
+        payload['nextSibling'] = api.documents[siblings[position + 1]]
+    return 200, payload
+
+
+@route('/EditDocument')
+def _edit_document(api, ctx, body):
+    member = ctx.require_writer()
+    document = ctx.document(body.get('documentId'), member)
+    document.update({key: body[key] for key in ('title', 'icon') if key in body})
+    document['updatedAt'] = api.now()
+    return 200, {'document': document}
+
+
+@route('/DuplicateDocument')
+def _duplicate_document(api, ctx, body):
+    member = ctx.require_writer()
+    source = ctx.document(body.get('documentId'), member)
+    siblings = api.documents_by_parent[(source['kind'], source['kindId'], source['parentDocument'])]
+    document = api.add_document(ctx.space_id, source['kind'], source['kindId'], member, f"{source['title']} (copy)",
+                                parent_id=source['parentDocument'], index=siblings.index(source['_id']) + 1)
+    return 200, {'document': document}
+
+
+@route('/ArchiveDocument')
+def _archive_document(api, ctx, body):
+    member = ctx.require_writer()
+    document = ctx.document(body.get('documentId'), member)
+    document.update(archiver=member['_id'], archivedAt=api.now())
+    return 200, {'document': document}
+
+
+# --- комментарии ---------------------------------------------------------------------------------
+
+def _comment_document(api, ctx, document_id, member) -> str:
+    """Проверяет доступ к документу комментариев: документ задачи или документ спейса/проекта."""
+    task_id = api.task_documents.get(document_id)
+    if task_id is not None:
+        ctx.task(task_id, member)
+    else:
+        ctx.document(document_id, member)
+    return document_id
+
+
+def _comment_content(body) -> str:
+    content = body.get('content')
+    if not isinstance(content, str):
+        raise ApiError(400, 'ValidationError')
+    return sanitize(content)
+
+
+@route('/PostComment')
+def _post_comment(api, ctx, body):
+    member = ctx.require_writer()
+    document_id = _comment_document(api, ctx, body.get('documentId'), member)
+    now = api.now()
+    comment = {'_id': api.new_id(), 'documentId': document_id, 'content': _comment_content(body),
+               'authorId': member['_id'], 'createdAt': now, 'updatedAt': now, 'files': [], 'reactions': [],
+               'hasRemovedFiles': False}
+    if body.get('replyTo') is not None:
+        if api.comments.get(body['replyTo'], {}).get('documentId') != document_id:
+            raise ApiError(400, 'ValidationError')
+        comment['replyTo'] = body['replyTo']
+    api.comments[comment['_id']] = comment
+    api.comments_by_document[document_id].append(comment['_id'])
+    return 200, {'comment': comment}
+
+
+@route('/EditComment')
+def _edit_comment(api, ctx, body):
+    member = ctx.require_writer()
+    comment = api.comments.get(_object_id(body.get('commentId')))
+    if comment is None:
+        raise _not_found('Comment')
+    _comment_document(api, ctx, comment['documentId'], member)
+    if comment['authorId'] != member['_id']:
+        raise _denied()
+    now = api.now()
+    comment.update(content=_comment_content(body), editedAt=now, updatedAt=now)
+    return 200, {'comment': comment}
+
+
+@route('/GetComments')
+def _get_comments(api, ctx, body):
+    member = ctx.require_member()
+    document_id = _comment_document(api, ctx, body.get('documentId'), member)
+    return 200, {'comments': [api.comments[c] for c in api.comments_by_document[document_id]]}
+
+
+# --- история -------------------------------------------------------------------------------------
+
+def _image_type(head: bytes):
+    if head[:4] == b'RIFF' and head[8:12] == b'WEBP':
+        return 'webp'
+    return next((kind for signature, kind in IMAGE_SIGNATURES if head.startswith(signature)), None)
+
+
+@route('/UploadAvatar')
+def _upload_avatar(api, ctx, body):
+    file = body.get('file')
+    if body.get('kind') not in AVATAR_KINDS or not isinstance(file, UploadedFile):
+        raise ApiError(400, 'InvalidForm')
+    if file.size > AVATAR_MAX_BYTES:
+        raise ApiError(400, 'FileSize', meta={'max': f'{AVATAR_MAX_BYTES / 1000 / 1000:.2f} MB'})
+    image_type = _image_type(file.head)
+    if image_type is None:
+        raise ApiError(400, 'FileType')
+    if body['kind'] == 'Space':
+        member = ctx.require_member(body.get('kindId'))
+        if member['spaceAccess'] not in FULL_ACCESS:
+            raise _denied()
+        target = api.spaces[member['space']]
+    else:
+        target = ctx.require_user()
+        if body.get('kindId') != target['_id']:
+            raise _denied()
+    url = f'https://files.fake.vaiz/avatars/{file.sha256[:24]}.{image_type}'
+    target['avatar'] = url
+    if body['kind'] == 'Space':
+        api.add_history('Space', target['_id'], member, 'SPACE_AVATAR_CHANGED', {'avatar': url})
+    return 200, {'avatar': {'avatar': url, 'kind': body['kind'], 'kindId': target['_id'], 'size': file.size}}
+
+
+@route('/GetHistory')
+def _get_history(api, ctx, body):
+    ctx.require_member()
+    events = api.history.get((body.get('kind'), body.get('kindId')), [])
+    start, end = body.get('dateRangeStart'), body.get('dateRangeEnd')
+    last_loaded = body.get('lastLoadedDate')
+    keys, exclude = body.get('keys'), set(body.get('excludeKeys') or ())
+    selected = []
+    # Новые события — первыми; lastLoadedDate (мс) — страница событий строго старше этой даты
+    for event in reversed(events):
+        created_at = event['createdAt']
+        if start and created_at < start or end and created_at > end:
+            continue
+        if last_loaded is not None and datetime.fromisoformat(created_at).timestamp() * 1000 >= last_loaded:
+            continue
+        if keys and event['key'] not in keys or event['key'] in exclude:
+            continue
+        selected.append(event)
+        if len(selected) >= (body.get('limit') or DEFAULT_TASKS_LIMIT):
+            break
+    return 200, {'histories': selected}
@@ -0,0 +1,179 @@
+"""
+Backend-тесты, которые фейковый стенд (TEST_STAND_NAME=fake) не поддерживает.
+
+Фейк моделирует основные сущности и права, но не весь API: на нём такие тесты пропускаются с причиной,
+а не падают, чтобы `-m backend` на фейке был зелёным и падение означало регресс. Ключ — node id теста
+относительно tests/test_backend: каталог, файл, функция (все параметры) или конкретный параметр. Поддержали
+сценарий в фейке — уберите ключ из списка.
+"""
+
+BACKEND_TESTS = 'tests/test_backend/'
+
+
+def _params(test: str, *ids: str) -> tuple:
+    """Ключи отдельных параметров теста: остальные параметры на фейке проходят."""
+    return tuple(f'{test}[{param_id}]' for param_id in ids)
+
+
+NOT_IMPLEMENTED_ROUTES = ('эндпоинт не реализован в фейке (GetYDocument, CreateAccessGroup, RemoveInvite, '
+                          'DeclineSpaceInvite, ResendInvite, Deactivate/ReactivateMember, ToggleTaskConnector, '
+                          'DuplicateTask)')
+HISTORY_EVENTS = 'событие истории не пишется фейком или пишется с другими данными'
+INVITE_FLOW = 'инвайты: ответ, валидация профиля и лимиты мест в фейке упрощены'
+FOREIGN_CODES = ('ответ без доступа к спейсу, проекту или борде на стенде зависит от эндпоинта (пустой список, '
+                 '400 или 403), фейк отвечает 403 по общему правилу')
+GUEST_PERSONAL_DOCS = 'личные документы гостя: фейк запрещает гостю любые записи'
+DOCUMENT_VALIDATION = 'валидация документов (заголовок, kind, id) и поле map в фейке не моделируются'
+TASK_VALIDATION = 'валидация EditTask/CreateTask (даты, приоритет, дубли, неизменяемые поля, coverAR) не моделируется'
+TASK_COUNTERS = 'счётчики сабтасок и майлстоунов не пересчитываются фейком'
+GET_TASKS_VALIDATION = 'валидация фильтров GetTasks (типы, форматы id, пустые массивы) не моделируется'
+STAND_DATA = 'тест опирается на данные стенда (задачи по slug, связи, архиваторы), которых нет в сиде фейка'
+DIRECT_DB = 'тест ходит напрямую в MongoDB стенда'
+TIMESTAMP_EMAILS = 'параметры теста получают один email за одну секунду: на быстром фейке это дубликат'
+
+FAKE_UNSUPPORTED = {
+    NOT_IMPLEMENTED_ROUTES: (
+        'document/test_get_y_document.py',
+        'history/space_events/test_space_access_group_history_events.py',
+        'history/space_events/test_space_team_history_events.py::test_space_invite_removed_event',
+        'history/space_events/test_space_team_history_events.py::test_space_invite_declined_event',
+        'history/task_events/test_task_connectors_history_events.py',
+        'history/task_events/test_task_duplicated_history_event.py',
+        'invite/acces_invite/test_resend_and_remove_invite.py',
+        'invite/acces_invite/test_space_deactivate_reactivate.py',
+        'invite/test_invite_to_space_with_optional_params.py::test_invite_to_space_with_access_group',
+        'task_service/duplicate_task/test_duplicate_task_to_forbidden_board.py',
+    ),
+    HISTORY_EVENTS: (
+        'history/space_events/test_space_settings_history_events.py::test_space_created_event',
+        'history/space_events/test_space_team_history_events.py::test_space_invite_lifecycle_events',
+        'history/task_events/test_task_commented_history_event.py',
+        'history/task_events/test_task_created_completed_deleted_events.py',
+        'history/task_events/test_task_milestones_history_events.py',
+        'history/task_events/test_task_name_and_dates_history_events.py',
+        'history/task_events/test_task_types_history_events.py',
+        'history/task_events/test_task_with_subtask_moved_group.py',
+    ),
+    INVITE_FLOW: (
+        'invite/acces_invite/test_space_invite.py::test_space_invite_access_by_role[owner_client-200]',
+        'invite/acces_invite/test_space_invite.py::test_space_invite_access_by_role[manager_client-200]',
+        'invite/acces_invite/test_space_invite.py::test_manager_cannot_invite_owner',
+        'invite/test_confirm_invite_error_field.py',
+        'invite/test_confirm_space_invite.py::test_confirm_space_invite_success',
+        'invite/test_invite_error_code.py::test_cant_deprive_access_yourself_error',
+        'invite/test_invite_error_code.py::test_cant_deprive_access_creator_error',
+        'invite/test_invite_rate_and_seats_limits.py',
+        'invite/test_invite_to_space.py',
+        'invite/test_invite_to_space_with_optional_params.py::test_invite_to_space_with_optional_params',
+        'invite/test_invite_user_with_avatar.py::test_invite_user_with_avatar_positive',
+    ),
+    FOREIGN_CODES: (
+        'document/access_doc/test_duplicate_doc_access_by_roles.py::test_duplicate_document_forbidden_no_membership',
+        'document/access_doc/test_edit_doc_access_by_roles.py::test_edit_document_forbidden_no_membership',
+        'document/access_doc/test_get_doc_access_for_foreign.py::test_document_foreign_access_denied_for_foreign_space',
+        'document/test_create_document.py::test_create_document_without_auth',
+        'document/test_create_document.py::test_create_document_in_foreign_space',
+        'document/test_duplicate_document.py::test_duplicate_document_invalid_id',
+        *_params('document/test_get_documents.py::test_get_documents_mismatched_kind_and_id',
+                 'project-wrong-id', 'space-wrong-id'),
+        *_params('task_service/get_task/access_get_task/test_get_task.py::test_get_task',
+                 'no_access_to_project', 'no_access_to_board'),
+        *_params('task_service/get_tasks/access_get_tasks/test_get_tasks_board_filters.py'
+                 '::test_get_tasks_limited_access_filtered_by_board', 'no_access_to_project', 'no_access_to_board'),
+        'task_service/get_tasks/access_get_tasks/test_get_tasks_board_filters.py'
+        '::test_get_tasks_no_access_filtered_by_board',
+        'task_service/get_tasks/access_get_tasks/test_get_tasks_project_filters.py'
+        '::test_get_tasks_no_access_filtered_by_project',
+        'task_service/get_tasks/access_get_tasks/test_get_tasks_space_all_(important).py::test_get_tasks_no_access',
+    ),
+    GUEST_PERSONAL_DOCS: (
+        'document/access_doc/test_create_doc_access_by_roles.py'
+        '::test_create_and_archive_personal_doc_access_by_roles[guest]',
+        'document/access_doc/test_duplicate_doc_access_by_roles.py'
+        '::test_duplicate_personal_doc_different_roles[guest_self_personal]',
+        *_params('document/access_doc/test_get_siblings_doc_access.py::test_get_personal_siblings_docs_access_by_roles',
+                 'guest_docs_by_owner_403', 'guest_docs_by_manager_403', 'guest_docs_by_member_403',
+                 'guest_self_docs_200'),
+        'document/test_archive_all_docs.py::test_archive_all_personal_documents[guest]',
+    ),
+    DOCUMENT_VALIDATION: (
+        *_params('document/test_create_document.py::test_document_title_validation',
+                 'None', 'title > MAX length (2049)', 'int as title'),
+        *_params('document/test_edit_document.py::test_edit_document_title_length',
+                 'exceed_max-project', 'exceed_max-space', 'exceed_max-member'),
+        *_params('document/test_get_documents.py::test_get_documents_invalid_inputs', 'invalid kind', 'missing kind'),
+        'document/test_get_siblings.py::test_get_document_siblings',
+    ),
+    TASK_VALIDATION: (
+        *_params('task_service/create_task/access_task/test_create_task.py'
+                 '::test_create_task_with_specific_payload_and_response', 'owner', 'manager', 'member'),
+        *_params('task_service/edit_task/access_edit_task/test_edit_task.py::test_edit_task_endpoint_all_fields',
+                 'owner_client-200', 'manager_client-200', 'member_client-200'),
+        *_params('task_service/edit_task/test_check_negative.py::test_edit_task_immutable_field_cannot_be_changed',
+                 "milestones-['fake1', 'fake2']", 'archivedAt-2025-01-01T00:00:00.000Z'),
+        'task_service/edit_task/test_edit_task_assignees.py::test_edit_task_with_duplicate_assignees',
+        'task_service/edit_task/test_edit_task_cover_image.py',
+        'task_service/edit_task/test_edit_task_due_date.py::test_edit_task_due_start_after_due_end_error',
+        'task_service/edit_task/test_edit_task_priority.py::test_edit_task_invalid_priority_value',
+        'task_service/edit_task/test_edit_task_types.py::test_edit_task_duplicate_types_error',
+    ),
+    TASK_COUNTERS: (
+        'task_service/create_task/test_taskTable_total_subtask_counter.py'
+        '::test_parent_task_total_subtask_count_decrease_after_subtask_deletion',
+        'task_service/del_task/test_delete_task_access.py::test_delete_task_access_control[member]',
+        'task_service/edit_task/test_task_completed_updates_milestone_counters.py',
+    ),
+    GET_TASKS_VALIDATION: (
+        'task_service/get_tasks/test_get_tasks_vlidation.py',
+        'task_service/get_tasks/tasks_filtered_by_criteria/test_get_tasks_archived.py'
+        '::test_get_tasks_archived_invalid_type',
+        'task_service/get_tasks/tasks_filtered_by_criteria/test_get_tasks_assignees.py::test_get_tasks_assignees_empty',
+        'task_service/get_tasks/tasks_filtered_by_criteria/test_get_tasks_assignees.py'
+        '::test_get_tasks_assignees_invalid_format',
+        'task_service/get_tasks/tasks_filtered_by_criteria/test_get_tasks_board.py::test_get_tasks_board_non_existing',
+        'task_service/get_tasks/tasks_filtered_by_criteria/test_get_tasks_board.py::test_get_tasks_board_without_tasks',
+        'task_service/get_tasks/tasks_filtered_by_criteria/test_get_tasks_completed.py'
+        '::test_get_tasks_completed_invalid_type',
+        'task_service/get_tasks/tasks_filtered_by_criteria/test_get_tasks_creator.py'
+        '::test_get_tasks_filtered_non_existent_creator',
+        'task_service/get_tasks/tasks_filtered_by_criteria/test_get_tasks_creator.py'
+        '::test_get_tasks_creator_two_valid_ids',
+        'task_service/get_tasks/tasks_filtered_by_criteria/test_get_tasks_ids.py::test_get_tasks_ids_empty_array',
+        'task_service/get_tasks/tasks_filtered_by_criteria/test_get_tasks_ids.py::test_get_tasks_ids_invalid_format',
+        'task_service/get_tasks/tasks_filtered_by_criteria/test_get_tasks_skip.py'
+        '::test_get_tasks_skip_not_number_string',
+        'task_service/get_tasks/tasks_filtered_by_criteria/test_get_tasks_with_archived.py'
+        '::test_get_tasks_with_archived_invalid_type',
+    ),
+    STAND_DATA: (
+        *_params('task_service/get_task/access_get_task/test_get_task.py::test_get_task',
+                 'owner', 'manager', 'member', 'guest'),
+        *_params('task_service/get_tasks/tasks_filtered_by_criteria/test_get_tasks_archiver.py'
+                 '::test_get_tasks_filter_by_archiver', 'archiver: owner', 'archiver: manager', 'archiver: member'),
+        'task_service/get_tasks/tasks_filtered_by_criteria/test_get_tasks_connectors.py',
+        *_params('task_service/get_tasks/tasks_filtered_by_criteria/test_get_tasks_creator.py'
+                 '::test_get_tasks_filtered_by_creator', 'creator: owner', 'creator: manager', 'creator: member'),
+        'task_service/get_tasks/tasks_filtered_by_criteria/test_get_tasks_due_date.py::test_get_tasks_due_start',
+        'task_service/get_tasks/tasks_filtered_by_criteria/test_get_tasks_limit.py'
+        '::test_get_tasks_limit_more_than_available',
+        'task_service/get_tasks/tasks_filtered_by_criteria/test_get_tasks_milestones.py'
+        '::test_get_tasks_task_contains_both_milestones',
+        'task_service/get_tasks/tasks_filtered_by_criteria/test_get_tasks_parent_task.py',
+    ),
+    DIRECT_DB: (
+        'invite/test_confirm_space_invite.py::test_confirm_space_invite_new_user',
+    ),
+    TIMESTAMP_EMAILS: (
+        'authServis/register/test_positive_registration.py::test_register_user_success[uppercase]',
+    ),
+}
+
+_REASONS = {BACKEND_TESTS + key: reason for reason, keys in FAKE_UNSUPPORTED.items() for key in keys}
+
+
+def fake_unsupported_reason(nodeid: str):
+    """Причина пропуска теста на фейке или None. Ключ совпадает с node id целиком или с его началом до '/', '::', '['."""
+    for key, reason in _REASONS.items():
+        if nodeid == key or nodeid.startswith(key) and nodeid[len(key)] in '/:[':
+            return reason
+    return None
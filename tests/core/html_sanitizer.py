@@ -0,0 +1,137 @@
+import hashlib
+from html import escape
+from html.parser import HTMLParser
+from typing import List, Optional, Union
+
+# Эталонная модель санитайзера HTML комментариев (PostComment/EditComment). Правила собраны из поведения API,
+# зафиксированного в comment/sanitizer: разрешённые теги и их атрибуты сохраняются, остальные атрибуты удаляются.
+GLOBAL_ATTRS = ('class', 'id')
+ALLOWED_TAGS = {
+    'p': (), 'b': (), 'i': (), 'u': (), 's': (), 'code': (), 'pre': (), 'mark': (), 'blockquote': (),
+    'span': (), 'div': (), 'label': (), 'br': (),
+    'a': ('href', 'target', 'rel'),
+    'img': ('src', 'alt'),
+    'ul': ('data-type',),
+    'ol': ('start',),
+    'li': ('data-checked', 'data-type'),
+    'input': ('type', 'checked'),
+    'em-emoji': ('shortcodes',),
+    'block-custom-mention-v2': ('custom', 'inline', 'data'),
+}
+# Запрещённые теги, которые удаляются вместе с содержимым; прочие неразрешённые теги разворачиваются (form -> дети)
+DROPPED_TAGS = ('script', 'iframe', 'svg', 'object')
+VOID_TAGS = ('img', 'br', 'input', 'hr')
+# Атрибуты-ссылки и запрещённые в них схемы
+URL_ATTRS = ('href', 'src')
+BLOCKED_SCHEMES = ('javascript:',)
+# Ссылки всегда открываются в новой вкладке
+LINK_ATTRS = {'target': '_blank', 'rel': 'noopener noreferrer'}
+# Что сохраняется, если после очистки не осталось ничего
+EMPTY_CONTENT = '<p></p>'
+
+# Версия правил: меняется вместе с таблицами выше (по ней сбрасываются кэши доказанных случаев)
+MODEL_VERSION = hashlib.sha256(repr((GLOBAL_ATTRS, ALLOWED_TAGS, DROPPED_TAGS, VOID_TAGS, URL_ATTRS,
+                                     BLOCKED_SCHEMES, LINK_ATTRS, EMPTY_CONTENT)).encode()).hexdigest()[:12]
+
+
+class Element:
+    """Узел разобранного HTML: тег, атрибуты [(имя, значение или None)] и дети (Element или текст)."""
+
+    __slots__ = ('tag', 'attrs', 'children')
+
+    def __init__(self, tag: str, attrs: list = None, children: list = None):
+        self.tag = tag
+        self.attrs = list(attrs or [])
+        self.children = list(children or [])
+
+    def __repr__(self):
+        return f'Element({self.tag!r}, {self.attrs!r}, {self.children!r})'
+
+
+Node = Union[Element, str]
+
+
+class _TreeBuilder(HTMLParser):
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.root = Element('#root')
+        self.stack = [self.root]
+
+    def handle_starttag(self, tag, attrs):
+        element = Element(tag, attrs)
+        self.stack[-1].children.append(element)
+        if tag not in VOID_TAGS:
+            self.stack.append(element)
+
+    def handle_startendtag(self, tag, attrs):
+        self.stack[-1].children.append(Element(tag, attrs))
+
+    def handle_endtag(self, tag):
+        for depth in range(len(self.stack) - 1, 0, -1):
+            if self.stack[depth].tag == tag:
+                del self.stack[depth:]
+                return
+
+    def handle_data(self, data):
+        self.stack[-1].children.append(data)
+
+
+def parse(html: str) -> List[Node]:
+    """Разбирает HTML в дерево без очистки (незакрытые теги закрываются в конце, лишние закрывающие — игнорируются)."""
+    builder = _TreeBuilder()
+    builder.feed(html)
+    builder.close()
+    return builder.root.children
+
+
+def _allowed_value(name: str, value: Optional[str]) -> bool:
+    if name in URL_ATTRS and value is not None:
+        compact = ''.join(ch for ch in value if ch > ' ').lower()
+        return not compact.startswith(BLOCKED_SCHEMES)
+    return True
+
+
+def clean(nodes: List[Node]) -> List[Node]:
+    """Применяет правила модели к дереву."""
+    cleaned = []
+    for node in nodes:
+        if isinstance(node, str):
+            cleaned.append(node)
+        elif node.tag in DROPPED_TAGS:
+            continue
+        elif node.tag not in ALLOWED_TAGS:
+            cleaned.extend(clean(node.children))
+        else:
+            allowed = GLOBAL_ATTRS + ALLOWED_TAGS[node.tag]
+            attrs = [(name, value) for name, value in node.attrs if name in allowed and _allowed_value(name, value)]
+            if node.tag == 'a':
+                attrs = [(name, LINK_ATTRS.get(name, value)) for name, value in attrs]
+                attrs += [(name, value) for name, value in LINK_ATTRS.items() if name not in dict(attrs)]
+            cleaned.append(Element(node.tag, attrs, clean(node.children)))
+    return cleaned
+
+
+def _attr(name: str, value: Optional[str]) -> str:
+    if value is None:
+        return f' {name}'
+    return f' {name}="{escape(value, quote=False).replace(chr(34), "&quot;")}"'
+
+
+def render(nodes: List[Node]) -> str:
+    """HTML из дерева: значения атрибутов в двойных кавычках, пустые элементы как <br />."""
+    parts = []
+    for node in nodes:
+        if isinstance(node, str):
+            parts.append(escape(node, quote=False))
+            continue
+        attrs = ''.join(_attr(name, value) for name, value in node.attrs)
+        if node.tag in VOID_TAGS:
+            parts.append(f'<{node.tag}{attrs} />')
+        else:
+            parts.append(f'<{node.tag}{attrs}>{render(node.children)}</{node.tag}>')
+    return ''.join(parts)
+
+
+def sanitize(html: str) -> str:
+    """Ожидаемый content комментария после санитайзера API."""
+    return render(clean(parse(html))) or EMPTY_CONTENT
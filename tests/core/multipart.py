@@ -0,0 +1,182 @@
+import hashlib
+import os
+import re
+import uuid
+from dataclasses import dataclass, field
+from typing import Iterable, Iterator, Optional
+
+# Размер куска, которым читаются файлы и отдаётся тело запроса
+CHUNK_SIZE = 64 * 1024
+# Сколько первых байт файла сохраняет парсер (сигнатура формата)
+HEAD_BYTES = 32
+
+
+def _source_size(source) -> Optional[int]:
+    """Размер источника в байтах или None, если он известен только после чтения (итератор, поток)."""
+    if isinstance(source, (bytes, bytearray, memoryview)):
+        return len(source)
+    if isinstance(source, (str, os.PathLike)):
+        return os.path.getsize(source)
+    return None
+
+
+def iter_chunks(source, chunk_size: int = CHUNK_SIZE) -> Iterator[bytes]:
+    """
+    Содержимое источника кусками: bytes отдаются как есть, путь к файлу открывается и читается по chunk_size,
+    у файлового объекта вызывается read(chunk_size), любой другой итерируемый источник отдаёт свои куски.
+    """
+    if isinstance(source, (bytes, bytearray, memoryview)):
+        yield bytes(source)
+    elif isinstance(source, (str, os.PathLike)):
+        with open(source, 'rb') as f:
+            while chunk := f.read(chunk_size):
+                yield chunk
+    elif hasattr(source, 'read'):
+        while chunk := source.read(chunk_size):
+            yield chunk
+    else:
+        for chunk in source:
+            if chunk:
+                yield bytes(chunk)
+
+
+def _quote(value: str) -> str:
+    return value.replace('\\', '\\\\').replace('"', '\\"').replace('\r', '%0D').replace('\n', '%0A')
+
+
+class MultipartStream:
+    """
+    Тело multipart/form-data, которое собирается при отправке: файлы читаются кусками по chunk_size
+    и целиком в памяти не лежат. Передаётся в requests как data= вместе с заголовком content_type.
+
+    fields — текстовые поля формы, files — {поле: (имя файла, источник, content-type)}, где источник —
+    bytes, путь к файлу, файловый объект или итерируемое кусков bytes. Если размеры всех источников известны,
+    len() даёт точный Content-Length; иначе len() == 0 и requests отправляет тело с Transfer-Encoding: chunked.
+    Пути и bytes перечитываются при каждой итерации (тело можно отправить повторно), итераторы — одноразовые.
+    """
+
+    def __init__(self, fields: dict = None, files: dict = None, chunk_size: int = CHUNK_SIZE, boundary: str = None):
+        self.boundary = boundary or uuid.uuid4().hex
+        self.chunk_size = chunk_size
+        self._parts = []
+        for name, value in (fields or {}).items():
+            head = f'--{self.boundary}\r\nContent-Disposition: form-data; name="{_quote(name)}"\r\n\r\n'
+            self._parts.append((head.encode(), str(value).encode()))
+        for name, (filename, source, content_type) in (files or {}).items():
+            head = (f'--{self.boundary}\r\nContent-Disposition: form-data; name="{_quote(name)}"; '
+                    f'filename="{_quote(filename)}"\r\nContent-Type: {content_type}\r\n\r\n')
+            self._parts.append((head.encode(), source))
+        self._tail = f'--{self.boundary}--\r\n'.encode()
+
+    @property
+    def content_type(self) -> str:
+        return f'multipart/form-data; boundary={self.boundary}'
+
+    @property
+    def size(self) -> Optional[int]:
+        total = len(self._tail)
+        for head, source in self._parts:
+            size = _source_size(source)
+            if size is None:
+                return None
+            total += len(head) + size + 2
+        return total
+
+    def __iter__(self) -> Iterator[bytes]:
+        for head, source in self._parts:
+            yield head
+            yield from iter_chunks(source, self.chunk_size)
+            yield b'\r\n'
+        yield self._tail
+
+    def __len__(self) -> int:
+        # requests берёт Content-Length из len(); 0 — размер неизвестен, тело уходит chunked
+        return self.size or 0
+
+    def __bool__(self) -> bool:
+        return True
+
+
+@dataclass
+class UploadedFile:
+    """Файл из multipart-тела на стороне приёма: содержимое не хранится, только размер, хэш и первые байты."""
+
+    filename: str
+    content_type: str
+    size: int = 0
+    head: bytes = b''
+    _hash: object = field(default_factory=hashlib.sha256, repr=False, compare=False)
+
+    @property
+    def sha256(self) -> str:
+        return self._hash.hexdigest()
+
+    def feed(self, data: bytes):
+        if len(self.head) < HEAD_BYTES:
+            self.head += data[:HEAD_BYTES - len(self.head)]
+        self.size += len(data)
+        self._hash.update(data)
+
+
+class _Field:
+    def __init__(self):
+        self.data = bytearray()
+
+    def feed(self, data: bytes):
+        self.data += data
+
+    def value(self) -> str:
+        return self.data.decode('utf-8')
+
+
+def _part(raw_headers: bytes):
+    headers = {}
+    for line in raw_headers.decode('utf-8').split('\r\n'):
+        name, _, value = line.partition(':')
+        headers[name.strip().lower()] = value.strip()
+    disposition = headers.get('content-disposition', '')
+    params = dict(re.findall(r';\s*([\w*]+)="((?:[^"\\]|\\.)*)"', disposition))
+    if 'filename' in params:
+        return params.get('name'), UploadedFile(params['filename'], headers.get('content-type', ''))
+    return params.get('name'), _Field()
+
+
+def parse_multipart(chunks: Iterable[bytes], content_type: str) -> dict:
+    """
+    Разбирает multipart/form-data, читая тело кусками: в памяти держится один кусок и хвост длиной с разделитель.
+    Текстовые поля возвращаются строками, файлы — UploadedFile. Некорректное тело — ValueError.
+    """
+    match = re.search(r'boundary="?([^";]+)"?', content_type or '')
+    if match is None:
+        raise ValueError('multipart: в Content-Type нет boundary')
+    delimiter = b'\r\n--' + match.group(1).encode()
+    keep = len(delimiter) - 1
+    form, name, part = {}, None, None
+    state, buffer = 'preamble', b'\r\n'
+    chunks = iter(chunks)
+    for chunk in chunks:
+        buffer += chunk
+        while True:
+            if state == 'headers':
+                if buffer.startswith(b'--'):
+                    # Закрывающий разделитель: эпилог дочитывается, как это делает сервер
+                    for _ in chunks:
+                        pass
+                    return form
+                end = buffer.find(b'\r\n\r\n')
+                if end < 0:
+                    break
+                name, part = _part(buffer[2:end])
+                buffer, state = buffer[end + 4:], 'body'
+                continue
+            index = buffer.find(delimiter)
+            if index < 0:
+                if state == 'body' and len(buffer) > keep:
+                    part.feed(buffer[:-keep])
+                buffer = buffer[-keep:]
+                break
+            if state == 'body':
+                part.feed(buffer[:index])
+                form[name] = part if isinstance(part, UploadedFile) else part.value()
+            buffer, state = buffer[index + len(delimiter):], 'headers'
+    raise ValueError('multipart: тело оборвалось до закрывающего разделителя')
@@ -0,0 +1,126 @@
+import copy
+from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
+
+# Размер страницы по умолчанию для обхода списков (GetTasks и т.п.)
+DEFAULT_PAGE_SIZE = 100
+
+
+class StreamCheck(ABC):
+    """
+    Инвариант, проверяемый по потоку элементов за один проход: feed() — на каждый элемент,
+    finish() — после последнего. Нарушение — AssertionError с позицией элемента в потоке.
+    Порядок элементов проверяет sort_order.SortOrderValidator.
+    """
+
+    @abstractmethod
+    def feed(self, item: dict, position: int):
+        ...
+
+    def finish(self):
+        """Проверка после последнего элемента; по умолчанию проверять нечего."""
+        return None
+
+
+class NoDuplicates(StreamCheck):
+    """Каждый key встречается в потоке один раз (дубли появляются при сдвиге skip/limit между страницами)."""
+
+    def __init__(self, key: str = '_id'):
+        self.key = key
+        self._positions = {}
+
+    def feed(self, item, position):
+        value = item.get(self.key)
+        first = self._positions.setdefault(value, position)
+        assert first == position, f'Дубль {self.key}={value}: позиции {first} и {position}'
+
+
+class ExpectedCount(StreamCheck):
+    """Всего в потоке ровно count элементов."""
+
+    def __init__(self, count: int):
+        self.count = count
+        self.seen = 0
+
+    def feed(self, item, position):
+        self.seen += 1
+
+    def finish(self):
+        assert self.seen == self.count, f'Ожидалось {self.count} элементов, получено {self.seen}'
+
+
+class PageStream:
+    """
+    Потоковый обход постраничного списка: элементы отдаются по одному, страницы запрашиваются через skip/limit.
+
+    Пока потребитель разбирает текущую страницу, следующая уже запрашивается в фоне (prefetch),
+    поэтому время обхода ~ max(сеть, обработка), а не их сумма. В памяти — не больше двух страниц.
+    Обход заканчивается на неполной странице или после max_items элементов.
+    Проверки (StreamCheck) выполняются по ходу обхода; finish() — когда поток дочитан до конца.
+    Пример:
+        stream = PageStream(owner_client, get_tasks_endpoint(space_id=main_space, board=board_id), 'tasks',
+                            checks=[NoDuplicates()])
+        for task in stream:
+            ...
+    """
+
+    def __init__(self, client, endpoint: dict, key: str, page_size: int = DEFAULT_PAGE_SIZE, checks=(),
+                 prefetch: bool = True, max_items: int = None):
+        self.client = client
+        self.endpoint = endpoint
+        self.key = key
+        self.page_size = page_size
+        self.checks = list(checks)
+        self.prefetch = prefetch
+        self.max_items = max_items
+        self.pages = 0
+        self.items = 0
+
+    def _fetch(self, skip: int) -> list:
+        endpoint = copy.deepcopy(self.endpoint)
+        endpoint['json'] = {**endpoint.get('json', {}), 'skip': skip, 'limit': self.page_size}
+        response = self.client.post(**endpoint)
+        assert response.status_code == 200, f"{endpoint['path']} skip={skip}: {response.status_code} {response.text}"
+        page = response.json()['payload'][self.key]
+        assert len(page) <= self.page_size, (
+            f"{endpoint['path']} skip={skip}: вернулось {len(page)} элементов при limit={self.page_size}"
+        )
+        return page
+
+    def __iter__(self):
+        executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='page-prefetch') if self.prefetch else None
+        pending = None
+        skip = 0
+        try:
+            page = self._fetch(skip)
+            while True:
+                self.pages += 1
+                last = len(page) < self.page_size or (
+                    self.max_items is not None and self.items + len(page) >= self.max_items
+                )
+                if not last and executor is not None:
+                    pending = executor.submit(self._fetch, skip + self.page_size)
+                for item in page:
+                    if self.max_items is not None and self.items >= self.max_items:
+                        break
+                    for check in self.checks:
+                        check.feed(item, self.items)
+                    self.items += 1
+                    yield item
+                if last:
+                    break
+                skip += self.page_size
+                page = pending.result() if pending is not None else self._fetch(skip)
+                pending = None
+            for check in self.checks:
+                check.finish()
+        finally:
+            if pending is not None:
+                pending.cancel()
+            if executor is not None:
+                executor.shutdown(wait=False)
+
+
+def stream_tasks(client, endpoint: dict, page_size: int = DEFAULT_PAGE_SIZE, checks=(), **kwargs) -> PageStream:
+    """Поток задач GetTasks (endpoint — результат get_tasks_endpoint без skip/limit)."""
+    return PageStream(client, endpoint, 'tasks', page_size=page_size, checks=checks, **kwargs)
@@ -0,0 +1,172 @@
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Callable, Iterable, Optional
+
+from bson import ObjectId
+
+# Сколько id уходит в один запрос {'_id': {'$in': [...]}}
+MONGO_IN_BATCH = 500
+# Ответы API, после которых сущность считается отсутствующей
+MISSING_STATUSES = (400, 404)
+_MISSING = object()
+
+
+@dataclass(frozen=True)
+class PersistedEntity:
+    """
+    Как прочитать сохранённую сущность: коллекция MongoDB и запасной путь через API —
+    endpoint(id, space_id) -> словарь *_endpoint() и ключ сущности в payload ответа.
+    """
+
+    name: str
+    collection: str
+    endpoint: Callable[[str, str], dict]
+    payload_key: str
+
+
+def plain(value):
+    """Документ MongoDB в виде ответа API: ObjectId -> str, datetime -> ISO с миллисекундами (рекурсивно)."""
+    if isinstance(value, ObjectId):
+        return str(value)
+    if isinstance(value, datetime):
+        moment = value if value.tzinfo else value.replace(tzinfo=timezone.utc)
+        return moment.astimezone(timezone.utc).isoformat(timespec='milliseconds').replace('+00:00', 'Z')
+    if isinstance(value, dict):
+        return {key: plain(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [plain(item) for item in value]
+    return value
+
+
+def object_id(value):
+    """Строковый id в ObjectId (как он лежит в базе); прочие значения — без изменений."""
+    return ObjectId(value) if isinstance(value, str) and ObjectId.is_valid(value) else value
+
+
+def _select(value, path: list):
+    """Часть value по пути в форме проекции MongoDB: {'a': {'b': ...}}, по массивам — поэлементно."""
+    if not path:
+        return value
+    if isinstance(value, list):
+        items = [_select(item, path) for item in value if isinstance(item, dict)]
+        return [{} if item is _MISSING else item for item in items]
+    if not isinstance(value, dict) or path[0] not in value:
+        return _MISSING
+    nested = _select(value[path[0]], path[1:])
+    return _MISSING if nested is _MISSING else {path[0]: nested}
+
+
+def _merge(target, part):
+    if isinstance(target, dict) and isinstance(part, dict):
+        for key, value in part.items():
+            target[key] = _merge(target[key], value) if key in target else value
+        return target
+    if isinstance(target, list) and isinstance(part, list):
+        return [_merge(old, new) for old, new in zip(target, part)]
+    return part
+
+
+def project(document: dict, fields: Iterable[str]) -> dict:
+    """
+    Оставляет в документе _id и поля fields (пути через точку) — как inclusion-проекция MongoDB:
+    вложенные словари сохраняют форму, по массивам путь применяется к каждому элементу.
+    """
+    projected = {'_id': document['_id']} if '_id' in document else {}
+    for field in fields:
+        part = _select(document, field.split('.'))
+        if part is not _MISSING:
+            _merge(projected, part)
+    return projected
+
+
+def get_path(document: dict, path: str):
+    """Значение поля по пути через точку (None, если поля нет)."""
+    value = document
+    for key in path.split('.'):
+        if not isinstance(value, dict):
+            return None
+        value = value.get(key)
+    return value
+
+
+class PersistedState:
+    """
+    Чтение сохранённого состояния для проверок после записи вместо повторного Get* через API.
+
+    С базой (db — pymongo Database или совместимая заглушка) сущности читаются из MongoDB проекцией только
+    проверяемых полей, по MONGO_IN_BATCH id за запрос {'_id': {'$in': [...]}}. Без базы — запасной путь:
+    Get* каждой сущности через API (параллельно, если клиент умеет post_many) с той же проекцией ответа,
+    поэтому проверки одинаковы для обоих источников. Пример:
+        state = PersistedState(db)
+        tasks = state.many(TASK, task_ids, ['name', 'completed'], client=owner_client, space_id=main_space)
+    """
+
+    def __init__(self, db=None, batch_size: int = MONGO_IN_BATCH):
+        self.db = db
+        self.batch_size = batch_size
+        self.queries = 0
+        self.requests = 0
+
+    @property
+    def source(self) -> str:
+        return 'api' if self.db is None else 'mongo'
+
+    def many(self, entity: PersistedEntity, ids: Iterable[str], fields: Iterable[str], client=None,
+             space_id: str = None) -> dict:
+        """{id: документ с _id и полями fields}; отсутствующих сущностей в результате нет."""
+        ids, fields = list(dict.fromkeys(ids)), list(fields)
+        if self.db is None:
+            return self._from_api(entity, ids, fields, client, space_id)
+        found = {}
+        projection = {field: 1 for field in fields}
+        for start in range(0, len(ids), self.batch_size):
+            batch = [object_id(entity_id) for entity_id in ids[start:start + self.batch_size]]
+            self.queries += 1
+            for document in self.db[entity.collection].find({'_id': {'$in': batch}}, projection):
+                document = plain(document)
+                found[document['_id']] = document
+        return found
+
+    def one(self, entity: PersistedEntity, entity_id: str, fields: Iterable[str], client=None,
+            space_id: str = None) -> Optional[dict]:
+        return self.many(entity, [entity_id], fields, client=client, space_id=space_id).get(entity_id)
+
+    def _from_api(self, entity: PersistedEntity, ids: list, fields: list, client, space_id: str) -> dict:
+        assert client is not None, f"{entity.name}: MongoDB не настроена, для проверки через API нужен client"
+        endpoints = [entity.endpoint(entity_id, space_id) for entity_id in ids]
+        self.requests += len(endpoints)
+        if hasattr(client, 'post_many'):
+            responses = client.post_many(endpoints)
+        else:
+            responses = [client.post(**endpoint) for endpoint in endpoints]
+        found = {}
+        for entity_id, response in zip(ids, responses):
+            if response.status_code in MISSING_STATUSES:
+                continue
+            assert response.status_code == 200, \
+                f"{entity.name} {entity_id}: ответ {response.status_code} {response.text[:200]}"
+            found[entity_id] = project(response.json()['payload'][entity.payload_key], fields)
+        return found
+
+    def mismatches(self, entity: PersistedEntity, expected: dict, client=None, space_id: str = None) -> list:
+        """
+        Сверяет {id: {поле: ожидаемое значение}} с сохранённым состоянием одним чтением на всё.
+        Возвращает строки расхождений (пустой список — всё сохранено).
+        """
+        fields = {field for values in expected.values() for field in values}
+        found = self.many(entity, expected, fields, client=client, space_id=space_id)
+        problems = []
+        for entity_id, values in expected.items():
+            document = found.get(entity_id)
+            if document is None:
+                problems.append(f"{entity.name} {entity_id}: не найдена ({self.source})")
+                continue
+            for field, value in values.items():
+                actual = get_path(document, field)
+                if actual != value:
+                    problems.append(f"{entity.name} {entity_id}.{field}: ожидалось {value!r}, сохранено {actual!r}")
+        return problems
+
+    def verify(self, entity: PersistedEntity, expected: dict, client=None, space_id: str = None):
+        problems = self.mismatches(entity, expected, client=client, space_id=space_id)
+        assert not problems, f"Расхождения с сохранённым состоянием ({self.source}):\n" + '\n'.join(problems)
@@ -0,0 +1,136 @@
+import os
+import threading
+import time
+
+import pytest
+
+from tests.core.client import add_middleware, remove_middleware
+
+# Сколько фикстур показывать в таблице в конце прогона
+PROFILE_TOP = 15
+
+
+def _response_bytes(response) -> int:
+    """Объём запроса и ответа в байтах (тело запроса известно только для запросов, ушедших в сеть)."""
+    request = getattr(response, 'request', None)
+    body = getattr(request, 'body', None) or b''
+    return len(body) + len(response.content or b'')
+
+
+class _Frame:
+    __slots__ = ('key', 'path', 'phase', 'start', 'children', 'requests', 'bytes')
+
+    def __init__(self, key: tuple, path: str, phase: str):
+        self.key = key
+        self.path = path
+        self.phase = phase
+        self.start = time.perf_counter()
+        self.children = 0.0
+        self.requests = 0
+        self.bytes = 0
+
+
+class FixtureProfiler:
+    """
+    Профиль фикстур: собственное время setup и teardown, число запросов APIClient и байты по каждой фикстуре
+    и по scope. Запрос относится к фикстуре, которая выполняется в момент вызова (в т.ч. из потоков post_many);
+    время вложенных фикстур (getfixturevalue внутри фикстуры) из времени родителя вычитается.
+
+    В конце прогона пишет профиль в формате folded stacks (flamegraph.pl, speedscope): строка
+    "setup;temp_board [function];temp_project [function] 1234" — путь от фикстуры, которую запросил тест,
+    до зависимости и собственное время в микросекундах. Так в flame graph temp_board включает стоимость
+    temp_project и temp_space, поднятых ради неё.
+    """
+
+    def __init__(self, path: str, top: int = PROFILE_TOP):
+        self.path = path
+        self.top = top
+        # {(фикстура, scope): [setup-ов, setup с, teardown с, запросов, байт]}
+        self.stats = {}
+        # {путь в folded-формате: микросекунды}
+        self.folded = {}
+        self._stack = []
+        self._paths = {}
+        self._lock = threading.Lock()
+
+    def __call__(self, call, send):
+        response = send(call)
+        with self._lock:
+            if self._stack:
+                frame = self._stack[-1]
+                frame.requests += 1
+                frame.bytes += _response_bytes(response)
+        return response
+
+    def pytest_sessionstart(self, session):
+        add_middleware(self)
+
+    @pytest.hookimpl(hookwrapper=True)
+    def pytest_fixture_setup(self, fixturedef, request):
+        # Зависимости фикстуры к этому моменту уже подняты, цепочка запросов ведёт от теста к фикстуре
+        chain = [f'{sub.fixturename} [{sub.scope}]' for sub in request._iter_chain()]
+        path = ';'.join(['setup', *reversed(chain)])
+        key = (fixturedef.argname, fixturedef.scope)
+        self._push(_Frame(key, path, 'setup'))
+        outcome = yield
+        self._pop()
+        if outcome.excinfo is None:
+            fixture_id = id(fixturedef)
+            self._paths[fixture_id] = (key, path.replace('setup', 'teardown', 1))
+            # Финализаторы выполняются в обратном порядке: этот сработает перед teardown самой фикстуры
+            fixturedef.addfinalizer(lambda: self._push(_Frame(*self._paths[fixture_id], 'teardown')))
+
+    def pytest_fixture_post_finalizer(self, fixturedef, request):
+        if self._paths.pop(id(fixturedef), None) is not None:
+            self._pop()
+
+    def _push(self, frame: _Frame):
+        with self._lock:
+            self._stack.append(frame)
+
+    def _pop(self):
+        with self._lock:
+            frame = self._stack.pop()
+            elapsed = time.perf_counter() - frame.start
+            if self._stack:
+                self._stack[-1].children += elapsed
+            own = max(elapsed - frame.children, 0.0)
+            stats = self.stats.setdefault(frame.key, [0, 0.0, 0.0, 0, 0])
+            if frame.phase == 'setup':
+                stats[0] += 1
+                stats[1] += own
+            else:
+                stats[2] += own
+            stats[3] += frame.requests
+            stats[4] += frame.bytes
+            self.folded[frame.path] = self.folded.get(frame.path, 0) + round(own * 1_000_000)
+
+    def pytest_sessionfinish(self, session):
+        remove_middleware(self)
+        if not self.folded:
+            return
+        os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+        with open(self.path, 'w', encoding='utf-8') as f:
+            f.writelines(f'{path} {value}\n' for path, value in sorted(self.folded.items()))
+
+    def table(self) -> str:
+        """Top-N фикстур по собственному времени setup + teardown и итоги по scope."""
+        rows = sorted(self.stats.items(), key=lambda row: row[1][1] + row[1][2], reverse=True)[:self.top]
+        width = max((len(name) for (name, _), _ in rows), default=7)
+        lines = [f"{'fixture':<{width}}  {'scope':<8}  {'setups':>6}  {'setup s':>8}  {'teardown s':>10}  "
+                 f"{'requests':>8}  {'KB':>8}"]
+        for (name, scope), (setups, setup, teardown, requests_count, size) in rows:
+            lines.append(f'{name:<{width}}  {scope:<8}  {setups:>6}  {setup:>8.2f}  {teardown:>10.2f}  '
+                         f'{requests_count:>8}  {size / 1024:>8.1f}')
+
+        scopes = {}
+        for (_, scope), (_, setup, teardown, requests_count, size) in self.stats.items():
+            totals = scopes.setdefault(scope, [0.0, 0, 0])
+            totals[0] += setup + teardown
+            totals[1] += requests_count
+            totals[2] += size
+        lines.append('По scope: ' + ', '.join(
+            f'{scope} {seconds:.2f} с / {count} запросов / {size / 1024:.0f} KB'
+            for scope, (seconds, count, size) in sorted(scopes.items(), key=lambda row: -row[1][0])
+        ))
+        return '\n'.join(lines)
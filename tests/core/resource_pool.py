@@ -0,0 +1,170 @@
+import queue
+import threading
+import traceback
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Optional
+
+
+@dataclass
+class SpaceBundle:
+    """Заранее созданный спейс с проектом и (опционально) бордой внутри."""
+
+    space_id: str
+    project_id: Optional[str] = None
+    board_id: Optional[str] = None
+
+
+class ResourcePool:
+    """
+    Пул заранее созданных сущностей: provision() выполняется в фоне, фикстуры забирают готовое через acquire().
+
+    В пуле держится до size готовых (или создающихся) сущностей, но всего создаётся не больше demand —
+    ожидаемого числа выдач за прогон (None — без ограничения). Если готовой сущности нет, acquire() ждёт
+    уже начатое создание или запускает новое. Выданная сущность после теста не возвращается в пул
+    (в ней остаются данные теста), а удаляется через release() в фоне. Невыданные удаляются в close().
+    При size=0 пул работает синхронно: создание и удаление выполняются в вызывающем потоке.
+    """
+
+    def __init__(self, name: str, provision, destroy, size: int = 2, demand: Optional[int] = None):
+        self.name = name
+        self.provision = provision
+        self.destroy = destroy
+        self.size = size
+        self.demand = demand
+        self.hits = 0
+        self.misses = 0
+        self.provisioned = 0
+        self.destroyed = 0
+        self.errors = []
+        self._ready = queue.Queue()
+        self._in_flight = 0
+        self._scheduled = 0
+        self._closed = False
+        self._lock = threading.Lock()
+        self._provisioner = ThreadPoolExecutor(max_workers=max(size, 1), thread_name_prefix=f'pool-{name}')
+        self._destroyer = ThreadPoolExecutor(max_workers=max(size, 1), thread_name_prefix=f'pool-{name}-rm')
+
+    def start(self):
+        """Запускает фоновое заполнение пула. Возвращает self."""
+        self._fill()
+        return self
+
+    def _submit(self):
+        self._in_flight += 1
+        self._scheduled += 1
+        self._provisioner.submit(self._provision_one)
+
+    def _fill(self):
+        with self._lock:
+            while (
+                not self._closed
+                and self._ready.qsize() + self._in_flight < self.size
+                and (self.demand is None or self._scheduled < self.demand)
+            ):
+                self._submit()
+
+    def _provision_one(self):
+        try:
+            item, error = self.provision(), None
+        except Exception as e:
+            item, error = None, e
+        with self._lock:
+            self._in_flight -= 1
+            if error is None:
+                self.provisioned += 1
+        self._ready.put((item, error))
+
+    def acquire(self, timeout: float = 120):
+        if self._closed:
+            raise RuntimeError(f'Пул {self.name} уже закрыт')
+        if self.size == 0:
+            self.misses += 1
+            item = self.provision()
+            self.provisioned += 1
+            return item
+
+        try:
+            item, error = self._ready.get_nowait()
+            self.hits += 1
+        except queue.Empty:
+            self.misses += 1
+            self._fill()
+            with self._lock:
+                if self._in_flight == 0:
+                    self._submit()
+            item, error = self._ready.get(timeout=timeout)
+        self._fill()
+
+        if error is not None:
+            raise error
+        return item
+
+    def _destroy_one(self, item):
+        try:
+            self.destroy(item)
+        except Exception:
+            self.errors.append(traceback.format_exc(limit=3))
+        else:
+            with self._lock:
+                self.destroyed += 1
+
+    def release(self, item):
+        """Удаляет выданную сущность: в фоне, при size=0 — сразу."""
+        if self.size == 0:
+            self._destroy_one(item)
+            return
+        self._destroyer.submit(self._destroy_one, item)
+
+    def close(self):
+        """Останавливает пополнение, дожидается фоновых операций и удаляет невыданные сущности."""
+        with self._lock:
+            self._closed = True
+        self._provisioner.shutdown(wait=True)
+        while True:
+            try:
+                item, error = self._ready.get_nowait()
+            except queue.Empty:
+                break
+            if error is None:
+                self._destroyer.submit(self._destroy_one, item)
+        self._destroyer.shutdown(wait=True)
+        return self.stats()
+
+    def stats(self) -> dict:
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'provisioned': self.provisioned,
+            'destroyed': self.destroyed,
+            'errors': len(self.errors),
+        }
+
+
+def count_pool_demand(items, pooled_fixtures: dict) -> dict:
+    """
+    Оценивает, сколько сущностей каждого пула понадобится прогону.
+
+    pooled_fixtures: имя фикстуры -> (имя пула, scope). Фикстуры ищутся в item.fixturenames и среди значений
+    параметризации (фикстуры, которые тест получает через request.getfixturevalue). Фикстуры одного пула
+    внутри одного scope (например, space_id_module и board_id_module в модуле) делят одну сущность.
+    """
+    keys = set()
+    for item in items:
+        used = set(getattr(item, 'fixturenames', ()))
+        callspec = getattr(item, 'callspec', None)
+        if callspec is not None:
+            used.update(value for value in callspec.params.values() if isinstance(value, str))
+        for fixture in used & pooled_fixtures.keys():
+            pool, scope = pooled_fixtures[fixture]
+            if scope == 'function':
+                keys.add((pool, item.nodeid))
+            elif scope == 'module':
+                keys.add((pool, item.nodeid.split('::')[0]))
+            else:
+                keys.add((pool, fixture))
+
+    demand = {}
+    for pool, _ in keys:
+        demand[pool] = demand.get(pool, 0) + 1
+    return demand
@@ -0,0 +1,93 @@
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Any, Optional
+
+import allure
+import pytest
+
+# Роль -> клиентская фикстура
+ROLE_CLIENTS = {
+    'owner': 'owner_client',
+    'manager': 'manager_client',
+    'member': 'member_client',
+    'guest': 'guest_client',
+}
+
+
+@dataclass
+class RoleResult:
+    """Результат операции для одной роли: ответ либо исключение, брошенное операцией."""
+
+    role: str
+    expected_status: int
+    response: Any = None
+    error: Optional[BaseException] = None
+    elapsed: float = 0.0
+
+    @property
+    def status_code(self) -> Optional[int]:
+        return self.response.status_code if self.response is not None else None
+
+
+class RoleMatrix:
+    """
+    Матрица доступа: одна операция и таблица ожидаемых статусов по ролям.
+
+    run() вызывает operation(client, role) сразу для всех ролей параллельно — один раз, из общей
+    module-фикстуры с общей подготовкой данных. parametrize() раскладывает роли на отдельные тесты,
+    которые только проверяют свой результат, поэтому в Allure каждая роль остаётся отдельным кейсом.
+    Пример:
+        GET_BOARD = RoleMatrix({'owner': 200, 'manager': 200, 'member': 200, 'guest': 200})
+
+        @pytest.fixture(scope='module')
+        def get_board_results(request, main_space, main_board):
+            return GET_BOARD.run(request, lambda client, role: client.post(**get_board_endpoint(...)))
+
+        @GET_BOARD.parametrize()
+        def test_get_board(get_board_results, role, expected_status):
+            check_role_result(get_board_results[role])
+    """
+
+    def __init__(self, expected: dict, clients: dict = None):
+        self.expected = dict(expected)
+        self.clients = clients or ROLE_CLIENTS
+
+    def parametrize(self):
+        return pytest.mark.parametrize(
+            'role, expected_status',
+            list(self.expected.items()),
+            ids=list(self.expected),
+        )
+
+    def run(self, request, operation) -> dict:
+        """Выполняет operation для всех ролей параллельно и возвращает {роль: RoleResult}."""
+        # Фикстуры клиентов берутся в основном потоке: request.getfixturevalue не потокобезопасен
+        clients = {role: request.getfixturevalue(self.clients[role]) for role in self.expected}
+
+        def _call(role):
+            result = RoleResult(role=role, expected_status=self.expected[role])
+            start = time.perf_counter()
+            try:
+                result.response = operation(clients[role], role)
+            except Exception as e:
+                result.error = e
+            result.elapsed = time.perf_counter() - start
+            return result
+
+        with ThreadPoolExecutor(max_workers=len(clients)) as executor:
+            return {result.role: result for result in executor.map(_call, clients)}
+
+
+def check_role_result(result: RoleResult):
+    """Проверка результата роли в тесте: пробрасывает ошибку операции и сверяет статус-код."""
+    if result.error is not None:
+        raise result.error
+
+    with allure.step(f'Проверка статус-кода для роли {result.role}: ожидаемый {result.expected_status}'):
+        allure.attach(
+            result.response.text,
+            name=f'{result.role}: ответ ({result.elapsed * 1000:.0f} ms)',
+            attachment_type=allure.attachment_type.JSON,
+        )
+        assert result.status_code == result.expected_status, result.response.text
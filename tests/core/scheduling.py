@@ -0,0 +1,156 @@
+import math
+import os
+import statistics
+import time
+
+import pytest
+import requests
+
+# Фикстуры, которые меняют общие ресурсы стенда: {фикстура: (ресурс, ...)}. Ресурс — имя session-фикстуры
+# с фиксированным id из окружения (main_space, main_board, board_with_tasks, ...). Временные ресурсы
+# (temp_space, temp_board и т.п.) у каждого xdist-воркера свои, поэтому конфликтов между воркерами не создают
+MUTATING_FIXTURES = {
+    # Создаёт и архивирует майлстоун, сбрасывает кэш метаданных борды
+    'temp_milestone_on_board_with_tasks': ('board_with_tasks',),
+    # Фабрики задач в main_board: создают и удаляют задачи, которые видят GetTasks по спейсу и проекту
+    'create_task_in_main': ('main_board',),
+    'make_task_in_main': ('main_board',),
+    'create_30_tasks': ('main_board',),
+    'bulk_task_factory': ('main_board',),
+}
+# Префикс имени xdist_group для тестов, меняющих общие ресурсы
+GROUP_PREFIX = 'mutates'
+
+# Подбор числа воркеров: сколько процессорного времени клиент тратит на один запрос (подготовка, разбор ответа,
+# проверки) — пока воркер ждёт ответ, ядро может обслуживать других воркеров
+CPU_MS_PER_REQUEST = 10.0
+# Сколько замеров задержки делать перед прогоном
+LATENCY_PROBES = 5
+
+
+def item_resources(item, mutating_fixtures: dict = MUTATING_FIXTURES) -> tuple:
+    """
+    Ресурсы теста: (mutates, reads).
+
+    mutates — ресурсы, которые тест меняет: аргументы маркеров mutates(...) и ресурсы фикстур из
+    mutating_fixtures ({фикстура: (ресурс, ...)}), которые тест использует.
+    reads — ресурсы, чувствительные к чужим изменениям: аргументы маркеров reads(...).
+    Тест, который просто использует общую фикстуру, считается читающим и может идти на любом воркере.
+    """
+    mutates = {name for marker in item.iter_markers('mutates') for name in marker.args}
+    reads = {name for marker in item.iter_markers('reads') for name in marker.args}
+    for fixture in getattr(item, 'fixturenames', ()):
+        mutates.update(mutating_fixtures.get(fixture, ()))
+    return mutates, reads - mutates
+
+
+class _DisjointSet:
+    def __init__(self):
+        self.parent = {}
+
+    def find(self, key):
+        self.parent.setdefault(key, key)
+        root = key
+        while self.parent[root] != root:
+            root = self.parent[root]
+        while self.parent[key] != root:
+            self.parent[key], key = root, self.parent[key]
+        return root
+
+    def union(self, first, *others):
+        root = self.find(first)
+        for other in others:
+            self.parent[self.find(other)] = root
+
+
+def assign_groups(items, mutating_fixtures: dict = MUTATING_FIXTURES) -> dict:
+    """
+    Распределяет тесты по группам {nodeid: имя группы}; тесты без группы в словарь не попадают.
+
+    Тесты, которые меняют один и тот же ресурс (или читают ресурс, который меняет другой тест),
+    получают общую группу и выполняются одним воркером последовательно. Тест, затрагивающий несколько
+    таких ресурсов, связывает их в одну группу. Остальные тесты распределяются по воркерам свободно.
+    """
+    resources = {item.nodeid: item_resources(item, mutating_fixtures) for item in items}
+    mutated = set().union(*(mutates for mutates, _ in resources.values()))
+
+    components = _DisjointSet()
+    touched_by = {}
+    for nodeid, (mutates, reads) in resources.items():
+        touched = mutates | (reads & mutated)
+        if touched:
+            touched_by[nodeid] = touched
+            components.union(*sorted(touched))
+
+    members = {}
+    for resource in mutated:
+        members.setdefault(components.find(resource), set()).add(resource)
+    names = {root: f"{GROUP_PREFIX}:{'+'.join(sorted(group))}" for root, group in members.items()}
+    return {nodeid: names[components.find(min(touched))] for nodeid, touched in touched_by.items()}
+
+
+def measure_latency_ms(url: str, probes: int = LATENCY_PROBES, timeout: float = 2.0):
+    """Медиана времени ответа url (мс); None, если стенд недоступен. Любой HTTP-ответ считается ответом."""
+    samples = []
+    with requests.Session() as session:
+        for _ in range(probes):
+            start = time.perf_counter()
+            try:
+                session.get(url, timeout=timeout, verify=False)
+            except requests.RequestException:
+                continue
+            samples.append((time.perf_counter() - start) * 1000)
+    return statistics.median(samples) if samples else None
+
+
+def recommend_workers(latency_ms, cpus: int = None, max_workers: int = 8,
+                      cpu_ms_per_request: float = CPU_MS_PER_REQUEST) -> int:
+    """
+    Число воркеров для I/O-bound прогона: на ядро помещается 1 + latency / cpu_ms_per_request воркеров
+    (пока один ждёт ответ, остальные работают). Сверху ограничено max_workers, чтобы не упереться в лимиты API.
+    Если задержку измерить не удалось — по числу ядер.
+    """
+    cpus = cpus or os.cpu_count() or 1
+    per_core = 1 + (latency_ms or 0) / cpu_ms_per_request
+    return max(1, min(max_workers, math.floor(cpus * per_core)))
+
+
+class SchedulingPlugin:
+    """
+    Помечает тесты, меняющие общие ресурсы, маркером xdist_group (см. assign_groups): с --dist loadgroup
+    такие тесты идут одним воркером, остальные распределяются свободно.
+    Хук выполняется раньше хука воркера xdist, который дописывает группу к nodeid.
+    """
+
+    def __init__(self, mutating_fixtures: dict = MUTATING_FIXTURES):
+        self.mutating_fixtures = mutating_fixtures
+        self.groups = {}
+
+    @pytest.hookimpl(tryfirst=True)
+    def pytest_collection_modifyitems(self, config, items):
+        self.groups = assign_groups(items, self.mutating_fixtures)
+        for item in items:
+            group = self.groups.get(item.nodeid)
+            if group:
+                item.add_marker(pytest.mark.xdist_group(group))
+
+    def report(self) -> str:
+        sizes = {}
+        for group in self.groups.values():
+            sizes[group] = sizes.get(group, 0) + 1
+        return ', '.join(f'{group} ({count})' for group, count in sorted(sizes.items()))
+
+
+class WorkerCountPlugin:
+    """-n auto: число воркеров по измеренной задержке API (регистрируется, только если установлен pytest-xdist)."""
+
+    def __init__(self, api_url: str, max_workers: int):
+        self.api_url = api_url
+        self.max_workers = max_workers
+
+    def pytest_xdist_auto_num_workers(self, config):
+        latency_ms = measure_latency_ms(self.api_url)
+        workers = recommend_workers(latency_ms, max_workers=self.max_workers)
+        shown = 'недоступен' if latency_ms is None else f'{latency_ms:.0f} мс'
+        print(f'\nxdist: задержка API {shown}, воркеров: {workers} (максимум {self.max_workers})')
+        return workers
@@ -0,0 +1,185 @@
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Optional
+
+import allure
+
+# Сколько нарушений показывать в сообщении об ошибке (в Allure уходят все)
+MAX_REPORTED_VIOLATIONS = 20
+
+NoneType = type(None)
+
+
+def type_name(expected) -> str:
+    types = expected if isinstance(expected, tuple) else (expected,)
+    return ' | '.join('None' if t is NoneType else t.__name__ for t in types)
+
+
+def _freeze(mapping) -> tuple:
+    return tuple((mapping or {}).items())
+
+
+@dataclass
+class SchemaViolation:
+    """Нарушение схемы: index — позиция объекта в списке (None для одиночного объекта), path — путь к полю."""
+
+    index: Optional[int]
+    path: str
+    message: str
+
+    def __str__(self):
+        where = self.path if self.index is None else f'[{self.index}] {self.path}'
+        return f'{where}: {self.message}'
+
+
+class Schema:
+    """
+    Скомпилированная схема объекта из словарей вида {поле: тип или кортеж типов}.
+
+    required — обязательные поля, optional — поля, которые могут отсутствовать (nullable_optional=True
+    разрешает им None), strict — запрет неизвестных полей. items — тип элементов поля-списка,
+    values — тип значений поля-словаря, nested — вложенные Schema.
+
+    При компиляции схема превращается в одну сгенерированную функцию-предикат: валидный объект
+    проверяется одним вызовом без циклов по схеме. Подробный разбор (все нарушения с путями) выполняется
+    только для объектов, не прошедших предикат. Создавайте схемы через compile_schema — она кеширует результат.
+    """
+
+    def __init__(self, name: str, required: tuple, optional: tuple = (), strict: bool = True,
+                 nullable_optional: bool = False, items: tuple = (), values: tuple = (), nested: tuple = ()):
+        self.name = name
+        self.required = dict(required)
+        self.optional = {
+            field: (*(t if isinstance(t, tuple) else (t,)), NoneType) if nullable_optional else t
+            for field, t in optional
+        }
+        self.strict = strict
+        self.items = dict(items)
+        self.values = dict(values)
+        self.nested = dict(nested)
+        self._required_keys = frozenset(self.required)
+        self._allowed_keys = self._required_keys | frozenset(self.optional)
+        self.is_valid = self._compile()
+
+    def _compile(self):
+        """Генерирует предикат obj -> bool, эквивалентный errors(obj) == []."""
+        namespace = {'dict': dict, 'list': list, 'isinstance': isinstance,
+                     'REQUIRED': self._required_keys, 'ALLOWED': self._allowed_keys}
+        if self.strict and not self.optional:
+            conditions = ['o.keys() == REQUIRED']
+        elif self.strict:
+            conditions = ['REQUIRED <= o.keys() <= ALLOWED']
+        else:
+            conditions = ['REQUIRED <= o.keys()']
+
+        for i, (field, expected) in enumerate(self.required.items()):
+            namespace[f'T{i}'] = expected
+            conditions.append(f'isinstance(o[{field!r}], T{i})')
+        for i, (field, expected) in enumerate(self.optional.items()):
+            namespace[f'O{i}'] = expected
+            conditions.append(f'({field!r} not in o or isinstance(o[{field!r}], O{i}))')
+        for i, (field, expected) in enumerate(self.items.items()):
+            namespace[f'I{i}'] = expected
+            conditions.append(f'all([isinstance(x, I{i}) for x in o[{field!r}]]) '
+                              f'if isinstance(o.get({field!r}), list) else True')
+        for i, (field, expected) in enumerate(self.values.items()):
+            namespace[f'V{i}'] = expected
+            conditions.append(f'all([isinstance(x, V{i}) for x in o[{field!r}].values()]) '
+                              f'if isinstance(o.get({field!r}), dict) else True')
+        for i, (field, schema) in enumerate(self.nested.items()):
+            namespace[f'N{i}'] = schema.is_valid
+            conditions.append(f'({field!r} not in o or N{i}(o[{field!r}]))')
+
+        body = ' and\n        '.join(f'({c})' for c in conditions)
+        source = f'def is_valid(o):\n    return isinstance(o, dict) and (\n        {body})\n'
+        exec(compile(source, f'<schema {self.name}>', 'exec'), namespace)
+        return namespace['is_valid']
+
+    def errors(self, obj, path: str = None) -> list:
+        """Все нарушения схемы в obj: список (путь, сообщение)."""
+        path = path or self.name
+        if not isinstance(obj, dict):
+            return [(path, f'ожидается объект, получен {type(obj).__name__}')]
+        found = []
+        missing = self._required_keys - obj.keys()
+        if missing:
+            found.append((path, f'отсутствуют обязательные поля: {sorted(missing)}'))
+        if self.strict:
+            extra = obj.keys() - self._allowed_keys
+            if extra:
+                found.append((path, f'найдены лишние поля: {sorted(extra)}'))
+        for schema in (self.required, self.optional):
+            for field, expected in schema.items():
+                if field in obj and not isinstance(obj[field], expected):
+                    found.append((f'{path}.{field}', f'неверный тип: {type(obj[field]).__name__}, '
+                                                     f'ожидается {type_name(expected)}'))
+        for field, expected in self.items.items():
+            value = obj.get(field)
+            if isinstance(value, list):
+                bad = [i for i, x in enumerate(value) if not isinstance(x, expected)]
+                if bad:
+                    found.append((f'{path}.{field}', f'элементы {bad} не {type_name(expected)}'))
+        for field, expected in self.values.items():
+            value = obj.get(field)
+            if isinstance(value, dict):
+                bad = sorted(key for key, x in value.items() if not isinstance(x, expected))
+                if bad:
+                    found.append((f'{path}.{field}', f'значения по ключам {bad} не {type_name(expected)}'))
+        for field, schema in self.nested.items():
+            if field in obj:
+                found.extend(schema.errors(obj[field], f'{path}.{field}'))
+        return found
+
+    def validate(self, obj) -> list:
+        """Нарушения схемы в одном объекте (список SchemaViolation, пустой — объект валиден)."""
+        if self.is_valid(obj):
+            return []
+        return [SchemaViolation(None, path, message) for path, message in self.errors(obj)]
+
+    def validate_many(self, objects) -> list:
+        """Нарушения по всем объектам списка с индексами; валидные объекты стоят один вызов предиката."""
+        is_valid = self.is_valid
+        violations = []
+        for index, obj in enumerate(objects):
+            if not is_valid(obj):
+                label = f'{self.name}[_id={obj.get("_id")}]' if isinstance(obj, dict) and '_id' in obj else None
+                violations += [SchemaViolation(index, path, message) for path, message in self.errors(obj, label)]
+        return violations
+
+    def assert_valid(self, obj):
+        """Падает со всеми нарушениями схемы объекта."""
+        self._raise(self.validate(obj), total=1)
+
+    def assert_all_valid(self, objects):
+        """Проверяет все объекты списка и падает одним отчётом по всем нарушениям."""
+        objects = objects if isinstance(objects, list) else list(objects)
+        self._raise(self.validate_many(objects), total=len(objects))
+
+    def _raise(self, violations: list, total: int):
+        if not violations:
+            return
+        invalid = len({v.index for v in violations})
+        lines = [f'Нарушений схемы {self.name}: {len(violations)} (объектов с ошибками: {invalid} из {total})']
+        lines += [str(v) for v in violations[:MAX_REPORTED_VIOLATIONS]]
+        if len(violations) > MAX_REPORTED_VIOLATIONS:
+            lines.append(f'... и ещё {len(violations) - MAX_REPORTED_VIOLATIONS}')
+        allure.attach('\n'.join(str(v) for v in violations), name=f'Нарушения схемы {self.name}',
+                      attachment_type=allure.attachment_type.TEXT)
+        raise AssertionError('\n'.join(lines))
+
+
+@lru_cache(maxsize=None)
+def _compile_schema(name, required, optional, strict, nullable_optional, items, values, nested) -> Schema:
+    return Schema(name, required, optional, strict, nullable_optional, items, values, nested)
+
+
+def compile_schema(name: str, required: dict, optional: dict = None, strict: bool = True,
+                   nullable_optional: bool = False, items: dict = None, values: dict = None,
+                   nested: dict = None) -> Schema:
+    """
+    Компилирует схему один раз: повторный вызов с теми же словарями возвращает тот же объект Schema.
+        TASK_VALIDATOR = compile_schema('Task', TASK_FULL_SCHEMA, items={'assignees': str})
+        TASK_VALIDATOR.assert_all_valid(tasks)
+    """
+    return _compile_schema(name, _freeze(required), _freeze(optional), strict, nullable_optional,
+                           _freeze(items), _freeze(values), _freeze(nested))
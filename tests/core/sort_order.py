@@ -0,0 +1,191 @@
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, Callable, Optional, Union
+
+import allure
+from dateutil import parser as date_parser
+
+from tests.core.pagination import StreamCheck
+
+ASC, DESC = 1, -1
+# Где в выдаче null-значения: 'lowest' — null меньше любого значения (как в MongoDB: в начале при ASC,
+# в конце при DESC), 'highest' — наоборот, 'first'/'last' — независимо от направления, 'error' — null запрещён
+NULLS_LOWEST, NULLS_HIGHEST, NULLS_FIRST, NULLS_LAST, NULLS_ERROR = 'lowest', 'highest', 'first', 'last', 'error'
+# Сколько нарушений показывать в сообщении об ошибке (в Allure уходят все)
+MAX_REPORTED_VIOLATIONS = 20
+
+
+def parse_datetime(value) -> float:
+    """ISO 8601 -> unix timestamp; быстрый путь через fromisoformat, остальные форматы — через dateutil."""
+    try:
+        return datetime.fromisoformat(value).timestamp()
+    except ValueError:
+        return date_parser.parse(value).timestamp()
+
+
+def parse_number(value) -> float:
+    return float(value)
+
+
+def parse_raw(value):
+    return value
+
+
+PARSERS = {
+    'datetime': parse_datetime,
+    'number': parse_number,
+    'bool': parse_number,
+    'raw': parse_raw,
+}
+
+
+@dataclass(frozen=True)
+class SortSpec:
+    """
+    Ожидаемый порядок: поле, направление (ASC/DESC), положение null и разбор значения.
+    parse — имя из PARSERS или функция value -> сравнимый ключ; значение разбирается один раз.
+    tiebreaker — порядок среди элементов с равным ключом (например, SortSpec('_id', parse='raw')).
+    """
+
+    field: str
+    direction: int = ASC
+    nulls: str = NULLS_LOWEST
+    parse: Union[str, Callable[[Any], Any]] = 'raw'
+    tiebreaker: Optional['SortSpec'] = None
+
+    def nulls_first(self) -> Optional[bool]:
+        if self.nulls == NULLS_ERROR:
+            return None
+        if self.nulls in (NULLS_FIRST, NULLS_LAST):
+            return self.nulls == NULLS_FIRST
+        return (self.nulls == NULLS_LOWEST) == (self.direction == ASC)
+
+    def parser(self) -> Callable:
+        return PARSERS[self.parse] if isinstance(self.parse, str) else self.parse
+
+    def describe(self) -> str:
+        text = f"{self.field} {'ASC' if self.direction == ASC else 'DESC'}, null: {self.nulls}"
+        return f'{text}; затем {self.tiebreaker.describe()}' if self.tiebreaker else text
+
+
+@dataclass
+class SortViolation:
+    """Нарушение порядка между элементами index-1 и index."""
+
+    index: int
+    item_id: Any
+    previous: Any
+    current: Any
+    reason: str
+
+    def __str__(self):
+        return f'[{self.index}] {self.item_id}: {self.previous!r} -> {self.current!r} ({self.reason})'
+
+
+class SortOrderValidator(StreamCheck):
+    """
+    Проверка порядка за один проход: каждый элемент сравнивается только с предыдущим
+    по заранее разобранному ключу. Нарушения копятся все (с индексом), а не до первого.
+
+    Подходит и для списка (validate / assert_sorted), и как проверка PageStream:
+        validator = SortOrderValidator(SortSpec('dueStart', DESC, parse='datetime'))
+        for task in stream_tasks(client, endpoint, checks=[validator]): ...
+    finish() падает с перечнем нарушений и прикладывает полный список в Allure.
+    """
+
+    def __init__(self, spec: SortSpec, id_field: str = '_id'):
+        self.spec = spec
+        self.id_field = id_field
+        self.violations = []
+        self.count = 0
+        self.non_null = 0
+        self._field = spec.field
+        self._ascending = spec.direction == ASC
+        self._nulls_first = spec.nulls_first()
+        self._parse = spec.parser()
+        self._tiebreaker = SortOrderValidator(spec.tiebreaker, id_field) if spec.tiebreaker else None
+        self._prev_raw = None
+        self._prev_key = None
+        self._prev_null = None
+
+    def _violation(self, index, item, current, reason):
+        self.violations.append(SortViolation(index, item.get(self.id_field), self._prev_raw, current, reason))
+
+    def _key(self, item, index, raw):
+        try:
+            return self._parse(raw)
+        except (TypeError, ValueError, OverflowError) as e:
+            self._violation(index, item, raw, f'не разбирается: {e}')
+            return None
+
+    def feed(self, item, position=None):
+        index = self.count if position is None else position
+        raw = item.get(self._field)
+        is_null = raw is None
+        key = None
+        if is_null:
+            if self._nulls_first is None:
+                self._violation(index, item, raw, f'{self._field} = null')
+        else:
+            key = self._key(item, index, raw)
+
+        new_group = True
+        if self.count:
+            if is_null != self._prev_null:
+                # Переход между null и значениями допустим только в одну сторону
+                if self._nulls_first is not None and is_null == self._nulls_first:
+                    where = 'в начале' if self._nulls_first else 'в конце'
+                    self._violation(index, item, raw, f'null должны быть {where}')
+            elif is_null:
+                new_group = False
+            elif key is not None and self._prev_key is not None:
+                if (key < self._prev_key) if self._ascending else (key > self._prev_key):
+                    self._violation(index, item, raw, 'нарушен порядок')
+                else:
+                    new_group = key != self._prev_key
+
+        if self._tiebreaker is not None:
+            # Тайбрейкер сравнивает элементы только внутри группы с равным ключом
+            if new_group:
+                self._tiebreaker.reset()
+            self._tiebreaker.feed(item, index)
+            self.violations.extend(self._tiebreaker.violations)
+            self._tiebreaker.violations = []
+
+        self._prev_raw, self._prev_key, self._prev_null = raw, key, is_null
+        self.count += 1
+        self.non_null += not is_null
+
+    def reset(self):
+        self.count = 0
+        self._prev_raw = self._prev_key = self._prev_null = None
+
+    def report(self) -> str:
+        lines = [f'Нарушений порядка ({self.spec.describe()}): {len(self.violations)} из {self.count} элементов']
+        lines += [str(v) for v in self.violations[:MAX_REPORTED_VIOLATIONS]]
+        if len(self.violations) > MAX_REPORTED_VIOLATIONS:
+            lines.append(f'... и ещё {len(self.violations) - MAX_REPORTED_VIOLATIONS}')
+        return '\n'.join(lines)
+
+    def finish(self):
+        if self.violations:
+            allure.attach('\n'.join(str(v) for v in self.violations), name=f'Нарушения сортировки {self._field}',
+                          attachment_type=allure.attachment_type.TEXT)
+            raise AssertionError(self.report())
+
+
+def validate_sort_order(items, spec: SortSpec, id_field: str = '_id') -> list:
+    """Все нарушения порядка в items (список SortViolation, пустой — порядок верный)."""
+    validator = SortOrderValidator(spec, id_field)
+    for item in items:
+        validator.feed(item)
+    return validator.violations
+
+
+def assert_sorted(items, spec: SortSpec, id_field: str = '_id') -> SortOrderValidator:
+    """Проверяет порядок items; при нарушениях падает со списком (индексы, id, соседние значения)."""
+    validator = SortOrderValidator(spec, id_field)
+    for item in items:
+        validator.feed(item)
+    validator.finish()
+    return validator
@@ -0,0 +1,98 @@
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+
+import allure
+import requests
+
+from core.waiters import ExponentialBackoff
+
+# Ответы, после которых удаление считается выполненным
+DELETED_STATUSES = (200,)
+# Сущности уже нет (удалена в тесте, конвертирована и т.п.) — тоже успех
+GONE_STATUSES = (400, 404)
+# Временные ошибки, удаление стоит повторить
+RETRY_STATUSES = (408, 409, 425, 429, 500, 502, 503, 504)
+
+
+@dataclass
+class TeardownReport:
+    """Итог массового удаления: что удалено, чего уже не было и что осталось (с последним статусом)."""
+
+    deleted: list = field(default_factory=list)
+    gone: list = field(default_factory=list)
+    leftovers: list = field(default_factory=list)
+
+    def summary(self) -> str:
+        lines = [f"Удалено: {len(self.deleted)}, уже отсутствовали: {len(self.gone)}, осталось: {len(self.leftovers)}"]
+        for label, status, text in self.leftovers:
+            lines.append(f"  {label}: статус {status}, ответ: {text}")
+        return '\n'.join(lines)
+
+
+class BulkTeardown:
+    """
+    Движок массовой очистки: собирает запросы на удаление и выполняет их параллельно.
+
+    Запросы (словари *_endpoint(), например delete_task_endpoint) отправляются пулом из max_workers потоков.
+    Повтор делается только для статусов из RETRY_STATUSES и сетевых ошибок, с экспоненциальной паузой.
+    Пример:
+        teardown = BulkTeardown(owner_client)
+        for task_id in created_ids:
+            teardown.add(delete_task_endpoint(task_id=task_id, space_id=main_space), label=task_id)
+        teardown.run()
+    """
+
+    def __init__(self, client, max_workers: int = 8, retries: int = 3, backoff=None):
+        self.client = client
+        self.max_workers = max_workers
+        self.retries = retries
+        self.backoff = backoff or ExponentialBackoff(initial=0.2, max_interval=2.0)
+        self._calls = []
+
+    def add(self, endpoint: dict, label: str = None):
+        self._calls.append((label or endpoint['json'], endpoint))
+        return self
+
+    def _delete(self, label, endpoint):
+        delays = self.backoff.delays()
+        status, text = None, ''
+        for attempt in range(self.retries + 1):
+            if attempt:
+                time.sleep(next(delays))
+            try:
+                resp = self.client.post(**endpoint)
+            except requests.RequestException as e:
+                status, text = None, str(e)
+                continue
+            status, text = resp.status_code, resp.text
+            if status in DELETED_STATUSES:
+                return 'deleted', label, status, text
+            if status in GONE_STATUSES:
+                return 'gone', label, status, text
+            if status not in RETRY_STATUSES:
+                break
+        return 'leftover', label, status, text
+
+    def run(self, report_title: str = "Teardown: массовое удаление") -> TeardownReport:
+        """Выполняет накопленные удаления и возвращает отчёт. Оставшиеся сущности прикладываются к Allure."""
+        calls, self._calls = self._calls, []
+        report = TeardownReport()
+        if not calls:
+            return report
+
+        with ThreadPoolExecutor(max_workers=min(self.max_workers, len(calls))) as executor:
+            results = list(executor.map(lambda call: self._delete(*call), calls))
+
+        for outcome, label, status, text in results:
+            if outcome == 'deleted':
+                report.deleted.append(label)
+            elif outcome == 'gone':
+                report.gone.append(label)
+            else:
+                report.leftovers.append((label, status, text))
+
+        if report.leftovers:
+            print(f"{report_title}\n{report.summary()}")
+            allure.attach(report.summary(), name=report_title, attachment_type=allure.attachment_type.TEXT)
+        return report
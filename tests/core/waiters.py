@@ -1,7 +1,90 @@
+import random
+import sys
 import time
+from collections import defaultdict
+from contextlib import contextmanager
 
 
-def wait_until(condition_func, timeout=10, poll_interval=0.5, error_msg="Превышено время ожидания"):
+class FixedInterval:
+    """Стратегия поллинга с постоянным интервалом (прежнее поведение wait_until)."""
+
+    def __init__(self, interval: float = 0.5):
+        self.interval = interval
+
+    def delays(self):
+        while True:
+            yield self.interval
+
+
+class ExponentialBackoff:
+    """
+    Стратегия поллинга с экспоненциальным ростом интервала и джиттером.
+
+    Первая повторная проверка делается быстро (initial), затем интервал растёт в factor раз
+    до max_interval. Джиттер (доля от интервала) разводит параллельные поллеры во времени.
+    """
+
+    def __init__(self, initial: float = 0.05, factor: float = 2.0, max_interval: float = 1.0, jitter: float = 0.1):
+        self.initial = initial
+        self.factor = factor
+        self.max_interval = max_interval
+        self.jitter = jitter
+
+    def delays(self):
+        interval = self.initial
+        while True:
+            yield interval * (1 + random.uniform(-self.jitter, self.jitter))
+            interval = min(interval * self.factor, self.max_interval)
+
+
+class DeadlineBudget:
+    """Общий бюджет времени на все ожидания внутри теста (вложенные wait_until берут время из него)."""
+
+    def __init__(self, seconds: float):
+        self.seconds = seconds
+        self.deadline = time.monotonic() + seconds
+
+    def remaining(self) -> float:
+        return max(0.0, self.deadline - time.monotonic())
+
+
+_budgets = []
+
+# Статистика по местам вызова wait_until: "файл:строка" -> calls/attempts/waited/timeouts
+WAIT_STATS = defaultdict(lambda: {'calls': 0, 'attempts': 0, 'waited': 0.0, 'timeouts': 0})
+
+
+@contextmanager
+def deadline_budget(seconds: float):
+    """
+    Ограничивает суммарное время всех wait_until внутри блока.
+    Вложенный бюджет не может быть больше оставшегося внешнего.
+    """
+    if _budgets:
+        seconds = min(seconds, _budgets[-1].remaining())
+    budget = DeadlineBudget(seconds)
+    _budgets.append(budget)
+    try:
+        yield budget
+    finally:
+        _budgets.remove(budget)
+
+
+def budgeted(timeout: float) -> float:
+    """Таймаут с учётом активного deadline_budget (не больше его остатка)."""
+    if _budgets:
+        return min(timeout, _budgets[-1].remaining())
+    return timeout
+
+
+def caller_site(depth: int = 2) -> str:
+    """Место вызова ("файл:строка") на depth кадров выше этой функции."""
+    frame = sys._getframe(depth)
+    return f'{frame.f_code.co_filename}:{frame.f_lineno}'
+
+
+def wait_until(condition_func, timeout=10, poll_interval=None, error_msg="Превышено время ожидания",
+               strategy=None, call_site: str = None):
     """
     Универсальная функция для поллинга (ожидания).
 
@@ -9,17 +92,47 @@ def wait_until(condition_func, timeout=10, poll_interval=0.5, error_msg="Пре
     (например, найденный словарь, список или True), поллинг завершается и возвращает это значение.
     Если время вышло, выбрасывается исключение TimeoutError.
 
+    Первая проверка делается сразу, дальше интервалы задаёт стратегия: явно переданный poll_interval
+    означает фиксированный интервал, иначе используется экспоненциальный backoff.
+    Если активен deadline_budget, таймаут не превышает остаток бюджета.
+
     :param condition_func: Функция без аргументов, возвращающая искомый результат или None/False.
     :param timeout: Максимальное время ожидания в секундах.
-    :param poll_interval: Интервал между проверками в секундах.
+    :param poll_interval: Фиксированный интервал между проверками в секундах (None — backoff).
     :param error_msg: Сообщение об ошибке при таймауте.
+    :param strategy: Стратегия поллинга (FixedInterval, ExponentialBackoff или объект с методом delays()).
+    :param call_site: Ключ для статистики WAIT_STATS (по умолчанию — файл и строка вызова).
     """
-    start_time = time.time()
+    if strategy is None:
+        strategy = FixedInterval(poll_interval) if poll_interval is not None else ExponentialBackoff()
+    timeout = budgeted(timeout)
+    stats = WAIT_STATS[call_site or caller_site()]
+    stats['calls'] += 1
+
+    start_time = time.monotonic()
+    deadline = start_time + timeout
+    delays = strategy.delays()
+    try:
+        while True:
+            stats['attempts'] += 1
+            result = condition_func()
+            if result:
+                return result
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            time.sleep(min(next(delays), remaining))
+    finally:
+        stats['waited'] += time.monotonic() - start_time
+
+    stats['timeouts'] += 1
+    raise TimeoutError(error_msg)
 
-    while time.time() - start_time < timeout:
-        result = condition_func()
-        if result:
-            return result
-        time.sleep(poll_interval)
 
-    raise TimeoutError(error_msg)
\ No newline at end of file
+def wait_stats_report(top: int = 20) -> str:
+    """Таблица мест вызова wait_until, отсортированная по суммарному времени ожидания."""
+    rows = sorted(WAIT_STATS.items(), key=lambda item: item[1]['waited'], reverse=True)[:top]
+    lines = [f"{'waited, s':>10} {'calls':>6} {'attempts':>9} {'timeouts':>9}  call site"]
+    for site, s in rows:
+        lines.append(f"{s['waited']:>10.2f} {s['calls']:>6} {s['attempts']:>9} {s['timeouts']:>9}  {site}")
+    return '\n'.join(lines)
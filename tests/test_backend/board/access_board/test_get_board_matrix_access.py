@@ -1,39 +1,30 @@
 import pytest
 import allure
 
+from tests.core.role_matrix import RoleMatrix, check_role_result
 from tests.test_backend.data.endpoints.Board.board_endpoints import (
     get_board_endpoint,
 )
 
 pytestmark = [pytest.mark.backend]
 
-@allure.parent_suite("Board Service")
-@allure.suite("Access board")
-@pytest.mark.parametrize(
-    'client_fixture, expected_status',
-    [
-        ('owner_client', 200),
-        ('manager_client', 200),
-        ('member_client', 200),
-        ('guest_client', 200),
-    ],
-    ids=['owner', 'manager', 'member', 'guest'],
-)
-def test_get_board_access_by_roles(request, client_fixture, expected_status, board_with_tasks, main_space):
-    allure.dynamic.title(f'Тест получения доски: клиент={client_fixture}, ожидаемый статус={expected_status}')
+GET_BOARD_BY_ROLES = RoleMatrix({'owner': 200, 'manager': 200, 'member': 200, 'guest': 200})
 
-    with allure.step(f'Получение клиента: {client_fixture}'):
-        client = request.getfixturevalue(client_fixture)
 
-    with allure.step("Отправка запроса на получение борды"):
-        payload = get_board_endpoint(
-            space_id=main_space,
-            board_id=board_with_tasks
-        )
-        response = client.post(**payload)
+@pytest.fixture(scope='module')
+def get_board_results(request, board_with_tasks, main_space):
+    """Запросы GetBoard всех ролей, отправленные параллельно один раз на модуль."""
+    payload = get_board_endpoint(space_id=main_space, board_id=board_with_tasks)
+    return GET_BOARD_BY_ROLES.run(request, lambda client, role: client.post(**payload))
 
-    with allure.step(f'Проверка статус-кода: ожидаемый {expected_status}'):
-        assert response.status_code == expected_status, response.text
+
+@allure.parent_suite("Board Service")
+@allure.suite("Access board")
+@GET_BOARD_BY_ROLES.parametrize()
+def test_get_board_access_by_roles(get_board_results, role, expected_status):
+    allure.dynamic.title(f'Тест получения доски: роль={role}, ожидаемый статус={expected_status}')
+
+    check_role_result(get_board_results[role])
 
 @allure.parent_suite("Board Service")
 @allure.suite("Access board")
@@ -1,5 +1,6 @@
 import pytest
 
+from test_backend.comment.sanitizer.fuzz import FUZZ_SEED_KEY
 from test_backend.data.endpoints.Task.task_endpoints import create_task_endpoint, get_task_endpoint, delete_task_endpoint
 
 
@@ -26,3 +27,10 @@ def document_id(owner_client, main_space, main_board):
     yield doc_id
 
     owner_client.post(**delete_task_endpoint(task_id=task_id, space_id=main_space))
+
+
+def pytest_terminal_summary(terminalreporter):
+    """Печатает seed фаззинга санитайзера: с FUZZ_SEED=<seed> прогон повторяет те же случаи."""
+    seed = terminalreporter.config.stash.get(FUZZ_SEED_KEY, None)
+    if seed is not None:
+        terminalreporter.write_line(f'Фаззинг санитайзера: FUZZ_SEED={seed}')
@@ -0,0 +1,334 @@
+import hashlib
+import json
+import os
+import random
+import time
+from dataclasses import dataclass, field
+from html import escape
+from typing import List, Optional
+
+import allure
+import pytest
+
+from test_backend.data.endpoints.Comment.comment_endpoints import (
+    create_comment_endpoint,
+    edit_comment_endpoint,
+    get_comments_endpoint,
+)
+from tests.core.auth import _file_lock
+from tests.core.html_sanitizer import ALLOWED_TAGS, DROPPED_TAGS, GLOBAL_ATTRS, MODEL_VERSION, VOID_TAGS, Element, \
+    parse, render, sanitize
+
+# Сколько случаев уходит одной пачкой post_many (одновременно в полёте — не больше пула клиента)
+BATCH_SIZE = 200
+# Сколько проверок (запросов) можно потратить на минимизацию одного падения и сколько падений минимизировать
+SHRINK_BUDGET = 300
+SHRINK_BATCH = 16
+MAX_SHRUNK_FAILURES = 5
+# Исходный content комментария, который в режиме edit заменяется случаем через EditComment
+EDIT_ORIGINAL = '<p>original</p>'
+MODES = ('create', 'edit')
+# Seed прогона фаззинга в config.stash: conftest печатает его в итогах pytest для воспроизведения падений
+FUZZ_SEED_KEY = pytest.StashKey[int]()
+
+# Грамматика: неразрешённые теги, которые санитайзер разворачивает, запрещённые атрибуты и значения атрибутов
+UNWRAPPED_TAGS = ('form',)
+BLOCKED_ATTRS = ('onclick', 'onerror', 'onmouseover', 'style', 'data-custom', 'data-inject')
+ATTR_VALUES = {
+    'href': ('https://example.com', 'javascript:alert(1)', ' JavaScript:alert(1)', 'java\tscript:alert(1)'),
+    'src': ('https://example.com/img.png', 'x', 'javascript:alert(1)'),
+    'target': ('_blank', '_self'),
+    'rel': ('noopener noreferrer', 'nofollow'),
+    'alt': ('image', 'a "quoted" alt'),
+    'class': ('my-class', 'emoji'),
+    'id': ('p1',),
+    'start': ('1', '5'),
+    'data-type': ('taskList', 'taskItem'),
+    'data-checked': ('true', 'false'),
+    'type': ('checkbox', 'submit'),
+    'checked': (None,),
+    'shortcodes': (':smile:',),
+    'custom': ('1',),
+    'inline': ('true',),
+    'data': ('{"item": {"id": "0", "kind": "User"}}',),
+}
+BLOCKED_VALUES = ("alert('xss')", 'color:red', 'evil')
+TEXTS = ('text', 'Hello world', 'a & b', '1 < 2', '"quoted"', "it's", 'привет', 'alert(1)')
+
+
+class HtmlGrammar:
+    """
+    Генератор HTML комментариев: деревья из разрешённых (ALLOWED_TAGS), запрещённых (DROPPED_TAGS)
+    и разворачиваемых (UNWRAPPED_TAGS) тегов с разрешёнными и запрещёнными атрибутами. Разметка пишется
+    с разными кавычками и формами пустых тегов. Один seed — один и тот же набор случаев.
+    """
+
+    def __init__(self, seed: int, max_depth: int = 3, max_children: int = 3):
+        self.random = random.Random(seed)
+        self.max_depth = max_depth
+        self.max_children = max_children
+        self.containers = [tag for tag in ALLOWED_TAGS if tag not in VOID_TAGS]
+        self.voids = [tag for tag in ALLOWED_TAGS if tag in VOID_TAGS]
+
+    def cases(self, count: int) -> List[str]:
+        """count различных случаев (короткие входы вроде одного слова выпадают повторно — их не дублируем)."""
+        cases = {}
+        for _ in range(count * 20):
+            if len(cases) == count:
+                break
+            cases.setdefault(self.case(), None)
+        return list(cases)
+
+    def case(self) -> str:
+        return ''.join(self._node(0) for _ in range(self.random.randint(1, self.max_children)))
+
+    def _node(self, depth: int) -> str:
+        roll = self.random.random()
+        if depth >= self.max_depth or roll < 0.25:
+            return escape(self.random.choice(TEXTS), quote=False)
+        if roll < 0.35:
+            tag = self.random.choice(self.voids)
+            return f'<{tag}{self._attrs(tag)}{self.random.choice((">", " />", "/>"))}'
+        if roll < 0.45:
+            tag = self.random.choice(DROPPED_TAGS + UNWRAPPED_TAGS)
+        else:
+            tag = self.random.choice(self.containers)
+        children = ''.join(self._node(depth + 1) for _ in range(self.random.randint(0, self.max_children)))
+        return f'<{tag}{self._attrs(tag)}>{children}</{tag}>'
+
+    def _attrs(self, tag: str) -> str:
+        parts = []
+        for name in GLOBAL_ATTRS + ALLOWED_TAGS.get(tag, ()):
+            if self.random.random() < 0.3:
+                parts.append(self._attr(name, self.random.choice(ATTR_VALUES.get(name, ('value',)))))
+        for name in BLOCKED_ATTRS:
+            if self.random.random() < 0.1:
+                parts.append(self._attr(name, self.random.choice(BLOCKED_VALUES)))
+        return ''.join(parts)
+
+    def _attr(self, name: str, value: Optional[str]) -> str:
+        if value is None:
+            return f' {name}'
+        if self.random.random() < 0.5:
+            return f' {name}="{escape(value)}"'
+        return f" {name}='{escape(value)}'"
+
+
+class FuzzCache:
+    """
+    Случаи, которые уже проверены и совпали с моделью: ключ — первые 16 символов sha256 от стенда,
+    версии модели, режима и входного HTML. Смена правил модели (MODEL_VERSION) делает старые ключи
+    неактуальными. Файл общий для процессов: save() дописывает ключи под межпроцессной блокировкой.
+    """
+
+    def __init__(self, path: str, namespace: str):
+        self.path = path
+        self.namespace = namespace
+        self.keys = self._load()
+        self._new = set()
+
+    def _load(self) -> set:
+        try:
+            with open(self.path, encoding='utf-8') as f:
+                return set(json.load(f).get('keys', []))
+        except (FileNotFoundError, ValueError):
+            return set()
+
+    def key(self, mode: str, html: str) -> str:
+        raw = '\0'.join((self.namespace, MODEL_VERSION, mode, html))
+        return hashlib.sha256(raw.encode('utf-8')).hexdigest()[:16]
+
+    def __contains__(self, key: str) -> bool:
+        return key in self.keys
+
+    def add(self, key: str):
+        self.keys.add(key)
+        self._new.add(key)
+
+    def save(self):
+        if not self._new:
+            return
+        os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+        with _file_lock(f'{self.path}.lock'):
+            self.keys |= self._load()
+            tmp_path = f'{self.path}.tmp'
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump({'version': 1, 'keys': sorted(self.keys)}, f, separators=(',', ':'))
+            os.replace(tmp_path, self.path)
+        self._new = set()
+
+
+@dataclass
+class FuzzFailure:
+    mode: str
+    input: str
+    expected: str
+    actual: str
+    minimal: Optional[str] = None
+
+    def __str__(self):
+        lines = [f'[{self.mode}] вход:      {self.input!r}', f'  ожидалось: {self.expected!r}', f'  получено:  {self.actual!r}']
+        if self.minimal is not None and self.minimal != self.input:
+            lines.append(f'  минимальный вход: {self.minimal!r} -> ожидалось {sanitize(self.minimal)!r}')
+        return '\n'.join(lines)
+
+
+@dataclass
+class FuzzReport:
+    mode: str
+    cases: int = 0
+    cached: int = 0
+    passed: int = 0
+    failures: List[FuzzFailure] = field(default_factory=list)
+    elapsed: float = 0.0
+
+    @property
+    def per_minute(self) -> float:
+        return (self.cases - self.cached) / self.elapsed * 60 if self.elapsed else 0.0
+
+    def summary(self) -> str:
+        lines = [f'[{self.mode}] случаев: {self.cases}, из кэша: {self.cached}, совпали с моделью: {self.passed}, '
+                 f'расхождений: {len(self.failures)}, {self.per_minute:.0f} случаев/мин']
+        lines += [str(failure) for failure in self.failures[:MAX_SHRUNK_FAILURES]]
+        if len(self.failures) > MAX_SHRUNK_FAILURES:
+            lines.append(f'... и ещё {len(self.failures) - MAX_SHRUNK_FAILURES}')
+        return '\n'.join(lines)
+
+    def attach(self):
+        allure.attach(self.summary() + '\n\n' + '\n'.join(str(f) for f in self.failures[MAX_SHRUNK_FAILURES:]),
+                      name=f'Фаззинг санитайзера ({self.mode})', attachment_type=allure.attachment_type.TEXT)
+
+
+def _shrink_candidates(nodes: list):
+    """Упрощения дерева: удалить узел, развернуть элемент, убрать атрибут, укоротить текст (крупные — раньше)."""
+    for i, node in enumerate(nodes):
+        yield nodes[:i] + nodes[i + 1:]
+        if isinstance(node, str):
+            if len(node) > 1:
+                yield nodes[:i] + [node[:len(node) // 2]] + nodes[i + 1:]
+            continue
+        if node.children:
+            yield nodes[:i] + node.children + nodes[i + 1:]
+        for j in range(len(node.attrs)):
+            yield nodes[:i] + [Element(node.tag, node.attrs[:j] + node.attrs[j + 1:], node.children)] + nodes[i + 1:]
+        for children in _shrink_candidates(node.children):
+            yield nodes[:i] + [Element(node.tag, node.attrs, children)] + nodes[i + 1:]
+
+
+class SanitizerFuzzer:
+    """
+    Дифференциальный фаззинг санитайзера комментариев: случаи отправляются пачками по BATCH_SIZE через post_many
+    (PostComment, в режиме edit — PostComment с EDIT_ORIGINAL и EditComment), сохранённый content читается одним
+    GetComments на пачку и сравнивается с эталоном html_sanitizer.sanitize. Совпавшие случаи попадают в кэш
+    и при следующих прогонах не отправляются; расхождения минимизируются до короткого воспроизводящего входа.
+        fuzzer = SanitizerFuzzer(owner_client, main_space, document_id, cache=FuzzCache(path, stand))
+        report = fuzzer.run(HtmlGrammar(seed).cases(1000), mode='edit')
+    """
+
+    def __init__(self, client, space_id: str, document_id: str, cache: FuzzCache = None, batch_size: int = BATCH_SIZE):
+        self.client = client
+        self.space_id = space_id
+        self.document_id = document_id
+        self.cache = cache
+        self.batch_size = batch_size
+
+    def _post_all(self, endpoints: list) -> list:
+        if hasattr(self.client, 'post_many'):
+            return self.client.post_many(endpoints)
+        return [self.client.post(**endpoint) for endpoint in endpoints]
+
+    def _create(self, contents: list) -> list:
+        return self._post_all([create_comment_endpoint(space_id=self.space_id, document_id=self.document_id,
+                                                       content=content) for content in contents])
+
+    def contents(self, cases: List[str], mode: str) -> List[str]:
+        """Сохранённый content комментария для каждого случая (для ошибок — 'HTTP <статус>: <ответ>')."""
+        if mode not in MODES:
+            raise ValueError(f"Неизвестный режим {mode!r}, доступны: {MODES}")
+        created = self._create(cases if mode == 'create' else [EDIT_ORIGINAL] * len(cases))
+        comment_ids = [resp.json()['payload']['comment']['_id'] if resp.status_code == 200 else None for resp in created]
+        responses = list(created)
+        if mode == 'edit':
+            edits = [(i, edit_comment_endpoint(space_id=self.space_id, comment_id=comment_id, content=case))
+                     for i, (case, comment_id) in enumerate(zip(cases, comment_ids)) if comment_id is not None]
+            for (i, _), resp in zip(edits, self._post_all([endpoint for _, endpoint in edits])):
+                responses[i] = resp
+
+        stored = {}
+        if any(comment_ids):
+            comments_resp = self.client.post(**get_comments_endpoint(space_id=self.space_id,
+                                                                     document_id=self.document_id))
+            assert comments_resp.status_code == 200, f"Ошибка GetComments: {comments_resp.text}"
+            stored = {comment['_id']: comment['content'] for comment in comments_resp.json()['payload']['comments']}
+        results = []
+        for resp, comment_id in zip(responses, comment_ids):
+            if resp.status_code != 200:
+                results.append(f'HTTP {resp.status_code}: {resp.text[:200]}')
+            else:
+                results.append(stored.get(comment_id, f'комментарий {comment_id} не найден в GetComments'))
+        return results
+
+    def run(self, cases: List[str], mode: str = 'create') -> FuzzReport:
+        report = FuzzReport(mode=mode, cases=len(cases))
+        start = time.perf_counter()
+        pending = []
+        for case in cases:
+            key = self.cache.key(mode, case) if self.cache is not None else None
+            if key is not None and key in self.cache:
+                report.cached += 1
+            else:
+                pending.append((case, key))
+
+        with allure.step(f"[{mode}] {len(pending)} случаев (из кэша: {report.cached}), пачки по {self.batch_size}"):
+            for offset in range(0, len(pending), self.batch_size):
+                batch = pending[offset:offset + self.batch_size]
+                for (case, key), actual in zip(batch, self.contents([case for case, _ in batch], mode)):
+                    expected = sanitize(case)
+                    if actual == expected:
+                        report.passed += 1
+                        if key is not None:
+                            self.cache.add(key)
+                    else:
+                        report.failures.append(FuzzFailure(mode, case, expected, actual))
+        report.elapsed = time.perf_counter() - start
+
+        if report.failures:
+            with allure.step(f"Минимизация расхождений (до {MAX_SHRUNK_FAILURES})"):
+                for failure in report.failures[:MAX_SHRUNK_FAILURES]:
+                    failure.minimal = self.shrink(failure.input, mode)
+        return report
+
+    def failing(self, cases: List[str], mode: str) -> List[bool]:
+        return [actual != sanitize(case) for case, actual in zip(cases, self.contents(cases, mode))]
+
+    def shrink(self, html: str, mode: str, budget: int = SHRINK_BUDGET) -> str:
+        """
+        Жадно упрощает падающий вход, пока расхождение воспроизводится: на каждом шаге проверяет упрощения
+        пачками по SHRINK_BATCH и берёт первое падающее. Не больше budget проверок.
+        """
+        current = render(parse(html))
+        if current != html and not self.failing([current], mode)[0]:
+            # Расхождение зависит от исходной записи разметки (кавычки, форма тегов) — упрощать нечего
+            return html
+        spent = 1
+        while spent < budget:
+            seen = {current, ''}
+            candidates = []
+            for nodes in _shrink_candidates(parse(current)):
+                candidate = render(nodes)
+                if candidate not in seen:
+                    seen.add(candidate)
+                    candidates.append(candidate)
+            found = None
+            for offset in range(0, len(candidates), SHRINK_BATCH):
+                chunk = candidates[offset:offset + SHRINK_BATCH][:budget - spent]
+                if not chunk:
+                    break
+                spent += len(chunk)
+                found = next((case for case, failed in zip(chunk, self.failing(chunk, mode)) if failed), None)
+                if found is not None:
+                    break
+            if found is None:
+                break
+            current = found
+        return current
@@ -0,0 +1,38 @@
+import os
+import time
+
+import allure
+import pytest
+
+from config import settings
+from test_backend.comment.sanitizer.fuzz import FUZZ_SEED_KEY, FuzzCache, HtmlGrammar, SanitizerFuzzer
+
+pytestmark = [pytest.mark.backend]
+
+FUZZ_CASES = int(os.getenv('FUZZ_CASES', 200))
+# Без FUZZ_SEED каждый прогон проверяет новые случаи; seed пишется в Allure, в сообщение об ошибке и в итоги pytest
+FUZZ_SEED = int(os.getenv('FUZZ_SEED', time.time_ns() % 2 ** 32))
+
+
+@allure.parent_suite("Comment Service")
+@allure.suite("Sanitizer")
+@allure.sub_suite("Fuzzing")
+@pytest.mark.parametrize("mode", ["create", "edit"], ids=["post_comment", "edit_comment"])
+def test_comment_sanitizer_matches_model(request, owner_client, main_space, document_id, mode):
+    """
+    Сгенерированный HTML (FUZZ_CASES случаев из грамматики разрешённых и запрещённых тегов и атрибутов)
+    после PostComment/EditComment должен совпасть с эталонной моделью санитайзера.
+    Расхождения минимизируются; уже совпавшие на этом стенде случаи берутся из кэша.
+    На стенде fake комментарии очищает та же модель (html_sanitizer.sanitize), поэтому там тест расхождений
+    не найдёт: он проверяет только сам фаззер (пачки, кэш, минимизацию), а не санитайзер.
+    """
+    request.config.stash[FUZZ_SEED_KEY] = FUZZ_SEED
+    allure.dynamic.title(f"Фаззинг санитайзера ({mode}): {FUZZ_CASES} случаев, seed={FUZZ_SEED}")
+    cache = FuzzCache(settings.SANITIZER_FUZZ_CACHE_PATH, namespace=settings.TEST_STAND_NAME)
+    fuzzer = SanitizerFuzzer(owner_client, main_space, document_id, cache=cache)
+
+    report = fuzzer.run(HtmlGrammar(seed=FUZZ_SEED).cases(FUZZ_CASES), mode=mode)
+    cache.save()
+    report.attach()
+
+    assert not report.failures, f"Санитайзер расходится с моделью (FUZZ_SEED={FUZZ_SEED}):\n{report.summary()}"
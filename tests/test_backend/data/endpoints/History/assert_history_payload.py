@@ -1,5 +1,7 @@
 import allure
 
+from tests.core.schema import compile_schema
+
 # Обязательные поля для IHistory
 HISTORY_REQUIRED_SCHEMA = {
     "_id": str,
@@ -22,6 +24,11 @@ HISTORY_OPTIONAL_FIELDS = {
     "updatedAt": str,
 }
 
+# Опциональные поля могут отсутствовать или быть None
+HISTORY_VALIDATOR = compile_schema(
+    "History", HISTORY_REQUIRED_SCHEMA, optional=HISTORY_OPTIONAL_FIELDS, nullable_optional=True,
+)
+
 
 def assert_history_payload(history: dict, expected_kind: str = None, expected_kind_id: str = None):
     """
@@ -32,32 +39,8 @@ def assert_history_payload(history: dict, expected_kind: str = None, expected_ki
         expected_kind (str, optional): Ожидаемый тип сущности (Space, Project, Board, Task, Document, Member, Milestone).
         expected_kind_id (str, optional): Ожидаемый ID этой сущности.
     """
-    with allure.step("Проверка набора полей события истории"):
-        actual_keys = set(history.keys())
-        required_keys = set(HISTORY_REQUIRED_SCHEMA.keys())
-        all_allowed_keys = required_keys.union(set(HISTORY_OPTIONAL_FIELDS.keys()))
-
-        missing = required_keys - actual_keys
-        extra = actual_keys - all_allowed_keys
-
-        assert not missing, f"Отсутствуют обязательные поля: {sorted(missing)}"
-        assert not extra, f"Найдены лишние/неизвестные поля: {sorted(extra)}"
-
-    with allure.step("Проверка типов данных полей истории"):
-        # Проверка обязательных полей
-        for field, expected_type in HISTORY_REQUIRED_SCHEMA.items():
-            value = history[field]
-            assert isinstance(value, expected_type), (
-                f"Поле '{field}' имеет неверный тип: {type(value).__name__}, ожидается {expected_type}"
-            )
-
-        # Проверка опциональных полей (если они присутствуют и не None)
-        for field, expected_type in HISTORY_OPTIONAL_FIELDS.items():
-            if field in history:
-                value = history.get(field)
-                assert isinstance(value, expected_type) or value is None, (
-                    f"Поле '{field}' имеет неверный тип: {type(value).__name__}, ожидается {expected_type} или None"
-                )
+    with allure.step("Проверка схемы события истории"):
+        HISTORY_VALIDATOR.assert_valid(history)
 
     # Аналог функции checkSelf из TypeScript
     if expected_kind and expected_kind_id:
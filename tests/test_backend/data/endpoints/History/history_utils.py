@@ -1,59 +1,225 @@
 import allure
 import time
+from collections import OrderedDict, defaultdict
+from datetime import datetime
 
+from core.waiters import caller_site, wait_until
+from tests.core.change_stream import STREAM_TIMEOUT_SHARE, get_change_waiter
 from test_backend.data.endpoints.History.get_history_endpoint import get_history_endpoint
 from tests.test_backend.data.endpoints.History.assert_history_payload import assert_history_payload
 
+HISTORY_PAGE_LIMIT = 50
+# Сколько индексов истории (сущность x клиент) держим между ожиданиями; самые давние вытесняются
+HISTORY_INDEX_CACHE_SIZE = 256
+# Коллекция событий истории в MongoDB (ожидание по change stream, см. assert_history_event_exists)
+HISTORY_COLLECTION = 'histories'
+
+
+def _data_matches(event_data: dict, expected_data: dict = None) -> bool:
+    """Все ключи expected_data есть в event_data и их значения совпадают."""
+    return not expected_data or all(event_data.get(k) == v for k, v in expected_data.items())
+
+
+class HistoryIndex:
+    """
+    Инкрементальный индекс истории одной сущности (kind, kindId).
+
+    Первый poll() забирает последние HISTORY_PAGE_LIMIT событий, следующие — только события
+    не старше самого свежего уже увиденного (dateRangeStart = его createdAt).
+    Если между опросами набралось больше страницы событий, догружаем более старые страницы через lastLoadedDate.
+    События индексируются по key, поэтому поиск по ключу не пересканирует всю историю. Внутри ключа события
+    лежат от новых к старым, как их отдаёт GetHistory: find возвращает самое свежее подходящее.
+    """
+
+    def __init__(self, client, space_id: str, kind: str, kind_id: str, page_limit: int = HISTORY_PAGE_LIMIT):
+        self.client = client
+        self.space_id = space_id
+        self.kind = kind
+        self.kind_id = kind_id
+        self.page_limit = page_limit
+        self.events_by_key = defaultdict(list)
+        self.cursor = None
+        self._seen_ids = set()
+
+    def _fetch(self, last_loaded_date: int = None) -> list:
+        resp = self.client.post(
+            **get_history_endpoint(
+                space_id=self.space_id,
+                kind=self.kind,
+                kind_id=self.kind_id,
+                limit=self.page_limit,
+                date_range_start=self.cursor,
+                last_loaded_date=last_loaded_date,
+            )
+        )
+        assert resp.status_code == 200, f"Ошибка при получении истории: {resp.text}"
+        return resp.json().get('payload', {}).get('histories', [])
+
+    def poll(self) -> list:
+        """Запрашивает историю начиная с курсора и добавляет в индекс новые события. Возвращает новые события."""
+        histories = self._fetch()
+        if self.cursor is not None:
+            page = histories
+            while len(page) >= self.page_limit and page[-1].get('createdAt'):
+                oldest = page[-1]
+                page = self._fetch(last_loaded_date=int(datetime.fromisoformat(oldest['createdAt']).timestamp() * 1000))
+                if not page or page[-1].get('_id') == oldest.get('_id'):
+                    break
+                histories = histories + page
+
+        # Граница dateRangeStart включительная, поэтому уже увиденные события отсекаем по _id
+        new_events = [event for event in histories if event.get('_id') not in self._seen_ids]
+        new_by_key = defaultdict(list)
+        for event in new_events:
+            self._seen_ids.add(event.get('_id'))
+            new_by_key[event.get('key')].append(event)
+            created_at = event.get('createdAt')
+            if created_at and (self.cursor is None or created_at > self.cursor):
+                self.cursor = created_at
+        # Новые события свежее уже проиндексированных — встают в начало
+        for key, events in new_by_key.items():
+            self.events_by_key[key][:0] = events
+        return new_events
+
+    def find(self, event_key: str, expected_data: dict = None):
+        """Ищет в индексе событие с ключом event_key, data которого содержит expected_data."""
+        for event in self.events_by_key.get(event_key, ()):
+            if _data_matches(event.get('data', {}), expected_data):
+                return event
+        return None
+
+
+_history_indexes = OrderedDict()
+
+
+def get_history_index(client, space_id: str, kind: str, kind_id: str) -> HistoryIndex:
+    """
+    Индекс истории сущности, общий для всех ожиданий этим клиентом (история только дописывается).
+    Хранится не больше HISTORY_INDEX_CACHE_SIZE индексов: давно не использованные вытесняются вместе с клиентом.
+    """
+    key = (client.token, space_id, kind, kind_id)
+    if key in _history_indexes:
+        _history_indexes.move_to_end(key)
+    else:
+        _history_indexes[key] = HistoryIndex(client, space_id, kind, kind_id)
+        while len(_history_indexes) > HISTORY_INDEX_CACHE_SIZE:
+            _history_indexes.popitem(last=False)
+    return _history_indexes[key]
+
+
 def assert_history_event_exists(
         client, space_id: str, kind: str, kind_id: str, expected_event_key: str,
-        expected_data: dict = None, timeout: int = 20, interval: float = 0.5
+        expected_data: dict = None, timeout: int = 20, interval: float = None
 ) -> dict:
     """
     Вспомогательная функция: запрашивает историю с механизмом ожидания (поллингом).
     Если передан expected_data, функция будет искать событие, в котором data содержит указанные пары ключ-значение.
+    История запрашивается инкрементально (см. HistoryIndex), interval=None — адаптивный интервал поллинга.
+    Если доступна MongoDB, событие сначала ждётся по change stream коллекции HISTORY_COLLECTION (не дольше
+    STREAM_TIMEOUT_SHARE от timeout), и API запрашивается, когда оно уже записано. Если сигнала из базы нет,
+    оставшееся время история опрашивается через API, как без базы.
     """
     with allure.step(f"Ожидание события '{expected_event_key}' в истории {kind}"):
-        start_time = time.time()
-        found_event = None
-
-        while time.time() - start_time < timeout:
-            resp = client.post(
-                **get_history_endpoint(
-                    space_id=space_id,
-                    kind=kind,
-                    kind_id=kind_id,
-                    limit=50
+        index = get_history_index(client, space_id, kind, kind_id)
+        deadline = time.monotonic() + timeout
+        waiter = get_change_waiter()
+        if waiter.available:
+            try:
+                waiter.wait_for(
+                    HISTORY_COLLECTION,
+                    {'key': expected_event_key, f'{kind[0].lower()}{kind[1:]}Id': kind_id},
+                    predicate=lambda event: _data_matches(event.get('data') or {}, expected_data),
+                    timeout=timeout * STREAM_TIMEOUT_SHARE,
+                    call_site=caller_site(),
                 )
-            )
-            assert resp.status_code == 200, f"Ошибка при получении истории: {resp.text}"
-
-            histories = resp.json().get('payload', {}).get('histories', [])
-
-            # Ищем подходящее событие
-            for event in histories:
-                if event.get('key') == expected_event_key:
-                    # Если ожидаем конкретные данные, проверяем их
-                    if expected_data:
-                        event_data = event.get('data', {})
-                        # Проверяем, что все ключи из expected_data есть в event_data и их значения совпадают
-                        match = all(event_data.get(k) == v for k, v in expected_data.items())
-                        if match:
-                            found_event = event
-                            break
-                    else:
-                        found_event = event
-                        break
-
-            if found_event:
-                break
-
-            time.sleep(interval)
+            except TimeoutError:
+                pass
+
+        def _find_event():
+            found = index.find(expected_event_key, expected_data)
+            if found is None and index.poll():
+                found = index.find(expected_event_key, expected_data)
+            return found
+
+        try:
+            found_event = wait_until(_find_event, timeout=max(0.0, deadline - time.monotonic()),
+                                     poll_interval=interval, call_site=caller_site())
+        except TimeoutError:
+            found_event = None
 
         assert found_event is not None, (
             f"Событие {expected_event_key} с данными {expected_data} не найдено за {timeout} секунд. "
-            f"Последний ответ: {histories}"
+            f"События в истории: {list(index.events_by_key)}"
         )
 
         assert_history_payload(history=found_event, expected_kind=kind, expected_kind_id=kind_id)
 
-        return found_event
\ No newline at end of file
+        return found_event
+
+
+def _normalize_event_spec(spec):
+    """'KEY' или ('KEY', {data}) -> ('KEY', {data} | None)."""
+    if isinstance(spec, str):
+        return spec, None
+    event_key, expected_data = spec
+    return event_key, expected_data
+
+
+def iter_history_events(
+        client, space_id: str, kind: str, kind_id: str, expected_events: list,
+        timeout: int = 20, interval: float = None
+):
+    """
+    Ждёт сразу несколько событий в истории одной сущности в одном цикле поллинга.
+
+    expected_events — список спецификаций 'KEY' или ('KEY', expected_data).
+    Генератор отдаёт (event_key, expected_data, event) по мере появления событий, в порядке их нахождения.
+    Если к дедлайну найдены не все события, бросает AssertionError со списком недостающих.
+    """
+    index = get_history_index(client, space_id, kind, kind_id)
+    pending = [_normalize_event_spec(spec) for spec in expected_events]
+    deadline = time.monotonic() + timeout
+    site = caller_site()
+
+    def _resolve():
+        found = ((spec, index.find(*spec)) for spec in pending)
+        return [(spec, event) for spec, event in found if event is not None]
+
+    while pending:
+        try:
+            ready = wait_until(
+                lambda: _resolve() or (index.poll() and _resolve()),
+                timeout=max(0.0, deadline - time.monotonic()),
+                poll_interval=interval,
+                call_site=site,
+            )
+        except TimeoutError:
+            missing = ', '.join(f"{key} с данными {data}" for key, data in pending)
+            raise AssertionError(
+                f"За {timeout} секунд не найдены события: {missing}. "
+                f"События в истории: {list(index.events_by_key)}"
+            ) from None
+
+        for spec, event in ready:
+            pending.remove(spec)
+            assert_history_payload(history=event, expected_kind=kind, expected_kind_id=kind_id)
+            yield spec[0], spec[1], event
+
+
+def assert_history_events_exist(
+        client, space_id: str, kind: str, kind_id: str, expected_events: list,
+        timeout: int = 20, interval: float = None
+) -> list:
+    """
+    Проверяет, что в истории сущности есть все ожидаемые события (один цикл поллинга на все события).
+    Возвращает найденные события в порядке expected_events.
+    """
+    specs = [_normalize_event_spec(spec) for spec in expected_events]
+    with allure.step(f"Ожидание событий {[key for key, _ in specs]} в истории {kind}"):
+        found = {}
+        for event_key, expected_data, event in iter_history_events(
+                client, space_id, kind, kind_id, specs, timeout=timeout, interval=interval
+        ):
+            position = next(i for i, spec in enumerate(specs) if spec == (event_key, expected_data) and i not in found)
+            found[position] = event
+        return [found[i] for i in range(len(specs))]
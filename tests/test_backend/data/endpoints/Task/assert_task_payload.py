@@ -1,5 +1,7 @@
 import allure
 
+from tests.core.schema import compile_schema
+
 TASK_FULL_SCHEMA = {
     "_id": str,
     # Disposition
@@ -40,6 +42,26 @@ TASK_FULL_SCHEMA = {
     "deletedAt": (str, type(None)),
 }
 
+# "editor" допустим как дополнительное поле
+TASK_OPTIONAL_SCHEMA = {
+    "editor": str,
+}
+
+# Скомпилированный валидатор задачи: набор полей, типы, элементы массивов и значения followers
+# (ключи JSON-объекта всегда строки, отдельно не проверяются)
+TASK_VALIDATOR = compile_schema(
+    "Task",
+    TASK_FULL_SCHEMA,
+    optional=TASK_OPTIONAL_SCHEMA,
+    items={
+        "assignees": str, "subtasks": str, "milestones": str,
+        "rightConnectors": str, "leftConnectors": str, "types": str,
+        "customFields": dict,
+    },
+    values={"followers": str},
+)
+
+
 def assert_task_payload(task: dict, board_id: str, project_id: str):
     """
     Валидирует структуру и типы данных задачи, а также проверяет бизнес-правила.
@@ -49,45 +71,22 @@ def assert_task_payload(task: dict, board_id: str, project_id: str):
         board_id (str): Ожидаемый идентификатор доски для бизнес-проверки.
         project_id (str): Ожидаемый идентификатор проекта для бизнес-проверки.
     """
-    with allure.step("Проверка полного совпадения набора полей задачи"):
-        expected_schema = TASK_FULL_SCHEMA
-
-        actual_keys = set(task.keys())
-        expected_keys = set(expected_schema.keys())
-        missing = expected_keys - actual_keys
-        extra = actual_keys - expected_keys
-        assert not missing, f"Отсутствуют обязательные поля: {sorted(missing)}"
-        assert not extra - {"editor"}, f"Найдены лишние поля: {sorted(extra - {'editor'})}"
-        # "editor" допустим как дополнительное поле
-        if "editor" in actual_keys:
-            assert isinstance(task["editor"], str), "Поле 'editor' (если присутствует) должно быть строкой"
-
-    with allure.step("Проверка типов данных всех полей задачи"):
-        for field, expected_type in expected_schema.items():
-            value = task[field]
-            assert isinstance(value, expected_type), (
-                f"Поле '{field}' имеет неверный тип: {type(value).__name__}, ожидается {expected_type}"
-            )
-
-    with allure.step("Дополнительные проверки содержимого коллекций"):
-        # Массивы строк
-        list_of_strings_fields = [
-            "assignees", "subtasks", "milestones",
-            "rightConnectors", "leftConnectors", "types"
-        ]
-        for f in list_of_strings_fields:
-            assert isinstance(task[f], list), f"Поле '{f}' должно быть массивом"
-            assert all(isinstance(x, str) for x in task[f]), f"Элементы поля '{f}' должны быть строками"
-
-        # customFields: массив словарей
-        assert isinstance(task["customFields"], list), "Поле 'customFields' должно быть массивом"
-        for cf in task["customFields"]:
-            assert isinstance(cf, dict), "Элементы поля 'customFields' должны быть словарями"
+    with allure.step("Проверка схемы задачи и стабильных значений"):
+        TASK_VALIDATOR.assert_valid(task)
+        assert task["board"] == board_id, "Ошибка: неверное значение поля 'board'"
+        assert task["project"] == project_id, "Ошибка: неверное значение поля 'project'"
 
-        # followers: ключи и значения строки
-        assert all(isinstance(k, str) for k in task["followers"].keys()), "Ключи 'followers' должны быть строками"
-        assert all(isinstance(v, str) for v in task["followers"].values()), "Значения 'followers' должны быть строками"
 
-    with allure.step("Бизнес-проверки стабильных значений"):
-        assert task["board"] == board_id, "Ошибка: неверное значение поля 'board'"
-        assert task["project"] == project_id, "Ошибка: неверное значение поля 'project'"
\ No newline at end of file
+def assert_tasks_payload(tasks: list, board_id: str = None, project_id: str = None):
+    """
+    Проверяет схему всех задач списка (например, страницы GetTasks) одним проходом
+    и падает одним отчётом по всем нарушениям. board_id / project_id — если заданы, сверяются у каждой задачи.
+    """
+    with allure.step(f"Проверка схемы {len(tasks)} задач"):
+        TASK_VALIDATOR.assert_all_valid(tasks)
+        if board_id is not None:
+            wrong = [t["_id"] for t in tasks if t["board"] != board_id]
+            assert not wrong, f"Задачи не с доски {board_id}: {wrong[:20]}"
+        if project_id is not None:
+            wrong = [t["_id"] for t in tasks if t["project"] != project_id]
+            assert not wrong, f"Задачи не из проекта {project_id}: {wrong[:20]}"
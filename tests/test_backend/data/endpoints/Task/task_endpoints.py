@@ -126,7 +126,7 @@ def multiple_edit_tasks_endpoint(
             "Content-Type": "application/json",
         },
         "json": {
-            "tasks": tasks,
+            "tasks": tasks_payload,
             "actionType": "editTask"
         }
     }
@@ -1,5 +1,7 @@
 from typing import Dict, Any, Tuple
 
+from tests.core.multipart import MultipartStream
+
 # Константа с валидным содержимым PNG-картинки размером 1x1 пиксель
 DUMMY_PNG_CONTENT = b'\x89PNG\r\n\x1a\n\x00\x00\x00\rIHDR\x00\x00\x00\x01\x00\x00\x00\x01\x08\x06\x00\x00\x00\x1f\x15\xc4\x89\x00\x00\x00\nIDATx\x9cc\x00\x01\x00\x00\x05\x00\x01\r\n-\xb4\x00\x00\x00\x00IEND\xaeB`\x82'
 
@@ -34,34 +36,55 @@ def upload_avatar_endpoint(
     }
 
 
+def upload_avatar_stream_endpoint(
+        file_tuple: Tuple[str, Any, str],
+        kind: str,
+        kind_id: str,
+        **crop_area,
+) -> Dict[str, Any]:
+    """
+    Те же данные UploadAvatar, но тело собирается потоком (MultipartStream): содержимое файла —
+    bytes, путь к файлу, файловый объект или итерируемое кусков bytes, в память целиком не читается.
+    Результат отправляется как client.post(**req).
+    """
+    req = upload_avatar_endpoint(file_tuple=file_tuple, kind=kind, kind_id=kind_id, **crop_area)
+    body = MultipartStream(req["data"], req["files"])
+
+    return {
+        "path": req["path"],
+        "data": body,
+        "headers": {"Content-Type": body.content_type},
+    }
+
+
 def get_uploaded_avatar_url(
         client,
         kind_id: str,
         kind: str,
         headers: dict,
-        file_content: bytes,
+        file_content: Any,
         file_name: str = "avatar.png",
         content_type: str = "image/png"
 ) -> str:
     """
     Вспомогательная функция для отправки multipart/form-data запроса и извлечения URL аватара.
+    file_content — bytes, путь к файлу или итерируемое кусков bytes: тело отправляется потоком.
     """
-    req = upload_avatar_endpoint(
+    req = upload_avatar_stream_endpoint(
         file_tuple=(file_name, file_content, content_type),
         kind=kind,
         kind_id=kind_id,
     )
 
-    # ВАЖНО: Удаляем Content-Type из заголовков, чтобы requests
-    # сам поставил правильный multipart/form-data с нужным boundary
+    # Content-Type из заголовков спейса заменяем на multipart/form-data с boundary потока
     # Создаем копию, чтобы не менять оригинальный словарь
     upload_headers = dict(headers)
     upload_headers.pop("Content-Type", None)
+    upload_headers.update(req["headers"])
 
     response = client.post(
         req["path"],
         data=req["data"],
-        files=req["files"],
         headers=upload_headers
     )
 
@@ -69,4 +92,4 @@ def get_uploaded_avatar_url(
         print(f"\n[ОШИБКА ЗАГРУЗКИ] Ответ сервера: {response.text}\n")
 
     assert response.status_code == 200, f"Ошибка загрузки аватара: {response.text}"
-    return response.json()["payload"]["avatar"]["avatar"]
\ No newline at end of file
+    return response.json()["payload"]["avatar"]["avatar"]
@@ -0,0 +1,23 @@
+from typing import Optional
+
+from test_backend.data.endpoints.Board.board_endpoints import get_board_endpoint
+from test_backend.data.endpoints.Document.document_endpoints import get_document_endpoint
+from test_backend.data.endpoints.Project.project_endpoints import get_project_endpoint
+from test_backend.data.endpoints.Task.task_endpoints import get_task_endpoint
+from test_backend.data.endpoints.milestone.milestones_endpoints import get_milestone_endpoint
+from tests.core.persisted import PersistedEntity, PersistedState
+
+# Сущности для проверок через фикстуру persisted: коллекция MongoDB и Get* на случай, когда база не настроена
+TASK = PersistedEntity('Task', 'tasks', get_task_endpoint, 'task')
+DOCUMENT = PersistedEntity('Document', 'documents', get_document_endpoint, 'document')
+MILESTONE = PersistedEntity('Milestone', 'milestones', get_milestone_endpoint, 'milestone')
+BOARD = PersistedEntity('Board', 'boards', get_board_endpoint, 'board')
+PROJECT = PersistedEntity('Project', 'projects', get_project_endpoint, 'project')
+
+
+def get_persisted_custom_field(state: PersistedState, client, space_id: str, task_id: str,
+                               field_id: str) -> Optional[dict]:
+    """Сохранённое кастомное поле задачи ({'id', 'value', ...}) или None, если поля у задачи нет."""
+    task = state.one(TASK, task_id, ['customFields'], client=client, space_id=space_id)
+    assert task is not None, f"Задача {task_id} не найдена ({state.source})"
+    return next((cf for cf in task.get('customFields') or [] if cf.get('id') == field_id), None)
@@ -7,6 +7,7 @@ from tests.test_backend.data.endpoints.Document.document_endpoints import (
     get_document_siblings_endpoint,
     archive_document_endpoint,
 )
+from tests.test_backend.document.document_tree import DocumentTreeBuilder, assert_siblings_match
 
 pytestmark = [pytest.mark.backend]
 
@@ -303,4 +304,37 @@ def test_get_siblings_foreign_space_access_denied(
         with allure.step('Архивация созданных документов'):
             for doc_id in doc_ids:
                 archive_resp = owner_client.post(**archive_document_endpoint(space_id=main_space, document_id=doc_id))
-                assert archive_resp.status_code == 200
\ No newline at end of file
+                assert archive_resp.status_code == 200
+
+@allure.parent_suite("Document Service")
+@allure.suite("Access document")
+@pytest.mark.parametrize(
+    'client_fixture', ['owner_client', 'manager_client', 'member_client', 'guest_client'],
+    ids=['owner', 'manager', 'member', 'guest'],
+)
+@pytest.mark.parametrize(
+    'kind, container_fixture',
+    [
+        ('Space', 'main_space'),
+        ('Project', 'main_project'),
+    ],
+    ids=['space_doc', 'project_doc'],
+)
+def test_siblings_of_document_tree_by_roles(request, main_space, owner_client, client_fixture, kind, container_fixture):
+    """
+    Владелец строит дерево документов (глубина 2, ветвление 3), пользователь с ролью запрашивает siblings
+    каждого документа; ответы сверяются с эталоном DocumentTree.
+    """
+    viewer = request.getfixturevalue(client_fixture)
+    container_id = request.getfixturevalue(container_fixture)
+    allure.dynamic.title(
+        f'Siblings всех документов дерева {kind} глазами {client_fixture.replace("_client", "")}'
+    )
+
+    builder = DocumentTreeBuilder(owner_client, kind, container_id, main_space,
+                                  title_prefix=f'{datetime.now().strftime("%d.%m_%H:%M:%S")}_tree')
+    try:
+        tree = builder.build(depth=2, fan_out=3)
+        assert_siblings_match(viewer, main_space, tree)
+    finally:
+        builder.cleanup()
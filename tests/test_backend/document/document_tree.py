@@ -0,0 +1,196 @@
+from typing import Dict, List, Optional, Sequence, Union
+
+import allure
+
+from tests.core.schema import MAX_REPORTED_VIOLATIONS
+from tests.core.teardown import BulkTeardown, TeardownReport
+from tests.test_backend.data.endpoints.Document.document_endpoints import (
+    archive_document_endpoint,
+    create_document_endpoint,
+    get_document_siblings_endpoint,
+)
+
+
+def _document_id(resp) -> str:
+    assert resp.status_code == 200, f"CreateDocument: статус {resp.status_code}, ответ: {resp.text}"
+    return resp.json()['payload']['document']['_id']
+
+
+def _post_all(client, endpoints: list) -> list:
+    if hasattr(client, 'post_many'):
+        return client.post_many(endpoints)
+    return [client.post(**endpoint) for endpoint in endpoints]
+
+
+def _flatten(nodes: list) -> list:
+    """Узлы tree в виде плоского списка: ответ может быть как вложенным (children), так и плоским."""
+    flat, stack = [], list(reversed(nodes))
+    while stack:
+        node = stack.pop()
+        flat.append(node)
+        stack.extend(reversed(node.get('children') or []))
+    return flat
+
+
+class DocumentTree:
+    """
+    Эталон дерева документов для GetDocumentSiblings: по списку детей каждого узла за O(n) считает
+    порядок обхода, глубину, размер поддерева, соседей и nested-set нумерацию (lft/rgt) всех узлов.
+
+    root_id — корень дерева (создаётся на уровне контейнера, его соседи по контейнеру эталону неизвестны
+    и не проверяются), children — {_id: [_id детей по порядку]}.
+    """
+
+    def __init__(self, root_id: str, children: Dict[str, List[str]]):
+        self.root_id = root_id
+        self.children = children
+        self.parent = {root_id: None}
+        self.prev_sibling, self.next_sibling = {}, {}
+        self.depth = {root_id: 0}
+        self.order = []
+        stack = [root_id]
+        while stack:
+            node = stack.pop()
+            self.order.append(node)
+            kids = children.get(node, [])
+            for i, kid in enumerate(kids):
+                self.parent[kid] = node
+                self.depth[kid] = self.depth[node] + 1
+                self.prev_sibling[kid] = kids[i - 1] if i else None
+                self.next_sibling[kid] = kids[i + 1] if i + 1 < len(kids) else None
+            stack.extend(reversed(kids))
+        self.position = {node: i for i, node in enumerate(self.order)}
+        self.size = {}
+        for node in reversed(self.order):
+            self.size[node] = 1 + sum(self.size[kid] for kid in children.get(node, []))
+        # Nested set: lft — номер входа в узел при обходе, rgt — номер выхода
+        self.lft = {node: 2 * i - self.depth[node] + 1 for i, node in enumerate(self.order)}
+
+    def __len__(self):
+        return len(self.order)
+
+    def rgt(self, node: str) -> int:
+        return self.lft[node] + 2 * self.size[node] - 1
+
+    def parents(self, node: str) -> List[str]:
+        """Цепочка родителей от корня дерева к непосредственному родителю."""
+        chain = []
+        parent = self.parent[node]
+        while parent is not None:
+            chain.append(parent)
+            parent = self.parent[parent]
+        return chain[::-1]
+
+    def subtree(self, node: str) -> List[str]:
+        """Поддерево узла в порядке обхода (сам узел первым)."""
+        start = self.position[node]
+        return self.order[start:start + self.size[node]]
+
+    def mismatches(self, node: str, payload: dict) -> List[str]:
+        """Расхождения ответа GetDocumentSiblings для node с эталоном (пустой список — ответ верный)."""
+        found = []
+        if node != self.root_id:
+            for field, expected in (('prevSibling', self.prev_sibling[node]), ('nextSibling', self.next_sibling[node])):
+                actual = (payload.get(field) or {}).get('_id')
+                if actual != expected:
+                    found.append(f'{node}: {field} {actual}, ожидается {expected}')
+
+        parents = [parent['_id'] for parent in payload.get('parents') or []]
+        if parents != self.parents(node):
+            found.append(f'{node}: parents {parents}, ожидается {self.parents(node)}')
+
+        # lft/rgt сравниваются относительно запрошенного узла: так не важно, с какого номера API начинает нумерацию
+        tree = sorted(_flatten(payload.get('tree') or []), key=lambda item: item['lft'])
+        ids = [item['document']['_id'] for item in tree]
+        if ids != self.subtree(node):
+            found.append(f'{node}: tree {ids}, ожидается {self.subtree(node)}')
+        elif tree:
+            base_actual, base_expected = tree[0]['lft'], self.lft[node]
+            for item, kid in zip(tree, ids):
+                actual = (item['lft'] - base_actual, item['rgt'] - base_actual)
+                expected = (self.lft[kid] - base_expected, self.rgt(kid) - base_expected)
+                if actual != expected:
+                    found.append(f'{node}: tree-узел {kid} lft/rgt (относительно узла) {actual}, ожидается {expected}')
+        return found
+
+
+class DocumentTreeBuilder:
+    """
+    Строит дерево документов произвольной формы из короткой спецификации (глубина, ветвление) и возвращает
+    его эталон DocumentTree.
+
+    Под корнем (отдельный документ на уровне контейнера) создаётся depth уровней; fan_out — число детей
+    у каждого узла: одно число для всех уровней или по числу на уровень. Документы уровня создаются волнами
+    через post_many клиента: в k-й волне — k-й ребёнок каждого родителя уровня. В одной волне нет двух детей
+    одного родителя, поэтому порядок соседей детерминирован при параллельных CreateDocument.
+        builder = DocumentTreeBuilder(owner_client, 'Project', project_id, space_id)
+        tree = builder.build(depth=3, fan_out=4)      # 1 + 4 + 16 + 64 документа, 13 волн
+        assert_siblings_match(owner_client, space_id, tree)
+        builder.cleanup()
+    """
+
+    def __init__(self, client, kind: str, kind_id: str, space_id: str, title_prefix: str = 'Tree doc'):
+        self.client = client
+        self.kind = kind
+        self.kind_id = kind_id
+        self.space_id = space_id
+        self.title_prefix = title_prefix
+        self.roots: List[str] = []
+
+    def _create(self, parents: list, titles: list) -> list:
+        return [_document_id(resp) for resp in _post_all(self.client, [
+            create_document_endpoint(kind=self.kind, kind_id=self.kind_id, space_id=self.space_id,
+                                     parent_document_id=parent, title=title)
+            for parent, title in zip(parents, titles)
+        ])]
+
+    def build(self, depth: int, fan_out: Union[int, Sequence[int]]) -> DocumentTree:
+        fan_outs = [fan_out] * depth if isinstance(fan_out, int) else list(fan_out)
+        if len(fan_outs) != depth:
+            raise ValueError(f"fan_out задаётся числом или по значению на уровень: {depth} уровней, {fan_out!r}")
+
+        with allure.step(f"Построить дерево документов {self.kind}: глубина {depth}, ветвление {fan_outs}"):
+            root_id = self._create([None], [f'{self.title_prefix} 0'])[0]
+            self.roots.append(root_id)
+            children: Dict[str, List[str]] = {}
+            titles: Dict[str, str] = {root_id: '0'}
+            level = [root_id]
+            for width in fan_outs:
+                for k in range(width):
+                    created = self._create(level, [f'{self.title_prefix} {titles[parent]}.{k}' for parent in level])
+                    for parent, document_id in zip(level, created):
+                        children.setdefault(parent, []).append(document_id)
+                        titles[document_id] = f'{titles[parent]}.{k}'
+                level = [kid for parent in level for kid in children.get(parent, [])]
+        return DocumentTree(root_id, children)
+
+    def cleanup(self, report_title: str = "Teardown: архивация деревьев документов") -> TeardownReport:
+        """Архивирует корни построенных деревьев (параллельно; 400/404 — документ уже архивирован в тесте)."""
+        teardown = BulkTeardown(self.client)
+        for root_id in self.roots:
+            teardown.add(archive_document_endpoint(document_id=root_id, space_id=self.space_id), label=root_id)
+        self.roots = []
+        return teardown.run(report_title)
+
+
+def assert_siblings_match(client, space_id: str, tree: DocumentTree, document_ids: Optional[list] = None):
+    """
+    Запрашивает GetDocumentSiblings для узлов дерева (по умолчанию — всех) параллельно и сверяет с эталоном;
+    падает одним отчётом по всем расхождениям (полный список — во вложении Allure).
+    """
+    document_ids = list(document_ids or tree.order)
+    with allure.step(f"GetDocumentSiblings для {len(document_ids)} документов и сверка с эталоном"):
+        responses = _post_all(client, [get_document_siblings_endpoint(document_id=document_id, space_id=space_id)
+                                       for document_id in document_ids])
+        found = []
+        for document_id, resp in zip(document_ids, responses):
+            if resp.status_code != 200:
+                found.append(f'{document_id}: статус {resp.status_code}, ответ: {resp.text}')
+                continue
+            found.extend(tree.mismatches(document_id, resp.json()['payload']))
+    if found:
+        allure.attach('\n'.join(found), name='Расхождения GetDocumentSiblings',
+                      attachment_type=allure.attachment_type.TEXT)
+        lines = [f'Расхождений с эталоном дерева: {len(found)} (проверено документов: {len(document_ids)})']
+        lines += found[:MAX_REPORTED_VIOLATIONS]
+        raise AssertionError('\n'.join(lines))
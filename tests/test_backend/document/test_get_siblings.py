@@ -5,6 +5,7 @@ from tests.test_backend.data.endpoints.Document.document_endpoints import (
     create_document_endpoint,
     get_document_siblings_endpoint,
 )
+from tests.test_backend.document.document_tree import DocumentTreeBuilder, assert_siblings_match
 
 pytestmark = [pytest.mark.backend]
 
@@ -372,4 +373,28 @@ def test_get_document_siblings_foreign_space(
         assert resp.status_code == 403, f'Ожидался 403, но получен {resp.status_code}'
 
     with allure.step('Проверяем отсутствие payload в ответе'):
-        assert not resp.json().get('payload'), 'У гостя не должно быть payload'
\ No newline at end of file
+        assert not resp.json().get('payload'), 'У гостя не должно быть payload'
+
+@allure.parent_suite("Document Service")
+@allure.feature('Document Siblings')
+@pytest.mark.parametrize(
+    'kind, kind_id_fixture',
+    [
+        ('Project', 'project_id_function'),
+        ('Space', 'space_id_function'),
+        ('Member', 'member_id_function'),
+    ],
+    ids=['project', 'space', 'member'],
+)
+@pytest.mark.parametrize('depth, fan_out', [(3, 4), (5, (1, 2, 1, 3, 1))], ids=['wide', 'deep'])
+def test_document_tree_siblings_match_oracle(owner_client, request, kind, kind_id_fixture, space_id_function,
+                                             depth, fan_out):
+    """
+    Строит дерево документов по спецификации (глубина, ветвление) и сверяет prevSibling, nextSibling,
+    parents и tree каждого документа с эталоном DocumentTree.
+    """
+    allure.dynamic.title(f'Siblings всех документов дерева глубины {depth} с ветвлением {fan_out} (kind={kind})')
+    kind_id = request.getfixturevalue(kind_id_fixture)
+    builder = DocumentTreeBuilder(owner_client, kind, kind_id, space_id_function)
+    tree = builder.build(depth=depth, fan_out=fan_out)
+    assert_siblings_match(owner_client, space_id_function, tree)
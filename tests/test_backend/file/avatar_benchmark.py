@@ -0,0 +1,89 @@
+import random
+import time
+from dataclasses import dataclass, field
+
+from PIL import Image
+
+from tests.core.benchmark import BenchmarkReport, LatencyStats, peak_rss_kb, reset_peak_rss, rss_kb
+
+# Форматы аватара: формат Pillow, расширение и content-type
+AVATAR_FORMATS = {
+    'png': ('PNG', 'png', 'image/png'),
+    'jpeg': ('JPEG', 'jpg', 'image/jpeg'),
+    'webp': ('WEBP', 'webp', 'image/webp'),
+    'gif': ('GIF', 'gif', 'image/gif'),
+}
+
+
+def generate_avatar(path, side: int, fmt: str = 'png', seed: int = 0) -> str:
+    """
+    Пишет в path картинку side x side из случайного шума (почти не сжимается: размер файла растёт с side,
+    PNG 4096 x 4096 — около 50 МБ). Один seed — один и тот же файл.
+    """
+    pillow_format = AVATAR_FORMATS[fmt][0]
+    noise = random.Random(seed).randbytes(side * side * 3)
+    Image.frombytes('RGB', (side, side), noise).save(path, format=pillow_format)
+    return str(path)
+
+
+@dataclass
+class UploadStats(LatencyStats):
+    """Замер загрузки: задержки, размер тела, пропускная способность и пиковый RSS процесса на каждую загрузку."""
+
+    upload_bytes: int = 0
+    rss_growth_kb: list = field(default_factory=list)
+    peak_rss_kb: int = 0
+
+    def summary(self) -> dict:
+        seconds = sum(self.samples_ms) / 1000
+        return {
+            **super().summary(),
+            'upload_bytes': self.upload_bytes,
+            'uploads_per_s': round(len(self.samples_ms) / seconds, 2) if seconds else None,
+            'mb_per_s': round(self.upload_bytes * len(self.samples_ms) / seconds / 1e6, 2) if seconds else None,
+            'peak_rss_mb': round(self.peak_rss_kb / 1024, 1),
+            'rss_growth_mb': round(max(self.rss_growth_kb, default=0) / 1024, 1),
+        }
+
+
+def measure_uploads(client, endpoint: dict, name: str, params: dict = None, runs: int = 10,
+                    warmup: int = 1) -> UploadStats:
+    """
+    Отправляет потоковый endpoint (upload_avatar_stream_endpoint с путём к файлу) warmup + runs раз.
+    Перед каждой загрузкой пик RSS сбрасывается, rss_growth — насколько пик во время загрузки превысил RSS до неё.
+    Без сброса пика (не Linux) rss_growth считается от пика за всё время жизни процесса.
+    """
+    stats = UploadStats(name=name, params=params or {}, upload_bytes=len(endpoint['data']))
+    for attempt in range(warmup + runs):
+        reset_peak_rss()
+        before = rss_kb()
+        start = time.perf_counter()
+        response = client.post(**endpoint)
+        elapsed_ms = (time.perf_counter() - start) * 1000
+        peak = peak_rss_kb()
+        if attempt < warmup:
+            continue
+        if response.status_code != 200:
+            stats.errors += 1
+            continue
+        stats.samples_ms.append(elapsed_ms)
+        stats.payload_bytes = len(response.content)
+        stats.rss_growth_kb.append(max(peak - before, 0))
+        stats.peak_rss_kb = max(stats.peak_rss_kb, peak)
+    return stats
+
+
+class UploadBenchmarkReport(BenchmarkReport):
+    """BenchmarkReport с колонками загрузки: размер файла, MB/s и прирост пикового RSS."""
+
+    def table(self) -> str:
+        width = max((len(r['name']) for r in self.results), default=4)
+        lines = [f"{'case':<{width}}  {'p50':>8}  {'p95':>8}  {'MB':>7}  {'MB/s':>7}  {'up/s':>6}  "
+                 f"{'rss+MB':>6}  {'peakMB':>7}  err"]
+        for r in self.results:
+            lines.append(
+                f"{r['name']:<{width}}  {r['p50_ms']:>8.1f}  {r['p95_ms']:>8.1f}  {r['upload_bytes'] / 1e6:>7.2f}  "
+                f"{r['mb_per_s'] or 0:>7.1f}  {r['uploads_per_s'] or 0:>6.1f}  {r['rss_growth_mb']:>6.1f}  "
+                f"{r['peak_rss_mb']:>7.1f}  {r['errors']}"
+            )
+        return '\n'.join(lines)
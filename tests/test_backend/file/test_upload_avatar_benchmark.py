@@ -0,0 +1,68 @@
+import os
+
+import allure
+import pytest
+
+from config import settings
+from test_backend.data.endpoints.file.upload_avatar_endpoint import upload_avatar_stream_endpoint
+from test_backend.file.avatar_benchmark import AVATAR_FORMATS, UploadBenchmarkReport, generate_avatar, measure_uploads
+from tests.core.benchmark import load_baseline, reset_peak_rss
+
+pytestmark = [pytest.mark.backend, pytest.mark.benchmark]
+
+RUNS = int(os.getenv('AVATAR_BENCHMARK_RUNS', 10))
+# Стороны картинок (px) и форматы; шум почти не сжимается, PNG 4096 x 4096 — около 50 МБ
+SIDES = [int(side) for side in os.getenv('AVATAR_BENCHMARK_SIDES', '256,1024,4096').split(',')]
+FORMATS = os.getenv('AVATAR_BENCHMARK_FORMATS', 'png,jpeg,webp').split(',')
+# Насколько пиковый RSS может вырасти за одну загрузку: файл отправляется кусками и в память целиком не читается
+RSS_GROWTH_LIMIT_MB = float(os.getenv('AVATAR_RSS_GROWTH_LIMIT_MB', 32))
+BASELINE_NAME = 'upload_avatar.json'
+
+
+@allure.parent_suite("File Service")
+@allure.suite("Upload Avatar")
+@allure.title("UploadAvatar benchmark: задержка, пропускная способность и пиковый RSS по размерам и форматам")
+def test_upload_avatar_benchmark(request, owner_client, main_space, tmp_path):
+    """
+    Для каждой пары (сторона, формат) генерирует картинку Pillow и RUNS раз загружает её аватаром спейса
+    потоком с диска. Пишет JSON в settings.BENCHMARK_RESULTS_DIR и таблицу в Allure; падает, если загрузка
+    подняла пиковый RSS больше чем на RSS_GROWTH_LIMIT_MB, или при регрессии p50/p95 относительно baseline стенда
+    (с --update-benchmark-baseline сохраняет результаты как новый baseline).
+    """
+    report = UploadBenchmarkReport('upload_avatar', stand=settings.TEST_STAND_NAME)
+    headers = {"Current-Space-Id": main_space}
+
+    for side in SIDES:
+        for fmt in FORMATS:
+            name = f'{fmt} {side}x{side}'
+            with allure.step(f"Замер: {name}"):
+                _, extension, content_type = AVATAR_FORMATS[fmt]
+                path = generate_avatar(tmp_path / f'avatar_{side}.{extension}', side, fmt)
+                endpoint = upload_avatar_stream_endpoint((f'avatar.{extension}', path, content_type), 'Space', main_space)
+                endpoint['headers'].update(headers)
+                stats = measure_uploads(owner_client, endpoint, name, params={'side': side, 'format': fmt}, runs=RUNS)
+                os.remove(path)
+            assert not stats.errors, f"{name}: {stats.errors} ответов не 200"
+            report.add(stats)
+
+    report.write(os.path.join(settings.BENCHMARK_RESULTS_DIR, BASELINE_NAME))
+    report.attach()
+    print(f"\n{report.table()}")
+
+    if reset_peak_rss():
+        with allure.step(f"Пиковый RSS на загрузку не больше +{RSS_GROWTH_LIMIT_MB} МБ"):
+            grown = [r for r in report.results if r['rss_growth_mb'] > RSS_GROWTH_LIMIT_MB]
+            assert not grown, "Загрузка держит файл в памяти:\n" + "\n".join(
+                f"{r['name']}: {r['upload_bytes'] / 1e6:.1f} МБ файла, RSS +{r['rss_growth_mb']} МБ" for r in grown)
+
+    baseline_path = os.path.join(settings.BENCHMARK_BASELINE_DIR, BASELINE_NAME)
+    if request.config.getoption('--update-benchmark-baseline'):
+        report.write(baseline_path)
+        return
+    baseline = load_baseline(baseline_path)
+    if baseline is None:
+        pytest.skip(f"Нет baseline {baseline_path}: сохраните его флагом --update-benchmark-baseline")
+
+    with allure.step("Сравнить с baseline"):
+        regressions = report.compare(baseline)
+        assert not regressions, "Регрессия задержки UploadAvatar:\n" + "\n".join(str(r) for r in regressions)
@@ -4,9 +4,10 @@ import pytest
 from test_backend.data.endpoints.Task.task_endpoints import convert_task_to_milestone_endpoint, create_task_endpoint, \
     delete_task_endpoint
 from test_backend.data.endpoints.milestone.milestones_endpoints import archive_milestone_endpoint
-from tests.test_backend.data.endpoints.History.history_utils import assert_history_event_exists
+from tests.test_backend.data.endpoints.History.history_utils import assert_history_event_exists, \
+    assert_history_events_exist
 
-pytestmark = [pytest.mark.backend]
+pytestmark = [pytest.mark.backend, pytest.mark.mutates("main_board")]
 
 
 @allure.parent_suite("History Service")
@@ -64,37 +65,22 @@ def test_convert_task_to_milestone_history_events(owner_client, main_space, main
             )
 
         with allure.step("1.2 Проверяем каскадные события в истории Подзадачи"):
-            with allure.step("A) Задача узнала о конвертации родителя"):
-                assert_history_event_exists(
-                    client=owner_client,
-                    space_id=main_space,
-                    kind="Task",
-                    kind_id=subtask_id,
-                    expected_event_key="PARENT_TASK_CONVERTED_TO_MILESTONE",
-                    expected_data={"_id": parent_task_id}
-                )
-
-            with allure.step("B) Задача была автоматически отвязана от старого родителя"):
-                assert_history_event_exists(
-                    client=owner_client,
-                    space_id=main_space,
-                    kind="Task",
-                    kind_id=subtask_id,
-                    expected_event_key="TASK_DETACHED_TO_PARENT",
-                    expected_data={"_id": parent_task_id}
-                )
-
-            with allure.step("C) Задача была автоматически привязана к новому майлстоуну"):
-                assert_history_event_exists(
-                    client=owner_client,
-                    space_id=main_space,
-                    kind="Task",
-                    kind_id=subtask_id,
-                    expected_event_key="TASK_ATTACHED_TO_MILESTONE",
-                    # Привязка к майлстоуну пишется с указанием ID майлстоуна
-                    # (как мы видели в тесте `test_task_milestones_history_events`)
-                    expected_data={"_id": milestone_id}
-                )
+            assert_history_events_exist(
+                client=owner_client,
+                space_id=main_space,
+                kind="Task",
+                kind_id=subtask_id,
+                expected_events=[
+                    # A) Задача узнала о конвертации родителя
+                    ("PARENT_TASK_CONVERTED_TO_MILESTONE", {"_id": parent_task_id}),
+                    # B) Задача была автоматически отвязана от старого родителя
+                    ("TASK_DETACHED_TO_PARENT", {"_id": parent_task_id}),
+                    # C) Задача была автоматически привязана к новому майлстоуну
+                    # (привязка к майлстоуну пишется с указанием ID майлстоуна,
+                    # как мы видели в тесте `test_task_milestones_history_events`)
+                    ("TASK_ATTACHED_TO_MILESTONE", {"_id": milestone_id}),
+                ],
+            )
 
         with allure.step("1.3 Проверяем каскадное событие в самом Майлстоуне (что подзадача к нему прикрепилась)"):
             assert_history_event_exists(
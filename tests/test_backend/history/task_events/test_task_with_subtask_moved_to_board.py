@@ -10,7 +10,7 @@ from test_backend.data.endpoints.Task.task_endpoints import (
 )
 from tests.test_backend.data.endpoints.History.history_utils import assert_history_event_exists
 
-pytestmark = [pytest.mark.backend]
+pytestmark = [pytest.mark.backend, pytest.mark.mutates("main_board")]
 
 
 @allure.parent_suite("History Service")
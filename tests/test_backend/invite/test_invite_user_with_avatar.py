@@ -2,7 +2,9 @@ import uuid
 import allure
 import pytest
 
-from test_backend.data.endpoints.file.upload_avatar_endpoint import get_uploaded_avatar_url, upload_avatar_endpoint
+from test_backend.data.endpoints.file.upload_avatar_endpoint import (
+    get_uploaded_avatar_url, upload_avatar_endpoint, upload_avatar_stream_endpoint,
+)
 from test_backend.data.endpoints.invite.assert_invite_payload import assert_invite_payload
 from test_backend.data.endpoints.invite.invite_endpoint import invite_to_space_endpoint
 from tests.test_backend.data.endpoints.member.member_endpoints import get_space_members_endpoint
@@ -150,35 +152,37 @@ def test_upload_avatar_negative(second_main_client, space_id_, scenario, kind, f
 @allure.parent_suite("Invite Service")
 @allure.suite("Space Invitations - Avatar (Negative)")
 @allure.title("Загрузка аватара, превышающего лимит размера (> 100 МБ)")
-def test_upload_avatar_too_large(second_main_client, space_id_):
+def test_upload_avatar_too_large(second_main_client, space_id_, tmp_path):
     """
     Проверка лимита размера загружаемого файла (максимум 100 МБ).
-    Генерируем "фейковый" файл размером 101 МБ в памяти и ожидаем ошибку EUploadErrorCode.FileSize.
+    Генерируем "фейковый" файл размером 101 МБ на диске и отправляем его потоком, не читая в память.
+    Ожидаем ошибку EUploadErrorCode.FileSize.
     """
 
-    with allure.step("Генерация файла размером 101 МБ в памяти"):
-        # 101 мегабайт (испол/э
-        # ьзуем множитель 1000, как на бэкенде: 101 * 1000 * 1000)
-        large_file_size = 101 * 1000 * 1000
-        # Создаем строку из нулей нужного размера
-        huge_file_content = b"0" * large_file_size
+    with allure.step("Генерация файла размером 101 МБ на диске"):
+        # 101 мегабайт (используем множитель 1000, как на бэкенде: 101 * 1000 * 1000)
+        huge_file_path = tmp_path / "huge_avatar.png"
+        chunk = b"0" * 1000 * 1000
+        with open(huge_file_path, "wb") as f:
+            for _ in range(101):
+                f.write(chunk)
 
     with allure.step("Подготовка параметров запроса"):
         space_req = get_space_members_endpoint(space_id=space_id_)
         headers = space_req.get("headers", {})
         headers.pop("Content-Type", None)
 
-        req = upload_avatar_endpoint(
-            file_tuple=("huge_avatar.png", huge_file_content, "image/png"),
+        req = upload_avatar_stream_endpoint(
+            file_tuple=("huge_avatar.png", huge_file_path, "image/png"),
             kind="Space",
             kind_id=space_id_,
         )
+        headers.update(req["headers"])
 
     with allure.step("Отправка огромного файла на сервер (может занять несколько секунд)"):
         response = second_main_client.post(
             req["path"],
             data=req["data"],
-            files=req["files"],
             headers=headers
         )
 
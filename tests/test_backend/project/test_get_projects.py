@@ -1,7 +1,7 @@
 import allure
 import pytest
 
-from test_backend.data.endpoints.Project.assert_project_output_payload import assert_project_payload
+from test_backend.data.endpoints.Project.assert_project_output_payload import PROJECT_VALIDATOR
 from tests.test_backend.data.endpoints.Project.project_endpoints import (
     get_projects_endpoint
 )
@@ -32,11 +32,8 @@ def test_get_projects(owner_client, main_project, main_space):
             assert project['space'] == main_space, \
                 f"Проект с ID {project['_id']} привязан к пространству '{project['space']}', ожидалось '{main_space}'."
 
-    with allure.step("Пошаговая проверка структуры каждого проекта в списке"):
+    with allure.step("Проверка структуры каждого проекта в списке"):
         if projects_list:
-            for project in projects_list:
-                with allure.step("Проверка структуры проекта"):
-                    # assert_project_payload ожидает полезную нагрузку в формате {'project': {...}}
-                    assert_project_payload({'project': project})
+            PROJECT_VALIDATOR.assert_all_valid(projects_list)
         else:
             allure.attach("Список проектов пуст, структура каждого проекта не проверяется.", name="Информация")
\ No newline at end of file
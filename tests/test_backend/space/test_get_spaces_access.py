@@ -1,7 +1,7 @@
 import allure
 import pytest
 
-from test_backend.data.endpoints.Space.assert_space_payload import assert_space_payload
+from test_backend.data.endpoints.Space.assert_space_payload import assert_spaces_payload
 from test_backend.data.endpoints.Space.space_endpoints import get_spaces_endpoint
 from test_backend.task_service.utils import get_client
 
@@ -45,9 +45,8 @@ def test_get_spaces(request, main_space, client_fixture, expected_status):
 
             spaces = body["payload"]["spaces"]
 
-            for space in spaces:
-                # Валидация каждого space в списке через вынесенный валидатор
-                assert_space_payload(space)
+            # Валидация всех space в списке одним проходом через вынесенный валидатор
+            assert_spaces_payload(spaces)
 
     else:
         # Для случаев, когда статус не 200, проверяем структуру ошибки
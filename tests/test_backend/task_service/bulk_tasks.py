@@ -0,0 +1,111 @@
+from typing import List
+
+import allure
+
+from test_backend.data.endpoints.Task.task_endpoints import (
+    create_task_endpoint,
+    delete_task_endpoint,
+    multiple_edit_tasks_endpoint,
+)
+from tests.core.teardown import BulkTeardown, TeardownReport
+
+# Лимит MultipleEditTasks: больше 20 задач в одном запросе -> TooManyTasksSelected
+MULTIPLE_EDIT_LIMIT = 20
+# Сколько CreateTask уходит одной пачкой post_many (одновременно в полёте — не больше пула клиента)
+CREATE_CHUNK = 100
+# Общие атрибуты, которые фабрика выставляет пачками через MultipleEditTasks
+SHARED_FIELDS = ('assignees', 'priority', 'milestones', 'completed', 'dueStart', 'dueEnd', 'types')
+
+
+def chunked(items: list, size: int) -> list:
+    return [items[i:i + size] for i in range(0, len(items), size)]
+
+
+def _task_id(resp) -> str:
+    resp.raise_for_status()
+    body = resp.json()
+    task = (body.get("payload") or {}).get("task") or body.get("task") or {}
+    task_id = task.get("_id") or task.get("id")
+    assert task_id, f"Не удалось получить _id созданной задачи: {body!r}"
+    return task_id
+
+
+class BulkTaskFactory:
+    """
+    Массовое создание задач на борде.
+
+    create(count) отправляет CreateTask пачками по CREATE_CHUNK через post_many клиента
+    (параллелизм ограничен пулом соединений PooledAPIClient), затем общие атрибуты (SHARED_FIELDS)
+    выставляются через MultipleEditTasks по MULTIPLE_EDIT_LIMIT задач в запросе, а не правкой каждой задачи.
+    Возвращается список _id в порядке создания. cleanup() удаляет всё созданное одним BulkTeardown.
+        factory = BulkTaskFactory(owner_client, main_space, main_board)
+        task_ids = factory.create(300, priority=3, completed=True)
+        ...
+        factory.cleanup()
+    """
+
+    def __init__(self, client, space_id: str, board: str, name_prefix: str = "Bulk task", group: str = None):
+        self.client = client
+        self.space_id = space_id
+        self.board = board
+        self.name_prefix = name_prefix
+        self.group = group
+        self.created: List[str] = []
+
+    def _post_all(self, endpoints: list) -> list:
+        if hasattr(self.client, 'post_many'):
+            return self.client.post_many(endpoints)
+        return [self.client.post(**endpoint) for endpoint in endpoints]
+
+    def create(self, count: int, **shared) -> List[str]:
+        """Создаёт count задач и выставляет им общие атрибуты shared (см. SHARED_FIELDS)."""
+        self._check_fields(shared)
+        task_ids = []
+        with allure.step(f"Создать {count} задач на борде {self.board}"):
+            first = len(self.created) + 1
+            for numbers in chunked(list(range(first, first + count)), CREATE_CHUNK):
+                responses = self._post_all([
+                    create_task_endpoint(space_id=self.space_id, board=self.board, group=self.group,
+                                         name=f"{self.name_prefix} #{number}")
+                    for number in numbers
+                ])
+                # Созданные задачи учитываются сразу, чтобы cleanup удалил их и при падении на следующей пачке
+                created = [_task_id(resp) for resp in responses if resp.ok]
+                self.created.extend(created)
+                task_ids.extend(created)
+                failed = [(resp.status_code, resp.text) for resp in responses if not resp.ok]
+                assert not failed, f"CreateTask вернул ошибки ({len(failed)} из {len(responses)}): {failed[:5]}"
+        if shared:
+            self.edit(task_ids, **shared)
+        return task_ids
+
+    def edit(self, task_ids: List[str], **changes) -> list:
+        """Применяет одни и те же changes ко всем task_ids через MultipleEditTasks; возвращает ответы по пачкам."""
+        self._check_fields(changes)
+        batches = chunked(list(task_ids), MULTIPLE_EDIT_LIMIT)
+        with allure.step(f"MultipleEditTasks {sorted(changes)}: {len(task_ids)} задач, {len(batches)} запросов"):
+            responses = self._post_all([
+                multiple_edit_tasks_endpoint(space_id=self.space_id,
+                                             tasks=[{"taskId": task_id, **changes} for task_id in batch])
+                for batch in batches
+            ])
+            errors = [(i, resp.status_code, resp.text) for i, resp in enumerate(responses) if resp.status_code != 200]
+            assert not errors, f"MultipleEditTasks вернул ошибки (пачка, статус, ответ): {errors[:5]}"
+            # Ошибки по отдельным задачам API возвращает в payload.failed при статусе 200
+            failed = [task_id for resp in responses for task_id in (resp.json().get("payload") or {}).get("failed") or []]
+            assert not failed, f"MultipleEditTasks не применил изменения к {len(failed)} задачам: {failed[:20]}"
+        return responses
+
+    @staticmethod
+    def _check_fields(changes: dict):
+        unknown = set(changes) - set(SHARED_FIELDS)
+        if unknown:
+            raise ValueError(f"Неподдерживаемые общие атрибуты задач: {sorted(unknown)}; доступны: {SHARED_FIELDS}")
+
+    def cleanup(self, report_title: str = "Teardown: удаление созданных задач") -> TeardownReport:
+        """Удаляет все созданные фабрикой задачи (параллельно; 400/404 — задача уже удалена в тесте)."""
+        teardown = BulkTeardown(self.client)
+        for task_id in self.created:
+            teardown.add(delete_task_endpoint(task_id=task_id, space_id=self.space_id), label=task_id)
+        self.created = []
+        return teardown.run(report_title)
@@ -4,8 +4,10 @@ from typing import List
 
 import pytest
 
+from tests.core.teardown import BulkTeardown
 from tests.test_backend.data.endpoints.Task.task_endpoints import create_task_endpoint, delete_task_endpoint, \
     edit_task_custom_field_endpoint
+from test_backend.task_service.bulk_tasks import BulkTaskFactory
 from test_backend.task_service.utils import get_client, create_task, get_random_type_id, get_random_group_id, \
     get_current_timestamp, get_due_end, get_priority, get_assignee
 
@@ -69,43 +71,36 @@ def create_task_in_main(request, main_space, main_board, main_project):
 
     return _create_task
 
+@pytest.fixture
+def bulk_task_factory(owner_client, main_space, main_board):
+    """
+    Фабрика массового создания задач в main_board (см. BulkTaskFactory); все созданные задачи удаляются после теста.
+    Использование:
+        task_ids = bulk_task_factory.create(300, priority=3, assignees=[member_id])
+        bulk_task_factory.edit(task_ids[:50], completed=True)
+    """
+    factory = BulkTaskFactory(owner_client, main_space, main_board)
+    yield factory
+    factory.cleanup("Teardown [bulk_task_factory]: удаление задач")
+
+
 @pytest.fixture
 def create_30_tasks(owner_client, main_space, main_board):
     """
     Фикстура создаёт N задач и гарантированно удаляет их по завершении теста.
     Использование:
-        task_ids = create_30_tasks()           # по умолчанию 30 задач
-        task_ids = create_30_tasks(count=10)   # создать 10 задач
+        task_ids = create_30_tasks()                        # по умолчанию 30 задач
+        task_ids = create_30_tasks(count=10)                # создать 10 задач
+        task_ids = create_30_tasks(count=10, priority=3)    # с общими атрибутами (через MultipleEditTasks)
     """
-    created_ids: List[str] = []
-
-    def _factory(count: int = 30) -> List[str]:
-        nonlocal created_ids
-        created_ids = []
-        for i in range(count):
-            title = f"Multiple Edit Tasks #{i + 1}"
-            resp = owner_client.post(
-                **create_task_endpoint(space_id=main_space, board=main_board, name=title, completed=False))
-            resp.raise_for_status()
-            body = resp.json()
-            task = (body.get("payload") or {}).get("task") or body.get("task") or {}
-            task_id = task.get("_id") or task.get("id")
-            assert task_id, f"Не удалось получить _id созданной задачи: {body!r}"
-            created_ids.append(task_id)
-        return created_ids
+    factory = BulkTaskFactory(owner_client, main_space, main_board, name_prefix="Multiple Edit Tasks")
+
+    def _factory(count: int = 30, **shared) -> List[str]:
+        return factory.create(count, **shared)
 
     yield _factory
 
-    # Teardown: удаление созданных задач
-    if created_ids:
-        for tid in created_ids:
-            try:
-                resp = owner_client.post(**delete_task_endpoint(task_id=tid, space_id=main_space))
-                # допускаем 2xx/404 (если задача уже удалена в тесте)
-                if resp.status_code >= 400 and resp.status_code != 404:
-                    pass
-            except Exception:
-                pass
+    factory.cleanup("Teardown [create_30_tasks]: удаление задач")
 
 
 @pytest.fixture
@@ -131,16 +126,11 @@ def make_task_in_main(owner_client, main_space, main_board):
 
     yield _create_task
 
-    # Teardown: удаление созданных задач
-    if created_ids:
-        for tid in created_ids:
-            try:
-                resp = owner_client.post(**delete_task_endpoint(task_id=tid, space_id=main_space))
-                # допускаем 2xx/404 (если задача уже удалена в тесте)
-                if resp.status_code >= 400 and resp.status_code != 404:
-                    pass
-            except Exception:
-                pass
+    # Teardown: удаление созданных задач (параллельно; 400/404 — задача уже удалена в тесте)
+    teardown = BulkTeardown(owner_client)
+    for tid in created_ids:
+        teardown.add(delete_task_endpoint(task_id=tid, space_id=main_space), label=tid)
+    teardown.run("Teardown [make_task_in_main]: удаление задач")
 
 
 def _update_custom_field(client, space_id, task_id, field_id, value):
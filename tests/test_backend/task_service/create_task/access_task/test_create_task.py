@@ -4,114 +4,114 @@ import random
 import allure
 import pytest
 
+from tests.core.role_matrix import RoleMatrix, check_role_result
+from tests.core.teardown import BulkTeardown
 from tests.test_backend.data.endpoints.Task.task_endpoints import create_task_endpoint, delete_task_endpoint
 from test_backend.task_service.utils import validate_hrid, get_client, get_member_profile, create_task, get_random_type_id, get_random_group_id, \
     get_current_timestamp, get_due_end, get_priority, get_assignee, get_milestone, assert_task_keys
 
-pytestmark = [pytest.mark.backend]
+pytestmark = [pytest.mark.backend, pytest.mark.mutates("main_board")]
+
+CREATE_TASK_BY_ROLES = RoleMatrix({'owner': 200, 'manager': 200, 'member': 200, 'guest': 403})
+
+
+@pytest.fixture(scope='module')
+def created_minimal_tasks(request, main_space, main_board, owner_client):
+    """Создание задачи с минимальным payload всеми ролями параллельно; созданные задачи удаляются после модуля."""
+    payload = create_task_endpoint(space_id=main_space, board=main_board)
+    results = CREATE_TASK_BY_ROLES.run(request, lambda client, role: create_task(client, payload))
+
+    yield results
+
+    teardown = BulkTeardown(owner_client)
+    for result in results.values():
+        if result.status_code == 200:
+            task_id = result.response.json()["payload"]["task"]["_id"]
+            teardown.add(delete_task_endpoint(task_id=task_id, space_id=main_space), label=task_id)
+    report = teardown.run("Удаление задач, созданных ролями")
+    assert not report.leftovers, report.summary()
+
 
 @allure.parent_suite("Task Service")
 @allure.suite("Create Task")
 @allure.sub_suite("Access Task")
 @allure.title("Тестирование создания задачи разными пользовательскими ролями с минимальным набором полей."
               " Проверка полного совпадения набора ключей задачи")
-@pytest.mark.parametrize(
-    'client_fixture, expected_status',
-    [
-        ('owner_client', 200),
-        ('manager_client', 200),
-        ('member_client', 200),
-        ('guest_client', 403),
-    ],
-    ids=['owner', 'manager', 'member', 'guest'],
-)
-def test_create_task_with_minimal_payload(request, main_space, main_board, client_fixture, expected_status, main_project, owner_client):
+@CREATE_TASK_BY_ROLES.parametrize()
+def test_create_task_with_minimal_payload(request, main_space, main_board, role, expected_status, main_project, created_minimal_tasks):
     """
     Тест проверки создания задачи с минимальным набором полей в системе управления проектами под разными ролями.
 
     Цель теста — убедиться, что можно успешно создать задачу, указав только минимально необходимые данные, и что поведение API зависит от прав пользователя (типа клиента).
-    В процессе теста дополнительно валидируются структура созданной задачи, значения по умолчанию, связи (creator, board и пр.), а также удаление задачи после проверки.
+    Запросы всех ролей отправляются параллельно в фикстуре created_minimal_tasks, тест проверяет результат своей роли.
+    В процессе теста дополнительно валидируются структура созданной задачи, значения по умолчанию, связи (creator, board и пр.); задачи удаляются после модуля.
     assert_task_keys обеспечивает падение теста при добавлении/удалении ключей с понятным сообщением.
     """
+    client_fixture = CREATE_TASK_BY_ROLES.clients[role]
     allure.dynamic.title(
         f"Create task with minimal payload: клиент={client_fixture}, ожидаемый статус={expected_status}")
 
     client = get_client(request, client_fixture)
-    member_id = get_member_profile(client, main_space)
+    result = created_minimal_tasks[role]
+    response = result.response
 
-    task_id = None  # переменную объявляем до блока try
+    # Проверяем статус ответа
+    check_role_result(result)
 
-    try:
+    # Если запрос успешен, проверяем содержимое ответа
+    if response.status_code == 200:
+        member_id = get_member_profile(client, main_space)
+        with allure.step("Проверяем содержимое ответа с задачей"):
+            task = response.json()["payload"]["task"]
 
-        with allure.step("Создание задачи с минимальным payload"):
-            payload = create_task_endpoint(space_id=main_space, board=main_board)
-            response = create_task(client, payload)
+            with allure.step("Проверка обязательных полей"):
+                assert task["board"] == main_board, "Ошибка: неверное значение поля 'board'"
+                assert task["name"] == "Untitled task", "Ошибка: неверное значение поля 'name'"
+                assert task["completed"] is False, "Ошибка: поле 'completed' должно быть False"
+                assert task["creator"] == member_id, "Ошибка: 'creator' не соответствует memberId пользователя"
 
-        # Проверяем статус ответа
-        with allure.step(f"Проверка статус-кода: ожидаем {expected_status}"):
-            assert response.status_code == expected_status, response.text
+            with allure.step("Проверка системных полей"):
+                assert "_id" in task, "Ошибка: отсутствует поле '_id'"
+                assert task["createdAt"] is not None, "Ошибка: поле 'createdAt' должно быть задано"
+                assert task["updatedAt"] is not None, "Ошибка: поле 'updatedAt' должно быть задано"
 
-        # Если запрос успешен, проверяем содержимое ответа
-        if response.status_code == 200:
-            with allure.step("Проверяем содержимое ответа с задачей"):
-                task = response.json()["payload"]["task"]
-                task_id = task["_id"]
-
-                with allure.step("Проверка обязательных полей"):
-                    assert task["board"] == main_board, "Ошибка: неверное значение поля 'board'"
-                    assert task["name"] == "Untitled task", "Ошибка: неверное значение поля 'name'"
-                    assert task["completed"] is False, "Ошибка: поле 'completed' должно быть False"
-                    assert task["creator"] == member_id, "Ошибка: 'creator' не соответствует memberId пользователя"
-
-                with allure.step("Проверка системных полей"):
-                    assert "_id" in task, "Ошибка: отсутствует поле '_id'"
-                    assert task["createdAt"] is not None, "Ошибка: поле 'createdAt' должно быть задано"
-                    assert task["updatedAt"] is not None, "Ошибка: поле 'updatedAt' должно быть задано"
+                # Проверка корректности формата `hrid`
+                with allure.step("Проверяем поле 'hrid'"):
+                    assert "hrid" in task, "Поле 'hrid' отсутствует"
+                    validate_hrid(client, main_space, main_project, task["hrid"])
 
-                    # Проверка корректности формата `hrid`
-                    with allure.step("Проверяем поле 'hrid'"):
-                        assert "hrid" in task, "Поле 'hrid' отсутствует"
-                        validate_hrid(client, main_space, main_project, task["hrid"])
-
-                with allure.step("Проверка полей, которые должны быть пустыми"):
-                    assert task["assignees"] == [], "Ошибка: 'assignees' должно быть пустым списком"
-                    assert task["types"] == [], "Ошибка: 'types' должно быть пустым списком"
-                    assert task["milestones"] == [], "Ошибка: 'milestones' должно быть пустым списком"
-                    assert task["subtasks"] == [], "Ошибка: 'subtasks' должно быть пустым списком"
-
-                with allure.step("Проверка полей с `None` (null)"):
-                    assert task["parentTask"] is None, "Ошибка: 'parentTask' должно быть None"
-                    assert task["archiver"] is None, "Ошибка: 'archiver' должно быть None"
-                    assert task["archivedAt"] is None, "Ошибка: 'archivedAt' должно быть None"
-                    assert task["completedAt"] is None, "Ошибка: 'completedAt' должно быть None"
-
-                with allure.step("Проверка значений по умолчанию"):
-                    assert task["priority"] == 1, "Ошибка: 'priority' должно быть равно 1"
-                    assert isinstance(task["followers"], dict), "Ошибка: 'followers' должно быть словарем"
-                    assert task["followers"] == {member_id: "creator"}, "Ошибка: 'followers' должно включать creator"
-                    assert isinstance(task["rightConnectors"], list) and len(task["rightConnectors"]) == 0, \
-                        "Ошибка: 'rightConnectors' должно быть пустым списком"
-                    assert isinstance(task["leftConnectors"], list) and len(task["leftConnectors"]) == 0, \
-                        "Ошибка: 'leftConnectors' должно быть пустым списком"
+            with allure.step("Проверка полей, которые должны быть пустыми"):
+                assert task["assignees"] == [], "Ошибка: 'assignees' должно быть пустым списком"
+                assert task["types"] == [], "Ошибка: 'types' должно быть пустым списком"
+                assert task["milestones"] == [], "Ошибка: 'milestones' должно быть пустым списком"
+                assert task["subtasks"] == [], "Ошибка: 'subtasks' должно быть пустым списком"
+
+            with allure.step("Проверка полей с `None` (null)"):
+                assert task["parentTask"] is None, "Ошибка: 'parentTask' должно быть None"
+                assert task["archiver"] is None, "Ошибка: 'archiver' должно быть None"
+                assert task["archivedAt"] is None, "Ошибка: 'archivedAt' должно быть None"
+                assert task["completedAt"] is None, "Ошибка: 'completedAt' должно быть None"
+
+            with allure.step("Проверка значений по умолчанию"):
+                assert task["priority"] == 1, "Ошибка: 'priority' должно быть равно 1"
+                assert isinstance(task["followers"], dict), "Ошибка: 'followers' должно быть словарем"
+                assert task["followers"] == {member_id: "creator"}, "Ошибка: 'followers' должно включать creator"
+                assert isinstance(task["rightConnectors"], list) and len(task["rightConnectors"]) == 0, \
+                    "Ошибка: 'rightConnectors' должно быть пустым списком"
+                assert isinstance(task["leftConnectors"], list) and len(task["leftConnectors"]) == 0, \
+                    "Ошибка: 'leftConnectors' должно быть пустым списком"
 
-                    task = response.json()["payload"]["task"]
+                task = response.json()["payload"]["task"]
 
-                    with allure.step("Проверка полного совпадения набора ключей задачи"):
-                        expected_task_keys = {
-                            "name", "group", "board", "project", "parentTask", "priority", "completed",
-                            "types", "assignees", "milestones", "subtasks", "dueStart", "dueEnd",
-                            "_id", "createdAt", "updatedAt", "document", "followers",
-                            "hrid", "rightConnectors", "leftConnectors", "archiver", "archivedAt",
-                            "completedAt", "deleter", "deletedAt", "customFields", "creator",
-                        }
-                        assert_task_keys(task, expected_task_keys)
-    finally:
-        if task_id:
-            with allure.step(f"Удаляем задачу: {task_id}"):
-                del_resp = owner_client.post(**delete_task_endpoint(task_id=task_id, space_id=main_space))
-                assert del_resp.status_code == 200, (
-                    f"Не удалось удалить задачу {task_id}: {del_resp.status_code} {del_resp.text}"
-                )
+                with allure.step("Проверка полного совпадения набора ключей задачи"):
+                    expected_task_keys = {
+                        "name", "group", "board", "project", "parentTask", "priority", "completed",
+                        "types", "assignees", "milestones", "subtasks", "dueStart", "dueEnd",
+                        "_id", "createdAt", "updatedAt", "document", "followers",
+                        "hrid", "rightConnectors", "leftConnectors", "archiver", "archivedAt",
+                        "completedAt", "deleter", "deletedAt", "customFields", "creator",
+                    }
+                    assert_task_keys(task, expected_task_keys)
 
 
 @allure.parent_suite("Task Service")
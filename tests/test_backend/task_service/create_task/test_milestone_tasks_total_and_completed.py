@@ -5,7 +5,8 @@ import pytest
 from tests.test_backend.data.endpoints.milestone.milestones_endpoints import get_milestone_endpoint
 from test_backend.task_service.utils import delete_task_with_retry, get_named_milestone_id
 
-pytestmark = [pytest.mark.backend]
+# Тесты очищают общий майлстоун main_board, поэтому при xdist идут одним воркером
+pytestmark = [pytest.mark.backend, pytest.mark.mutates("main_board")]
 
 def get_milestone_total(client, space_id, milestone_id):
     resp = client.post(**get_milestone_endpoint(space_id=space_id, ms_id=milestone_id))
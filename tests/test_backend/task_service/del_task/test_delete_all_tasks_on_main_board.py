@@ -7,7 +7,7 @@ import allure
 from tests.test_backend.data.endpoints.Task.task_endpoints import get_tasks_endpoint, delete_task_endpoint
 from test_backend.task_service.utils import get_client
 
-pytestmark = [pytest.mark.backend]
+pytestmark = [pytest.mark.backend, pytest.mark.mutates("main_board")]
 
 @allure.parent_suite("Task Service")
 @allure.suite("Delete Task")
@@ -4,7 +4,7 @@ import pytest
 from tests.test_backend.data.endpoints.Task.task_endpoints import create_task_endpoint, delete_task_endpoint
 from test_backend.task_service.utils import get_client, create_task
 
-pytestmark = [pytest.mark.backend]
+pytestmark = [pytest.mark.backend, pytest.mark.mutates("main_board")]
 
 @allure.parent_suite("Task Service")
 @allure.suite("Delete Task")
@@ -3,6 +3,7 @@ import pytest
 
 from test_backend.data.endpoints.Task.assert_task_payload import assert_task_payload
 from test_backend.data.endpoints.Task.task_endpoints import get_task_endpoint
+from test_backend.data.persisted_entities import get_persisted_custom_field
 from test_backend.task_service.conftest import _update_custom_field
 
 pytestmark = [pytest.mark.backend]
@@ -12,7 +13,7 @@ pytestmark = [pytest.mark.backend]
 @allure.suite("Edit Task Custom Field")
 @allure.sub_suite("Estimation Custom Fields")
 @allure.title("Edit Estimation Custom Field. Проверка успешного обновления значения и очистки поля.")
-def test_edit_task_estimation_custom_field(owner_client, main_space, board_with_tasks, main_project):
+def test_edit_task_estimation_custom_field(owner_client, main_space, board_with_tasks, main_project, persisted):
     """
     Estimation Custom Fields. Проверка успешного обновления значения (ISO 8601 Duration) и очистки поля.
     """
@@ -55,12 +56,8 @@ def test_edit_task_estimation_custom_field(owner_client, main_space, board_with_
 
             assert_task_payload(task, board_with_tasks, main_project)
 
-    with allure.step("Post-condition: Проверка сохранения данных в БД (через GET Task)"):
-        resp_after_set = owner_client.post(**get_task_endpoint(space_id=main_space, slug_id=target_task_id))
-        assert resp_after_set.status_code == 200
-
-        task_db = resp_after_set.json().get("payload", {}).get("task")
-        field_db = next((cf for cf in task_db.get("customFields", []) if cf.get("id") == estimation_field_id), None)
+    with allure.step("Post-condition: Проверка сохранения данных в БД"):
+        field_db = get_persisted_custom_field(persisted, owner_client, main_space, target_task_id, estimation_field_id)
 
         assert field_db is not None
         assert field_db.get("value") == value_to_set, "Значение в БД не сохранилось"
@@ -78,13 +75,8 @@ def test_edit_task_estimation_custom_field(owner_client, main_space, board_with_
             assert cleared_field.get("value") == "", \
                 "Поле не очистилось. Ожидалось: "", получено: '{cleared_field.get('value')}'"
 
-    with allure.step("Post-condition: Проверка очистки данных в БД (через GET Task)"):
-        resp_after_clear = owner_client.post(**get_task_endpoint(space_id=main_space, slug_id=target_task_id))
-        assert resp_after_clear.status_code == 200
-
-        task_db_empty = resp_after_clear.json().get("payload", {}).get("task")
-        field_db_empty = next(
-            (cf for cf in task_db_empty.get("customFields", []) if cf.get("id") == estimation_field_id), None)
+    with allure.step("Post-condition: Проверка очистки данных в БД"):
+        field_db_empty = get_persisted_custom_field(persisted, owner_client, main_space, target_task_id, estimation_field_id)
 
         assert field_db_empty is not None
         assert field_db_empty.get("value") == "", "Значение в БД не очистилось"
@@ -1,8 +1,8 @@
 import allure
 import pytest
-from dateutil import parser
 
-from test_backend.data.endpoints.Task.task_endpoints import get_tasks_endpoint
+from test_backend.task_service.utils import check_tasks_sorted
+from tests.core.sort_order import ASC, SortSpec
 
 pytestmark = [pytest.mark.backend]
 
@@ -11,44 +11,14 @@ pytestmark = [pytest.mark.backend]
 @allure.suite("Get Tasks")
 @allure.sub_suite("Filtered by criteria")
 @allure.sub_suite("Sort by Direction ASC")
-@allure.title("GetTasks dueStart_asc: Проверка сортировки задач по dueStart: ненулевые по убыванию, затем null (в пределах лимита)")
-def test_get_tasks_sorting_by_due_start_asc(owner_client, main_space, board_with_10000_tasks, main_board):
-
-    with allure.step("Запрос задач: dueStart ASC"):
-        resp = owner_client.post(**get_tasks_endpoint(
-            space_id=main_space,
+@allure.title("GetTasks dueStart_asc: Проверка сортировки задач по dueStart: null в начале, затем ненулевые по возрастанию")
+def test_get_tasks_sorting_by_due_start_asc(owner_client, main_space, board_with_10000_tasks):
+    """Ненулевые dueStart идут по возрастанию, null — в начале выдачи (null меньше любой даты)."""
+    with allure.step("Стримим задачи: dueStart ASC, проверяем порядок и положение null"):
+        validator = check_tasks_sorted(
+            owner_client, main_space, SortSpec('dueStart', ASC, parse='datetime'),
             board=board_with_10000_tasks,
-            sortCriteria="dueStart",
-            sortDirection=1
-        ))
-    with allure.step("Проверить HTTP 200"):
-        assert resp.status_code == 200
-
-    with allure.step("Извлечь задачи и проверить лимит"):
-        tasks = resp.json()["payload"]["tasks"]
-        assert tasks, "Ожидаются задачи в ответе"
-
-    non_null_tasks = [t for t in tasks if t.get("dueStart") is not None]
-
-    if len(non_null_tasks) <= 2:
-        task_ids = [t.get("id") for t in tasks]
-        allure.attach(
-            f"Всего задач: {len(tasks)}\n"
-            f"IDs: {task_ids}\n"
-            f"Ненулевых dueStart: {len(non_null_tasks)}",
-            "Диагностика skip (ASC)",
-            allure.attachment_type.TEXT
         )
-        pytest.skip(f"Недостаточно данных для проверки убывания: ненулевых={len(non_null_tasks)} (нужно > 2)")
-
-    with allure.step("Проверить, что все null идут после всех ненулевых (при ASC)"):
-        flags = [t.get("dueStart") is None for t in tasks]
-        assert flags == sorted(flags, reverse=True), "Null значения должны быть в начале ответа при сортировке ASC"
 
-    with allure.step("Проверить возрастание только среди ненулевых dueStart"):
-        dates = [parser.parse(t["dueStart"]) for t in non_null_tasks[:20]]
-        for i in range(len(dates) - 1):
-            assert dates[i] <= dates[i + 1], (
-                f"Нарушена сортировка по возрастанию среди ненулевых: "
-                f"{dates[i]} должно быть <= {dates[i+1]}"
-            )
\ No newline at end of file
+    if validator.non_null <= 2:
+        pytest.skip(f"Недостаточно данных для проверки: ненулевых dueStart={validator.non_null} (нужно > 2)")
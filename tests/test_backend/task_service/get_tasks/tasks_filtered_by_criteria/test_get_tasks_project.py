@@ -3,7 +3,7 @@ import allure
 
 from test_backend.data.endpoints.Task.task_endpoints import get_tasks_endpoint
 
-pytestmark = [pytest.mark.backend]
+pytestmark = [pytest.mark.backend, pytest.mark.reads("main_board")]
 
 
 @allure.parent_suite("Task Service")
@@ -2,6 +2,7 @@ import pytest
 import allure
 
 from test_backend.data.endpoints.Project.project_endpoints import get_projects_endpoint
+from test_backend.data.endpoints.Task.assert_task_payload import assert_tasks_payload
 from test_backend.data.endpoints.Task.task_endpoints import get_tasks_endpoint
 
 pytestmark = [pytest.mark.backend]
@@ -11,19 +12,21 @@ pytestmark = [pytest.mark.backend]
 @allure.parent_suite("Task Service")
 @allure.suite("Get Tasks")
 @allure.title("GetTasks smoke: базовый смоук — успешный ответ и массив tasks")
-@allure.description("Проверка, что эндпоинт возвращает статус 200 и тело с полем tasks (массив).")
-def test_get_tasks_minimal(owner_client, board_with_10000_tasks, main_space):
+@allure.description("Проверка, что эндпоинт возвращает статус 200 и тело с полем tasks (массив) валидных задач.")
+def test_get_tasks_minimal(owner_client, board_with_10000_tasks, main_space, main_project):
     with allure.step("Выполнить POST /GetTasks без доп. параметров"):
         response = owner_client.post(**get_tasks_endpoint(board=board_with_10000_tasks, space_id=main_space, limit=100))
     with allure.step("Проверить статус и контракт ответа"):
         assert response.status_code == 200
         data = response.json()['payload']
         assert "tasks" in data and isinstance(data["tasks"], list)
+        assert_tasks_payload(data["tasks"], board_with_10000_tasks, main_project)
 
 
 @allure.parent_suite("Task Service")
 @allure.suite("Get Tasks")
 @allure.title("GetTasks: пустой payload")
+@pytest.mark.reads("main_board")
 def test_get_tasks_with_empty_payload(owner_client,main_space):
     """
     Проверяет, что при запросе задач без фильтров возвращаются задачи только из проектов указанного space_id.
@@ -0,0 +1,75 @@
+import os
+
+import allure
+import pytest
+
+from config import settings
+from test_backend.data.endpoints.Task.task_endpoints import get_tasks_endpoint
+from test_backend.task_service.utils import get_member_profile
+from tests.core.benchmark import BenchmarkReport, load_baseline, measure
+
+pytestmark = [pytest.mark.backend, pytest.mark.benchmark]
+
+RUNS = int(os.getenv('BENCHMARK_RUNS', 20))
+BASELINE_NAME = 'get_tasks.json'
+ASSIGNEE, MILESTONE = '<assignee>', '<milestone>'
+
+# Сценарии: по одному фактору от базового запроса (limit=50, skip=0) плюс типичные сочетания
+GET_TASKS_SWEEP = [
+    *[(f'limit={limit}', {'limit': limit}) for limit in (10, 50, 200, 1000)],
+    *[(f'skip={skip}', {'limit': 50, 'skip': skip}) for skip in (1000, 5000, 9900)],
+    *[
+        (f'sort={criteria}:{direction}', {'limit': 50, 'sortCriteria': criteria, 'sortDirection': direction})
+        for criteria in ('createdAt', 'dueStart', 'completedAt', 'priority')
+        for direction in (1, -1)
+    ],
+    ('archived', {'limit': 50, 'archived': True}),
+    ('withArchived', {'limit': 50, 'withArchived': True}),
+    ('assignees', {'limit': 50, 'assignees': [ASSIGNEE]}),
+    ('milestones', {'limit': 50, 'milestones': [MILESTONE]}),
+    ('skip=5000+sort=dueStart:-1', {'limit': 50, 'skip': 5000, 'sortCriteria': 'dueStart', 'sortDirection': -1}),
+    ('archived+sort=archivedAt:-1', {'limit': 200, 'archived': True, 'sortCriteria': 'archivedAt',
+                                     'sortDirection': -1}),
+]
+
+
+def _resolve(params: dict, values: dict) -> dict:
+    return {key: [values.get(v, v) for v in value] if isinstance(value, list) else value
+            for key, value in params.items()}
+
+
+@allure.parent_suite("Task Service")
+@allure.suite("Get Tasks")
+@allure.title("Get Tasks benchmark: p50/p95/p99 и размер ответа по фильтрам и сортировкам на доске 10.000 задач")
+def test_get_tasks_latency_sweep(request, owner_client, main_space, board_with_10000_tasks):
+    """
+    Прогоняет GET_TASKS_SWEEP (RUNS замеров на сценарий), пишет JSON в settings.BENCHMARK_RESULTS_DIR
+    и таблицу в Allure. Если для стенда есть baseline — падает при регрессии p50/p95;
+    с --update-benchmark-baseline сохраняет результаты как новый baseline.
+    """
+    values = {ASSIGNEE: get_member_profile(owner_client, main_space), MILESTONE: settings.MILESTONE_1_ID}
+    report = BenchmarkReport('get_tasks', stand=settings.TEST_STAND_NAME)
+
+    for name, params in GET_TASKS_SWEEP:
+        params = _resolve(params, values)
+        with allure.step(f"Замер: {name}"):
+            endpoint = get_tasks_endpoint(space_id=main_space, board=board_with_10000_tasks, **params)
+            stats = measure(owner_client, endpoint, name, params=params, runs=RUNS, items_key='tasks')
+        assert not stats.errors, f"{name}: {stats.errors} ответов не 200"
+        report.add(stats)
+
+    report.write(os.path.join(settings.BENCHMARK_RESULTS_DIR, BASELINE_NAME))
+    report.attach()
+    print(f"\n{report.table()}")
+
+    baseline_path = os.path.join(settings.BENCHMARK_BASELINE_DIR, BASELINE_NAME)
+    if request.config.getoption('--update-benchmark-baseline'):
+        report.write(baseline_path)
+        return
+    baseline = load_baseline(baseline_path)
+    if baseline is None:
+        pytest.skip(f"Нет baseline {baseline_path}: сохраните его флагом --update-benchmark-baseline")
+
+    with allure.step("Сравнить с baseline"):
+        regressions = report.compare(baseline)
+        assert not regressions, "Регрессия задержки GetTasks:\n" + "\n".join(str(r) for r in regressions)
@@ -2,6 +2,7 @@ import allure
 import pytest
 
 from test_backend.data.endpoints.Task.task_endpoints import get_tasks_endpoint
+from tests.core.pagination import NoDuplicates, stream_tasks
 
 pytestmark = [pytest.mark.backend]
 
@@ -29,3 +30,23 @@ def test_get_tasks_response_time(request, board_with_10000_tasks, main_space):
         # Разумный лимит времени ответа - 10 секунд
         assert response_time < 10.0, f"Запрос выполнялся слишком долго: {response_time:.2f}s"
 
+
+
+@allure.parent_suite("Task Service")
+@allure.suite("Get Tasks")
+@allure.title("Get Tasks: обход всей доски на 10.000 задач страницами без дублей")
+def test_get_tasks_walk_whole_board(owner_client, board_with_10000_tasks, main_space):
+    """Стримит все задачи доски (следующая страница грузится в фоне) и проверяет инварианты по ходу обхода."""
+    stream = stream_tasks(
+        owner_client,
+        get_tasks_endpoint(space_id=main_space, board=board_with_10000_tasks),
+        page_size=200,
+        checks=[NoDuplicates()],
+    )
+
+    with allure.step("Обойти доску страницами по 200 задач"):
+        for task in stream:
+            assert task["board"] == board_with_10000_tasks, f"Задача {task['_id']} с чужой доски"
+
+    with allure.step(f"Проверить объём обхода: {stream.items} задач, {stream.pages} страниц"):
+        assert stream.items > 0, "На доске нет задач"
@@ -1,15 +1,52 @@
 import pytest
 import allure
 from test_backend.data.endpoints.Task.task_endpoints import get_tasks_endpoint
+from tests.core.schema import compile_schema
 
 pytestmark = [pytest.mark.backend]
 
+# Схема задачи в выдаче GetTasks
+GET_TASKS_REQUIRED_FIELDS = {
+    "_id": str,
+    "name": str,
+    "group": str,
+    "project": str,
+    "priority": (int, float),
+    "creator": str,
+    "completed": bool,
+    "assignees": list,
+    "document": str,
+    "createdAt": str,
+    "updatedAt": str,
+    "board": str,
+    "types": list,
+    "subtasks": list,
+    "hrid": str,
+    "leftConnectors": list,
+    "rightConnectors": list,
+    "customFields": list,
+    "followers": dict,
+    "milestones": list,
+}
+
+# Nullable-поля и поля, тип которых не проверяется (могут отсутствовать)
+GET_TASKS_OPTIONAL_FIELDS = {
+    "archiver": (str, type(None)),
+    "archivedAt": (str, type(None)),
+    "parentTask": (str, type(None)),
+    "dueEnd": (str, type(None)),
+    **{field: object for field in ("editor", "milestone", "dueStart", "completedAt", "deleter", "deletedAt")},
+}
+
+GET_TASKS_VALIDATOR = compile_schema("GetTasks.task", GET_TASKS_REQUIRED_FIELDS, optional=GET_TASKS_OPTIONAL_FIELDS)
+
+
 @allure.parent_suite("Task Service")
 @allure.suite("Get Tasks")
 @allure.title("GetTasks schema: Проверка структуры и типов полей задач в ответе")
 def test_get_tasks_schema(owner_client, main_space, board_with_10000_tasks):
     """
-    Проверка структуры и типов полей задач только для owner_client.
+    Проверка структуры и типов полей всех задач страницы только для owner_client.
     """
     with allure.step("owner_client: вызвать GetTasks с фильтром board"):
         resp = owner_client.post(**get_tasks_endpoint(space_id=main_space, limit=1000, board=board_with_10000_tasks))
@@ -26,50 +63,5 @@ def test_get_tasks_schema(owner_client, main_space, board_with_10000_tasks):
         with allure.step("Список задач пуст — проверку схемы пропускаем"):
             return
 
-    with allure.step(f"Проверить схему для 20 задач из {len(tasks)}"):
-        required_fields = {
-            "_id": str,
-            "name": str,
-            "group": str,
-            "project": str,
-            "priority": (int, float),
-            "creator": str,
-            "completed": bool,
-            "assignees": list,
-            "document": str,
-            "createdAt": str,
-            "updatedAt": str,
-            "board": str,
-            "types": list,
-            "subtasks": list,
-            "hrid": str,
-            "leftConnectors": list,
-            "rightConnectors": list,
-            "customFields": list,
-            "followers": dict,
-            "milestones": list,
-        }
-
-        nullable_fields = {
-            "archiver": (str, type(None)),
-            "archivedAt": (str, type(None)),
-            "parentTask": (str, type(None)),
-            "dueEnd": (str, type(None)),
-        }
-
-        optional_fields = {"editor", "milestone", "dueStart", "completedAt", "deleter", "deletedAt"}
-
-        for task in tasks[:20]:
-            with allure.step(f"Валидация схемы для задачи '_id'={task.get('_id', 'unknown')}"):
-                for field, expected_type in required_fields.items():
-                    assert field in task, f"Отсутствует обязательное поле: {field}"
-                    assert isinstance(task[field], expected_type), f"Поле {field} должно быть типа {expected_type}"
-
-                for field, expected_types in nullable_fields.items():
-                    if field in task:
-                        assert isinstance(task[field], expected_types), f"Поле {field} имеет неверный тип"
-
-                task_fields = set(task.keys())
-                all_known_fields = set(required_fields.keys()) | set(nullable_fields.keys()) | optional_fields
-                unexpected_fields = task_fields - all_known_fields
-                assert not unexpected_fields, f"Найдены неожиданные поля: {unexpected_fields}"
+    with allure.step(f"Проверить схему всех {len(tasks)} задач"):
+        GET_TASKS_VALIDATOR.assert_all_valid(tasks)
@@ -3,14 +3,73 @@ import re
 import random
 import allure
 import time
+from core.waiters import caller_site, wait_until
+from tests.core.cache import TTLCache
+from tests.core.change_stream import STREAM_TIMEOUT_SHARE, get_change_waiter
+from tests.core.pagination import stream_tasks
+from tests.core.sort_order import SortOrderValidator
+from tests.core.teardown import BulkTeardown
 from tests.test_backend.data.endpoints.Board.board_endpoints import get_board_endpoint
 from tests.test_backend.data.endpoints.Project.project_endpoints import get_project_endpoint
-from tests.test_backend.data.endpoints.Task.task_endpoints import delete_task_endpoint
+from tests.test_backend.data.endpoints.Task.task_endpoints import delete_task_endpoint, get_tasks_endpoint
 from tests.test_backend.data.endpoints.User.profile_endpoint import get_profile_endpoint
 from tests.test_backend.data.endpoints.member.member_endpoints import get_space_members_endpoint
 from tests.test_backend.data.endpoints.milestone.milestones_endpoints import get_milestones_endpoint, get_milestone_endpoint
 
 
+# Кэш метаданных борд на всю сессию: борда (typesList, groups), участники спейса, майлстоуны.
+# Ключ: (вид, токен клиента (= роль), space_id, board_id). Тест, меняющий структуру борды,
+# должен вызвать invalidate_board_metadata(); иначе запись устаревает по TTL.
+BOARD_METADATA_TTL = 60
+board_metadata_cache = TTLCache(ttl=BOARD_METADATA_TTL)
+
+# Сколько задач проверяют тесты сортировки GetTasks (страницами по SORTED_TASKS_PAGE)
+SORTED_TASKS_LIMIT = 1000
+SORTED_TASKS_PAGE = 200
+
+
+def _load_payload(client, endpoint: dict) -> dict:
+    response = client.post(**endpoint)
+    response.raise_for_status()
+    return response.json().get("payload", {})
+
+
+def get_board_cached(client, board_id, space_id) -> dict:
+    """Борда из кэша метаданных (один /GetBoard на роль, борду и TTL)."""
+    return board_metadata_cache.get_or_load(
+        ("board", client.token, space_id, board_id),
+        lambda: _load_payload(client, get_board_endpoint(board_id=board_id, space_id=space_id)).get("board", {}),
+    )
+
+
+def get_space_members_cached(client, space_id) -> list:
+    """Участники спейса из кэша метаданных."""
+    return board_metadata_cache.get_or_load(
+        ("members", client.token, space_id, None),
+        lambda: _load_payload(client, get_space_members_endpoint(space_id)).get("members", []),
+    )
+
+
+def get_milestones_cached(client, space_id, board_id) -> list:
+    """Майлстоуны борды из кэша метаданных."""
+    return board_metadata_cache.get_or_load(
+        ("milestones", client.token, space_id, board_id),
+        lambda: _load_payload(client, get_milestones_endpoint(space_id=space_id, board_id=board_id)).get("milestones", []),
+    )
+
+
+def invalidate_board_metadata(space_id=None, board_id=None) -> int:
+    """
+    Сбрасывает кэш метаданных для спейса и/или борды (без аргументов — весь кэш).
+    Участники спейса сбрасываются вместе со спейсом. Возвращает число удалённых записей.
+    """
+    def _matches(key):
+        _, _, key_space, key_board = key
+        return (space_id is None or key_space == space_id) and (board_id is None or key_board in (board_id, None))
+
+    return board_metadata_cache.invalidate(_matches)
+
+
 def validate_hrid(client, space_id, project_id, task_hrid):
     """
     Проверяет, что hrid соответствует формату <slug>-<число>.
@@ -46,12 +105,9 @@ def get_client(request, client_fixture):
 
 def get_random_type_id(client, board_id, space_id):
     """
-    Получение случайного `_id` из typesList борды.
+    Получение случайного `_id` из typesList борды (борда берётся из кэша метаданных).
     """
-    response = client.post(**get_board_endpoint(board_id=board_id, space_id=space_id))
-    response.raise_for_status()
-
-    board_data = response.json().get("payload", {}).get("board", {})
+    board_data = get_board_cached(client, board_id, space_id)
     types_list = board_data.get("typesList", [])
 
     assert types_list, "Ошибка: typesList пуст или не существует."
@@ -62,12 +118,9 @@ def get_random_type_id(client, board_id, space_id):
 
 def get_random_group_id(client, board_id, space_id):
     """
-    Получение случайного `_id` группы из списка groups борды.
+    Получение случайного `_id` группы из списка groups борды (борда берётся из кэша метаданных).
     """
-    response = client.post(**get_board_endpoint(board_id=board_id, space_id=space_id))
-    response.raise_for_status()
-
-    board_data = response.json().get("payload", {}).get("board", {})
+    board_data = get_board_cached(client, board_id, space_id)
     groups = board_data.get("groups", [])
 
     assert groups, "Ошибка: groups пуст или не существует."
@@ -102,14 +155,10 @@ def get_priority():
 def get_assignee(client, space_id):
     """
     Возвращает случайный member_id из списка участников пространства (space).
+    Список участников берётся из кэша метаданных.
     :return: случайный member_id
     """
-    # Делаем запрос к endpoint для получения списка участников
-    response = client.post(**get_space_members_endpoint(space_id))
-    response.raise_for_status()  # Поднимаем исключение, если статус код != 2xx
-
-    # Извлекаем список участников
-    members = response.json().get("payload", {}).get("members", [])
+    members = get_space_members_cached(client, space_id)
     assert members, "Ошибка: список участников пуст или недоступен"
 
     # Фильтруем список, исключая участника с nickName "automation_bot"
@@ -196,66 +245,77 @@ def delete_task_with_retry(client, task_id, space_id, retries=1, delay=0.5):
 
 def delete_all_group_tasks(client, board_id, space_id, group_id):
     """
-    Удаляет все задачи из указанной группы на борде.
+    Удаляет все задачи из указанной группы на борде (параллельно, см. BulkTeardown).
+    Возвращает TeardownReport.
     """
     resp = client.post(**get_board_endpoint(board_id, space_id))
     resp.raise_for_status()
     board = resp.json()['payload']['board']
     task_ids = board['taskOrderByGroups'].get(group_id, [])
+    teardown = BulkTeardown(client)
     for task_id in task_ids:
-        time.sleep(0.5)
-        delete_task_with_retry(client, task_id, space_id)
+        teardown.add(delete_task_endpoint(task_id=task_id, space_id=space_id), label=task_id)
+    return teardown.run(f"Удаление задач группы {group_id}")
 
 def safe_delete_all_tasks_in_group(client, main_board, main_space, group_id, max_retries=3):
     """
     Удаляет все задачи из конкретной группы.
-    Для каждой задачи делает несколько попыток, если не получилось — пишет причину, но не падает жестко.
+    Для каждой задачи делает несколько попыток (при временных ошибках), если не получилось —
+    пишет причину в отчёт, но не падает жестко. Возвращает TeardownReport.
     """
     resp = client.post(**get_board_endpoint(main_board, main_space))
     board = resp.json()["payload"]["board"]
     task_ids = board["taskOrderByGroups"].get(group_id, [])
-    if not task_ids:
-        return
     # Чтобы не пропустить "зависшие" задачи (если get_tasks_endpoint вдруг отличается), проходим по списку task_ids
+    teardown = BulkTeardown(client, retries=max_retries)
     for tid in task_ids:
-        time.sleep(0.5)
-        for attempt in range(max_retries):
-            del_resp = client.post(
-                path="/DeleteTask",
-                json={"taskId": tid},
-                headers={"Content-Type": "application/json", "Current-Space-Id": main_space}
-            )
-            if del_resp.status_code == 200:
-                break
-            time.sleep(0.5)
-        else:
-            print(f"Не удалось удалить задачу {tid} после {max_retries} попыток: статус {del_resp.status_code}, ответ: {del_resp.text}")
+        teardown.add(delete_task_endpoint(task_id=tid, space_id=main_space), label=tid)
+    return teardown.run(f"Удаление задач группы {group_id}")
 
 
 def wait_group_empty(client, board_id, space_id, group_id, timeout=10, poll_interval=0.5):
-    """Ожидает, пока группа не станет пустой, либо истекает timeout (сек)"""
-    start_time = time.time()
-    while time.time() - start_time < timeout:
+    """
+    Ожидает, пока группа не станет пустой, либо истекает timeout (сек).
+    С MongoDB сначала ждёт изменения борды по change stream (не дольше STREAM_TIMEOUT_SHARE от timeout),
+    затем результат всегда подтверждается через GetBoard: в оставшееся время (или весь timeout без базы)
+    GetBoard опрашивается, пока группа не опустеет.
+    """
+    def _group_tasks():
         board = client.post(**get_board_endpoint(board_id, space_id)).json()["payload"]["board"]
-        tasks = board["taskOrderByGroups"].get(group_id, [])
-        if not tasks:
-            return
-        time.sleep(poll_interval)
-    # Если tasks не пуст — значит, что-то не так
-    raise AssertionError(f"Группа {group_id} осталась не пустой: {tasks}")
+        return board["taskOrderByGroups"].get(group_id, [])
+
+    def _group_empty_in_db(board):
+        task_order = board.get("taskOrderByGroups")
+        return isinstance(task_order, dict) and not task_order.get(group_id)
+
+    deadline = time.monotonic() + timeout
+    site = caller_site()
+    waiter = get_change_waiter()
+    if waiter.available:
+        try:
+            waiter.wait_for("boards", {"_id": board_id}, predicate=_group_empty_in_db,
+                            timeout=timeout * STREAM_TIMEOUT_SHARE, call_site=site)
+        except TimeoutError:
+            pass
+    try:
+        wait_until(lambda: not _group_tasks(), timeout=max(0.0, deadline - time.monotonic()),
+                   poll_interval=poll_interval, call_site=site)
+    except TimeoutError:
+        # Если tasks не пуст — значит, что-то не так
+        raise AssertionError(f"Группа {group_id} осталась не пустой: {_group_tasks()}") from None
 
 
 def get_named_milestone_id(client, space_id, board_id, milestone_name):
     """
-    Возвращает _id майлстоуна с заданным именем в текущей доске.
-    Ошибка, если не найден.
+    Возвращает _id майлстоуна с заданным именем в текущей доске (список майлстоунов — из кэша метаданных).
+    Если в кэше майлстоуна нет, список перечитывается один раз. Ошибка, если не найден.
     """
-    resp = client.post(**get_milestones_endpoint(space_id=space_id, board_id=board_id))
-    resp.raise_for_status()
-    milestones = resp.json().get("payload", {}).get("milestones", [])
-    for ms in milestones:
-        if ms.get("name") == milestone_name:
-            return ms["_id"]
+    for attempt in range(2):
+        if attempt:
+            board_metadata_cache.invalidate(lambda key: key == ("milestones", client.token, space_id, board_id))
+        for ms in get_milestones_cached(client, space_id, board_id):
+            if ms.get("name") == milestone_name:
+                return ms["_id"]
     raise AssertionError(f"Milestone с именем '{milestone_name}' не найден на борде {board_id}")
 
 def get_parent_ms_1(client, space_id, board_id):
@@ -350,4 +410,19 @@ def create_parent_and_subtasks(create_task_in_main, client_fixture, owner_client
         "subtask3": subtask3_id,
     }
 
-    return ids, ms
\ No newline at end of file
+    return ids, ms
+
+
+def check_tasks_sorted(client, space_id, spec, max_items=SORTED_TASKS_LIMIT, send_sort=True, **filters):
+    """
+    Стримит задачи GetTasks (sortCriteria/sortDirection из spec, если send_sort) и проверяет порядок за один проход.
+    Падает со списком всех нарушений; возвращает валидатор — в нём count и non_null для проверок объёма выборки.
+    """
+    if send_sort:
+        filters.update(sortCriteria=spec.field, sortDirection=spec.direction)
+    validator = SortOrderValidator(spec)
+    stream = stream_tasks(client, get_tasks_endpoint(space_id=space_id, **filters), page_size=SORTED_TASKS_PAGE,
+                          checks=[validator], max_items=max_items)
+    for _ in stream:
+        pass
+    return validator
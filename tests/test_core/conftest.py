@@ -0,0 +1,95 @@
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+
+class StubServer:
+    """
+    Локальный HTTP-стаб API для тестов ядра фреймворка (без стенда).
+
+    Маршруты регистрируются через route(path, handler), где handler(body: dict, headers: dict)
+    возвращает (status_code, json_body). Все запросы пишутся в self.requests.
+    latency — искусственная задержка каждого ответа в секундах (имитация round-trip до стенда).
+    """
+
+    def __init__(self, latency: float = 0.0):
+        self.latency = latency
+        self.routes = {}
+        self.requests = []
+        self._lock = threading.Lock()
+        self._server = ThreadingHTTPServer(('127.0.0.1', 0), self._make_handler())
+        self._server.daemon_threads = True
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+
+    @property
+    def url(self) -> str:
+        host, port = self._server.server_address
+        return f'http://{host}:{port}'
+
+    def route(self, path: str, handler):
+        self.routes[path] = handler
+
+    def calls(self, path: str) -> list:
+        """Тела запросов, пришедших на path, в порядке поступления."""
+        with self._lock:
+            return [body for p, body, _ in self.requests if p == path]
+
+    def start(self):
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._server.shutdown()
+        self._server.server_close()
+
+    def _make_handler(self):
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = 'HTTP/1.1'
+            # Заголовки и тело уходят отдельными записями: без TCP_NODELAY ответ на keep-alive соединении
+            # ждёт delayed ACK клиента (~40 мс) и искажает замеры времени
+            disable_nagle_algorithm = True
+
+            def do_POST(self):
+                length = int(self.headers.get('Content-Length') or 0)
+                raw = self.rfile.read(length) if length else b''
+                try:
+                    body = json.loads(raw) if raw else {}
+                except ValueError:
+                    body = {'_raw': raw}
+                headers = dict(self.headers)
+                with stub._lock:
+                    stub.requests.append((self.path, body, headers))
+
+                if stub.latency:
+                    time.sleep(stub.latency)
+
+                handler = stub.routes.get(self.path)
+                if handler is None:
+                    status, payload = 404, {'error': {'code': 'NotFound'}}
+                else:
+                    status, payload = handler(body, headers)
+
+                data = json.dumps(payload).encode()
+                self.send_response(status)
+                self.send_header('Content-Type', 'application/json')
+                self.send_header('Content-Length', str(len(data)))
+                self.end_headers()
+                self.wfile.write(data)
+
+            def log_message(self, format, *args):
+                pass
+
+        return Handler
+
+
+@pytest.fixture
+def stub_server():
+    """Поднимает локальный StubServer на свободном порту и гасит его после теста."""
+    server = StubServer().start()
+    yield server
+    server.stop()
@@ -0,0 +1,98 @@
+import asyncio
+import time
+import warnings
+
+import allure
+import pytest
+
+from tests.core.async_client import PooledAPIClient, run_concurrently
+from tests.core.client import APIClient
+
+pytestmark = [pytest.mark.core]
+
+
+def _echo(body, headers):
+    return 200, {'payload': {'echo': body, 'space': headers.get('Current-Space-Id')}}
+
+
+@allure.parent_suite("Core")
+@allure.suite("Async APIClient")
+@allure.title("post_many возвращает ответы в исходном порядке и передаёт заголовки")
+def test_post_many_keeps_order_and_headers(stub_server):
+    stub_server.latency = 0.01
+    stub_server.route('/Echo', _echo)
+    client = PooledAPIClient(base_url=stub_server.url, token='token-1', max_connections=4)
+
+    calls = [
+        {'path': '/Echo', 'json': {'i': i}, 'headers': {'Current-Space-Id': f'space-{i}'}}
+        for i in range(20)
+    ]
+    responses = client.post_many(calls)
+
+    assert [r.json()['payload']['echo']['i'] for r in responses] == list(range(20))
+    assert [r.json()['payload']['space'] for r in responses] == [f'space-{i}' for i in range(20)]
+    assert all(h['Authorization'] == 'Bearer token-1' for _, _, h in stub_server.requests)
+
+
+@allure.parent_suite("Core")
+@allure.suite("Async APIClient")
+@allure.title("Синхронный post() PooledAPIClient совместим с APIClient")
+def test_pooled_client_sync_post(stub_server):
+    stub_server.route('/Echo', _echo)
+    client = PooledAPIClient(base_url=stub_server.url + '/', token='token-2')
+
+    resp = client.post(path='/Echo', json={'a': 1}, headers={'Current-Space-Id': 's'})
+
+    assert resp.status_code == 200
+    assert resp.json()['payload'] == {'echo': {'a': 1}, 'space': 's'}
+    assert isinstance(client, APIClient)
+
+
+@allure.parent_suite("Core")
+@allure.suite("Async APIClient")
+@allure.title("Синхронные хелперы из работающего event loop — понятная ошибка, асинхронный post_many работает")
+def test_sync_helpers_inside_running_loop(stub_server):
+    stub_server.route('/Echo', _echo)
+    client = PooledAPIClient(base_url=stub_server.url, token='t')
+    calls = [{'path': '/Echo', 'json': {'i': i}} for i in range(3)]
+
+    async def _inside_loop():
+        with pytest.raises(RuntimeError, match='работающего event loop'):
+            client.post_many(calls)
+        return await client.aio.post_many(calls)
+
+    with warnings.catch_warnings():
+        warnings.simplefilter('error', RuntimeWarning)
+        responses = asyncio.run(_inside_loop())
+    assert [r.json()['payload']['echo']['i'] for r in responses] == [0, 1, 2]
+    assert run_concurrently() == []
+
+
+@pytest.mark.benchmark
+@allure.parent_suite("Core")
+@allure.suite("Async APIClient")
+@allure.title("Benchmark: последовательные запросы vs конкурентный post_many")
+def test_benchmark_sequential_vs_concurrent(stub_server):
+    stub_server.latency = 0.02
+    stub_server.route('/Echo', _echo)
+    calls = [{'path': '/Echo', 'json': {'i': i}, 'headers': {}} for i in range(100)]
+
+    sequential = APIClient(base_url=stub_server.url, token='t')
+    start = time.perf_counter()
+    for call in calls:
+        sequential.post(**call)
+    sequential_time = time.perf_counter() - start
+
+    pooled = PooledAPIClient(base_url=stub_server.url, token='t', max_connections=8)
+    start = time.perf_counter()
+    pooled.post_many(calls)
+    concurrent_time = time.perf_counter() - start
+
+    report = (
+        f"sequential: {len(calls) / sequential_time:.1f} req/s ({sequential_time:.2f}s)\n"
+        f"concurrent: {len(calls) / concurrent_time:.1f} req/s ({concurrent_time:.2f}s)\n"
+        f"speedup:    x{sequential_time / concurrent_time:.1f}"
+    )
+    print(f"\n{report}")
+    allure.attach(report, name="throughput", attachment_type=allure.attachment_type.TEXT)
+    assert concurrent_time < sequential_time
@@ -0,0 +1,62 @@
+import json
+
+import allure
+import pytest
+
+from tests.core.benchmark import BenchmarkReport, LatencyStats, load_baseline, measure, percentile
+from tests.core.client import APIClient
+
+pytestmark = [pytest.mark.core]
+
+
+def _stats(name, samples):
+    return LatencyStats(name=name, params={}, samples_ms=samples, payload_bytes=100, items=1)
+
+
+@allure.parent_suite("Core")
+@allure.suite("Benchmark")
+@allure.title("Перцентили считаются с интерполяцией, ошибки не попадают в выборку")
+def test_percentiles_and_measure(stub_server):
+    assert percentile([10, 20, 30, 40, 50], 50) == 30
+    assert percentile(list(range(1, 101)), 95) == pytest.approx(95.05)
+    assert percentile([7], 99) == 7
+
+    statuses = iter([200, 200, 500, 200, 200])
+    stub_server.route('/GetTasks', lambda body, headers: (next(statuses), {'payload': {'tasks': [{}, {}]}}))
+    client = APIClient(base_url=stub_server.url)
+    stats = measure(client, {'path': '/GetTasks', 'json': {}}, 'case', runs=4, warmup=1, items_key='tasks')
+
+    assert (len(stats.samples_ms), stats.errors, stats.items) == (3, 1, 2)
+    assert stats.payload_bytes == len(json.dumps({'payload': {'tasks': [{}, {}]}}))
+    assert len(stub_server.calls('/GetTasks')) == 5
+
+
+@allure.parent_suite("Core")
+@allure.suite("Benchmark")
+@allure.title("JSON-отчёт служит baseline; регрессия — рост p50/p95 сверх допуска и абсолютного запаса")
+def test_report_roundtrip_and_regression_gate(tmp_path):
+    baseline = BenchmarkReport('get_tasks', stand='stage')
+    baseline.add(_stats('fast', [1.0] * 10)).add(_stats('mid', [30.0] * 10)).add(_stats('slow', [100.0] * 10))
+    baseline.add(_stats('removed', [5.0]))
+    path = str(tmp_path / 'nested' / 'get_tasks.json')
+    baseline.write(path)
+    stored = load_baseline(path)
+    assert [r['name'] for r in stored['results']] == ['fast', 'mid', 'slow', 'removed']
+    assert load_baseline(str(tmp_path / 'missing.json')) is None
+
+    current = BenchmarkReport('get_tasks', stand='stage')
+    # fast: x1.6 — запас от доли миллисекунды не больше половины baseline, регрессия; mid: +40%, но в пределах
+    # запаса 15 мс; slow: +50% — регрессия; new: нет в baseline
+    current.add(_stats('fast', [1.6] * 10)).add(_stats('mid', [42.0] * 10)).add(_stats('slow', [150.0] * 10))
+    current.add(_stats('new', [999.0]))
+    regressions = current.compare(stored)
+
+    assert [(r.name, r.metric) for r in regressions] == \
+        [('fast', 'p50_ms'), ('fast', 'p95_ms'), ('slow', 'p50_ms'), ('slow', 'p95_ms')]
+    assert str(regressions[2]) == 'slow: p50_ms 100.0 -> 150.0 мс (x1.50)'
+    # на фейке допуск x3: +50% — шум машины, x4 — регрессия
+    stored['stand'] = 'fake'
+    assert current.compare(stored) == []
+    tripled = BenchmarkReport('get_tasks', stand='fake').add(_stats('fast', [4.0] * 10))
+    assert [(r.name, r.metric) for r in tripled.compare(stored)] == [('fast', 'p50_ms'), ('fast', 'p95_ms')]
+    assert current.table().splitlines()[0].split() == ['case', 'p50', 'p95', 'p99', 'bytes', 'items', 'err']
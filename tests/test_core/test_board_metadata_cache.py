@@ -0,0 +1,89 @@
+import allure
+import pytest
+
+from tests.core.cache import TTLCache
+from tests.core.client import APIClient
+from test_backend.task_service import utils
+
+pytestmark = [pytest.mark.core]
+
+BOARD = {'_id': 'board-1', 'typesList': [{'_id': 'type-1'}, {'_id': 'type-2'}], 'groups': [{'_id': 'group-1'}]}
+MEMBERS = [{'_id': f'member-{role}', 'fullName': role} for role in ['owner', 'manager', 'member', 'guest', 'main']]
+MILESTONES = [{'_id': 'ms-1', 'name': 'parent_ms_1'}]
+
+
+@pytest.fixture
+def metadata_stub(stub_server, monkeypatch):
+    monkeypatch.setattr(utils, 'board_metadata_cache', TTLCache(ttl=60))
+    milestones = list(MILESTONES)
+    stub_server.route('/GetBoard', lambda body, headers: (200, {'payload': {'board': BOARD}}))
+    stub_server.route('/GetSpaceMembers', lambda body, headers: (200, {'payload': {'members': MEMBERS}}))
+    stub_server.route('/GetMilestones', lambda body, headers: (200, {'payload': {'milestones': milestones}}))
+    stub_server.milestones = milestones
+    return stub_server
+
+
+def _reads(stub_server):
+    return {path: len(stub_server.calls(path)) for path in ('/GetBoard', '/GetSpaceMembers', '/GetMilestones')}
+
+
+@allure.parent_suite("Core")
+@allure.suite("Board metadata cache")
+@allure.title("Метаданные для N задач читаются один раз на роль, борду и спейс")
+def test_metadata_read_once_for_many_tasks(metadata_stub):
+    client = APIClient(base_url=metadata_stub.url, token='owner')
+
+    for _ in range(30):
+        assert utils.get_random_type_id(client, 'board-1', 'space-1') in ('type-1', 'type-2')
+        assert utils.get_random_group_id(client, 'board-1', 'space-1') == 'group-1'
+        assert utils.get_assignee(client, 'space-1')
+        assert utils.get_named_milestone_id(client, 'space-1', 'board-1', 'parent_ms_1') == 'ms-1'
+
+    assert _reads(metadata_stub) == {'/GetBoard': 1, '/GetSpaceMembers': 1, '/GetMilestones': 1}
+    assert utils.board_metadata_cache.hits == 30 * 4 - 3
+
+
+@allure.parent_suite("Core")
+@allure.suite("Board metadata cache")
+@allure.title("Кэш разделён по ролям и сбрасывается invalidate_board_metadata")
+def test_metadata_keyed_by_role_and_invalidated(metadata_stub):
+    owner = APIClient(base_url=metadata_stub.url, token='owner')
+    guest = APIClient(base_url=metadata_stub.url, token='guest')
+
+    utils.get_random_type_id(owner, 'board-1', 'space-1')
+    utils.get_random_type_id(guest, 'board-1', 'space-1')
+    assert utils.invalidate_board_metadata(space_id='space-1', board_id='board-1') == 2
+    utils.get_random_type_id(owner, 'board-1', 'space-1')
+
+    assert _reads(metadata_stub)['/GetBoard'] == 3
+
+
+@allure.parent_suite("Core")
+@allure.suite("Board metadata cache")
+@allure.title("Новый майлстоун находится по имени: при промахе список перечитывается")
+def test_named_milestone_reloaded_on_miss(metadata_stub):
+    client = APIClient(base_url=metadata_stub.url, token='owner')
+    utils.get_named_milestone_id(client, 'space-1', 'board-1', 'parent_ms_1')
+    metadata_stub.milestones.append({'_id': 'ms-2', 'name': 'subtask_ms_1'})
+
+    assert utils.get_named_milestone_id(client, 'space-1', 'board-1', 'subtask_ms_1') == 'ms-2'
+    assert _reads(metadata_stub)['/GetMilestones'] == 2
+
+
+@allure.parent_suite("Core")
+@allure.suite("Board metadata cache")
+@allure.title("Запись кэша устаревает по TTL")
+def test_ttl_expiry(monkeypatch):
+    clock = [100.0]
+    monkeypatch.setattr('tests.core.cache.time.monotonic', lambda: clock[0])
+    cache = TTLCache(ttl=10)
+    loads = []
+
+    cache.get_or_load('key', lambda: loads.append(1))
+    clock[0] += 5
+    cache.get_or_load('key', lambda: loads.append(1))
+    clock[0] += 6
+    cache.get_or_load('key', lambda: loads.append(1))
+
+    assert len(loads) == 2
+    assert cache.stats() == {'hits': 1, 'misses': 2, 'size': 1}
@@ -0,0 +1,79 @@
+from collections import Counter
+
+import allure
+import pytest
+
+from test_backend.task_service.bulk_tasks import MULTIPLE_EDIT_LIMIT, BulkTaskFactory
+from tests.core.async_client import PooledAPIClient
+from tests.core.client import add_middleware, remove_middleware
+from tests.core.fake_api import FAKE_ENV, FakeVaizAPI
+
+pytestmark = [pytest.mark.core]
+
+BASE_URL = 'http://fake.vaiz.test/v4'
+SPACE_ID, BOARD_ID = FAKE_ENV['MAIN_SPACE_ID'], FAKE_ENV['MAIN_BOARD_ID']
+
+
+@pytest.fixture
+def requests_by_path():
+    """Счётчик запросов по путям; регистрируется раньше фейка, поэтому видит все запросы."""
+    paths = Counter()
+
+    def _count(call, send):
+        paths[call.path] += 1
+        return send(call)
+
+    add_middleware(_count)
+    yield paths
+    remove_middleware(_count)
+
+
+@pytest.fixture
+def fake(requests_by_path):
+    api = FakeVaizAPI(base_url=BASE_URL).seed(board_tasks=0)
+    add_middleware(api)
+    yield api
+    remove_middleware(api)
+
+
+@pytest.fixture
+def owner(fake):
+    return PooledAPIClient(base_url=BASE_URL, token=fake.issue_token(fake.users_by_email[FAKE_ENV['OWNER_EMAIL']]))
+
+
+@allure.parent_suite("Core")
+@allure.suite("Bulk tasks")
+@allure.title("Общие атрибуты выставляются MultipleEditTasks пачками по 20, а не правкой каждой задачи")
+def test_shared_attributes_are_applied_in_chunks(fake, owner, requests_by_path):
+    member_id = fake.users_by_email[FAKE_ENV['MEMBER_EMAIL']]['_id']
+    factory = BulkTaskFactory(owner, SPACE_ID, BOARD_ID)
+
+    task_ids = factory.create(250, priority=3, assignees=[member_id], milestones=[FAKE_ENV['MILESTONE_1_ID']],
+                              completed=True)
+
+    assert len(task_ids) == len(set(task_ids)) == 250
+    assert requests_by_path == {'/CreateTask': 250, '/MultipleEditTasks': 13}
+    tasks = [fake.tasks[task_id] for task_id in task_ids]
+    assert [task['name'] for task in tasks[:2]] == ['Bulk task #1', 'Bulk task #2']
+    assert all(t['priority'] == 3 and t['assignees'] == [member_id] and t['completed'] for t in tasks)
+    assert set(task_ids) <= set(fake.milestones[FAKE_ENV['MILESTONE_1_ID']]['tasks'])
+
+
+@allure.parent_suite("Core")
+@allure.suite("Bulk tasks")
+@allure.title("cleanup удаляет все созданные задачи, включая уже удалённые в тесте")
+def test_cleanup_deletes_everything_created(fake, owner, requests_by_path):
+    factory = BulkTaskFactory(owner, SPACE_ID, BOARD_ID)
+    first, second = factory.create(5), factory.create(MULTIPLE_EDIT_LIMIT + 1)
+    factory.edit(second, priority=1)
+    assert requests_by_path['/MultipleEditTasks'] == 2
+
+    report = factory.cleanup()
+
+    assert sorted(report.deleted) == sorted(first + second)
+    assert not report.leftovers and not factory.created
+    assert all(fake.tasks[task_id]['deletedAt'] for task_id in first + second)
+    with pytest.raises(ValueError, match='name'):
+        factory.create(1, name='x')
+    with pytest.raises(AssertionError, match='не применил изменения к 1 задачам'):
+        factory.edit([first[0]], milestones=['5d00000000000000000000ff'])
@@ -0,0 +1,70 @@
+import time
+from collections import Counter
+
+import allure
+import pytest
+
+from core.waiters import FixedInterval
+from tests.core.client import APIClient
+from tests.core.teardown import BulkTeardown
+from test_backend.data.endpoints.Task.task_endpoints import delete_task_endpoint
+from test_backend.task_service.utils import delete_all_group_tasks
+
+pytestmark = [pytest.mark.core]
+
+
+@pytest.fixture
+def delete_stub(stub_server):
+    """/DeleteTask: 'flaky-*' отвечают 503 на первую попытку, 'gone-*' — 404, 'forbidden-*' — 403."""
+    attempts = Counter()
+
+    def _delete(body, headers):
+        task_id = body['taskId']
+        attempts[task_id] += 1
+        if task_id.startswith('flaky') and attempts[task_id] == 1:
+            return 503, {'error': {'code': 'Unavailable'}}
+        if task_id.startswith('gone'):
+            return 404, {'error': {'code': 'TaskNotFound'}}
+        if task_id.startswith('forbidden'):
+            return 403, {'error': {'code': 'AccessDenied'}}
+        return 200, {'payload': {}}
+
+    stub_server.route('/DeleteTask', _delete)
+    stub_server.attempts = attempts
+    return stub_server
+
+
+@allure.parent_suite("Core")
+@allure.suite("Bulk teardown")
+@allure.title("Повтор только для временных ошибок, отчёт содержит оставшиеся сущности")
+def test_retries_driven_by_status(delete_stub):
+    client = APIClient(base_url=delete_stub.url, token='t')
+    teardown = BulkTeardown(client, retries=2, backoff=FixedInterval(0.01))
+    for task_id in ['ok-1', 'flaky-1', 'gone-1', 'forbidden-1']:
+        teardown.add(delete_task_endpoint(task_id=task_id, space_id='space'), label=task_id)
+
+    report = teardown.run()
+
+    assert sorted(report.deleted) == ['flaky-1', 'ok-1']
+    assert report.gone == ['gone-1']
+    assert [(label, status) for label, status, _ in report.leftovers] == [('forbidden-1', 403)]
+    assert delete_stub.attempts == Counter({'ok-1': 1, 'flaky-1': 2, 'gone-1': 1, 'forbidden-1': 1})
+
+
+@allure.parent_suite("Core")
+@allure.suite("Bulk teardown")
+@allure.title("Очистка группы из 30 задач занимает несколько round-trip, а не 15+ секунд")
+def test_group_cleanup_is_concurrent(delete_stub):
+    delete_stub.latency = 0.05
+    task_ids = [f'task-{i}' for i in range(30)]
+    board = {'taskOrderByGroups': {'group-1': task_ids}}
+    delete_stub.route('/GetBoard', lambda body, headers: (200, {'payload': {'board': board}}))
+    client = APIClient(base_url=delete_stub.url, token='t')
+
+    start = time.perf_counter()
+    report = delete_all_group_tasks(client, 'board-1', 'space', 'group-1')
+    elapsed = time.perf_counter() - start
+
+    assert sorted(report.deleted) == sorted(task_ids)
+    assert not report.leftovers
+    assert elapsed < 30 * 0.05
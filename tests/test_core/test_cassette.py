@@ -0,0 +1,157 @@
+import time
+
+import allure
+import pytest
+import requests
+
+from tests.core.async_client import PooledAPIClient
+from tests.core.cassette import RECORD, REPLAY, Cassette, CassetteMiss, normalize_body
+from tests.core.client import APIClient, PostCall, add_middleware, remove_middleware
+
+pytestmark = [pytest.mark.core]
+
+TOKENS = {'owner-token': 'owner', 'guest-token': 'guest'}
+SPACE_HEADERS = {'Content-Type': 'application/json', 'Current-Space-Id': 'space-1'}
+
+
+@pytest.fixture
+def task_stub(stub_server):
+    """/CreateTask возвращает новый _id на каждый вызов, guest получает 403."""
+    counter = iter(range(1, 10_000))
+
+    def _create(body, headers):
+        if headers.get('Authorization') == 'Bearer guest-token':
+            return 403, {'error': {'code': 'AccessDenied'}}
+        return 200, {'payload': {'task': {'_id': f'task-{next(counter)}', 'name': body['name']}}}
+
+    stub_server.route('/CreateTask', _create)
+    return stub_server
+
+
+@pytest.fixture
+def use_cassette(tmp_path):
+    """Фабрика кассет, подключённых к APIClient; обработчики снимаются после теста."""
+    cassettes = []
+
+    def _use(mode):
+        for cassette in cassettes:
+            remove_middleware(cassette)
+        cassette = Cassette(str(tmp_path / 'api.jsonl'), mode, identify=TOKENS.get)
+        cassettes.append(cassette)
+        add_middleware(cassette)
+        return cassette
+
+    yield _use
+    for cassette in cassettes:
+        remove_middleware(cassette)
+
+
+def _create_task(client, name):
+    return client.post('/CreateTask', json={'board': 'board-1', 'name': name}, headers=SPACE_HEADERS)
+
+
+@allure.parent_suite("Core")
+@allure.suite("HTTP cassette")
+@allure.title("Записанный прогон воспроизводится без сети с маскированием изменчивых полей")
+def test_record_then_replay_offline(task_stub, use_cassette):
+    owner = APIClient(base_url=task_stub.url, token='owner-token')
+    guest = APIClient(base_url=task_stub.url, token='guest-token')
+
+    cassette = use_cassette(RECORD)
+    cassette.scope = 'test_a'
+    recorded = [_create_task(owner, 'Task 12:00:01').json(), _create_task(owner, 'Task 12:00:02').json()]
+    assert _create_task(guest, 'Task 12:00:03').status_code == 403
+    cassette.close()
+    task_stub.stop()
+
+    cassette = use_cassette(REPLAY)
+    cassette.scope = 'test_a'
+    replayed = [_create_task(owner, 'Task 13:30:01').json(), _create_task(owner, 'Task 13:30:02').json()]
+    guest_response = _create_task(guest, 'Task 13:30:03')
+
+    assert replayed == recorded, 'Одинаковые после маскирования запросы должны отдаваться в порядке записи'
+    assert guest_response.status_code == 403, 'Ответ должен сопоставляться с ролью'
+    assert guest_response.json()['error']['code'] == 'AccessDenied'
+    with pytest.raises(CassetteMiss):
+        owner.post('/DeleteTask', json={'taskId': 'task-1'}, headers=SPACE_HEADERS)
+    cassette.close()
+
+
+@allure.parent_suite("Core")
+@allure.suite("HTTP cassette")
+@allure.title("Запись другого теста используется, если у текущего теста своей нет; async-клиент тоже идёт через кассету")
+def test_scope_fallback_and_async_client(task_stub, use_cassette):
+    client = PooledAPIClient(base_url=task_stub.url, token='owner-token')
+
+    cassette = use_cassette(RECORD)
+    cassette.scope = 'test_setup'
+    recorded = client.post_many([
+        {'path': '/CreateTask', 'json': {'board': 'board-1', 'name': f'T{i}'}, 'headers': SPACE_HEADERS}
+        for i in range(3)
+    ])
+    cassette.close()
+    task_stub.stop()
+
+    cassette = use_cassette(REPLAY)
+    cassette.scope = 'test_other'
+    replayed = _create_task(client, 'another name')
+    # Параллельные одинаковые запросы пишутся в порядке завершения — годится любой из них
+    assert replayed.json() in [response.json() for response in recorded]
+    cassette.close()
+
+
+@allure.parent_suite("Core")
+@allure.suite("HTTP cassette")
+@allure.title("Нормализация тела: маскируются volatile-поля и даты, остальное сохраняется")
+def test_normalize_body():
+    body = {
+        'taskId': 'task-1',
+        'name': 'Random 1f3a',
+        'dueEnd': '2026-01-01T00:00:00Z',
+        'filter': [{'createdAt': '2025-01-01', 'value': '2025-05-05T10:00:00.000Z', 'priority': 2}],
+    }
+    assert normalize_body(body) == {
+        'taskId': 'task-1',
+        'name': '<masked>',
+        'dueEnd': '<masked>',
+        'filter': [{'createdAt': '<masked>', 'value': '<masked>', 'priority': 2}],
+    }
+
+
+@allure.parent_suite("Core")
+@allure.suite("HTTP cassette")
+@allure.title("Поиск в кассете на десятки тысяч записей не зависит от её размера")
+def test_lookup_is_constant_time(tmp_path):
+    path = str(tmp_path / 'big.jsonl')
+    session = requests.Session()
+    headers = {'Authorization': 'Bearer owner-token', **SPACE_HEADERS}
+
+    def call(i):
+        return PostCall(session, '/GetTask', 'http://stub/GetTask', {'taskId': f'task-{i}'}, headers)
+
+    def respond(i):
+        response = requests.Response()
+        response.status_code = 200
+        response._content = f'{{"payload": {{"task": {{"_id": "task-{i}"}}}}}}'.encode()
+        return response
+
+    size = 30_000
+    cassette = Cassette(path, RECORD, identify=TOKENS.get)
+    for i in range(size):
+        cassette(call(i), lambda c, i=i: respond(i))
+    cassette.close()
+
+    cassette = Cassette(path, REPLAY, identify=TOKENS.get)
+
+    def lookup_time(ids):
+        start = time.perf_counter()
+        for i in ids:
+            assert cassette(call(i), None).json()['payload']['task']['_id'] == f'task-{i}'
+        return time.perf_counter() - start
+
+    head = lookup_time(range(0, 500))
+    tail = lookup_time(range(size - 500, size))
+    cassette.close()
+
+    assert tail < head * 3 + 0.05, f'Поиск в конце кассеты заметно медленнее: {head:.3f}s vs {tail:.3f}s'
+    assert head + tail < 2, 'Поиск по индексу слишком медленный'
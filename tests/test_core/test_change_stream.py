@@ -0,0 +1,168 @@
+import threading
+import time
+
+import allure
+import pytest
+from pymongo.errors import AutoReconnect, OperationFailure, ServerSelectionTimeoutError
+
+from core.waiters import WAIT_STATS
+from test_backend.data.endpoints.History.history_utils import assert_history_event_exists
+from test_backend.data.endpoints.Task.task_endpoints import edit_task_endpoint
+from tests.core.async_client import PooledAPIClient
+from tests.core.change_stream import ChangeStreamWaiter, set_change_waiter
+from tests.core.client import add_middleware, remove_middleware
+from test_backend.task_service.utils import wait_group_empty
+from tests.core.fake_api import FAKE_ENV, FakeChangeStream, FakeCollection, FakeMongo, FakeVaizAPI
+
+pytestmark = [pytest.mark.core]
+
+BASE_URL = 'http://fake.vaiz.test/v4'
+SPACE_ID, BOARD_ID = FAKE_ENV['MAIN_SPACE_ID'], FAKE_ENV['BOARD_WITH_TASKS']
+WRITE_DELAY = 0.3
+
+
+@pytest.fixture
+def fake():
+    api = FakeVaizAPI(base_url=BASE_URL).seed(board_tasks=3)
+    add_middleware(api)
+    yield api
+    remove_middleware(api)
+    set_change_waiter(ChangeStreamWaiter())
+
+
+@pytest.fixture
+def owner(fake):
+    return PooledAPIClient(base_url=BASE_URL, token=fake.issue_token(fake.users_by_email[FAKE_ENV['OWNER_EMAIL']]))
+
+
+def _rename_later(owner, task_id: str, name: str):
+    timer = threading.Timer(WRITE_DELAY, owner.post, kwargs=edit_task_endpoint(SPACE_ID, task_id, name=name))
+    timer.start()
+    return timer
+
+
+@allure.parent_suite("Core")
+@allure.suite("Change stream waiter")
+@allure.title("Событие истории дожидается по change stream сразу после записи, API опрашивается один раз")
+def test_history_event_resolves_on_write(fake, owner):
+    waiter = ChangeStreamWaiter(fake.mongo())
+    set_change_waiter(waiter)
+    task_id = fake.tasks_by_board[BOARD_ID][0]
+    requests_before = fake.requests
+
+    start = time.monotonic()
+    _rename_later(owner, task_id, 'renamed').join()
+    event = assert_history_event_exists(owner, SPACE_ID, 'Task', task_id, 'TASK_RENAMED', {'name': 'renamed'}, timeout=5)
+    elapsed = time.monotonic() - start
+
+    assert event['data'] == {'name': 'renamed'} and waiter.streams == 1
+    assert WRITE_DELAY <= elapsed < WRITE_DELAY + 0.25, elapsed
+    # EditTask и один GetHistory: ожидание не опрашивало API
+    assert fake.requests - requests_before == 2
+
+
+@allure.parent_suite("Core")
+@allure.suite("Change stream waiter")
+@allure.title("Без change stream — поллинг базы, без базы — поллинг API; таймаут попадает в статистику ожиданий")
+def test_fallbacks(fake, owner, monkeypatch):
+    task_id = fake.tasks_by_board[BOARD_ID][1]
+    renamed = {'_id': task_id}
+
+    waiter = ChangeStreamWaiter(fake.mongo())
+    with pytest.raises(TimeoutError, match='tasks'):
+        waiter.wait_for('tasks', renamed, predicate=lambda task: task['name'] == 'never', timeout=0.3, call_site='t')
+    assert WAIT_STATS['t']['timeouts'] == 1
+
+    def _watch_fails(error):
+        def watch(self, *args, **kwargs):
+            raise error
+        monkeypatch.setattr(FakeCollection, 'watch', watch)
+
+    _watch_fails(OperationFailure('The $changeStream stage is only supported on replica sets', code=40573))
+    _rename_later(owner, task_id, 'polled')
+    task = waiter.wait_for('tasks', renamed, predicate=lambda task: task['name'] == 'polled', timeout=5)
+    assert task['name'] == 'polled' and waiter.fallbacks == 1
+
+    _watch_fails(ServerSelectionTimeoutError('no servers'))
+    calls = []
+    assert waiter.wait_for('tasks', renamed, timeout=5, fallback=lambda: calls.append(1) or len(calls) == 3)
+    assert not waiter.available and len(calls) == 3
+
+    with pytest.raises(AssertionError, match='нужен fallback'):
+        ChangeStreamWaiter().wait_for('tasks', renamed)
+
+
+@allure.parent_suite("Core")
+@allure.suite("Change stream waiter")
+@allure.title("Недоступная MongoDB: событие истории дожидается поллингом API, без ошибки про fallback")
+def test_history_event_with_unreachable_db(fake, owner, monkeypatch):
+    def watch(self, *args, **kwargs):
+        raise ServerSelectionTimeoutError('no servers')
+    monkeypatch.setattr(FakeCollection, 'watch', watch)
+    waiter = ChangeStreamWaiter(fake.mongo())
+    set_change_waiter(waiter)
+    task_id = fake.tasks_by_board[BOARD_ID][2]
+
+    _rename_later(owner, task_id, 'via api')
+    event = assert_history_event_exists(owner, SPACE_ID, 'Task', task_id, 'TASK_RENAMED', {'name': 'via api'}, timeout=5)
+
+    assert event['data'] == {'name': 'via api'}
+    assert not waiter.available and waiter.streams == 0
+
+
+@allure.parent_suite("Core")
+@allure.suite("Change stream waiter")
+@allure.title("База не дала сигнал: change stream занимает только часть таймаута, остаток — поллинг API")
+def test_history_miss_in_db_leaves_time_for_api(fake, owner, monkeypatch):
+    # События в базе лежат не там, где их ищет хелпер (другое имя коллекции/поля): сигнала не будет
+    fake.unrelated_events = {}
+    monkeypatch.setattr(FakeMongo, 'COLLECTIONS', {**FakeMongo.COLLECTIONS, 'histories': 'unrelated_events'})
+    set_change_waiter(ChangeStreamWaiter(fake.mongo()))
+    task_id = fake.tasks_by_board[BOARD_ID][0]
+
+    start = time.monotonic()
+    threading.Timer(2.0, owner.post, kwargs=edit_task_endpoint(SPACE_ID, task_id, name='late')).start()
+    event = assert_history_event_exists(owner, SPACE_ID, 'Task', task_id, 'TASK_RENAMED', {'name': 'late'}, timeout=3)
+
+    assert event['data'] == {'name': 'late'} and time.monotonic() - start < 3
+
+
+@allure.parent_suite("Core")
+@allure.suite("Change stream waiter")
+@allure.title("Обрыв соединения посреди change stream: ожидание продолжается через API")
+def test_connection_lost_mid_stream(fake, owner, monkeypatch):
+    def try_next(self):
+        raise AutoReconnect('connection reset')
+    monkeypatch.setattr(FakeChangeStream, 'try_next', try_next)
+    waiter = ChangeStreamWaiter(fake.mongo())
+    set_change_waiter(waiter)
+    task_id = fake.tasks_by_board[BOARD_ID][1]
+
+    _rename_later(owner, task_id, 'after drop')
+    event = assert_history_event_exists(owner, SPACE_ID, 'Task', task_id, 'TASK_RENAMED', {'name': 'after drop'},
+                                        timeout=5)
+    assert event['data'] == {'name': 'after drop'} and not waiter.available
+
+    waiter = ChangeStreamWaiter(fake.mongo())
+    assert waiter.wait_for('tasks', {'_id': task_id}, predicate=lambda task: False, timeout=5,
+                           fallback=lambda: 'api') == 'api'
+    assert not waiter.available and waiter.streams == 1
+
+
+@allure.parent_suite("Core")
+@allure.suite("Change stream waiter")
+@allure.title("wait_group_empty не верит одной базе: пустота группы подтверждается через GetBoard")
+def test_wait_group_empty_confirms_via_api(fake, owner, monkeypatch):
+    board = fake.boards[BOARD_ID]
+    group_id, task_ids = next((group, ids) for group, ids in board['taskOrderByGroups'].items() if ids)
+    # В базе борда уже без задач в группе, а API их ещё отдаёт
+    fake.stale_boards = {BOARD_ID: {**board, 'taskOrderByGroups': {group_id: []}}}
+    monkeypatch.setattr(FakeMongo, 'COLLECTIONS', {**FakeMongo.COLLECTIONS, 'boards': 'stale_boards'})
+    set_change_waiter(ChangeStreamWaiter(fake.mongo()))
+
+    with pytest.raises(AssertionError, match='осталась не пустой'):
+        wait_group_empty(owner, BOARD_ID, SPACE_ID, group_id, timeout=1, poll_interval=0.1)
+
+    board['taskOrderByGroups'][group_id] = []
+    wait_group_empty(owner, BOARD_ID, SPACE_ID, group_id, timeout=1, poll_interval=0.1)
+    board['taskOrderByGroups'][group_id] = task_ids
@@ -0,0 +1,56 @@
+import allure
+import pytest
+
+from test_backend.document.document_tree import DocumentTree, DocumentTreeBuilder, assert_siblings_match
+from tests.core.async_client import PooledAPIClient
+from tests.core.client import add_middleware, remove_middleware
+from tests.core.fake_api import FAKE_ENV, FakeVaizAPI
+
+pytestmark = [pytest.mark.core]
+
+BASE_URL = 'http://fake.vaiz.test/v4'
+SPACE_ID, PROJECT_ID = FAKE_ENV['MAIN_SPACE_ID'], FAKE_ENV['MAIN_PROJECT_ID']
+
+
+@pytest.fixture
+def owner():
+    api = FakeVaizAPI(base_url=BASE_URL).seed(board_tasks=0)
+    add_middleware(api)
+    yield PooledAPIClient(base_url=BASE_URL, token=api.issue_token(api.users_by_email[FAKE_ENV['OWNER_EMAIL']]))
+    remove_middleware(api)
+
+
+@allure.parent_suite("Core")
+@allure.suite("Document tree")
+@allure.title("Эталон дерева: соседи, родители и nested-set нумерация за один обход")
+def test_oracle_on_small_tree():
+    tree = DocumentTree('r', {'r': ['a', 'b'], 'a': ['a1', 'a2', 'a3']})
+    assert tree.order == ['r', 'a', 'a1', 'a2', 'a3', 'b']
+    assert [(tree.lft[n], tree.rgt(n)) for n in tree.order] == [(1, 12), (2, 9), (3, 4), (5, 6), (7, 8), (10, 11)]
+    assert (tree.prev_sibling['a2'], tree.next_sibling['a2'], tree.next_sibling['a3']) == ('a1', 'a3', None)
+    assert tree.parents('a3') == ['r', 'a'] and tree.subtree('a') == ['a', 'a1', 'a2', 'a3']
+
+    node = {'document': {'_id': 'a1'}, 'lft': 3, 'rgt': 4}
+    good = {'prevSibling': None, 'nextSibling': {'_id': 'a2'}, 'parents': [{'_id': 'r'}, {'_id': 'a'}], 'tree': [node]}
+    assert tree.mismatches('a1', good) == []
+    bad = {**good, 'nextSibling': {'_id': 'a3'}, 'parents': [{'_id': 'a'}]}
+    assert len(tree.mismatches('a1', bad)) == 2
+
+
+@allure.parent_suite("Core")
+@allure.suite("Document tree")
+@allure.title("Дерево глубины 3 строится волнами параллельных CreateDocument и совпадает с ответами GetDocumentSiblings")
+def test_builder_matches_api(owner):
+    builder = DocumentTreeBuilder(owner, 'Project', PROJECT_ID, SPACE_ID)
+    tree = builder.build(depth=3, fan_out=(3, 2, 4))
+    assert len(tree) == 1 + 3 + 6 + 24
+    assert_siblings_match(owner, SPACE_ID, tree)
+
+    # Эталон ловит перестановку соседей
+    first, second = tree.children[tree.root_id][:2]
+    swapped = DocumentTree(tree.root_id, {**tree.children, tree.root_id: [second, first, *tree.children[tree.root_id][2:]]})
+    with pytest.raises(AssertionError, match='Расхождений с эталоном дерева'):
+        assert_siblings_match(owner, SPACE_ID, swapped, [first, second])
+
+    report = builder.cleanup()
+    assert len(report.deleted) == 1 and not report.leftovers
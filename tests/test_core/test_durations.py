@@ -0,0 +1,98 @@
+import json
+import time
+from types import SimpleNamespace
+
+import allure
+import pytest
+
+from tests.core.durations import STALE_RUNS, DurationsPlugin, DurationStore, balance_shards, strip_group
+
+pytestmark = [pytest.mark.core]
+
+
+class _Item:
+    """Минимальный pytest.Item: nodeid и маркер xdist_group."""
+
+    def __init__(self, nodeid, group=None):
+        self.nodeid = nodeid
+        self._group = pytest.mark.xdist_group(group).mark if group else None
+
+    def get_closest_marker(self, name):
+        return self._group if name == 'xdist_group' else None
+
+    def __repr__(self):
+        return self.nodeid
+
+
+@allure.parent_suite("Core")
+@allure.suite("Durations")
+@allure.title("История длительностей: скользящее среднее, один прогон на все воркеры, удаление устаревших тестов")
+def test_store_merge_and_prune(tmp_path):
+    path = str(tmp_path / 'durations.json')
+    store = DurationStore()
+    store.merge({'a.py::test_x': {'setup': 1.0, 'call': 2.0, 'teardown': 0.0}}, {'main_space': (0.5, None)}, 'run1')
+    # Второй воркер того же прогона
+    store.merge({'a.py::test_y@mutates:main_board': {'call': 1.0}}, {'main_space': (0.3, 0.1)}, 'run1')
+    store.merge({'a.py::test_x': {'setup': 0.0, 'call': 2.0, 'teardown': 0.0}}, {}, 'run2')
+    store.write(path)
+
+    loaded = DurationStore.load(path)
+    assert loaded.runs == 2
+    assert loaded.expected('a.py::test_x') == pytest.approx(0.7 + 2.0)
+    assert loaded.expected('b.py::test_z') is None
+    assert loaded.fixtures['main_space'] == [2, 1, 0.44, 0.1]
+    assert strip_group('a.py::test_y@mutates:main_board') == 'a.py::test_y'
+    assert strip_group('a.py::test[user@mail]') == 'a.py::test[user@mail]'
+
+    for run in range(STALE_RUNS):
+        loaded.merge({'a.py::test_x': {'call': 2.0}}, {}, f'later{run}')
+    assert set(loaded.tests['a.py']) == {'test_x'}
+    assert 'main_space' not in loaded.fixtures
+
+
+@allure.parent_suite("Core")
+@allure.suite("Durations")
+@allure.title("Шарды: баланс по истории, группы xdist целиком в одном шарде, долгие тесты первыми")
+def test_sharding_by_history(tmp_path):
+    assert balance_shards({'a': 5, 'b': 4, 'c': 3, 'd': 3, 'e': 2, 'f': 1}, 2) == [(9, ['a', 'd', 'f']),
+                                                                                 (9, ['b', 'c', 'e'])]
+    history = {'t.py::slow': 10.0, 't.py::g1': 3.0, 't.py::g2': 3.0, 't.py::mid': 4.0, 't.py::fast': 1.0}
+    store = DurationStore()
+    store.merge({nodeid: {'call': seconds} for nodeid, seconds in history.items()}, {}, 'run')
+    path = str(tmp_path / 'durations.json')
+    store.write(path)
+
+    def shard(shard_id):
+        items = [_Item('t.py::fast'), _Item('t.py::g1', 'mutates:main_board'), _Item('t.py::slow'),
+                 _Item('t.py::new'), _Item('t.py::g2', 'mutates:main_board'), _Item('t.py::mid')]
+        deselected = []
+        config = SimpleNamespace(hook=SimpleNamespace(pytest_deselected=lambda items: deselected.extend(items)))
+        plugin = DurationsPlugin(path, shard_id, 2, slowest_first=True)
+        plugin.pytest_collection_modifyitems(config, items)
+        return [item.nodeid for item in items], len(deselected)
+
+    # Без истории у t.py::new — медиана известных (3 с): шарды 10+3 и 6+4+1
+    assert shard(0) == (['t.py::slow', 't.py::new'], 4)
+    assert shard(1) == (['t.py::mid', 't.py::g1', 't.py::g2', 't.py::fast'], 2)
+
+
+@allure.parent_suite("Core")
+@allure.suite("Durations")
+@allure.title("Файл истории на 5000 тестов компактный и читается быстро")
+def test_store_is_compact(tmp_path):
+    path = str(tmp_path / 'durations.json')
+    store = DurationStore()
+    tests = {f'tests/test_backend/suite_{i // 50}/test_file_{i // 10}.py::test_case_{i}[param-{i}]':
+             {'setup': 0.123456, 'call': 1.234567, 'teardown': 0.012345} for i in range(5000)}
+    for run in range(3):
+        store.merge(tests, {f'fixture_{i}': (0.5, 0.1) for i in range(200)}, f'run{run}')
+    store.write(path)
+
+    size = (tmp_path / 'durations.json').stat().st_size
+    raw = sum(len(json.dumps(phases)) + len(nodeid) for nodeid, phases in tests.items())
+    start = time.perf_counter()
+    loaded = DurationStore.load(path)
+    elapsed = time.perf_counter() - start
+    assert loaded.expected(next(iter(tests))) == pytest.approx(1.3705, abs=1e-3)
+    assert size < raw * 0.6, f"{size} байт против {raw} в несжатом виде"
+    assert elapsed < 0.5, f"Загрузка истории: {elapsed:.3f} с"
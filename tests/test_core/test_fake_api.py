@@ -0,0 +1,168 @@
+import time
+
+import allure
+import pytest
+import requests
+
+from tests.core.client import APIClient, add_middleware, remove_middleware
+from tests.core.fake_api import (FAKE_ENV, FAKE_PASSWORD, SEED_BOARD_CUSTOM_FIELDS, SEED_CUSTOM_FIELDS_TASK_ID,
+                                 FakeVaizAPI)
+from tests.core.fake_stand import FAKE_UNSUPPORTED, TIMESTAMP_EMAILS, fake_unsupported_reason
+
+pytestmark = [pytest.mark.core]
+
+BASE_URL = 'http://fake.vaiz.test/v4'
+SPACE_HEADERS = {'Content-Type': 'application/json', 'Current-Space-Id': FAKE_ENV['MAIN_SPACE_ID']}
+
+
+@pytest.fixture
+def fake():
+    """Фейк с сидовыми данными (1000 задач на BOARD_WITH_TASKS), подключённый к APIClient."""
+    api = FakeVaizAPI(base_url=BASE_URL).seed(board_tasks=1000)
+    add_middleware(api)
+    yield api
+    remove_middleware(api)
+    api.stop()
+
+
+def _client(fake, role):
+    user = fake.users_by_email[FAKE_ENV[{'main': 'MAIN_CLIENT', 'guest': 'GUEST_EMAIL'}[role]]]
+    return APIClient(base_url=BASE_URL, token=fake.issue_token(user))
+
+
+def _payload(response, status=200):
+    assert response.status_code == status, response.text
+    return response.json()['payload']
+
+
+@allure.parent_suite("Core")
+@allure.suite("Fake API")
+@allure.title("Спейс -> проект -> борда -> задача: правки пишутся в историю, гость не может создавать задачи")
+def test_entity_flow_and_history(fake):
+    main = _client(fake, 'main')
+    project = _payload(main.post('/CreateProject', json={'name': 'P', 'slug': 'FAKE', 'spaceId': SPACE_HEADERS[
+        'Current-Space-Id']}, headers=SPACE_HEADERS))['project']
+    board = _payload(main.post('/CreateBoard', json={'name': 'B', 'project': project['_id']},
+                               headers=SPACE_HEADERS))['board']
+    task = _payload(main.post('/CreateTask', json={'board': board['_id'], 'name': 'T'}, headers=SPACE_HEADERS))['task']
+    assert task['hrid'] == 'FAKE-1'
+
+    main.post('/EditTask', json={'taskId': task['_id'], 'priority': 3}, headers=SPACE_HEADERS)
+    main.post('/EditTask', json={'taskId': task['_id'], 'completed': True}, headers=SPACE_HEADERS)
+    histories = _payload(main.post('/GetHistory', json={'kind': 'Task', 'kindId': task['_id'], 'limit': 10},
+                                   headers=SPACE_HEADERS))['histories']
+    assert [event['key'] for event in histories] == ['TASK_COMPLETED', 'TASK_PRIORITY_CHANGED', 'TASK_CREATED']
+    assert histories[1]['data'] == {'taskPriority': 3}
+
+    guest = _client(fake, 'guest')
+    response = guest.post('/CreateTask', json={'board': board['_id'], 'name': 'T'}, headers=SPACE_HEADERS)
+    assert response.status_code == 403
+    assert response.json()['error']['code'] == 'AccessDenied'
+    assert _payload(guest.post('/GetTask', json={'slug': 'FAKE-1'}, headers=SPACE_HEADERS))['task']['completed']
+
+
+@allure.parent_suite("Core")
+@allure.suite("Fake API")
+@allure.title("GetDocumentSiblings: parents от корня, соседи и поддерево с lft/rgt")
+def test_document_siblings(fake):
+    main = _client(fake, 'main')
+    container = {'kind': 'Space', 'kindId': SPACE_HEADERS['Current-Space-Id']}
+
+    def create(**fields):
+        return _payload(main.post('/CreateDocument', json={**container, **fields}, headers=SPACE_HEADERS))['document']
+
+    root = create(title='root')
+    children = [create(title=f'child {i}', parentDocumentId=root['_id']) for i in range(3)]
+    grandchild = create(title='grandchild', parentDocumentId=children[1]['_id'])
+
+    payload = _payload(main.post('/GetDocumentSiblings', json={'documentId': children[1]['_id']}, headers=SPACE_HEADERS))
+    assert [doc['_id'] for doc in payload['parents']] == [root['_id']]
+    assert payload['prevSibling']['_id'] == children[0]['_id']
+    assert payload['nextSibling']['_id'] == children[2]['_id']
+    node = payload['tree'][0]
+    assert (node['id'], node['lft'], node['rgt']) == (children[1]['_id'], 1, 4)
+    assert node['children'][0]['document']['_id'] == grandchild['_id']
+
+    payload = _payload(main.post('/GetDocumentSiblings', json={'documentId': grandchild['_id']}, headers=SPACE_HEADERS))
+    assert [doc['_id'] for doc in payload['parents']] == [root['_id'], children[1]['_id']]
+    assert 'prevSibling' not in payload and 'nextSibling' not in payload
+
+
+@allure.parent_suite("Core")
+@allure.suite("Fake API")
+@allure.title("Логин по HTTP и постраничное чтение сидовой борды без сети")
+def test_login_over_http_and_paging(fake):
+    url = fake.serve()
+    response = requests.post(f'{url}/Login', json={'email': FAKE_ENV['MAIN_CLIENT'], 'password': FAKE_PASSWORD})
+    assert response.status_code == 202
+    assert requests.post(f'{url}/Login', json={'email': FAKE_ENV['MAIN_CLIENT'], 'password': '-'}).status_code == 400
+
+    main = APIClient(base_url=BASE_URL, token=response.json()['payload']['token'])
+    board = {'board': FAKE_ENV['BOARD_WITH_TASKS'], 'withArchived': True}
+    start = time.perf_counter()
+    seen = []
+    for skip in range(0, 1000, 100):
+        seen += _payload(main.post('/GetTasks', json={**board, 'skip': skip, 'limit': 100},
+                                   headers=SPACE_HEADERS))['tasks']
+    elapsed = time.perf_counter() - start
+
+    assert len({task['_id'] for task in seen}) == 1000
+    assert elapsed < 1, f'Чтение 10 страниц фейка заняло {elapsed:.2f}s'
+    unarchived = _payload(main.post('/GetTasks', json={'board': FAKE_ENV['BOARD_WITH_TASKS'], 'limit': 1000},
+                                    headers=SPACE_HEADERS))['tasks']
+    assert len(unarchived) == 1000 - len(range(0, 1000, 7))
+
+
+@allure.parent_suite("Core")
+@allure.suite("Fake API")
+@allure.title("Структуру спейса меняют только Owner/Manager; slug в верхнем регистре, у проекта есть цвет")
+def test_structure_changes_need_manager(fake):
+    main = _client(fake, 'main')
+    member = APIClient(base_url=BASE_URL, token=fake.issue_token(fake.users_by_email[FAKE_ENV['MEMBER_EMAIL']]))
+    form = {'name': 'P', 'slug': 'lower', 'spaceId': SPACE_HEADERS['Current-Space-Id']}
+
+    assert member.post('/CreateProject', json=form, headers=SPACE_HEADERS).status_code == 403
+    project = _payload(main.post('/CreateProject', json=form, headers=SPACE_HEADERS))['project']
+    assert (project['slug'], project['color']) == ('LOWER', 'blue')
+    assert main.post('/CreateProject', json={**form, 'slug': 'Lower'}, headers=SPACE_HEADERS).status_code == 400
+
+    board = {'name': 'B', 'project': project['_id']}
+    assert member.post('/CreateBoard', json=board, headers=SPACE_HEADERS).status_code == 403
+    assert main.post('/CreateBoard', json={**board, 'groups': None}, headers=SPACE_HEADERS).status_code == 400
+    board_id = _payload(main.post('/CreateBoard', json=board, headers=SPACE_HEADERS))['board']['_id']
+    field = {'boardId': board_id, 'name': 'Link', 'type': 'Url'}
+    assert member.post('/CreateBoardCustomField', json=field, headers=SPACE_HEADERS).status_code == 403
+    assert _payload(main.post('/CreateBoardCustomField', json=field,
+                              headers=SPACE_HEADERS))['customField']['type'] == 'Url'
+
+
+@allure.parent_suite("Core")
+@allure.suite("Fake API")
+@allure.title("Список неподдержанных фейком тестов: совпадение по файлу, функции и параметру")
+def test_fake_unsupported_reason():
+    registration = 'tests/test_backend/authServis/register/test_positive_registration.py::test_register_user_success'
+    assert fake_unsupported_reason(f'{registration}[uppercase]') == TIMESTAMP_EMAILS
+    assert fake_unsupported_reason(f'{registration}[lowercase]') is None
+    y_document = 'tests/test_backend/document/test_get_y_document.py'
+    assert fake_unsupported_reason(f'{y_document}::test_get_ydocument_success[space]')
+    assert fake_unsupported_reason(f'{y_document}_extra.py::test_x') is None
+    assert all(reason and keys for reason, keys in FAKE_UNSUPPORTED.items())
+
+
+@allure.parent_suite("Core")
+@allure.suite("Fake API")
+@allure.title("EditTaskCustomField: значение поля сидовой задачи стенда, ошибка формы и запрет гостю")
+def test_edit_task_custom_field(fake):
+    main = _client(fake, 'main')
+    url_field = next(field['_id'] for field in SEED_BOARD_CUSTOM_FIELDS if field['type'] == 'Url')
+    form = {'taskId': SEED_CUSTOM_FIELDS_TASK_ID, 'customFieldId': url_field}
+
+    task = _payload(main.post('/EditTaskCustomField', json={**form, 'value': 'https://vaiz.com'},
+                              headers=SPACE_HEADERS))['task']
+    assert {'id': url_field, 'value': 'https://vaiz.com'} in task['customFields']
+
+    error = main.post('/EditTaskCustomField', json={**form, 'value': 42}, headers=SPACE_HEADERS).json()['error']
+    assert error['code'] == 'InvalidForm' and error['fields'][0]['meta']['message'] == 'Expected string value'
+
+    guest = _client(fake, 'guest').post('/EditTaskCustomField', json={**form, 'value': ''}, headers=SPACE_HEADERS)
+    assert (guest.status_code, guest.json()['error']['meta']) == (403, {'kind': 'Board'})
@@ -0,0 +1,181 @@
+import threading
+from collections import OrderedDict
+from datetime import datetime, timedelta, timezone
+
+import allure
+import pytest
+
+from tests.core.client import APIClient
+from tests.test_backend.data.endpoints.History import history_utils
+from tests.test_backend.data.endpoints.History.history_utils import (
+    HistoryIndex,
+    assert_history_event_exists,
+    assert_history_events_exist,
+    iter_history_events,
+)
+
+pytestmark = [pytest.mark.core]
+
+TASK_ID = 'task-1'
+BASE_TIME = datetime(2025, 1, 1, tzinfo=timezone.utc)
+
+
+class FakeHistory:
+    """Фейковый /GetHistory: новые события сверху, dateRangeStart включительно, lastLoadedDate (ms) — строго раньше."""
+
+    def __init__(self):
+        self.events = []
+        self._lock = threading.Lock()
+
+    def add(self, key: str, data: dict = None):
+        with self._lock:
+            n = len(self.events)
+            self.events.append({
+                '_id': f'h{n}',
+                'creatorId': 'member-1',
+                'createdAt': (BASE_TIME + timedelta(seconds=n)).isoformat().replace('+00:00', 'Z'),
+                'key': key,
+                'type': 1,
+                'data': data or {},
+                'taskId': TASK_ID,
+            })
+
+    def handle(self, body, headers):
+        with self._lock:
+            events = [e for e in self.events if body.get('kindId') == TASK_ID]
+        if 'dateRangeStart' in body:
+            events = [e for e in events if e['createdAt'] >= body['dateRangeStart']]
+        if 'lastLoadedDate' in body:
+            events = [e for e in events
+                      if datetime.fromisoformat(e['createdAt']).timestamp() * 1000 < body['lastLoadedDate']]
+        events = sorted(events, key=lambda e: e['createdAt'], reverse=True)[:body.get('limit', 50)]
+        return 200, {'payload': {'histories': events}}
+
+
+@pytest.fixture
+def fake_history(stub_server, monkeypatch):
+    monkeypatch.setattr(history_utils, '_history_indexes', OrderedDict())
+    history = FakeHistory()
+    stub_server.route('/GetHistory', history.handle)
+    return history
+
+
+@pytest.fixture
+def client(stub_server):
+    return APIClient(base_url=stub_server.url, token='token')
+
+
+@allure.parent_suite("Core")
+@allure.suite("History polling")
+@allure.title("После первого опроса история запрашивается только начиная с последнего события")
+def test_incremental_polling_uses_cursor(stub_server, fake_history, client):
+    for i in range(30):
+        fake_history.add('TASK_UPDATED', {'i': i})
+    threading.Timer(0.3, fake_history.add, args=('TASK_COMPLETED',)).start()
+
+    event = assert_history_event_exists(client, 'space', 'Task', TASK_ID, 'TASK_COMPLETED', timeout=5)
+
+    requests = stub_server.calls('/GetHistory')
+    assert event['key'] == 'TASK_COMPLETED'
+    assert 'dateRangeStart' not in requests[0]
+    assert all(r['dateRangeStart'] == fake_history.events[29]['createdAt'] for r in requests[1:-1])
+    assert len(requests) > 2
+
+
+@allure.parent_suite("Core")
+@allure.suite("History polling")
+@allure.title("Повторное ожидание по той же сущности находит событие в индексе без запроса")
+def test_index_is_shared_between_waits(stub_server, fake_history, client):
+    fake_history.add('TASK_CREATED')
+    fake_history.add('TASK_UPDATED', {'name': 'new'})
+
+    assert_history_event_exists(client, 'space', 'Task', TASK_ID, 'TASK_CREATED')
+    assert_history_event_exists(client, 'space', 'Task', TASK_ID, 'TASK_UPDATED', expected_data={'name': 'new'})
+
+    assert len(stub_server.calls('/GetHistory')) == 1
+
+
+@allure.parent_suite("Core")
+@allure.suite("History polling")
+@allure.title("Если между опросами пришло больше страницы событий, старые догружаются через lastLoadedDate")
+def test_overflow_between_polls_is_paged(stub_server, fake_history, client):
+    fake_history.add('TASK_CREATED')
+    index = HistoryIndex(client, 'space', 'Task', TASK_ID, page_limit=10)
+    index.poll()
+    fake_history.add('TASK_MOVED')
+    for i in range(25):
+        fake_history.add('TASK_UPDATED', {'i': i})
+
+    index.poll()
+
+    assert index.find('TASK_MOVED') is not None
+    assert len(index.events_by_key['TASK_UPDATED']) == 25
+    assert any('lastLoadedDate' in r for r in stub_server.calls('/GetHistory'))
+
+
+@allure.parent_suite("Core")
+@allure.suite("History polling")
+@allure.title("Из одинаковых событий находится самое свежее; число индексов истории ограничено")
+def test_newest_event_wins_and_cache_is_bounded(fake_history, client, monkeypatch):
+    fake_history.add('TASK_UPDATED', {'name': 'same'})
+    index = history_utils.get_history_index(client, 'space', 'Task', TASK_ID)
+    index.poll()
+    fake_history.add('TASK_UPDATED', {'name': 'same'})
+    fake_history.add('TASK_UPDATED', {'name': 'same'})
+    index.poll()
+
+    assert [e['_id'] for e in index.events_by_key['TASK_UPDATED']] == ['h2', 'h1', 'h0']
+    assert index.find('TASK_UPDATED', {'name': 'same'})['_id'] == 'h2'
+
+    monkeypatch.setattr(history_utils, 'HISTORY_INDEX_CACHE_SIZE', 2)
+    history_utils.get_history_index(client, 'space', 'Task', 'other-1')
+    assert history_utils.get_history_index(client, 'space', 'Task', TASK_ID) is index
+    history_utils.get_history_index(client, 'space', 'Task', 'other-2')
+    assert [key[3] for key in history_utils._history_indexes] == [TASK_ID, 'other-2']
+
+
+@allure.parent_suite("Core")
+@allure.suite("History polling")
+@allure.title("Если событие не появилось, ошибка перечисляет ключи найденных событий")
+def test_missing_event_reports_known_keys(fake_history, client):
+    fake_history.add('TASK_CREATED')
+
+    with pytest.raises(AssertionError, match='TASK_CREATED'):
+        assert_history_event_exists(client, 'space', 'Task', TASK_ID, 'TASK_DELETED', timeout=0.3)
+
+
+@allure.parent_suite("Core")
+@allure.suite("History polling")
+@allure.title("Несколько событий ожидаются в одном цикле поллинга и отдаются по мере появления")
+def test_multi_event_waiter_single_loop(stub_server, fake_history, client):
+    fake_history.add('TASK_CREATED')
+    threading.Timer(0.2, fake_history.add, args=('TASK_DETACHED_TO_PARENT', {'_id': 'parent'})).start()
+    threading.Timer(0.4, fake_history.add, args=('TASK_ATTACHED_TO_MILESTONE', {'_id': 'ms'})).start()
+
+    found = list(iter_history_events(
+        client, 'space', 'Task', TASK_ID,
+        [('TASK_ATTACHED_TO_MILESTONE', {'_id': 'ms'}), ('TASK_DETACHED_TO_PARENT', {'_id': 'parent'}), 'TASK_CREATED'],
+        timeout=5,
+    ))
+
+    # События отдаются по мере появления; пришедшие в одном опросе — в порядке спецификаций
+    keys = [key for key, _, _ in found]
+    assert keys[0] == 'TASK_CREATED'
+    assert sorted(keys[1:]) == ['TASK_ATTACHED_TO_MILESTONE', 'TASK_DETACHED_TO_PARENT']
+    # Один цикл: запросов не больше, чем нужно для ожидания самого позднего события
+    assert len(stub_server.calls('/GetHistory')) <= 8
+
+
+@allure.parent_suite("Core")
+@allure.suite("History polling")
+@allure.title("assert_history_events_exist возвращает события в порядке спецификаций и перечисляет недостающие")
+def test_multi_event_waiter_reports_missing(fake_history, client):
+    fake_history.add('TASK_CREATED')
+    fake_history.add('TASK_COMPLETED')
+
+    events = assert_history_events_exist(client, 'space', 'Task', TASK_ID, ['TASK_COMPLETED', 'TASK_CREATED'])
+    assert [e['key'] for e in events] == ['TASK_COMPLETED', 'TASK_CREATED']
+
+    with pytest.raises(AssertionError, match='TASK_DELETED с данными None') as error:
+        assert_history_events_exist(client, 'space', 'Task', TASK_ID, ['TASK_CREATED', 'TASK_DELETED'], timeout=0.3)
+    assert 'TASK_CREATED с данными' not in str(error.value)
@@ -0,0 +1,90 @@
+import hashlib
+
+import allure
+import pytest
+import requests
+
+from test_backend.data.endpoints.file.upload_avatar_endpoint import (
+    get_uploaded_avatar_url, upload_avatar_stream_endpoint,
+)
+from test_backend.file.avatar_benchmark import generate_avatar, measure_uploads
+from tests.core.async_client import PooledAPIClient
+from tests.core.benchmark import peak_rss_kb, reset_peak_rss, rss_kb
+from tests.core.client import add_middleware, remove_middleware
+from tests.core.fake_api import FAKE_ENV, FakeVaizAPI
+from tests.core.multipart import MultipartStream, parse_multipart
+
+pytestmark = [pytest.mark.core]
+
+BASE_URL = 'http://fake.vaiz.test/v4'
+SPACE_ID = FAKE_ENV['MAIN_SPACE_ID']
+HEADERS = {'Current-Space-Id': SPACE_ID}
+
+
+@pytest.fixture
+def fake():
+    api = FakeVaizAPI(base_url=BASE_URL).seed(board_tasks=0)
+    add_middleware(api)
+    yield api
+    remove_middleware(api)
+
+
+@pytest.fixture
+def owner(fake):
+    return PooledAPIClient(base_url=BASE_URL, token=fake.issue_token(fake.users_by_email[FAKE_ENV['OWNER_EMAIL']]))
+
+
+@allure.parent_suite("Core")
+@allure.suite("Multipart")
+@allure.title("Потоковое тело: путь, bytes и итератор кусков; Content-Length или chunked; разбор по кускам любой длины")
+def test_stream_roundtrip(tmp_path):
+    path = tmp_path / 'a.bin'
+    path.write_bytes(bytes(range(256)) * 1000)
+    files = {'file': ('a.bin', path, 'application/octet-stream'), 'raw': ('r.txt', b'--\r\n--x', 'text/plain')}
+    stream = MultipartStream({'kind': 'Space', 'name': 'Тест "1"'}, files, chunk_size=1000)
+    prepared = requests.Request('POST', BASE_URL, data=stream, headers={'Content-Type': stream.content_type}).prepare()
+    assert prepared.headers['Content-Length'] == str(len(b''.join(stream)))
+
+    for size in (1, 7, 4096):
+        body = b''.join(stream)
+        form = parse_multipart((body[i:i + size] for i in range(0, len(body), size)), stream.content_type)
+        assert (form['kind'], form['name']) == ('Space', 'Тест "1"')
+        assert (form['file'].size, form['file'].sha256) == (256_000, hashlib.sha256(path.read_bytes()).hexdigest())
+        assert form['raw'].head == b'--\r\n--x'
+
+    chunked = MultipartStream(files={'file': ('b.bin', iter([b'x' * 10] * 3), 'application/octet-stream')})
+    prepared = requests.Request('POST', BASE_URL, data=chunked, headers={'Content-Type': chunked.content_type}).prepare()
+    assert prepared.headers['Transfer-Encoding'] == 'chunked' and 'Content-Length' not in prepared.headers
+    with pytest.raises(ValueError):
+        parse_multipart([b''.join(stream)[:-10]], stream.content_type)
+
+
+@allure.parent_suite("Core")
+@allure.suite("Multipart")
+@allure.title("UploadAvatar через фейк: картинка Pillow с диска, проверка формата и лимита, RSS не растёт на размер файла")
+def test_upload_avatar_streams(fake, owner, tmp_path):
+    path = generate_avatar(tmp_path / 'avatar.webp', 64, 'webp')
+    url = get_uploaded_avatar_url(owner, SPACE_ID, 'Space', HEADERS, path, 'avatar.webp', 'image/webp')
+    assert url.endswith('.webp') and fake.spaces[SPACE_ID]['avatar'] == url
+    assert fake.history[('Space', SPACE_ID)][-1]['key'] == 'SPACE_AVATAR_CHANGED'
+
+    text = upload_avatar_stream_endpoint(('a.txt', b'not an image', 'text/plain'), 'Space', SPACE_ID)
+    text['headers'].update(HEADERS)
+    assert owner.post(**text).json()['error']['code'] == 'FileType'
+
+    # 101 МБ кусками по 1 МБ: до фейка доходит поток, ни клиент, ни фейк не собирают файл целиком
+    chunk = b'\x89PNG\r\n\x1a\n'.ljust(1000 * 1000, b'\0')
+    huge = upload_avatar_stream_endpoint(('huge.png', (chunk for _ in range(101)), 'image/png'), 'Space', SPACE_ID)
+    huge['headers'].update(HEADERS)
+    exact_peak = reset_peak_rss()
+    before = rss_kb()
+    error = owner.post(**huge).json()['error']
+    assert (error['code'], error['meta']) == ('FileSize', {'max': '100.00 MB'})
+    if exact_peak:
+        assert peak_rss_kb() - before < 32 * 1024
+
+    png = generate_avatar(tmp_path / 'avatar.png', 128, 'png')
+    endpoint = upload_avatar_stream_endpoint(('avatar.png', png, 'image/png'), 'Space', SPACE_ID)
+    endpoint['headers'].update(HEADERS)
+    summary = measure_uploads(owner, endpoint, 'png 128', runs=3).summary()
+    assert summary['runs'] == 3 and not summary['errors'] and summary['upload_bytes'] > 128 * 128 * 3
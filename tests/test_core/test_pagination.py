@@ -0,0 +1,97 @@
+import time
+
+import allure
+import pytest
+
+from tests.core.client import APIClient
+from tests.core.pagination import ExpectedCount, NoDuplicates, StreamCheck, stream_tasks
+from tests.core.sort_order import DESC, SortOrderValidator, SortSpec
+
+pytestmark = [pytest.mark.core]
+
+TOTAL = 1050
+PAGE_SIZE = 100
+LATENCY = 0.05
+ENDPOINT = {'path': '/GetTasks', 'json': {'board': 'board-1'}, 'headers': {'Current-Space-Id': 'space-1'}}
+
+
+@pytest.fixture
+def tasks_stub(stub_server):
+    """/GetTasks отдаёт TOTAL задач с возрастающим priority; overlap — сдвиг skip (баг пагинации)."""
+    tasks = [{'_id': f'task-{i:05}', 'priority': i} for i in range(TOTAL)]
+    stub_server.overlap = 0
+
+    def _get_tasks(body, headers):
+        skip = max(body['skip'] - stub_server.overlap, 0) if body['skip'] else 0
+        return 200, {'payload': {'tasks': tasks[skip:skip + body['limit']]}}
+
+    stub_server.route('/GetTasks', _get_tasks)
+    return stub_server
+
+
+@allure.parent_suite("Core")
+@allure.suite("Pagination")
+@allure.title("Поток обходит все страницы, проверки инвариантов проходят на лету")
+def test_stream_walks_all_pages(tasks_stub):
+    client = APIClient(base_url=tasks_stub.url)
+    stream = stream_tasks(client, ENDPOINT, page_size=PAGE_SIZE,
+                          checks=[NoDuplicates(), SortOrderValidator(SortSpec('priority')), ExpectedCount(TOTAL)])
+
+    assert [task['priority'] for task in stream] == list(range(TOTAL))
+    assert stream.pages == 11
+    assert [(body['skip'], body['limit']) for body in tasks_stub.calls('/GetTasks')] == [
+        (skip, PAGE_SIZE) for skip in range(0, TOTAL, PAGE_SIZE)
+    ]
+    assert all(body['board'] == 'board-1' for body in tasks_stub.calls('/GetTasks'))
+
+
+@allure.parent_suite("Core")
+@allure.suite("Pagination")
+@allure.title("Следующая страница запрашивается, пока обрабатывается текущая")
+def test_next_page_is_prefetched(tasks_stub):
+    tasks_stub.latency = LATENCY
+    client = APIClient(base_url=tasks_stub.url)
+
+    def walk(prefetch):
+        start = time.perf_counter()
+        for task in stream_tasks(client, ENDPOINT, page_size=PAGE_SIZE, prefetch=prefetch):
+            if task['priority'] % PAGE_SIZE == 0:
+                time.sleep(LATENCY)  # обработка страницы
+        return time.perf_counter() - start
+
+    serial, prefetched = walk(False), walk(True)
+    assert prefetched < serial * 0.75, f'Prefetch не ускорил обход: {prefetched:.2f}s vs {serial:.2f}s'
+
+
+@allure.parent_suite("Core")
+@allure.suite("Pagination")
+@allure.title("Дубли на стыке страниц и нарушение порядка ловятся с позицией элемента")
+def test_invariant_violations_are_reported(tasks_stub):
+    client = APIClient(base_url=tasks_stub.url)
+    tasks_stub.overlap = 1
+    with pytest.raises(AssertionError, match='Дубль _id=task-00099: позиции 99 и 100'):
+        list(stream_tasks(client, ENDPOINT, page_size=PAGE_SIZE, checks=[NoDuplicates()]))
+
+    tasks_stub.overlap = 0
+    with pytest.raises(AssertionError, match=r'\[1\] task-00001: 0 -> 1 \(нарушен порядок\)'):
+        list(stream_tasks(client, ENDPOINT, page_size=PAGE_SIZE, checks=[SortOrderValidator(SortSpec('priority', DESC))]))
+    with pytest.raises(AssertionError, match=f'Ожидалось 10 элементов, получено {TOTAL}'):
+        list(stream_tasks(client, ENDPOINT, page_size=PAGE_SIZE, checks=[ExpectedCount(10)]))
+    with pytest.raises(TypeError):
+        StreamCheck()
+
+
+@allure.parent_suite("Core")
+@allure.suite("Pagination")
+@allure.title("max_items и досрочный выход не запрашивают лишних страниц")
+def test_max_items_and_early_exit(tasks_stub):
+    client = APIClient(base_url=tasks_stub.url)
+    stream = stream_tasks(client, ENDPOINT, page_size=PAGE_SIZE, max_items=250)
+    assert len(list(stream)) == 250
+    assert len(tasks_stub.calls('/GetTasks')) == 3
+
+    for task in stream_tasks(client, ENDPOINT, page_size=PAGE_SIZE):
+        if task['priority'] == 5:
+            break
+    # Первая страница и, самое большее, одна предзагруженная
+    assert len(tasks_stub.calls('/GetTasks')) <= 5
@@ -0,0 +1,65 @@
+import allure
+import pytest
+
+from test_backend.data.persisted_entities import TASK
+from tests.core.async_client import PooledAPIClient
+from tests.core.client import add_middleware, remove_middleware
+from tests.core.fake_api import FAKE_ENV, FakeVaizAPI
+from tests.core.persisted import PersistedState, project
+
+pytestmark = [pytest.mark.core]
+
+BASE_URL = 'http://fake.vaiz.test/v4'
+SPACE_ID, BOARD_ID = FAKE_ENV['MAIN_SPACE_ID'], FAKE_ENV['BOARD_WITH_TASKS']
+
+
+@pytest.fixture
+def fake():
+    api = FakeVaizAPI(base_url=BASE_URL).seed(board_tasks=25)
+    add_middleware(api)
+    yield api
+    remove_middleware(api)
+
+
+@pytest.fixture
+def owner(fake):
+    return PooledAPIClient(base_url=BASE_URL, token=fake.issue_token(fake.users_by_email[FAKE_ENV['OWNER_EMAIL']]))
+
+
+@allure.parent_suite("Core")
+@allure.suite("Persisted state")
+@allure.title("Проекция MongoDB: вложенные поля и массивы сохраняют форму документа")
+def test_projection():
+    document = {'_id': '1', 'name': 'x', 'a': {'b': 1, 'c': 2}, 'cf': [{'id': 'f', 'value': 3}, {'id': 'g'}, 'raw']}
+    assert project(document, ['name', 'a.b', 'cf.value', 'missing']) == \
+        {'_id': '1', 'name': 'x', 'a': {'b': 1}, 'cf': [{'value': 3}, {}]}
+    assert project(document, ['a', 'a.b', 'cf.id']) == {'_id': '1', 'a': {'b': 1, 'c': 2}, 'cf': [{'id': 'f'}, {'id': 'g'}]}
+
+
+@allure.parent_suite("Core")
+@allure.suite("Persisted state")
+@allure.title("Батчи $in из базы и запасной путь через API дают одинаковый результат и одинаково ловят расхождения")
+def test_mongo_batches_and_api_fallback(fake, owner):
+    task_ids = list(fake.tasks_by_board[BOARD_ID])
+    mongo = fake.mongo()
+    from_db = PersistedState(mongo, batch_size=10)
+    from_api = PersistedState()
+
+    tasks = from_db.many(TASK, task_ids + task_ids[:3], ['name', 'completed'])
+    assert (mongo.queries, len(tasks)) == (3, 25) and from_db.source == 'mongo'
+    assert set(tasks[task_ids[0]]) == {'_id', 'name', 'completed'}
+    assert from_api.many(TASK, task_ids, ['name', 'completed'], client=owner, space_id=SPACE_ID) == tasks
+    assert from_api.requests == 25
+
+    renamed, missing = task_ids[0], 'f' * 24
+    fake.tasks[renamed]['name'] = 'renamed'
+    expected = {task_id: {'name': tasks[task_id]['name'], 'completed': tasks[task_id]['completed']}
+                for task_id in task_ids[:5]}
+    expected[missing] = {'name': 'ghost'}
+    for state in (from_db, from_api):
+        problems = state.mismatches(TASK, expected, client=owner, space_id=SPACE_ID)
+        assert len(problems) == 2 and 'renamed' in problems[0] and 'не найдена' in problems[1], problems
+    assert mongo.queries == 4
+
+    with pytest.raises(AssertionError, match='нужен client'):
+        from_api.one(TASK, renamed, ['name'])
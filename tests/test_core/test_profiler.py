@@ -0,0 +1,101 @@
+import time
+from types import SimpleNamespace
+
+import allure
+import pytest
+import requests
+
+from tests.core.async_client import PooledAPIClient
+from tests.core.client import add_middleware, remove_middleware
+from tests.core.profiler import FixtureProfiler
+
+pytestmark = [pytest.mark.core]
+
+BASE_URL = 'http://fake.vaiz.test/v4'
+
+
+class _FixtureDef:
+    def __init__(self, argname, scope):
+        self.argname = argname
+        self.scope = scope
+        self.finalizers = []
+
+    def addfinalizer(self, finalizer):
+        self.finalizers.append(finalizer)
+
+
+class _Request:
+    """SubRequest: цепочка от фикстуры к тесту (fixturename, scope)."""
+
+    def __init__(self, *chain):
+        self.chain = [SimpleNamespace(fixturename=name, scope=scope) for name, scope in chain]
+
+    def _iter_chain(self):
+        return iter(self.chain)
+
+
+def _answer(call, send):
+    response = requests.Response()
+    response.status_code = 200
+    response._content = b'x' * 1024
+    return response
+
+
+@pytest.fixture
+def profiler(tmp_path):
+    profiler = FixtureProfiler(str(tmp_path / 'fixtures.folded'))
+    profiler.pytest_sessionstart(None)
+    add_middleware(_answer)
+    yield profiler
+    remove_middleware(_answer)
+    remove_middleware(profiler)
+
+
+def _setup(profiler, fixturedef, request, body):
+    hook = profiler.pytest_fixture_setup(fixturedef, request)
+    next(hook)
+    body()
+    with pytest.raises(StopIteration):
+        hook.send(SimpleNamespace(excinfo=None))
+
+
+def _teardown(profiler, fixturedef, body):
+    for finalizer in reversed([body, *fixturedef.finalizers]):
+        finalizer()
+    profiler.pytest_fixture_post_finalizer(fixturedef, None)
+
+
+@allure.parent_suite("Core")
+@allure.suite("Fixture profiler")
+@allure.title("Профиль фикстур: собственное время, запросы и байты по фикстурам, flame graph по цепочке зависимостей")
+def test_profile_attributes_requests_to_running_fixture(profiler):
+    client = PooledAPIClient(base_url=BASE_URL, token='token')
+    space = _FixtureDef('temp_space', 'module')
+    board = _FixtureDef('temp_board', 'function')
+
+    def setup_board():
+        client.post('/CreateBoard', json={})
+        # Вложенная фикстура (getfixturevalue) — её время и запросы не относятся к temp_board
+        _setup(profiler, space, _Request(('temp_space', 'module'), ('temp_board', 'function')), lambda: (
+            time.sleep(0.05), client.post_many([{'path': '/CreateSpace', 'json': {}}] * 3)))
+
+    _setup(profiler, board, _Request(('temp_board', 'function')), setup_board)
+    client.post('/GetTasks', json={})  # запрос теста, не фикстуры
+    _teardown(profiler, board, lambda: client.post('/ArchiveBoard', json={}))
+    profiler.pytest_sessionfinish(None)
+
+    setups, setup, teardown, requests_count, size = profiler.stats[('temp_space', 'module')]
+    assert (setups, teardown, requests_count, size) == (1, 0.0, 3, 3 * 1024)
+    assert setup >= 0.05
+    setups, setup, _, requests_count, _ = profiler.stats[('temp_board', 'function')]
+    assert (setups, requests_count) == (1, 2)
+    assert setup < 0.05
+
+    with open(profiler.path, encoding='utf-8') as f:
+        folded = dict(line.rsplit(' ', 1) for line in f.read().splitlines())
+    assert set(folded) == {'setup;temp_board [function]', 'setup;temp_board [function];temp_space [module]',
+                           'teardown;temp_board [function]'}
+    assert int(folded['setup;temp_board [function];temp_space [module]']) >= 50_000
+    table = profiler.table()
+    assert table.splitlines()[1].startswith('temp_space  ')
+    assert 'module' in table.splitlines()[-1] and '3 запросов' in table
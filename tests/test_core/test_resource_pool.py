@@ -0,0 +1,137 @@
+import itertools
+import threading
+import time
+from types import SimpleNamespace
+
+import allure
+import pytest
+
+from tests.core.resource_pool import ResourcePool, SpaceBundle, count_pool_demand
+
+pytestmark = [pytest.mark.core]
+
+PROVISION_LATENCY = 0.1
+
+
+class FakeSpaces:
+    """Имитация создания/удаления спейсов с задержкой API."""
+
+    def __init__(self, fail_first=0):
+        self.counter = itertools.count(1)
+        self.fail_first = fail_first
+        self.created = []
+        self.removed = []
+        self.lock = threading.Lock()
+
+    def provision(self):
+        time.sleep(PROVISION_LATENCY)
+        number = next(self.counter)
+        if number <= self.fail_first:
+            raise AssertionError(f'Ошибка создания спейса #{number}')
+        bundle = SpaceBundle(space_id=f'space-{number}', project_id=f'project-{number}')
+        with self.lock:
+            self.created.append(bundle.space_id)
+        return bundle
+
+    def destroy(self, bundle):
+        time.sleep(PROVISION_LATENCY)
+        with self.lock:
+            self.removed.append(bundle.space_id)
+
+
+def make_pool(spaces, size=2, demand=None):
+    return ResourcePool('spaces', provision=spaces.provision, destroy=spaces.destroy, size=size, demand=demand)
+
+
+@allure.parent_suite("Core")
+@allure.suite("Resource pool")
+@allure.title("Предзаполненный пул выдаёт спейс без ожидания создания")
+def test_prefilled_acquire_is_off_critical_path():
+    spaces = FakeSpaces()
+    pool = make_pool(spaces, size=2, demand=3).start()
+    time.sleep(PROVISION_LATENCY * 2)
+
+    start = time.perf_counter()
+    bundles = [pool.acquire(), pool.acquire()]
+    assert time.perf_counter() - start < PROVISION_LATENCY / 2
+
+    for bundle in bundles:
+        pool.release(bundle)
+    stats = pool.close()
+
+    assert stats['hits'] == 2
+    assert stats['provisioned'] == 3, 'Создано больше, чем требуется прогону'
+    assert sorted(spaces.removed) == sorted(spaces.created), 'Невыданный спейс не удалён в конце сессии'
+
+
+@allure.parent_suite("Core")
+@allure.suite("Resource pool")
+@allure.title("Пул пополняется после выдачи и не превышает size")
+def test_refill_keeps_size():
+    spaces = FakeSpaces()
+    pool = make_pool(spaces, size=2).start()
+
+    acquired = [pool.acquire() for _ in range(5)]
+    time.sleep(PROVISION_LATENCY * 2)
+
+    assert len({bundle.space_id for bundle in acquired}) == 5
+    assert pool.provisioned == 7
+    pool.close()
+    assert len(spaces.removed) == 2
+
+
+@allure.parent_suite("Core")
+@allure.suite("Resource pool")
+@allure.title("Ошибка фонового создания поднимается в acquire(), пул продолжает работу")
+def test_provision_error_is_raised_on_acquire():
+    spaces = FakeSpaces(fail_first=1)
+    pool = make_pool(spaces, size=1).start()
+
+    with pytest.raises(AssertionError, match='#1'):
+        pool.acquire()
+    assert pool.acquire().space_id == 'space-2'
+    pool.close()
+
+
+@allure.parent_suite("Core")
+@allure.suite("Resource pool")
+@allure.title("size=0: создание и удаление синхронно в вызывающем потоке")
+def test_size_zero_is_synchronous():
+    spaces = FakeSpaces()
+    pool = make_pool(spaces, size=0).start()
+    assert spaces.created == []
+
+    bundle = pool.acquire()
+    assert spaces.created == [bundle.space_id]
+    pool.release(bundle)
+    assert spaces.removed == [bundle.space_id]
+    pool.close()
+
+
+@allure.parent_suite("Core")
+@allure.suite("Resource pool")
+@allure.title("Потребность пулов считается по фикстурам и параметрам собранных тестов")
+def test_count_pool_demand():
+    pooled = {
+        'space_id_module': ('main', 'module'),
+        'board_id_module': ('main', 'module'),
+        'temp_space': ('main', 'session'),
+        'space_id_function': ('owner', 'function'),
+        'project_id_function': ('owner', 'function'),
+    }
+
+    def item(nodeid, fixtures, params=None):
+        callspec = SimpleNamespace(params=params) if params is not None else None
+        return SimpleNamespace(nodeid=nodeid, fixturenames=fixtures, callspec=callspec)
+
+    items = [
+        item('a.py::t1', ['space_id_module', 'board_id_module']),
+        item('a.py::t2', ['space_id_module']),
+        item('b.py::t1', ['board_id_module', 'temp_space']),
+        item('c.py::t1[Space]', ['kind_id_fixture'], {'kind_id_fixture': 'space_id_function'}),
+        item('c.py::t1[Project]', ['kind_id_fixture'], {'kind_id_fixture': 'project_id_function'}),
+        item('c.py::t2', ['space_id_function', 'project_id_function']),
+        item('d.py::t1', ['owner_client']),
+    ]
+
+    assert count_pool_demand(items, pooled) == {'main': 3, 'owner': 3}
@@ -0,0 +1,97 @@
+import time
+
+import allure
+import pytest
+
+from tests.core.client import APIClient
+from tests.core.role_matrix import RoleMatrix, check_role_result
+
+pytestmark = [pytest.mark.core]
+
+LATENCY = 0.2
+ROLE_STATUSES = {'owner': 200, 'manager': 200, 'member': 200, 'guest': 403}
+STUB_CLIENTS = {role: f'stub_{role}_client' for role in ROLE_STATUSES}
+MATRIX = RoleMatrix(ROLE_STATUSES, clients=STUB_CLIENTS)
+
+
+@pytest.fixture
+def access_stub(stub_server):
+    """/GetBoard отвечает 403 токену guest и 200 остальным."""
+    stub_server.latency = LATENCY
+
+    def _get_board(body, headers):
+        if headers.get('Authorization', '').endswith('guest'):
+            return 403, {'error': {'code': 'AccessDenied'}}
+        return 200, {'payload': {'board': {'_id': body['boardId']}}}
+
+    stub_server.route('/GetBoard', _get_board)
+    return stub_server
+
+
+def _client(stub, role):
+    return APIClient(base_url=stub.url, token=role)
+
+
+@pytest.fixture
+def stub_owner_client(access_stub):
+    return _client(access_stub, 'owner')
+
+
+@pytest.fixture
+def stub_manager_client(access_stub):
+    return _client(access_stub, 'manager')
+
+
+@pytest.fixture
+def stub_member_client(access_stub):
+    return _client(access_stub, 'member')
+
+
+@pytest.fixture
+def stub_guest_client(access_stub):
+    return _client(access_stub, 'guest')
+
+
+@allure.parent_suite("Core")
+@allure.suite("Role matrix")
+@allure.title("Запросы всех ролей уходят параллельно, результаты разложены по ролям")
+def test_roles_dispatched_concurrently(request, access_stub):
+    start = time.perf_counter()
+    results = MATRIX.run(request, lambda client, role: client.post('/GetBoard', json={'boardId': 'b1'}))
+    elapsed = time.perf_counter() - start
+
+    assert {role: result.status_code for role, result in results.items()} == ROLE_STATUSES
+    assert len(access_stub.calls('/GetBoard')) == len(ROLE_STATUSES)
+    assert elapsed < LATENCY * 2, f'Роли выполнялись последовательно: {elapsed:.2f}s'
+    for result in results.values():
+        check_role_result(result)
+
+
+@allure.parent_suite("Core")
+@allure.suite("Role matrix")
+@allure.title("Несовпадение статуса и исключение операции падают только в тесте своей роли")
+def test_failures_are_reported_per_role(request, access_stub):
+    matrix = RoleMatrix({'owner': 200, 'guest': 200}, clients=STUB_CLIENTS)
+    results = matrix.run(request, lambda client, role: client.post('/GetBoard', json={'boardId': 'b1'}))
+
+    check_role_result(results['owner'])
+    with pytest.raises(AssertionError, match='AccessDenied'):
+        check_role_result(results['guest'])
+
+    def _broken(client, role):
+        if role == 'guest':
+            raise KeyError('payload')
+        return client.post('/GetBoard', json={'boardId': 'b1'})
+
+    results = matrix.run(request, _broken)
+    check_role_result(results['owner'])
+    with pytest.raises(KeyError):
+        check_role_result(results['guest'])
+
+
+@allure.parent_suite("Core")
+@allure.suite("Role matrix")
+@MATRIX.parametrize()
+def test_parametrize_gives_case_per_role(request, role, expected_status):
+    assert request.node.callspec.id == role
+    assert ROLE_STATUSES[role] == expected_status
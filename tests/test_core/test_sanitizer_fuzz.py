@@ -0,0 +1,72 @@
+import allure
+import pytest
+
+from test_backend.comment.sanitizer.fuzz import FuzzCache, HtmlGrammar, SanitizerFuzzer
+from tests.core import fake_api
+from tests.core.async_client import PooledAPIClient
+from tests.core.client import add_middleware, remove_middleware
+from tests.core.fake_api import FAKE_ENV, FakeVaizAPI
+from tests.core.html_sanitizer import sanitize
+
+pytestmark = [pytest.mark.core]
+
+BASE_URL = 'http://fake.vaiz.test/v4'
+SPACE_ID, DOCUMENT_ID = FAKE_ENV['MAIN_SPACE_ID'], FAKE_ENV['MAIN_PROJECT_DOC_ID']
+
+
+@pytest.fixture
+def fuzzer(tmp_path):
+    api = FakeVaizAPI(base_url=BASE_URL).seed(board_tasks=0)
+    add_middleware(api)
+    owner = PooledAPIClient(base_url=BASE_URL, token=api.issue_token(api.users_by_email[FAKE_ENV['OWNER_EMAIL']]))
+    yield SanitizerFuzzer(owner, SPACE_ID, DOCUMENT_ID, cache=FuzzCache(str(tmp_path / 'cache.json'), 'fake'))
+    remove_middleware(api)
+
+
+@allure.parent_suite("Core")
+@allure.suite("Sanitizer fuzzing")
+@allure.title("Эталонная модель санитайзера: развёртывание, удаление тегов, javascript: в ссылках, экранирование")
+def test_reference_model():
+    assert sanitize("<form action='x'><input type='submit'></form>") == '<input type="submit" />'
+    assert sanitize('<div><script>evil()</script>safe</div>') == '<div>safe</div>'
+    assert sanitize('<a href=" JavaScript:alert(1)" target="_self">x</a>') == \
+        '<a target="_blank" rel="noopener noreferrer">x</a>'
+    assert sanitize('<img alt=\'a "b" &amp; c\'>1 &lt; 2') == '<img alt="a &quot;b&quot; &amp; c" />1 &lt; 2'
+    assert sanitize('<iframe></iframe>') == '<p></p>'
+
+
+@allure.parent_suite("Core")
+@allure.suite("Sanitizer fuzzing")
+@allure.title("Фаззер: тысячи случаев в минуту против фейка, повторный прогон берёт доказанные случаи из кэша")
+def test_fuzzer_throughput_and_cache(fuzzer):
+    cases = HtmlGrammar(seed=1).cases(2000)
+    assert cases == HtmlGrammar(seed=1).cases(2000)
+
+    for mode in ('create', 'edit'):
+        report = fuzzer.run(cases[:1000], mode=mode)
+        assert not report.failures, report.summary()
+        assert report.passed == 1000 and report.per_minute > 5000, report.summary()
+    fuzzer.cache.save()
+
+    cache = FuzzCache(fuzzer.cache.path, 'fake')
+    fuzzer.cache = cache
+    report = fuzzer.run(cases, mode='create')
+    assert (report.cached, report.passed) == (1000, 1000)
+
+
+@allure.parent_suite("Core")
+@allure.suite("Sanitizer fuzzing")
+@allure.title("Расхождение с моделью минимизируется до короткого воспроизводящего входа")
+def test_failures_are_shrunk(fuzzer, monkeypatch):
+    # Санитайзер «стенда» с ошибкой: теряет class у элементов внутри blockquote
+    def buggy(html):
+        content = sanitize(html)
+        return content.replace('<blockquote class="my-class">', '<blockquote>')
+
+    monkeypatch.setattr(fake_api, 'sanitize', buggy)
+    report = fuzzer.run(HtmlGrammar(seed=7).cases(300), mode='edit')
+
+    assert report.failures, report.summary()
+    assert not fuzzer.cache._new & {fuzzer.cache.key('edit', failure.input) for failure in report.failures}
+    for failure in report.failures[:5]:
+        assert failure.minimal == '<blockquote class="my-class"></blockquote>', str(failure)
@@ -0,0 +1,64 @@
+import allure
+import pytest
+
+from tests.core.scheduling import assign_groups, recommend_workers
+
+pytestmark = [pytest.mark.core]
+
+
+class _Item:
+    """Минимальный pytest.Item: nodeid, фикстуры и маркеры mutates/reads."""
+
+    def __init__(self, nodeid, fixtures=(), mutates=(), reads=()):
+        self.nodeid = nodeid
+        self.fixturenames = list(fixtures)
+        self._markers = [pytest.mark.mutates(*mutates).mark] if mutates else []
+        self._markers += [pytest.mark.reads(*reads).mark] if reads else []
+
+    def iter_markers(self, name):
+        return (marker for marker in self._markers if marker.name == name)
+
+
+@allure.parent_suite("Core")
+@allure.suite("Scheduling")
+@allure.title("Тесты, меняющие общий ресурс, и чувствительные к нему читатели попадают в одну группу")
+def test_conflicting_tests_share_group():
+    items = [
+        _Item('a', fixtures=['main_board'], mutates=['main_board']),
+        _Item('b', fixtures=['main_board']),
+        _Item('c', fixtures=['main_board'], reads=['main_board']),
+        _Item('d', fixtures=['temp_milestone_on_board_with_tasks', 'board_with_tasks']),
+        _Item('e', fixtures=['board_with_tasks'], reads=['board_with_tasks', 'second_board']),
+        _Item('f', mutates=['main_space']),
+    ]
+    assert assign_groups(items) == {
+        'a': 'mutates:main_board', 'c': 'mutates:main_board',
+        'd': 'mutates:board_with_tasks', 'e': 'mutates:board_with_tasks',
+        'f': 'mutates:main_space',
+    }
+
+
+@allure.parent_suite("Core")
+@allure.suite("Scheduling")
+@allure.title("Тест, затрагивающий несколько ресурсов, объединяет их группы")
+def test_multi_resource_tests_merge_groups():
+    items = [
+        _Item('a', mutates=['main_board']),
+        _Item('b', mutates=['main_space']),
+        _Item('c', reads=['main_board', 'main_space']),
+        _Item('d', mutates=['second_board']),
+    ]
+    groups = assign_groups(items)
+    assert groups['a'] == groups['b'] == groups['c'] == 'mutates:main_board+main_space'
+    assert groups['d'] == 'mutates:second_board'
+
+
+@allure.parent_suite("Core")
+@allure.suite("Scheduling")
+@allure.title("Число воркеров растёт с задержкой API и ограничено сверху")
+def test_worker_count_follows_latency():
+    assert recommend_workers(None, cpus=4, max_workers=16) == 4
+    assert recommend_workers(0.5, cpus=2, max_workers=16) == 2
+    assert recommend_workers(30, cpus=2, max_workers=16) == 8
+    assert recommend_workers(300, cpus=2, max_workers=16) == 16
+    assert recommend_workers(300, cpus=1, max_workers=0) == 1
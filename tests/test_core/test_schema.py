@@ -0,0 +1,88 @@
+import time
+
+import allure
+import pytest
+
+from tests.core.schema import compile_schema
+
+pytestmark = [pytest.mark.core]
+
+TASK = {'_id': str, 'name': str, 'priority': int, 'dueEnd': (str, type(None)), 'assignees': list, 'followers': dict,
+        'color': dict}
+COLOR = {'color': str, 'isDark': bool}
+
+
+def _task(i):
+    return {'_id': f'task-{i}', 'name': f'Task {i}', 'priority': i % 4, 'dueEnd': None,
+            'assignees': ['member-1', 'member-2'], 'followers': {'member-1': 'creator'},
+            'color': {'color': 'red', 'isDark': False}}
+
+
+def _schema():
+    return compile_schema('Task', TASK, optional={'editor': str}, items={'assignees': str},
+                          values={'followers': str}, nested={'color': compile_schema('color', COLOR)})
+
+
+@allure.parent_suite("Core")
+@allure.suite("Schema")
+@allure.title("Схема компилируется один раз и кешируется по содержимому словарей")
+def test_compiled_schema_is_cached():
+    schema = _schema()
+    assert schema is _schema()
+    assert compile_schema('color', dict(COLOR)) is compile_schema('color', COLOR)
+    assert compile_schema('color', COLOR, strict=False) is not compile_schema('color', COLOR)
+
+
+@allure.parent_suite("Core")
+@allure.suite("Schema")
+@allure.title("Предикат совпадает с подробным разбором: набор полей, типы, элементы, вложенные объекты")
+@pytest.mark.parametrize('mutate, expected', [
+    (lambda t: t, []),
+    (lambda t: t.update(editor='member-1'), []),
+    (lambda t: t.pop('name'), [('Task', "отсутствуют обязательные поля: ['name']")]),
+    (lambda t: t.update(extra=1), [('Task', "найдены лишние поля: ['extra']")]),
+    (lambda t: t.update(priority='high'), [('Task.priority', 'неверный тип: str, ожидается int')]),
+    (lambda t: t.update(dueEnd=1), [('Task.dueEnd', 'неверный тип: int, ожидается str | None')]),
+    (lambda t: t.update(editor=None), [('Task.editor', 'неверный тип: NoneType, ожидается str')]),
+    (lambda t: t['assignees'].append(7), [('Task.assignees', 'элементы [2] не str')]),
+    (lambda t: t['followers'].update(x=None), [('Task.followers', "значения по ключам ['x'] не str")]),
+    (lambda t: t['color'].pop('isDark'), [('Task.color', "отсутствуют обязательные поля: ['isDark']")]),
+], ids=['valid', 'optional', 'missing', 'extra', 'type', 'nullable', 'optional-type', 'items', 'values', 'nested'])
+def test_predicate_matches_errors(mutate, expected):
+    schema = _schema()
+    task = _task(1)
+    mutate(task)
+    assert schema.errors(task) == expected
+    assert schema.is_valid(task) is (expected == [])
+    assert not schema.is_valid(None)
+
+
+@allure.parent_suite("Core")
+@allure.suite("Schema")
+@allure.title("Пакетная проверка собирает все нарушения по списку в один отчёт")
+def test_batch_report_aggregates_violations():
+    schema = _schema()
+    tasks = [_task(i) for i in range(50)]
+    tasks[3]['priority'] = None
+    tasks[3].pop('name')
+    tasks[40]['assignees'] = 'member-1'
+
+    violations = schema.validate_many(tasks)
+    assert [(v.index, v.path) for v in violations] == [
+        (3, 'Task[_id=task-3]'), (3, 'Task[_id=task-3].priority'), (40, 'Task[_id=task-40].assignees'),
+    ]
+    with pytest.raises(AssertionError, match=r'Нарушений схемы Task: 3 \(объектов с ошибками: 2 из 50\)') as error:
+        schema.assert_all_valid(tasks)
+    assert "[40] Task[_id=task-40].assignees: неверный тип: str, ожидается list" in str(error.value)
+
+
+@allure.parent_suite("Core")
+@allure.suite("Schema")
+@allure.title("Проверка 10.000 задач укладывается в миллисекунды")
+def test_batch_validation_is_cheap():
+    schema = _schema()
+    tasks = [_task(i) for i in range(10_000)]
+    start = time.perf_counter()
+    schema.assert_all_valid(tasks)
+    elapsed = time.perf_counter() - start
+    assert elapsed < 0.2, f'Проверка 10.000 задач заняла {elapsed:.3f}s'
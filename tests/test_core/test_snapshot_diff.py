@@ -0,0 +1,107 @@
+import random
+import time
+from pathlib import Path
+
+import allure
+import pytest
+from PIL import Image, ImageChops, ImageDraw
+
+from tests.test_frontend.core.snapshot_diff import compare_images, render_diff
+
+pytestmark = [pytest.mark.core]
+
+LOGIN_SNAPSHOTS = Path(__file__).resolve().parents[1] / 'test_frontend' / 'tests' / 'login' / '__snapshots__' / 'dev'
+
+
+def reference_diff(baseline, actual):
+    """Прежняя реализация assert_snapshot (цикл по пикселям) — эталон для сравнения результатов."""
+    diff = ImageChops.difference(baseline, actual)
+    diff_coords = [
+        (i % baseline.width, i // baseline.width)
+        for i, pixel in enumerate(diff.getdata())
+        if any(c > 10 for c in pixel)
+    ]
+    highlighted = baseline.copy()
+    draw = ImageDraw.Draw(highlighted)
+    for x, y in diff_coords:
+        draw.point((x, y), fill=(255, 0, 0))
+    if diff_coords:
+        xs = [p[0] for p in diff_coords]
+        ys = [p[1] for p in diff_coords]
+        draw.rectangle([min(xs) - 5, min(ys) - 5, max(xs) + 5, max(ys) + 5], outline=(255, 0, 0), width=2)
+    return len(diff_coords) / (baseline.width * baseline.height) * 100, highlighted
+
+
+def synthetic_pair(size=(1280, 720), seed=0):
+    """Пара 'скриншотов': шум рендеринга ниже порога + несколько изменённых блоков."""
+    rnd = random.Random(seed)
+    baseline = Image.effect_noise(size, 40).convert('RGB')
+    noise = Image.effect_noise(size, 3).convert('RGB')
+    actual = ImageChops.add(baseline, ImageChops.multiply(noise, Image.new('RGB', size, (2, 2, 2))))
+    draw = ImageDraw.Draw(actual)
+    for _ in range(5):
+        x, y = rnd.randrange(size[0] - 100), rnd.randrange(size[1] - 50)
+        draw.rectangle([x, y, x + rnd.randrange(10, 100), y + rnd.randrange(5, 50)], fill=(rnd.randrange(256), 0, 255))
+    return baseline, actual
+
+
+@allure.parent_suite("Core")
+@allure.suite("Snapshot diff")
+@allure.title("Процент отличий и diff-картинка совпадают с прежней попиксельной реализацией")
+@pytest.mark.parametrize('seed', [0, 1, 2])
+def test_matches_reference_implementation(seed):
+    baseline, actual = synthetic_pair(size=(320, 200), seed=seed)
+
+    pixel_diff = compare_images(baseline, actual)
+    expected_pct, expected_image = reference_diff(baseline, actual)
+
+    assert pixel_diff.diff_pct == expected_pct
+    assert ImageChops.difference(render_diff(baseline, pixel_diff), expected_image).getbbox() is None
+
+
+@allure.parent_suite("Core")
+@allure.suite("Snapshot diff")
+@allure.title("Одинаковые изображения: отличий нет, bbox отсутствует")
+def test_identical_images():
+    image = Image.effect_noise((64, 64), 50).convert('RGB')
+    pixel_diff = compare_images(image, image.copy())
+    assert pixel_diff.diff_pixels == 0
+    assert pixel_diff.bbox is None
+
+
+@allure.parent_suite("Core")
+@allure.suite("Snapshot diff")
+@allure.title("Реальная пара baseline/actual из __snapshots__ даёт тот же результат, что и прежняя реализация")
+def test_matches_reference_on_login_snapshot():
+    baseline = Image.open(LOGIN_SNAPSHOTS / 'sign_in_success.png').convert('RGB')
+    actual = Image.open(LOGIN_SNAPSHOTS / 'sign_in_success_actual.png').convert('RGB')
+    if baseline.size != actual.size:
+        pytest.skip('Размеры baseline и actual различаются')
+
+    expected_pct, _ = reference_diff(baseline, actual)
+    assert compare_images(baseline, actual).diff_pct == expected_pct
+
+
+@pytest.mark.benchmark
+@allure.parent_suite("Core")
+@allure.suite("Snapshot diff")
+@allure.title("Benchmark: попиксельный цикл vs операции над каналами")
+@pytest.mark.parametrize('size', [(1280, 720), (1280, 4000)], ids=['viewport', 'full-page'])
+def test_benchmark_diff(size):
+    baseline, actual = synthetic_pair(size=size)
+
+    start = time.perf_counter()
+    reference_diff(baseline, actual)
+    reference_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    render_diff(baseline, compare_images(baseline, actual))
+    vectorized_time = time.perf_counter() - start
+
+    report = (
+        f"{size[0]}x{size[1]}: pixel loop {reference_time * 1000:.0f} ms, "
+        f"band ops {vectorized_time * 1000:.1f} ms, x{reference_time / vectorized_time:.0f}"
+    )
+    print(f"\n{report}")
+    allure.attach(report, name="diff timing", attachment_type=allure.attachment_type.TEXT)
+    assert vectorized_time < reference_time
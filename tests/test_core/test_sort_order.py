@@ -0,0 +1,79 @@
+import time
+
+import allure
+import pytest
+
+from tests.core.sort_order import (
+    ASC, DESC, NULLS_ERROR, NULLS_LAST, SortSpec, assert_sorted, validate_sort_order,
+)
+
+pytestmark = [pytest.mark.core]
+
+
+def _tasks(values, field='dueStart'):
+    return [{'_id': f'task-{i}', field: value} for i, value in enumerate(values)]
+
+
+@allure.parent_suite("Core")
+@allure.suite("Sort order")
+@allure.title("null меньше любого значения: в начале при ASC, в конце при DESC")
+def test_nulls_follow_direction():
+    dates = ['2025-01-01T00:00:00.000Z', '2025-01-02T00:00:00.000Z', '2025-01-03T00:00:00+00:00']
+    asc = SortSpec('dueStart', ASC, parse='datetime')
+    desc = SortSpec('dueStart', DESC, parse='datetime')
+
+    assert validate_sort_order(_tasks([None, None, *dates]), asc) == []
+    assert validate_sort_order(_tasks([*reversed(dates), None]), desc) == []
+
+    violations = validate_sort_order(_tasks([dates[0], None, dates[1]]), asc)
+    assert [(v.index, v.reason) for v in violations] == [(1, 'null должны быть в начале')]
+    violations = validate_sort_order(_tasks([None, dates[0]]), SortSpec('dueStart', ASC, nulls=NULLS_LAST))
+    assert [v.index for v in violations] == [1]
+
+
+@allure.parent_suite("Core")
+@allure.suite("Sort order")
+@allure.title("Все нарушения порядка собираются с индексами, id и соседними значениями")
+def test_every_violation_is_reported():
+    tasks = _tasks([1, 3, 2, 4, 0, 5], field='priority')
+    violations = validate_sort_order(tasks, SortSpec('priority', ASC, parse='number'))
+
+    assert [(v.index, v.item_id, v.previous, v.current) for v in violations] == [
+        (2, 'task-2', 3, 2), (4, 'task-4', 4, 0),
+    ]
+    with pytest.raises(AssertionError, match=r'Нарушений порядка \(priority ASC, null: lowest\): 2 из 6') as error:
+        assert_sorted(tasks, SortSpec('priority', ASC, parse='number'))
+    assert "[4] task-4: 4 -> 0 (нарушен порядок)" in str(error.value)
+
+
+@allure.parent_suite("Core")
+@allure.suite("Sort order")
+@allure.title("Тайбрейкер проверяется только внутри группы равных ключей; запрещённый null и мусор ловятся")
+def test_tiebreaker_and_bad_values():
+    spec = SortSpec('priority', DESC, parse='number', tiebreaker=SortSpec('_id'))
+    tasks = [
+        {'_id': 'a', 'priority': 3}, {'_id': 'c', 'priority': 3},
+        {'_id': 'b', 'priority': 2}, {'_id': 'a', 'priority': 2},
+    ]
+    assert [(v.index, v.previous, v.current) for v in validate_sort_order(tasks, spec)] == [(3, 'b', 'a')]
+
+    strict = SortSpec('createdAt', ASC, nulls=NULLS_ERROR, parse='datetime')
+    reasons = [v.reason for v in validate_sort_order(_tasks(['2025-01-01', None, 'not a date'], 'createdAt'), strict)]
+    assert reasons[0] == 'createdAt = null'
+    assert reasons[1].startswith('не разбирается')
+
+
+@allure.parent_suite("Core")
+@allure.suite("Sort order")
+@allure.title("Проверка 10.000 задач по дате укладывается в доли секунды")
+def test_validator_is_cheap_on_full_pages():
+    base = 1_735_689_600
+    tasks = _tasks([None] * 500 + [
+        time.strftime('%Y-%m-%dT%H:%M:%S.000Z', time.gmtime(base + i * 60)) for i in range(9_500)
+    ])
+    start = time.perf_counter()
+    violations = validate_sort_order(tasks, SortSpec('dueStart', ASC, parse='datetime'))
+    elapsed = time.perf_counter() - start
+
+    assert violations == []
+    assert elapsed < 0.5, f'Проверка 10.000 задач заняла {elapsed:.2f}s'
@@ -0,0 +1,90 @@
+import base64
+import json
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+import allure
+import pytest
+
+from tests.core import auth
+
+pytestmark = [pytest.mark.core]
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+ROLES = {f'role_{i}': {'email': f'user_{i}@autotest.com', 'password': '123456'} for i in range(9)}
+
+
+def make_jwt(exp: float) -> str:
+    claims = base64.urlsafe_b64encode(json.dumps({'exp': exp}).encode()).decode().rstrip('=')
+    return f'header.{claims}.signature'
+
+
+@pytest.fixture
+def fake_login(stub_server, tmp_path, monkeypatch):
+    """Фейковый /Login: выдаёт JWT со сроком жизни state['ttl'] и считает вызовы."""
+    state = {'ttl': 3600}
+
+    def _login(body, headers):
+        return 202, {'payload': {'token': make_jwt(time.time() + state['ttl'])}}
+
+    stub_server.route('/Login', _login)
+    monkeypatch.setattr(auth, 'API_URL', stub_server.url)
+    monkeypatch.setattr(auth, 'USERS', ROLES)
+    monkeypatch.setattr(auth, 'TOKEN_CACHE_PATH', str(tmp_path / 'tokens.json'))
+    monkeypatch.setattr(auth, '_token_cache', {})
+    state['login_calls'] = lambda: len(stub_server.calls('/Login'))
+    return state
+
+
+@allure.parent_suite("Core")
+@allure.suite("Token cache")
+@allure.title("Токен берётся с диска после сброса кэша процесса")
+def test_token_reused_from_disk(fake_login):
+    token = auth.get_token('role_0')
+    auth._token_cache.clear()
+
+    assert auth.get_token('role_0') == token
+    assert fake_login['login_calls']() == 1
+
+
+@allure.parent_suite("Core")
+@allure.suite("Token cache")
+@allure.title("Токен, который скоро истечёт, перевыпускается")
+def test_token_refreshed_before_expiry(fake_login):
+    fake_login['ttl'] = auth.REFRESH_MARGIN - 1
+    auth.get_token('role_0')
+    fake_login['ttl'] = 3600
+    auth.get_token('role_0')
+    auth.get_token('role_0')
+
+    assert fake_login['login_calls']() == 2
+
+
+@allure.parent_suite("Core")
+@allure.suite("Token cache")
+@allure.title("prewarm_tokens логинит каждую роль ровно один раз")
+def test_prewarm_logs_in_each_role_once(fake_login):
+    tokens = auth.prewarm_tokens()
+    auth.prewarm_tokens()
+
+    assert set(tokens) == set(ROLES)
+    assert fake_login['login_calls']() == len(ROLES)
+
+
+@allure.parent_suite("Core")
+@allure.suite("Token cache")
+@allure.title("Параллельные процессы разделяют дисковый кэш и не логинятся повторно")
+def test_token_cache_shared_between_processes(fake_login, stub_server, tmp_path):
+    script = (
+        'from tests.core import auth\n'
+        f'auth.API_URL = {stub_server.url!r}\n'
+        f'auth.USERS = {ROLES!r}\n'
+        f'auth.TOKEN_CACHE_PATH = {str(tmp_path / "tokens.json")!r}\n'
+        'auth.prewarm_tokens()\n'
+    )
+    workers = [subprocess.Popen([sys.executable, '-c', script], cwd=REPO_ROOT) for _ in range(4)]
+    assert all(worker.wait(timeout=60) == 0 for worker in workers)
+
+    assert fake_login['login_calls']() == len(ROLES)
@@ -0,0 +1,93 @@
+import time
+
+import allure
+import pytest
+
+from core.waiters import (
+    WAIT_STATS,
+    ExponentialBackoff,
+    FixedInterval,
+    deadline_budget,
+    wait_until,
+)
+
+pytestmark = [pytest.mark.core]
+
+
+def condition_after(delay: float):
+    """Синтетическое условие: становится истинным через delay секунд после создания."""
+    ready_at = time.monotonic() + delay
+    return lambda: time.monotonic() >= ready_at
+
+
+@allure.parent_suite("Core")
+@allure.suite("Waiters")
+@allure.title("Первая проверка делается сразу, без ожидания")
+def test_first_probe_is_immediate():
+    start = time.monotonic()
+    assert wait_until(lambda: 'ready', timeout=5) == 'ready'
+    assert time.monotonic() - start < 0.05
+
+
+@allure.parent_suite("Core")
+@allure.suite("Waiters")
+@allure.title("Интервалы backoff растут экспоненциально и ограничены max_interval")
+def test_exponential_backoff_delays():
+    delays = ExponentialBackoff(initial=0.1, factor=2, max_interval=0.5, jitter=0).delays()
+    assert [next(delays) for _ in range(5)] == [0.1, 0.2, 0.4, 0.5, 0.5]
+
+
+@allure.parent_suite("Core")
+@allure.suite("Waiters")
+@allure.title("Вложенные ожидания берут время из общего бюджета")
+def test_nested_waits_draw_from_budget():
+    start = time.monotonic()
+    with deadline_budget(0.3):
+        with pytest.raises(TimeoutError):
+            wait_until(lambda: False, timeout=10, poll_interval=0.05)
+        with pytest.raises(TimeoutError):
+            wait_until(lambda: False, timeout=10, poll_interval=0.05)
+    assert time.monotonic() - start < 0.5
+
+
+@allure.parent_suite("Core")
+@allure.suite("Waiters")
+@allure.title("Статистика ожиданий собирается по месту вызова")
+def test_stats_per_call_site():
+    wait_until(condition_after(0.1), timeout=2, call_site='test-site')
+    stats = WAIT_STATS['test-site']
+    assert stats['calls'] == 1
+    assert stats['attempts'] > 1
+    assert stats['waited'] >= 0.1
+
+
+@pytest.mark.benchmark
+@allure.parent_suite("Core")
+@allure.suite("Waiters")
+@allure.title("Benchmark: фиксированный интервал vs экспоненциальный backoff")
+def test_benchmark_fixed_vs_backoff():
+    """
+    Backoff должен ждать меньше, чем прежний фиксированный интервал 0.5s,
+    и поллить реже, чем фиксированный интервал с той же быстрой первой проверкой (0.05s).
+    """
+    delays = [0.0, 0.02, 0.1, 0.3, 0.7, 1.5, 3.0]
+    strategies = {
+        'fixed 0.5s': lambda: FixedInterval(0.5),
+        'fixed 0.05s': lambda: FixedInterval(0.05),
+        'backoff': lambda: ExponentialBackoff(),
+    }
+    totals = {}
+    for name, make_strategy in strategies.items():
+        waited = polls = 0
+        for delay in delays:
+            site = f'bench-{name}-{delay}'
+            wait_until(condition_after(delay), timeout=10, strategy=make_strategy(), call_site=site)
+            waited += WAIT_STATS[site]['waited']
+            polls += WAIT_STATS[site]['attempts']
+        totals[name] = (waited, polls)
+
+    report = '\n'.join(f"{name:>11}: waited {w:.2f}s, polls {p}" for name, (w, p) in totals.items())
+    print(f"\n{report}")
+    allure.attach(report, name="wait totals", attachment_type=allure.attachment_type.TEXT)
+    assert totals['backoff'][0] < totals['fixed 0.5s'][0]
+    assert totals['backoff'][1] < totals['fixed 0.05s'][1]
@@ -3,9 +3,10 @@ from pathlib import Path
 
 import allure
 import pytest
-from PIL import Image, ImageChops, ImageDraw
+from PIL import Image
 
 from tests.test_frontend.core.settings import BASE_URL, FRONTEND_EMAIL, FRONTEND_PASSWORD, FRONTEND_STAND
+from tests.test_frontend.core.snapshot_diff import compare_images, render_diff
 
 
 def pytest_addoption(parser):
@@ -189,11 +190,9 @@ def assert_snapshot(request):
             )
 
         # Пиксель считается отличающимся если хоть один RGB-канал отличается больше чем на 10 единиц.
-        # Порог 10 отфильтровывает субпиксельный шум рендеринга.
-        diff = ImageChops.difference(baseline, actual)
-        diff_pixels = sum(1 for p in diff.getdata() if any(c > 10 for c in p))
-        total_pixels = baseline.width * baseline.height
-        diff_pct = diff_pixels / total_pixels * 100
+        # Сравнение идёт операциями над целыми каналами, см. snapshot_diff.compare_images.
+        pixel_diff = compare_images(baseline, actual)
+        diff_pct = pixel_diff.diff_pct
 
         if diff_pct > threshold:
             actual_path = snapshot_dir / name.replace(".png", "_actual.png")
@@ -201,25 +200,7 @@ def assert_snapshot(request):
 
             # Строим diff-картинку: копия baseline с красными точками в местах различий
             # и красным прямоугольником вокруг всей зоны отличий
-            diff_highlighted = baseline.copy()
-            draw = ImageDraw.Draw(diff_highlighted)
-            diff_coords = [
-                (i % baseline.width, i // baseline.width)
-                for i, pixel in enumerate(diff.getdata())
-                if any(c > 10 for c in pixel)
-            ]
-            for x, y in diff_coords:
-                draw.point((x, y), fill=(255, 0, 0))
-
-            if diff_coords:
-                xs = [p[0] for p in diff_coords]
-                ys = [p[1] for p in diff_coords]
-                padding = 5
-                draw.rectangle(
-                    [min(xs) - padding, min(ys) - padding,
-                     max(xs) + padding, max(ys) + padding],
-                    outline=(255, 0, 0), width=2,
-                )
+            diff_highlighted = render_diff(baseline, pixel_diff)
 
             diff_path = snapshot_dir / name.replace(".png", "_diff.png")
             diff_highlighted.save(diff_path)
@@ -0,0 +1,60 @@
+from dataclasses import dataclass
+from typing import Optional, Tuple
+
+from PIL import Image, ImageChops, ImageDraw
+
+# Пиксель считается отличающимся если хоть один RGB-канал отличается больше чем на 10 единиц.
+# Порог 10 отфильтровывает субпиксельный шум рендеринга.
+CHANNEL_THRESHOLD = 10
+HIGHLIGHT_COLOR = (255, 0, 0)
+BBOX_PADDING = 5
+
+
+@dataclass
+class PixelDiff:
+    """Результат попиксельного сравнения двух RGB-скриншотов одного размера."""
+
+    diff_pixels: int
+    total_pixels: int
+    # Маска отличий ("L"): 255 — пиксель отличается, 0 — совпадает
+    mask: Image.Image
+    # (left, upper, right, lower) зоны отличий, right/lower не включительно; None — отличий нет
+    bbox: Optional[Tuple[int, int, int, int]]
+
+    @property
+    def diff_pct(self) -> float:
+        return self.diff_pixels / self.total_pixels * 100
+
+
+def compare_images(baseline: Image.Image, actual: Image.Image, threshold: int = CHANNEL_THRESHOLD) -> PixelDiff:
+    """
+    Сравнивает два RGB-изображения одного размера операциями над целыми каналами (в C, без цикла по пикселям).
+
+    Канал разницы бинаризуется по порогу через lookup-таблицу, маски каналов объединяются через lighter (max),
+    количество отличий берётся из гистограммы маски, зона отличий — из getbbox().
+    """
+    diff = ImageChops.difference(baseline, actual)
+    lut = [255 if value > threshold else 0 for value in range(256)]
+    red, green, blue = (band.point(lut) for band in diff.split())
+    mask = ImageChops.lighter(ImageChops.lighter(red, green), blue)
+    return PixelDiff(
+        diff_pixels=mask.histogram()[255],
+        total_pixels=baseline.width * baseline.height,
+        mask=mask,
+        bbox=mask.getbbox(),
+    )
+
+
+def render_diff(baseline: Image.Image, pixel_diff: PixelDiff) -> Image.Image:
+    """Копия baseline с красными точками в местах различий и красным прямоугольником вокруг всей зоны отличий."""
+    highlighted = baseline.copy()
+    highlighted.paste(HIGHLIGHT_COLOR, mask=pixel_diff.mask)
+
+    if pixel_diff.bbox:
+        left, upper, right, lower = pixel_diff.bbox
+        ImageDraw.Draw(highlighted).rectangle(
+            [left - BBOX_PADDING, upper - BBOX_PADDING,
+             right - 1 + BBOX_PADDING, lower - 1 + BBOX_PADDING],
+            outline=HIGHLIGHT_COLOR, width=2,
+        )
+    return highlighted